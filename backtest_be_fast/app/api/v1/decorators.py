@@ -52,7 +52,9 @@ from app.core.exceptions import (
     DataNotFoundError,
     InvalidSymbolError,
     YFinanceRateLimitError,
-    ValidationError
+    ValidationError,
+    BacktestQueueFullError,
+    ExecutionTimeoutError
 )
 
 logger = logging.getLogger(__name__)
@@ -87,7 +89,8 @@ def handle_backtest_errors(func):
                 detail=str(e)
             )
         
-        except (DataNotFoundError, InvalidSymbolError, YFinanceRateLimitError) as e:
+        except (DataNotFoundError, InvalidSymbolError, YFinanceRateLimitError,
+                BacktestQueueFullError, ExecutionTimeoutError) as e:
             # 이미 적절한 HTTP 상태코드를 가진 커스텀 예외들은 그대로 전파
             raise e
         
@@ -138,7 +141,8 @@ def handle_portfolio_errors(func):
                 detail=str(e)
             )
         
-        except (DataNotFoundError, InvalidSymbolError, YFinanceRateLimitError) as e:
+        except (DataNotFoundError, InvalidSymbolError, YFinanceRateLimitError,
+                BacktestQueueFullError, ExecutionTimeoutError) as e:
             raise e
         
         except ValueError as e:
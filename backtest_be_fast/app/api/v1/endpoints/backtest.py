@@ -8,6 +8,7 @@
 
 **엔드포인트**:
 - POST /api/v1/backtest: 백테스트 실행 및 모든 데이터 반환
+- POST /api/v1/backtest/optimize: 전략 파라미터 그리드 최적화 (NDJSON 스트리밍)
 
 **요청 흐름**:
 1. 클라이언트 → FastAPI → 이 엔드포인트
@@ -22,6 +23,8 @@
 - app/services/portfolio_service.py: 백테스트 실행
 - app/services/unified_data_service.py: 추가 데이터 수집
 - app/services/news_service.py: 뉴스 데이터 조회
+- app/services/news_cache_service.py: 최신 뉴스 읽기 캐시
+- app/services/optimization_service.py: 파라미터 최적화
 
 **연관 컴포넌트**:
 - Backend: app/api/v1/api.py (라우터 등록)
@@ -33,13 +36,18 @@
 - 얇은 컨트롤러: 비즈니스 로직 없이 조율만 수행
 """
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+import json
 import logging
 
 from ....schemas.schemas import PortfolioBacktestRequest
+from ....schemas.requests import OptimizationRequest
 from ....services.portfolio_service import PortfolioService
 from ....services.unified_data_service import unified_data_service
 from ....services.news_service import news_service
-from ..decorators import handle_portfolio_errors
+from ....services.news_cache_service import news_cache_service
+from ....services.optimization_service import optimization_service
+from ..decorators import handle_portfolio_errors, handle_backtest_errors
 
 
 logger = logging.getLogger(__name__)
@@ -50,6 +58,7 @@ portfolio_service = PortfolioService()
 
 # 데이터 서비스에 뉴스 서비스 주입
 unified_data_service.news_service = news_service
+unified_data_service.news_cache = news_cache_service
 
 
 @router.post(
@@ -75,7 +84,7 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     - **start_date**: 시작 날짜 (YYYY-MM-DD)
     - **end_date**: 종료 날짜 (YYYY-MM-DD)
     - **commission**: 수수료율 (0 ~ 0.1)
-    - **rebalance_frequency**: 리밸런싱 주기 (monthly, quarterly, yearly)
+    - **rebalance_frequency**: 리밸런싱 주기 (none, daily, weekly, monthly, quarterly, yearly, 기본: none)
     - **strategy**: 전략명 (기본: buy_and_hold)
     
     **응답 형식**:
@@ -97,8 +106,9 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     }
     ```
     """
-    # 1. 백테스트 실행 (포트폴리오 서비스 위임)
-    backtest_result = await portfolio_service.run_portfolio_backtest(request)
+    # 1. 백테스트 실행 (포트폴리오 서비스 위임, 로드한 가격 데이터는 요청 단위로 공유)
+    price_frames = {}
+    backtest_result = await portfolio_service.run_portfolio_backtest(request, price_frames=price_frames)
     
     if backtest_result.get('status') != 'success':
         return backtest_result
@@ -111,13 +121,14 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     ]
     symbols = list(set(symbols))  # 중복 제거
     
-    # 3. 추가 데이터 수집 (데이터 서비스 위임)
-    unified_data = unified_data_service.collect_all_unified_data(
+    # 3. 추가 데이터 수집 (데이터 서비스 위임, 섹션별 동시 수집)
+    unified_data = await unified_data_service.collect_all_unified_data_async(
         symbols=symbols,
         start_date=request.start_date,
         end_date=request.end_date,
         include_news=True,
-        news_display_count=15
+        news_display_count=15,
+        frames=price_frames
     )
     
     # 4. 응답 데이터 병합
@@ -125,3 +136,37 @@ async def run_portfolio_backtest(request: PortfolioBacktestRequest):
     
     return backtest_result
 
+
+@router.post(
+    "/optimize",
+    status_code=status.HTTP_200_OK,
+    summary="전략 파라미터 최적화",
+    description="전략 파라미터 범위를 격자로 탐색하여 목적 함수 기준 상위 조합과 전체 결과 테이블을 반환합니다."
+)
+@handle_backtest_errors
+async def optimize_strategy_parameters(request: OptimizationRequest):
+    """
+    전략 파라미터 최적화 API
+    
+    가격 데이터를 한 번만 로드한 뒤 파라미터 조합을 프로세스 풀에서 병렬로 평가합니다.
+    
+    **요청 파라미터**:
+    - **strategy**: 최적화할 전략
+    - **param_ranges**: 파라미터별 범위 {min, max, step} 또는 {values} (미지정 시 전략 정의의 min/max)
+    - **objective**: sharpe_ratio, total_return, calmar_ratio
+    - **top_n**: 상위 결과 개수
+    - **stream**: true면 NDJSON 스트림 (조합별 result 라인 + 마지막 summary 라인)
+    """
+    # 데이터 로드와 격자 검증은 스트리밍 전에 수행하여 오류를 HTTP 상태코드로 반환
+    data = await optimization_service.load_price_data(request)
+    grid = optimization_service.build_parameter_grid(request.strategy.value, request.param_ranges)
+    
+    if not request.stream:
+        summary = await optimization_service.run_optimization(request, data, grid)
+        return {'status': 'success', 'data': summary}
+    
+    async def event_stream():
+        async for event in optimization_service.stream_optimization(request, data, grid):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
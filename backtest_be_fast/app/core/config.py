@@ -77,9 +77,52 @@ class Settings(BaseSettings):
     max_backtest_duration_days: int = 3650  # 10년
     max_backtest_duration_years: int = 5  # 포트폴리오 백테스트 최대 기간
     default_commission: float = 0.002  # 0.2%
+    # 백테스트 엔진 모드: "backtesting"(backtesting.py) 또는 "vectorized"(벡터화 고속 엔진)
+    backtest_engine_mode: str = Field(default="backtesting", env="BACKTEST_ENGINE_MODE")
+    
+    # 파라미터 최적화(스윕) 설정
+    optimization_max_workers: Optional[int] = Field(default=None, env="OPTIMIZATION_MAX_WORKERS")  # None이면 CPU 코어 수
+    optimization_max_combinations: int = 2000  # 한 번에 평가할 최대 파라미터 조합 수
+    optimization_default_grid_points: int = 10  # 범위 미지정 시 파라미터당 기본 격자 점 수
+    
+    # 실행기(Executor) 설정
+    io_executor_workers: int = Field(default=16, env="IO_EXECUTOR_WORKERS")  # DB/yfinance I/O 스레드 수
+    unified_data_io_workers: int = Field(default=8, env="UNIFIED_DATA_IO_WORKERS")  # 통합 데이터 섹션 전용 I/O 스레드 수 (제한 시간을 넘긴 공급자 호출이 요청 I/O 풀을 점유하지 않도록 분리)
+    backtest_process_workers: Optional[int] = Field(default=None, env="BACKTEST_PROCESS_WORKERS")  # None이면 CPU 코어 수, 0이면 스레드 풀 사용
+    backtest_max_queue_depth: int = Field(default=32, env="BACKTEST_MAX_QUEUE_DEPTH")  # 실행 슬롯을 기다릴 수 있는 최대 백테스트 수
+    io_stage_timeout_seconds: float = 60.0  # 검증/데이터 조회 단계 제한 시간
+    backtest_stage_timeout_seconds: float = 120.0  # Backtest.run 단계 제한 시간
+    unified_data_section_timeout_seconds: float = Field(default=20.0, env="UNIFIED_DATA_SECTION_TIMEOUT_SECONDS")  # 통합 데이터 가격/환율/벤치마크 섹션 제한 시간
+    unified_news_timeout_seconds: float = Field(default=5.0, env="UNIFIED_NEWS_TIMEOUT_SECONDS")  # 통합 데이터 뉴스(네이버) 섹션 제한 시간
+    
+    # 가격 데이터 메모리 캐시 설정
+    price_cache_max_mb: int = Field(default=512, env="PRICE_CACHE_MAX_MB")  # DataFrame 실제 메모리 기준 상한
+    price_cache_ttl_seconds: int = Field(default=3600, env="PRICE_CACHE_TTL_SECONDS")
+    
+    # 기술 지표 메모리 캐시 설정
+    indicator_cache_max_mb: int = Field(default=128, env="INDICATOR_CACHE_MAX_MB")  # 지표 배열 nbytes 기준 상한 (프로세스별)
+    
+    # 백테스트 결과 캐시 설정
+    backtest_result_cache_enabled: bool = Field(default=True, env="BACKTEST_RESULT_CACHE_ENABLED")
+    backtest_result_cache_max_entries: int = Field(default=512, env="BACKTEST_RESULT_CACHE_MAX_ENTRIES")  # 프로세스 내 LRU 항목 수
+    backtest_result_cache_persistent: bool = Field(default=True, env="BACKTEST_RESULT_CACHE_PERSISTENT")  # MySQL backtest_results 계층 사용
+    
+    # 티커별 데이터 버전(stocks.data_last_update) 설정
+    data_version_refresh_seconds: float = Field(default=5.0, env="DATA_VERSION_REFRESH_SECONDS")  # 프로세스 내 버전 맵 일괄 갱신 주기
+    
+    # 가격 데이터 DB 적재 설정
+    price_upsert_batch_size: int = Field(default=1000, env="PRICE_UPSERT_BATCH_SIZE")  # daily_prices upsert 배치당 행 수
+    ticker_info_refresh_hours: int = Field(default=168, env="TICKER_INFO_REFRESH_HOURS")  # stocks.info_json 갱신 주기 (기본 7일)
+    price_open_day_ttl_seconds: int = Field(default=900, env="PRICE_OPEN_DAY_TTL_SECONDS")  # 당일(장 마감 전) 수집 후 다시 수집하지 않는 시간
+    price_empty_range_ttl_seconds: int = Field(default=900, env="PRICE_EMPTY_RANGE_TTL_SECONDS")  # 수집 결과가 없던 구간을 다시 수집하지 않는 시간 (DB에는 기록하지 않음)
+    
+    # 데이터 Repository 설정
+    data_repository_type: str = Field(default="yfinance", env="DATA_REPOSITORY_TYPE")  # "yfinance" | "columnar" | "mock"
+    columnar_store_dir: str = Field(default="data/columnar", env="COLUMNAR_STORE_DIR")  # 컬럼형 가격 저장소 디렉터리
     
     # 포트폴리오 설정
     max_portfolio_items: int = 10  # 포트폴리오 최대 종목 수
+    portfolio_backtest_concurrency: int = Field(default=4, env="PORTFOLIO_BACKTEST_CONCURRENCY")  # 전략 포트폴리오에서 동시에 실행할 종목 백테스트 수
     max_symbol_length: int = 10  # 심볼 최대 길이
     default_dca_periods: int = 12  # DCA 기본 기간 (개월)
     max_dca_periods: int = 60  # DCA 최대 기간 (개월)
@@ -94,10 +137,20 @@ class Settings(BaseSettings):
     yahoo_finance_timeout: int = 30
     exchange_rate_ticker: str = "KRW=X"  # 원달러 환율 티커
     volatility_threshold_pct: float = 5.0  # 주가 변동성 기본 임계값 (%)
+    volatility_event_min_pct: float = Field(default=2.0, env="VOLATILITY_EVENT_MIN_PCT")  # volatility_events 테이블 저장 기준 (%)
+    volatility_news_backfill_max_dates: int = 10  # 종목당 한 번에 보완할 이벤트 날짜 뉴스 수
+    volatility_news_backfill_history_size: int = 5000  # 중복 예약 방지를 위해 기억할 (종목, 이벤트 날짜) 최대 수
     
     # 네이버 API 키 (환경변수 또는 .env에서 로드)
     naver_client_id: Optional[str] = Field(default=None, env="NAVER_CLIENT_ID")
     naver_client_secret: Optional[str] = Field(default=None, env="NAVER_CLIENT_SECRET")
+    naver_news_rate_limit_per_minute: int = Field(default=100, env="NAVER_NEWS_RATE_LIMIT_PER_MINUTE")  # 네이버 검색 API 분당 호출 한도
+    naver_news_http_timeout_seconds: float = 10.0  # 네이버 검색 API 요청 제한 시간
+    naver_news_max_connections: int = 10  # 네이버 검색 API 커넥션 풀 크기
+    
+    # 최신 뉴스 DB 캐시(stock_news) 설정
+    news_cache_fresh_minutes: int = Field(default=30, env="NEWS_CACHE_FRESH_MINUTES")  # 이 시간 이내 캐시는 그대로 사용
+    news_cache_max_age_hours: int = Field(default=24, env="NEWS_CACHE_MAX_AGE_HOURS")  # 이 시간 이내 캐시는 응답 후 백그라운드 갱신
     # Database configuration (support both DATABASE_URL and individual parts)
     database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
     database_host: Optional[str] = Field(default=None, env="DATABASE_HOST")
@@ -106,6 +159,15 @@ class Settings(BaseSettings):
     database_password: Optional[str] = Field(default=None, env="DATABASE_PASSWORD")
     database_name: Optional[str] = Field(default=None, env="DATABASE_NAME")
     
+    # DB 커넥션 풀 설정 (동기/비동기 엔진 각각 적용)
+    database_pool_size: int = Field(default=10, env="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
+    database_pool_recycle: int = Field(default=1800, env="DATABASE_POOL_RECYCLE")  # 초, MySQL wait_timeout보다 짧게
+    
+    # 비동기 DB 엔진(SQLAlchemy asyncio) 설정
+    database_async_enabled: bool = Field(default=False, env="DATABASE_ASYNC_ENABLED")  # 가격/뉴스 DB 접근을 I/O 스레드 풀 대신 비동기 드라이버로 실행
+    database_async_driver: str = Field(default="aiomysql", env="DATABASE_ASYNC_DRIVER")  # aiomysql 또는 asyncmy
+    
     # pydantic v2 configuration
     model_config = {
         "env_file": ".env",
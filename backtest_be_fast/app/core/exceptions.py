@@ -11,6 +11,8 @@
 - DataNotFoundError: 데이터 조회 실패 (404)
 - InvalidSymbolError: 잘못된 종목 심볼 (400)
 - ValidationError: 입력 검증 실패 (422)
+- BacktestQueueFullError: 백테스트 실행 대기열 포화 (503)
+- ExecutionTimeoutError: 실행 단계 시간 초과 (504)
 - StrategyNotFoundError: 전략 미존재 (404)
 - BacktestExecutionError: 백테스트 실행 실패 (500)
 
@@ -88,6 +90,29 @@ class ValidationError(HTTPException):
         logger.warning(f"검증 실패: {message}")
 
 
+class BacktestQueueFullError(HTTPException):
+    """백테스트 실행 대기열이 가득 찼을 때 발생하는 예외"""
+    def __init__(self, max_queue_depth: int, retry_after: int = 5):
+        detail = f"백테스트 요청이 많아 대기열({max_queue_depth}개)이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)}
+        )
+        logger.warning(f"백테스트 대기열 포화: {max_queue_depth}")
+
+
+class ExecutionTimeoutError(HTTPException):
+    """실행 단계가 제한 시간을 초과했을 때 발생하는 예외"""
+    def __init__(self, stage: str, timeout_seconds: float):
+        detail = f"'{stage}' 단계가 제한 시간({timeout_seconds:g}초)을 초과했습니다."
+        super().__init__(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=detail
+        )
+        logger.warning(f"실행 시간 초과: {stage} ({timeout_seconds:g}초)")
+
+
 # 유틸리티 함수
 def handle_yfinance_error(error: Exception, symbol: str, start_date: str, end_date: str) -> HTTPException:
     """yfinance 에러를 적절한 HTTP 예외로 변환"""
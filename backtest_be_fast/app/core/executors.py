@@ -0,0 +1,243 @@
+"""
+실행기(Executor) 관리
+
+**역할**:
+- 블로킹 I/O(MySQL, yfinance)와 CPU 바운드 작업(Backtest.run)을 이벤트 루프 밖에서 실행
+- 긴 백테스트 하나가 uvicorn 워커의 다른 요청을 막지 않도록 분리
+
+**주요 기능**:
+1. run_io(): 스레드 풀에서 블로킹 I/O 함수 실행 (단계별 제한 시간)
+   - run_unified_io(): 통합 데이터 섹션 전용 스레드 풀에서 실행 (제한 시간 초과 후에도 계속 실행되는
+     공급자 호출은 이 풀의 스레드만 점유하고, 요청 경로의 I/O 풀 슬롯은 비워 둠)
+2. run_cpu(): 프로세스 풀에서 CPU 바운드 함수 실행
+   - 실행 슬롯(워커 수)만큼만 동시 실행, 나머지는 대기열에서 대기
+   - 대기열이 가득 차면 BacktestQueueFullError(503)
+   - 제한 시간 초과 시 ExecutionTimeoutError(504)
+3. get_stats(): 실행 중/대기 중 작업 수 및 누적 카운터 조회
+4. shutdown(): 애플리케이션 종료 시 풀 정리
+
+**설정** (app/core/config.py):
+- io_executor_workers: I/O 스레드 수
+- unified_data_io_workers: 통합 데이터 섹션 전용 I/O 스레드 수
+- backtest_process_workers: 백테스트 프로세스 수 (None=CPU 코어 수, 0=스레드 풀 사용)
+- backtest_max_queue_depth: 최대 대기열 길이
+- io_stage_timeout_seconds / backtest_stage_timeout_seconds: 단계별 제한 시간
+
+**주의**:
+- 프로세스 풀로 전달하는 함수와 인자는 pickle 가능해야 함 (모듈 최상위 함수, 동적 생성 클래스 불가)
+- 제한 시간을 초과해도 이미 실행 중인 프로세스 작업은 끝까지 실행되며,
+  실행 슬롯은 실제 작업이 끝난 뒤 반환됨
+- 스레드 작업도 제한 시간 초과 시 기다림만 중단하고 스레드는 작업이 끝날 때까지 점유됨
+  (아직 시작하지 않은 작업은 취소)
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_engine.py (검증/데이터 조회/백테스트 실행)
+- Backend: app/repositories/data_repository.py (MySQL/yfinance 조회)
+- Backend: app/main.py (종료 시 shutdown)
+"""
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .config import settings
+from .exceptions import BacktestQueueFullError, ExecutionTimeoutError
+
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorManager:
+    """I/O 스레드 풀과 백테스트 프로세스 풀 관리자"""
+
+    def __init__(
+        self,
+        io_workers: Optional[int] = None,
+        cpu_workers: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+        unified_io_workers: Optional[int] = None,
+    ):
+        self.io_workers = io_workers or settings.io_executor_workers
+        self.unified_io_workers = unified_io_workers or settings.unified_data_io_workers
+        configured_cpu = settings.backtest_process_workers if cpu_workers is None else cpu_workers
+        self.use_processes = configured_cpu != 0 if use_processes is None else use_processes
+        self.cpu_workers = configured_cpu or os.cpu_count() or 1
+        self.max_queue_depth = max_queue_depth if max_queue_depth is not None else settings.backtest_max_queue_depth
+
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._unified_io_executor: Optional[ThreadPoolExecutor] = None
+        self._cpu_executor: Optional[Executor] = None
+        self._cpu_slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._in_flight = 0
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @property
+    def io_executor(self) -> ThreadPoolExecutor:
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=self.io_workers, thread_name_prefix="backtest-io"
+            )
+        return self._io_executor
+
+    @property
+    def unified_io_executor(self) -> ThreadPoolExecutor:
+        if self._unified_io_executor is None:
+            self._unified_io_executor = ThreadPoolExecutor(
+                max_workers=self.unified_io_workers, thread_name_prefix="unified-io"
+            )
+        return self._unified_io_executor
+
+    @property
+    def cpu_executor(self) -> Executor:
+        if self._cpu_executor is None:
+            if self.use_processes:
+                self._cpu_executor = ProcessPoolExecutor(max_workers=self.cpu_workers)
+            else:
+                self._cpu_executor = ThreadPoolExecutor(
+                    max_workers=self.cpu_workers, thread_name_prefix="backtest-cpu"
+                )
+        return self._cpu_executor
+
+    async def run_io(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        stage: str = "io",
+        **kwargs: Any,
+    ) -> Any:
+        """블로킹 I/O 함수를 스레드 풀에서 실행"""
+        return await self._run_in_thread(self.io_executor, func, args, kwargs, timeout, stage)
+
+    async def run_unified_io(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        stage: str = "unified",
+        **kwargs: Any,
+    ) -> Any:
+        """블로킹 I/O 함수를 통합 데이터 섹션 전용 스레드 풀에서 실행"""
+        return await self._run_in_thread(self.unified_io_executor, func, args, kwargs, timeout, stage)
+
+    async def _run_in_thread(
+        self,
+        executor: ThreadPoolExecutor,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+        timeout: Optional[float],
+        stage: str,
+    ) -> Any:
+        timeout = timeout if timeout is not None else settings.io_stage_timeout_seconds
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            raise ExecutionTimeoutError(stage, timeout)
+
+    async def run_cpu(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        stage: str = "backtest",
+    ) -> Any:
+        """CPU 바운드 함수를 실행 슬롯 확보 후 프로세스 풀에서 실행"""
+        timeout = timeout if timeout is not None else settings.backtest_stage_timeout_seconds
+        loop = asyncio.get_running_loop()
+        if self._cpu_slots is None or self._slots_loop is not loop:
+            self._cpu_slots = asyncio.Semaphore(self.cpu_workers)
+            self._slots_loop = loop
+
+        if self._cpu_slots.locked() and self._queued >= self.max_queue_depth:
+            self._rejected += 1
+            raise BacktestQueueFullError(self.max_queue_depth)
+
+        slots = self._cpu_slots
+        self._queued += 1
+        try:
+            await slots.acquire()
+        finally:
+            self._queued -= 1
+
+        self._in_flight += 1
+        try:
+            concurrent_future = self.cpu_executor.submit(func, *args)
+        except Exception:
+            self._release_cpu_slot(slots)
+            raise
+        # 슬롯은 실제 작업 종료 시점에 반환 (제한 시간 초과 후에도 실행 중인 작업 반영)
+        concurrent_future.add_done_callback(lambda _: self._schedule_release(loop, slots))
+
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(concurrent_future)), timeout
+            )
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            concurrent_future.cancel()
+            raise ExecutionTimeoutError(stage, timeout)
+        except Exception:
+            self._failed += 1
+            raise
+
+        self._completed += 1
+        return result
+
+    def _schedule_release(self, loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore) -> None:
+        try:
+            loop.call_soon_threadsafe(self._release_cpu_slot, slots)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 경우
+            self._in_flight -= 1
+
+    def _release_cpu_slot(self, slots: asyncio.Semaphore) -> None:
+        self._in_flight -= 1
+        slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행기 상태 통계"""
+        return {
+            'io_workers': self.io_workers,
+            'unified_io_workers': self.unified_io_workers,
+            'backtest_workers': self.cpu_workers,
+            'backtest_executor': 'process' if self.use_processes else 'thread',
+            'in_flight': self._in_flight,
+            'queued': self._queued,
+            'max_queue_depth': self.max_queue_depth,
+            'completed': self._completed,
+            'failed': self._failed,
+            'rejected': self._rejected,
+            'timed_out': self._timed_out,
+        }
+
+    def shutdown(self) -> None:
+        """실행기 종료 (대기 중 작업 취소)"""
+        if self._cpu_executor is not None:
+            self._cpu_executor.shutdown(wait=False, cancel_futures=True)
+            self._cpu_executor = None
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+            self._io_executor = None
+        if self._unified_io_executor is not None:
+            self._unified_io_executor.shutdown(wait=False, cancel_futures=True)
+            self._unified_io_executor = None
+        self._cpu_slots = None
+        self._slots_loop = None
+        logger.info("실행기 종료 완료")
+
+
+# 글로벌 실행기 인스턴스
+executor_manager = ExecutorManager()
@@ -31,6 +31,9 @@ import logging
 from datetime import datetime
 
 from .core.config import settings
+from .core.executors import executor_manager
+from .services.news_service import news_service
+from .services.yfinance_db import dispose_async_engine
 from .api.v1.api import api_router
 from .schemas.responses import HealthResponse
 
@@ -52,6 +55,9 @@ async def lifespan(app: FastAPI):
     yield
     
     # 종료 시 정리
+    await news_service.aclose()
+    await dispose_async_engine()
+    executor_manager.shutdown()
     logger.info(f"{settings.project_name} 종료됨")
 
 
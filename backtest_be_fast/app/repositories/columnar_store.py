@@ -0,0 +1,292 @@
+"""
+컬럼형(columnar) 디스크 가격 저장소
+
+**역할**:
+- 티커별 OHLCV를 컬럼 단위 NumPy(.npy) 파일로 디스크에 보관
+- 읽을 때는 np.load(mmap_mode='r')로 메모리 매핑 후 날짜 인덱스를 이진 탐색해 슬라이스
+- 슬라이스는 복사 없이 DataFrame/DatetimeIndex로 감싸 반환 (MySQL 행 → DataFrame 재구성 생략)
+- MySQL(daily_prices)이 원본이며, 저장소는 load_ticker_data 결과로 동기화되는 읽기 사본
+
+**주요 기능**:
+1. ColumnarPriceStore.read(): 저장된 구간에 포함된 요청을 메모리 매핑 슬라이스로 반환
+2. ColumnarPriceStore.write(): 새 버전 디렉터리에 컬럼 파일 작성 후 CURRENT 포인터 원자적 교체
+3. ColumnarDataRepository: DataRepositoryInterface 구현
+   - 저장소 적중 시 즉시 반환, 미스 시 MySQL에서 (기존 구간 ∪ 요청 구간)을 읽어 동기화
+4. get_stats(): 티커 수, 디스크 사용량, 적중/미스/동기화 카운터
+
+**데이터 버전**:
+- 동기화 시점의 티커 데이터 버전(stocks.data_last_update)을 meta.json에 기록
+- ColumnarDataRepository는 현재 버전과 다른 저장소를 미스로 처리하고 다시 동기화
+  (다른 프로세스가 MySQL에 적재한 데이터도 버전 갱신 주기 안에 반영, app/services/data_versions.py)
+
+**디스크 레이아웃**:
+```
+<root>/<TICKER>/CURRENT               # 현재 버전 디렉터리 이름
+<root>/<TICKER>/<version>/meta.json   # 구간 시작/종료일, 행 수, 데이터 버전, 동기화 시각
+<root>/<TICKER>/<version>/date.npy    # datetime64[ns]
+<root>/<TICKER>/<version>/open.npy ... volume.npy
+```
+
+**구간 규칙**:
+- 티커당 하나의 연속 구간만 보관 (떨어진 구간 요청은 두 구간을 포함하는 범위로 재동기화)
+- 종료일은 장 마감 전 데이터를 고려해 어제까지만 기록 (오늘이 포함된 요청은 항상 MySQL 경유)
+
+**설정** (app/core/config.py):
+- data_repository_type: "columnar"이면 전역 data_repository로 사용
+- columnar_store_dir: 저장소 루트 디렉터리
+
+**연관 컴포넌트**:
+- Backend: app/repositories/data_repository.py (DataRepositoryInterface, 팩토리)
+- Backend: app/services/yfinance_db.py (동기화 원본 조회)
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.executors import executor_manager
+from app.repositories.data_repository import DataRepositoryInterface
+from app.repositories.price_cache import _slice_frame, _to_timestamp
+from app.services import yfinance_db
+from app.services.data_versions import data_versions
+from app.utils.single_flight import AsyncSingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+# 파일 이름 -> DataFrame 컬럼
+_COLUMNS = {
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'adj_close': 'Adj Close',
+    'volume': 'Volume',
+}
+
+
+class _MappedTicker:
+    """메모리 매핑된 티커 한 버전"""
+
+    __slots__ = ('version', 'start', 'end', 'dates', 'columns', 'data_version')
+
+    def __init__(self, version: str, start: pd.Timestamp, end: pd.Timestamp,
+                 dates: np.ndarray, columns: Dict[str, np.ndarray], data_version: int = 0):
+        self.version = version
+        self.start = start
+        self.end = end
+        self.dates = dates
+        self.columns = columns
+        self.data_version = data_version
+
+
+class ColumnarPriceStore:
+    """티커별 컬럼 파일 저장소"""
+
+    def __init__(self, root_dir: Union[str, Path]):
+        self.root_dir = Path(root_dir)
+        self._mapped: Dict[str, _MappedTicker] = {}
+        self._lock = threading.Lock()
+
+    def read(self, ticker: str, start_date, end_date,
+             data_version: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """요청 구간이 저장 구간에 포함되면 복사 없는 슬라이스 반환 (없거나 데이터 버전이 다르면 None)"""
+        mapped = self._open(ticker)
+        if mapped is None:
+            return None
+        if data_version is not None and mapped.data_version != data_version:
+            return None
+        start, end = _to_timestamp(start_date), _to_timestamp(end_date)
+        if start < mapped.start or end > mapped.end:
+            return None
+
+        lo = np.searchsorted(mapped.dates, start.to_datetime64(), side='left')
+        hi = np.searchsorted(mapped.dates, (end + pd.Timedelta(days=1)).to_datetime64(), side='left')
+        index = pd.DatetimeIndex(mapped.dates[lo:hi], copy=False)
+        data = {column: values[lo:hi] for column, values in mapped.columns.items()}
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def coverage(self, ticker: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """저장된 구간 (시작일, 종료일)"""
+        mapped = self._open(ticker)
+        return (mapped.start, mapped.end) if mapped is not None else None
+
+    def write(self, ticker: str, start_date, end_date, data: pd.DataFrame, data_version: int = 0) -> None:
+        """새 버전으로 티커 데이터 저장 (읽는 중인 이전 버전에는 영향 없음)"""
+        start, end = _to_timestamp(start_date), _to_timestamp(end_date)
+        frame = _slice_frame(data, start, end).sort_index()
+        frame = frame[~frame.index.duplicated(keep='last')]
+
+        ticker_dir = self.root_dir / ticker
+        version = f"{time.time_ns()}"
+        version_dir = ticker_dir / version
+        version_dir.mkdir(parents=True, exist_ok=True)
+
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        np.save(version_dir / 'date.npy', index.normalize().to_numpy(dtype='datetime64[ns]'))
+        for name, column in _COLUMNS.items():
+            if column == 'Volume':
+                values = (pd.to_numeric(frame[column], errors='coerce').fillna(0).to_numpy(dtype='int64')
+                          if column in frame.columns else np.zeros(len(frame), dtype='int64'))
+            else:
+                values = (pd.to_numeric(frame[column], errors='coerce').to_numpy(dtype=float)
+                          if column in frame.columns else np.full(len(frame), np.nan))
+            np.save(version_dir / f'{name}.npy', values)
+        meta = {
+            'start': start.date().isoformat(),
+            'end': end.date().isoformat(),
+            'rows': len(frame),
+            'data_version': data_version,
+            'synced_at': datetime.utcnow().isoformat(),
+        }
+        (version_dir / 'meta.json').write_text(json.dumps(meta))
+
+        # CURRENT 포인터를 원자적으로 교체한 뒤 이전 버전 제거
+        # (이미 매핑된 파일은 unlink 후에도 읽을 수 있음)
+        pointer_tmp = ticker_dir / f'CURRENT.{version}.tmp'
+        pointer_tmp.write_text(version)
+        os.replace(pointer_tmp, ticker_dir / 'CURRENT')
+        for child in ticker_dir.iterdir():
+            if child.is_dir() and child.name != version:
+                shutil.rmtree(child, ignore_errors=True)
+
+    def invalidate(self, ticker: str) -> bool:
+        """티커 저장소 삭제"""
+        with self._lock:
+            self._mapped.pop(ticker, None)
+        ticker_dir = self.root_dir / ticker
+        if not ticker_dir.exists():
+            return False
+        shutil.rmtree(ticker_dir, ignore_errors=True)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        tickers = [p for p in self.root_dir.iterdir() if p.is_dir()] if self.root_dir.exists() else []
+        disk_bytes = sum(f.stat().st_size for t in tickers for f in t.rglob('*.npy'))
+        with self._lock:
+            mapped = len(self._mapped)
+        return {
+            'store_dir': str(self.root_dir),
+            'total_tickers': len(tickers),
+            'mapped_tickers': mapped,
+            'disk_usage_mb': disk_bytes / (1024 * 1024),
+        }
+
+    def _open(self, ticker: str) -> Optional[_MappedTicker]:
+        """현재 버전을 메모리 매핑 (버전이 바뀌었을 때만 다시 매핑)"""
+        try:
+            version = (self.root_dir / ticker / 'CURRENT').read_text().strip()
+        except FileNotFoundError:
+            with self._lock:
+                self._mapped.pop(ticker, None)
+            return None
+
+        with self._lock:
+            mapped = self._mapped.get(ticker)
+        if mapped is not None and mapped.version == version:
+            return mapped
+
+        version_dir = self.root_dir / ticker / version
+        try:
+            meta = json.loads((version_dir / 'meta.json').read_text())
+            # np.asarray: memmap 서브클래스가 DataFrame 컬럼으로 노출되지 않도록 ndarray 뷰로 변환 (복사 없음)
+            dates = np.asarray(np.load(version_dir / 'date.npy', mmap_mode='r'))
+            columns = {
+                column: np.asarray(np.load(version_dir / f'{name}.npy', mmap_mode='r'))
+                for name, column in _COLUMNS.items()
+            }
+        except FileNotFoundError:
+            # 쓰기와 경합해 이전 버전이 제거된 경우
+            return None
+        mapped = _MappedTicker(
+            version, pd.Timestamp(meta['start']), pd.Timestamp(meta['end']), dates, columns,
+            meta.get('data_version', 0),
+        )
+        with self._lock:
+            self._mapped[ticker] = mapped
+        return mapped
+
+
+class ColumnarDataRepository(DataRepositoryInterface):
+    """컬럼형 디스크 저장소 기반 데이터 Repository (MySQL 동기화 사본)"""
+
+    def __init__(self, store_dir: Union[str, Path, None] = None):
+        from app.core.config import settings
+        self.logger = logging.getLogger(__name__)
+        self.store = ColumnarPriceStore(store_dir or settings.columnar_store_dir)
+        self._inflight = AsyncSingleFlight()
+        self._stats = {'hits': 0, 'misses': 0, 'syncs': 0, 'errors': 0}
+        self._versions = data_versions
+
+    async def get_stock_data(self, ticker: str, start_date: Union[date, str],
+                           end_date: Union[date, str]) -> pd.DataFrame:
+        """주식 데이터 조회 (같은 데이터 버전의 메모리 매핑 저장소 우선, 미스 시 MySQL에서 동기화)"""
+        version = await self._versions.get(ticker)
+        cached = self.store.read(ticker, start_date, end_date, data_version=version)
+        if cached is not None:
+            self._stats['hits'] += 1
+            return cached
+
+        self._stats['misses'] += 1
+        start, end = _to_timestamp(start_date), _to_timestamp(end_date)
+        return await self._inflight.do((ticker, start, end, version), self._sync, ticker, start, end)
+
+    async def _sync(self, ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """기존 저장 구간과 요청 구간을 합친 범위를 MySQL에서 읽어 저장소 갱신 (조회 후 데이터 버전으로 기록)"""
+        sync_start, sync_end = start, end
+        coverage = self.store.coverage(ticker)
+        if coverage is not None:
+            sync_start, sync_end = min(start, coverage[0]), max(end, coverage[1])
+
+        try:
+            data = await yfinance_db.load_ticker_data_async(ticker, sync_start.date(), sync_end.date())
+        except Exception:
+            self._stats['errors'] += 1
+            raise
+
+        # 누락 구간 보완 적재로 버전이 바뀔 수 있으므로 조회 후 버전으로 기록
+        version = self._versions.peek(ticker)
+        stored_end = min(sync_end, pd.Timestamp(date.today() - timedelta(days=1)))
+        if data is not None and not data.empty and sync_start <= stored_end:
+            try:
+                await executor_manager.run_io(
+                    self.store.write, ticker, sync_start, stored_end, data, version, stage="columnar"
+                )
+                self._stats['syncs'] += 1
+            except Exception as e:
+                self.logger.warning(f"컬럼 저장소 동기화 실패: {ticker}, {str(e)}")
+        return _slice_frame(data, start, end)
+
+    async def cache_stock_data(self, ticker: str, data: pd.DataFrame) -> bool:
+        """MySQL에 저장 (저장소는 다음 미스 때 MySQL에서 다시 동기화)"""
+        try:
+            saved = await yfinance_db.save_ticker_data_async(ticker, data)
+            self.store.invalidate(ticker)
+            return saved > 0
+        except Exception as e:
+            self.logger.error(f"데이터 캐시 저장 실패: {ticker}, {str(e)}")
+            return False
+
+    async def invalidate_cache(self, ticker: str) -> bool:
+        """특정 티커의 저장소 및 적재 구간 캐시 무효화"""
+        self.store.invalidate(ticker)
+        yfinance_db.invalidate_coverage_cache(ticker)
+        return True
+
+    async def get_cache_stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            'columnar_store': {**self.store.get_stats(), **self._stats},
+            'cache_hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+        }
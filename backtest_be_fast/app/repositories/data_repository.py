@@ -17,15 +17,26 @@
 **캐싱 전략**:
 - 3단계 캐싱: 메모리 → DB → yfinance API
 - TTL (Time To Live): 메모리 캐시 만료 시간
-- 캐시 키: f"{ticker}:{start_date}:{end_date}"
+- 메모리 캐시 용량: DataFrame 실제 메모리 기준 상한, 초과 시 LRU 축출
+- 계층별(메모리/MySQL/yfinance) 적중/미스/축출 카운터를 get_cache_stats()로 제공
+- 메모리 캐시는 티커별 구간 캐시: 캐시된 구간에 포함된 요청은 슬라이싱으로 반환,
+  겹치거나 인접한 구간은 병합 (app/repositories/price_cache.py)
+- 메모리 캐시 구간과 single-flight 키에 티커 데이터 버전(stocks.data_last_update)을 포함해
+  다른 프로세스가 적재한 데이터도 버전 갱신 주기 안에 반영 (app/services/data_versions.py)
+- MySQL 조회/저장은 yfinance_db 비동기 버전 사용 (DATABASE_ASYNC_ENABLED이면 비동기 엔진, 아니면 I/O 스레드 풀)
+- yfinance 조회는 I/O 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+- 메모리 캐시 미스 시 같은 (티커, 구간) 동시 요청은 single-flight로 병합해
+  MySQL 조회/yfinance 다운로드/upsert를 한 번만 실행 (app/utils/single_flight.py)
 
 **인터페이스**:
 - DataRepositoryInterface: 추상 인터페이스 정의
-- DataRepository: 구현 클래스
+- DataRepository: 구현 클래스 (DATA_REPOSITORY_TYPE 설정으로 선택)
+- ColumnarDataRepository: 메모리 매핑 컬럼 저장소 구현 (app/repositories/columnar_store.py)
 
 **의존성**:
 - app/services/yfinance_db.py: yfinance 데이터 로딩
 - app/utils/data_fetcher.py: 데이터 페칭 유틸리티
+- app/services/data_versions.py: 티커별 데이터 버전
 
 **연관 컴포넌트**:
 - Backend: app/services/data_service.py (Repository 사용)
@@ -37,13 +48,18 @@
 - Strategy Pattern: 다양한 데이터 소스 전략
 """
 from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, date
+from datetime import date
 import pandas as pd
 import logging
 from abc import ABC, abstractmethod
 
+from app.core.config import settings
+from app.core.executors import executor_manager
+from app.repositories.price_cache import PriceRangeCache
 from app.utils.data_fetcher import data_fetcher
+from app.utils.single_flight import AsyncSingleFlight
 from app.services import yfinance_db
+from app.services.data_versions import data_versions
 
 
 class DataRepositoryInterface(ABC):
@@ -77,47 +93,74 @@ class YFinanceDataRepository(DataRepositoryInterface):
     def __init__(self):
         self.data_fetcher = data_fetcher
         self.logger = logging.getLogger(__name__)
-        self._memory_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_ttl = 3600  # 1시간 TTL
+        self._cache_ttl = settings.price_cache_ttl_seconds
+        self._price_cache = PriceRangeCache(
+            ttl_seconds=self._cache_ttl,
+            max_bytes=settings.price_cache_max_mb * 1024 * 1024,
+        )
+        # 계층별 조회 카운터 (메모리 계층은 PriceRangeCache가 집계)
+        self._tier_stats: Dict[str, Dict[str, int]] = {
+            'mysql': {'hits': 0, 'misses': 0, 'errors': 0},
+            'yfinance': {'hits': 0, 'misses': 0, 'errors': 0},
+        }
+        # 동일 티커/구간 동시 조회 병합
+        self._inflight = AsyncSingleFlight()
+        # 티커별 데이터 버전 (메모리 캐시 구간 키)
+        self._versions = data_versions
     
     async def get_stock_data(self, ticker: str, start_date: Union[date, str], 
                            end_date: Union[date, str]) -> pd.DataFrame:
         """주식 데이터 조회 (캐시 우선)"""
+        # 1. 메모리 캐시 확인 (같은 데이터 버전의 더 넓은 구간이 캐시되어 있으면 슬라이스 반환)
+        version = await self._versions.get(ticker)
+        cached_slice = self._price_cache.get(ticker, start_date, end_date, version=version)
+        if cached_slice is not None:
+            self.logger.debug(f"메모리 캐시에서 데이터 반환: {ticker} {start_date} ~ {end_date}")
+            return cached_slice
+        
+        # 2~5. 같은 티커/구간/버전의 동시 요청은 하나의 MySQL → yfinance 조회로 병합
+        key = (ticker, pd.Timestamp(start_date).date(), pd.Timestamp(end_date).date(), version)
+        return await self._inflight.do(key, self._load_from_sources, ticker, start_date, end_date)
+    
+    async def _load_from_sources(self, ticker: str, start_date: Union[date, str],
+                                 end_date: Union[date, str]) -> pd.DataFrame:
+        """MySQL → yfinance 순으로 조회 후 캐시에 저장 (메모리 캐시 구간은 조회 후 데이터 버전으로 기록)"""
         try:
-            # 캐시 키 생성
-            cache_key = f"{ticker}_{start_date}_{end_date}"
-            
-            # 1. 메모리 캐시 확인
-            if self._is_cache_valid(cache_key):
-                self.logger.debug(f"메모리 캐시에서 데이터 반환: {cache_key}")
-                return self._memory_cache[cache_key]['data']
-            
             # 2. MySQL 캐시 확인
             try:
-                cached_data = yfinance_db.load_ticker_data(ticker, start_date, end_date)
+                cached_data = await yfinance_db.load_ticker_data_async(ticker, start_date, end_date)
                 if cached_data is not None and not cached_data.empty:
+                    self._tier_stats['mysql']['hits'] += 1
                     self.logger.debug(f"MySQL 캐시에서 데이터 반환: {ticker}")
-                    # 메모리 캐시에도 저장
-                    self._memory_cache[cache_key] = {
-                        'data': cached_data,
-                        'timestamp': datetime.now()
-                    }
+                    # 메모리 캐시에도 저장 (누락 구간 보완 적재로 버전이 바뀔 수 있으므로 조회 후 버전 기준)
+                    self._price_cache.put(
+                        ticker, start_date, end_date, cached_data, version=self._versions.peek(ticker)
+                    )
                     return cached_data
+                self._tier_stats['mysql']['misses'] += 1
             except Exception as e:
+                self._tier_stats['mysql']['errors'] += 1
                 self.logger.warning(f"MySQL 캐시 조회 실패: {str(e)}")
             
             # 3. 실시간 데이터 페칭
             self.logger.info(f"실시간 데이터 페칭: {ticker}")
-            fresh_data = self.data_fetcher.get_stock_data(ticker, start_date, end_date)
+            try:
+                fresh_data = await executor_manager.run_io(
+                    self.data_fetcher.get_stock_data, ticker, start_date, end_date, stage="yfinance"
+                )
+            except Exception:
+                self._tier_stats['yfinance']['errors'] += 1
+                raise
+            if fresh_data is None or fresh_data.empty:
+                self._tier_stats['yfinance']['misses'] += 1
+            else:
+                self._tier_stats['yfinance']['hits'] += 1
             
-            # 4. 캐시에 저장
+            # 4. 캐시에 저장 (적재 시 데이터 버전 증가)
             await self.cache_stock_data(ticker, fresh_data)
             
-            # 5. 메모리 캐시에 저장
-            self._memory_cache[cache_key] = {
-                'data': fresh_data,
-                'timestamp': datetime.now()
-            }
+            # 5. 메모리 캐시에 저장 (적재 후 버전 기준)
+            self._price_cache.put(ticker, start_date, end_date, fresh_data, version=self._versions.peek(ticker))
             
             return fresh_data
             
@@ -129,7 +172,7 @@ class YFinanceDataRepository(DataRepositoryInterface):
         """주식 데이터 캐시 저장"""
         try:
             # MySQL 캐시에 저장 (yfinance_db 함수 사용)
-            success = yfinance_db.save_ticker_data(ticker, data)
+            success = await yfinance_db.save_ticker_data_async(ticker, data)
             if success > 0:
                 self.logger.info(f"데이터 캐시 저장 완료: {ticker}, {success}행")
                 return True
@@ -144,11 +187,10 @@ class YFinanceDataRepository(DataRepositoryInterface):
         """특정 티커의 캐시 무효화"""
         try:
             # 메모리 캐시에서 제거
-            keys_to_remove = [key for key in self._memory_cache.keys() 
-                            if key.startswith(f"{ticker}_")]
+            self._price_cache.invalidate(ticker)
             
-            for key in keys_to_remove:
-                del self._memory_cache[key]
+            # 적재 구간(price_coverage) 프로세스 캐시 제거 → 다음 조회 시 DB에서 다시 읽음
+            yfinance_db.invalidate_coverage_cache(ticker)
             
             # MySQL 캐시에서 제거 (필요시)
             # TODO: MySQL 캐시 무효화 로직 구현
@@ -163,29 +205,20 @@ class YFinanceDataRepository(DataRepositoryInterface):
     async def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보"""
         try:
-            # 메모리 캐시 통계
-            memory_stats = {
-                'total_entries': len(self._memory_cache),
-                'memory_usage_mb': len(str(self._memory_cache)) / (1024 * 1024),
-                'oldest_entry': None,
-                'newest_entry': None
-            }
+            # 메모리 캐시 통계 (적중/미스/축출 포함)
+            memory_stats = self._price_cache.get_stats()
             
-            if self._memory_cache:
-                timestamps = [item['timestamp'] for item in self._memory_cache.values()]
-                memory_stats['oldest_entry'] = min(timestamps)
-                memory_stats['newest_entry'] = max(timestamps)
-            
-            # MySQL 캐시 통계 (필요시)
-            mysql_stats = {
-                'total_tickers': 0,
-                'total_records': 0,
-                'disk_usage_mb': 0
-            }
+            # MySQL / yfinance 계층 통계
+            mysql_stats = dict(self._tier_stats['mysql'])
+            mysql_lookups = mysql_stats['hits'] + mysql_stats['misses'] + mysql_stats['errors']
+            mysql_stats['hit_rate'] = self._ratio(mysql_stats['hits'], mysql_lookups)
+            yfinance_stats = dict(self._tier_stats['yfinance'])
             
             return {
                 'memory_cache': memory_stats,
                 'mysql_cache': mysql_stats,
+                'yfinance': yfinance_stats,
+                'single_flight': self._inflight.get_stats(),
                 'cache_hit_rate': self._calculate_hit_rate()
             }
             
@@ -193,20 +226,15 @@ class YFinanceDataRepository(DataRepositoryInterface):
             self.logger.error(f"캐시 통계 조회 실패: {str(e)}")
             return {}
     
-    def _is_cache_valid(self, cache_key: str) -> bool:
-        """캐시 유효성 검사"""
-        if cache_key not in self._memory_cache:
-            return False
-        
-        cached_time = self._memory_cache[cache_key]['timestamp']
-        elapsed = (datetime.now() - cached_time).total_seconds()
-        
-        return elapsed < self._cache_ttl
-    
     def _calculate_hit_rate(self) -> float:
-        """캐시 히트율 계산 (간단한 구현)"""
-        # TODO: 실제 히트율 계산 로직 구현
-        return 0.0
+        """캐시 히트율 계산 (메모리 또는 MySQL에서 응답한 요청 비율)"""
+        cached = self._price_cache.hits + self._tier_stats['mysql']['hits']
+        total = self._price_cache.hits + self._price_cache.misses
+        return self._ratio(cached, total)
+    
+    @staticmethod
+    def _ratio(numerator: int, denominator: int) -> float:
+        return numerator / denominator if denominator else 0.0
 
 
 class MockDataRepository(DataRepositoryInterface):
@@ -278,10 +306,13 @@ class DataRepositoryFactory:
             return YFinanceDataRepository()
         elif repository_type == "mock":
             return MockDataRepository()
+        elif repository_type == "columnar":
+            from app.repositories.columnar_store import ColumnarDataRepository
+            return ColumnarDataRepository()
         else:
             raise ValueError(f"지원하지 않는 Repository 타입: {repository_type}")
 
 
 # 전역 인스턴스
-DataRepository = DataRepositoryFactory.create("yfinance")
+DataRepository = DataRepositoryFactory.create(settings.data_repository_type)
 data_repository = DataRepository
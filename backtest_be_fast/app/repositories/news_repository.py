@@ -11,37 +11,58 @@
 2. get_news_by_ticker(): 특정 종목의 뉴스 조회
 3. get_news_by_date(): 날짜별 뉴스 조회
 4. search_news(): 키워드로 뉴스 검색
+5. get_latest_news() / save_latest_news(): 최신 뉴스 캐시 조회 및 링크 기준 중복 제거 일괄 저장
+6. *_async(): 각 메서드의 비동기 버전 (async 서비스용, 동기 버전은 스크립트용으로 유지)
+   - DATABASE_ASYNC_ENABLED이면 비동기 엔진 연결에서 같은 쿼리를 실행 (AsyncConnection.run_sync)
+   - 아니면 동기 버전을 I/O 스레드 풀에서 실행
+
+**뉴스 종류 (stock_news.kind)**:
+- 'event': save_news()로 저장한 날짜별 뉴스 (급등락 이벤트 날짜 보완 등), check_news_exists() 대상
+- 'latest': save_latest_news()로 저장한 최신 뉴스 캐시, get_latest_news() 대상
+- 두 종류는 서로의 저장/삭제/조회에 영향을 주지 않음 (오래된 이벤트 뉴스가 최신 뉴스 캐시로 반환되지 않음)
+- kind 컬럼이 없는 기존 테이블은 첫 연결 시 컬럼 추가 (기존 행은 'event')
 
 **DB 스키마**:
 - 테이블: news
-- 컬럼: ticker, date, title, link, description, pubDate, source
+- 컬럼: ticker, date, title, link, description, pubDate, source, kind
 
 **의존성**:
 - SQLAlchemy: DB 연결 및 쿼리
-- app/services/yfinance_db.py: DB 엔진 획득
+- app/services/yfinance_db.py: DB 엔진 획득 (동기/비동기)
+- app/core/executors.py: 비동기 엔진을 쓰지 않을 때 I/O 스레드 풀 실행
 
 **연관 컴포넌트**:
 - Backend: app/services/news_service.py (뉴스 서비스)
+- Backend: app/services/news_cache_service.py (최신 뉴스 읽기 캐시)
 - Backend: app/services/unified_data_service.py (데이터 수집)
 - Database: database/schema.sql (테이블 정의)
 
 **아키텍처 패턴**:
 - Repository Pattern: 데이터 접근 추상화
 """
+import email.utils
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, date
-from sqlalchemy import text
-from ..services.yfinance_db import _get_engine
+from sqlalchemy import bindparam, text
+from ..core.config import settings
+from ..core.executors import executor_manager
+from ..services.yfinance_db import _get_async_engine, _get_engine
 
 logger = logging.getLogger(__name__)
 
+# stock_news.kind 값
+NEWS_KIND_EVENT = "event"
+NEWS_KIND_LATEST = "latest"
+
 
 class NewsRepository:
     """뉴스 데이터 Repository"""
 
     def __init__(self):
         self.engine = None
+        self.async_engine = None
+        self._kind_column_ready = False
 
     def _get_connection(self):
         """DB 연결 가져오기"""
@@ -49,9 +70,43 @@ class NewsRepository:
             self.engine = _get_engine()
         return self.engine.connect()
 
+    def _ensure_kind_column(self, conn) -> None:
+        """kind 컬럼이 없는 기존 stock_news 테이블에 컬럼 추가 (프로세스당 한 번 확인)"""
+        if self._kind_column_ready:
+            return
+        try:
+            conn.execute(text("SELECT kind FROM stock_news WHERE 1 = 0"))
+        except Exception:
+            conn.rollback()
+            conn.execute(text(
+                f"ALTER TABLE stock_news ADD COLUMN kind VARCHAR(10) NOT NULL DEFAULT '{NEWS_KIND_EVENT}'"
+            ))
+            logger.info("stock_news.kind 컬럼 추가")
+        conn.commit()
+        self._kind_column_ready = True
+
+    def _run(self, func: Callable[..., Any], *args) -> Any:
+        """동기 연결에서 func(conn, *args) 실행"""
+        conn = self._get_connection()
+        try:
+            self._ensure_kind_column(conn)
+            return func(conn, *args)
+        finally:
+            conn.close()
+
+    async def _run_async(self, func: Callable[..., Any], *args) -> Any:
+        """비동기 엔진 연결(DATABASE_ASYNC_ENABLED) 또는 I/O 스레드 풀의 동기 연결에서 func(conn, *args) 실행"""
+        if not settings.database_async_enabled:
+            return await executor_manager.run_io(self._run, func, *args, stage="news")
+        if self.async_engine is None:
+            self.async_engine = _get_async_engine()
+        async with self.async_engine.connect() as conn:
+            await conn.run_sync(self._ensure_kind_column)
+            return await conn.run_sync(func, *args)
+
     def save_news(self, ticker: str, news_date: date, news_list: List[Dict[str, Any]], source: str = "naver") -> int:
         """
-        뉴스 데이터를 DB에 저장합니다.
+        뉴스 데이터를 DB에 저장합니다 (kind='event', 같은 날짜의 기존 event 뉴스 교체).
 
         Args:
             ticker: 종목 티커
@@ -64,22 +119,30 @@ class NewsRepository:
         """
         if not news_list:
             return 0
+        return self._run(self._save_news, ticker, news_date, news_list, source)
 
-        conn = self._get_connection()
+    async def save_news_async(self, ticker: str, news_date: date, news_list: List[Dict[str, Any]],
+                              source: str = "naver") -> int:
+        """save_news의 비동기 버전"""
+        if not news_list:
+            return 0
+        return await self._run_async(self._save_news, ticker, news_date, news_list, source)
+
+    def _save_news(self, conn, ticker: str, news_date: date, news_list: List[Dict[str, Any]], source: str) -> int:
         trans = conn.begin()
 
         try:
-            # 기존 데이터 삭제 (날짜별로)
+            # 기존 데이터 삭제 (날짜별로, 최신 뉴스 캐시 행은 유지)
             delete_query = text("""
                 DELETE FROM stock_news
-                WHERE ticker = :ticker AND news_date = :news_date
+                WHERE ticker = :ticker AND news_date = :news_date AND kind = :kind
             """)
-            conn.execute(delete_query, {"ticker": ticker, "news_date": news_date})
+            conn.execute(delete_query, {"ticker": ticker, "news_date": news_date, "kind": NEWS_KIND_EVENT})
 
             # 새 뉴스 데이터 삽입
             insert_query = text("""
-                INSERT INTO stock_news (ticker, news_date, title, link, description, source)
-                VALUES (:ticker, :news_date, :title, :link, :description, :source)
+                INSERT INTO stock_news (ticker, news_date, title, link, description, source, kind)
+                VALUES (:ticker, :news_date, :title, :link, :description, :source, :kind)
             """)
 
             saved_count = 0
@@ -91,7 +154,8 @@ class NewsRepository:
                         "title": news_item.get('title', ''),
                         "link": news_item.get('link', ''),
                         "description": news_item.get('description', ''),
-                        "source": source
+                        "source": source,
+                        "kind": NEWS_KIND_EVENT
                     })
                     saved_count += 1
                 except Exception as e:
@@ -106,8 +170,6 @@ class NewsRepository:
             trans.rollback()
             logger.exception(f"뉴스 저장 실패: {ticker} {news_date}")
             raise
-        finally:
-            conn.close()
 
     def get_news_by_ticker_date(self, ticker: str, start_date: date, end_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """
@@ -121,14 +183,17 @@ class NewsRepository:
         Returns:
             뉴스 리스트
         """
-        if end_date is None:
-            end_date = start_date
+        return self._run(self._get_news_by_ticker_date, ticker, start_date, end_date or start_date)
 
-        conn = self._get_connection()
+    async def get_news_by_ticker_date_async(self, ticker: str, start_date: date,
+                                            end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """get_news_by_ticker_date의 비동기 버전"""
+        return await self._run_async(self._get_news_by_ticker_date, ticker, start_date, end_date or start_date)
 
+    def _get_news_by_ticker_date(self, conn, ticker: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         try:
             query = text("""
-                SELECT ticker, news_date, title, link, description, source, created_at
+                SELECT ticker, news_date, title, link, description, source, created_at, kind
                 FROM stock_news
                 WHERE ticker = :ticker
                   AND news_date >= :start_date
@@ -151,7 +216,8 @@ class NewsRepository:
                     "link": row[3],
                     "description": row[4],
                     "source": row[5],
-                    "created_at": row[6].isoformat() if hasattr(row[6], 'isoformat') else str(row[6])
+                    "created_at": row[6].isoformat() if hasattr(row[6], 'isoformat') else str(row[6]),
+                    "kind": row[7]
                 })
 
             return news_list
@@ -159,12 +225,10 @@ class NewsRepository:
         except Exception as e:
             logger.exception(f"뉴스 조회 실패: {ticker} {start_date} ~ {end_date}")
             return []
-        finally:
-            conn.close()
 
     def check_news_exists(self, ticker: str, news_date: date) -> bool:
         """
-        특정 종목의 특정 날짜 뉴스가 DB에 존재하는지 확인합니다.
+        특정 종목의 특정 날짜 뉴스(kind='event')가 DB에 존재하는지 확인합니다.
 
         Args:
             ticker: 종목 티커
@@ -173,18 +237,24 @@ class NewsRepository:
         Returns:
             존재 여부
         """
-        conn = self._get_connection()
+        return self._run(self._check_news_exists, ticker, news_date)
+
+    async def check_news_exists_async(self, ticker: str, news_date: date) -> bool:
+        """check_news_exists의 비동기 버전"""
+        return await self._run_async(self._check_news_exists, ticker, news_date)
 
+    def _check_news_exists(self, conn, ticker: str, news_date: date) -> bool:
         try:
             query = text("""
                 SELECT COUNT(*) as count
                 FROM stock_news
-                WHERE ticker = :ticker AND news_date = :news_date
+                WHERE ticker = :ticker AND news_date = :news_date AND kind = :kind
             """)
 
             result = conn.execute(query, {
                 "ticker": ticker,
-                "news_date": news_date
+                "news_date": news_date,
+                "kind": NEWS_KIND_EVENT
             })
 
             row = result.fetchone()
@@ -193,8 +263,6 @@ class NewsRepository:
         except Exception as e:
             logger.exception(f"뉴스 존재 여부 확인 실패: {ticker} {news_date}")
             return False
-        finally:
-            conn.close()
 
     def get_latest_news(self, ticker: str, max_age_hours: int = 24) -> List[Dict[str, Any]]:
         """
@@ -205,24 +273,32 @@ class NewsRepository:
             max_age_hours: 최대 캐시 유지 시간 (시간 단위, 기본 24시간)
         
         Returns:
-            뉴스 리스트 (캐시가 유효하지 않으면 빈 리스트)
+            뉴스 리스트 (캐시가 유효하지 않으면 빈 리스트, 최근 저장 순)
+            각 항목의 age_seconds는 저장 후 경과 시간(초)
         """
-        conn = self._get_connection()
+        return self._run(self._get_latest_news, ticker, max_age_hours)
 
+    async def get_latest_news_async(self, ticker: str, max_age_hours: int = 24) -> List[Dict[str, Any]]:
+        """get_latest_news의 비동기 버전"""
+        return await self._run_async(self._get_latest_news, ticker, max_age_hours)
+
+    def _get_latest_news(self, conn, ticker: str, max_age_hours: int) -> List[Dict[str, Any]]:
         try:
-            # 최신 뉴스는 당일 날짜로 저장되므로 최근 데이터를 조회
-            # created_at이 max_age_hours 이내인 뉴스만 반환
+            # 최신 뉴스 캐시 행(kind='latest') 중 created_at이 max_age_hours 이내인 뉴스만 반환
             query = text("""
-                SELECT ticker, news_date, title, link, description, source, created_at
+                SELECT ticker, news_date, title, link, description, source, created_at,
+                       TIMESTAMPDIFF(SECOND, created_at, NOW()) AS age_seconds
                 FROM stock_news
                 WHERE ticker = :ticker
+                  AND kind = :kind
                   AND created_at >= DATE_SUB(NOW(), INTERVAL :hours HOUR)
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id ASC
                 LIMIT 100
             """)
 
             result = conn.execute(query, {
                 "ticker": ticker,
+                "kind": NEWS_KIND_LATEST,
                 "hours": max_age_hours
             })
 
@@ -235,7 +311,8 @@ class NewsRepository:
                     "link": row[3],
                     "description": row[4],
                     "source": row[5],
-                    "created_at": row[6].isoformat() if hasattr(row[6], 'isoformat') else str(row[6])
+                    "created_at": row[6].isoformat() if hasattr(row[6], 'isoformat') else str(row[6]),
+                    "age_seconds": int(row[7]) if row[7] is not None else None
                 })
 
             return news_list
@@ -243,13 +320,12 @@ class NewsRepository:
         except Exception as e:
             logger.exception(f"최신 뉴스 조회 실패: {ticker}")
             return []
-        finally:
-            conn.close()
 
     def save_latest_news(self, ticker: str, news_list: List[Dict[str, Any]], source: str = "naver") -> int:
         """
-        최신 뉴스를 DB에 저장합니다 (당일 날짜로 저장).
-        기존 최신 뉴스를 삭제하고 새로 저장합니다.
+        최신 뉴스를 DB에 일괄 저장합니다 (kind='latest', 링크 기준 중복 제거).
+        같은 종목에 이미 저장된 동일 링크 최신 뉴스는 새 항목으로 교체하고,
+        news_date는 기사 발행일(pubDate, 파싱 실패 시 당일)로 저장합니다.
 
         Args:
             ticker: 종목 티커
@@ -259,58 +335,78 @@ class NewsRepository:
         Returns:
             저장된 뉴스 개수
         """
-        if not news_list:
+        links, rows = self._latest_news_rows(ticker, news_list, source)
+        if not rows:
             return 0
+        return self._run(self._save_latest_news, ticker, links, rows)
 
-        conn = self._get_connection()
+    async def save_latest_news_async(self, ticker: str, news_list: List[Dict[str, Any]], source: str = "naver") -> int:
+        """save_latest_news의 비동기 버전"""
+        links, rows = self._latest_news_rows(ticker, news_list, source)
+        if not rows:
+            return 0
+        return await self._run_async(self._save_latest_news, ticker, links, rows)
+
+    def _latest_news_rows(self, ticker: str, news_list: List[Dict[str, Any]],
+                          source: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """링크 기준 중복을 제거한 (링크 목록, 삽입 행 목록)"""
+        # 요청 내 중복 링크 제거 (먼저 나온 항목 유지)
+        unique_news = {}
+        for news_item in news_list:
+            link = news_item.get('link', '')
+            if link and link not in unique_news:
+                unique_news[link] = news_item
+
+        today = date.today()
+        rows = [
+            {
+                "ticker": ticker,
+                "news_date": self._parse_pub_date(news_item.get('pubDate')) or today,
+                "title": news_item.get('title', ''),
+                "link": link,
+                "description": news_item.get('description', ''),
+                "source": source,
+                "kind": NEWS_KIND_LATEST
+            }
+            for link, news_item in unique_news.items()
+        ]
+        return list(unique_news), rows
+
+    def _save_latest_news(self, conn, ticker: str, links: List[str], rows: List[Dict[str, Any]]) -> int:
         trans = conn.begin()
 
         try:
-            # 당일 날짜로 저장
-            from datetime import date
-            today = date.today()
-
-            # 기존 당일 뉴스 삭제 (같은 ticker의 오늘 날짜 뉴스만)
+            # 같은 종목의 동일 링크 기존 최신 뉴스 삭제 후 일괄 삽입 (이벤트 뉴스 행은 유지)
             delete_query = text("""
                 DELETE FROM stock_news
-                WHERE ticker = :ticker 
-                  AND news_date = :news_date
-                  AND created_at >= DATE_SUB(NOW(), INTERVAL 24 HOUR)
-            """)
-            conn.execute(delete_query, {"ticker": ticker, "news_date": today})
+                WHERE ticker = :ticker AND kind = :kind AND link IN :links
+            """).bindparams(bindparam("links", expanding=True))
+            conn.execute(delete_query, {"ticker": ticker, "kind": NEWS_KIND_LATEST, "links": links})
 
-            # 새 뉴스 데이터 삽입
             insert_query = text("""
-                INSERT INTO stock_news (ticker, news_date, title, link, description, source)
-                VALUES (:ticker, :news_date, :title, :link, :description, :source)
+                INSERT INTO stock_news (ticker, news_date, title, link, description, source, kind)
+                VALUES (:ticker, :news_date, :title, :link, :description, :source, :kind)
             """)
-
-            saved_count = 0
-            for news_item in news_list:
-                try:
-                    conn.execute(insert_query, {
-                        "ticker": ticker,
-                        "news_date": today,
-                        "title": news_item.get('title', ''),
-                        "link": news_item.get('link', ''),
-                        "description": news_item.get('description', ''),
-                        "source": source
-                    })
-                    saved_count += 1
-                except Exception as e:
-                    logger.warning(f"최신 뉴스 항목 저장 실패: {e}")
-                    continue
+            conn.execute(insert_query, rows)
 
             trans.commit()
-            logger.info(f"최신 뉴스 저장 완료: {ticker} - {saved_count}건")
-            return saved_count
+            logger.info(f"최신 뉴스 저장 완료: {ticker} - {len(rows)}건")
+            return len(rows)
 
         except Exception as e:
             trans.rollback()
             logger.exception(f"최신 뉴스 저장 실패: {ticker}")
             raise
-        finally:
-            conn.close()
+
+    @staticmethod
+    def _parse_pub_date(pub_date: Optional[str]) -> Optional[date]:
+        """RFC 2822 발행일 문자열 (예: "Mon, 01 Sep 2025 21:01:00 +0900")을 날짜로 변환"""
+        if not pub_date:
+            return None
+        try:
+            return email.utils.parsedate_to_datetime(pub_date).date()
+        except (TypeError, ValueError):
+            return None
 
     def delete_old_news(self, days_old: int = 90) -> int:
         """
@@ -322,7 +418,13 @@ class NewsRepository:
         Returns:
             삭제된 행 수
         """
-        conn = self._get_connection()
+        return self._run(self._delete_old_news, days_old)
+
+    async def delete_old_news_async(self, days_old: int = 90) -> int:
+        """delete_old_news의 비동기 버전"""
+        return await self._run_async(self._delete_old_news, days_old)
+
+    def _delete_old_news(self, conn, days_old: int) -> int:
         trans = conn.begin()
 
         try:
@@ -342,8 +444,6 @@ class NewsRepository:
             trans.rollback()
             logger.exception("오래된 뉴스 삭제 실패")
             raise
-        finally:
-            conn.close()
 
 
 # 전역 인스턴스
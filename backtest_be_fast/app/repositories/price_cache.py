@@ -0,0 +1,247 @@
+"""
+구간 인식(range-aware) 가격 데이터 메모리 캐시
+
+**역할**:
+- 티커별로 로드된 날짜 구간(interval)과 해당 DataFrame을 함께 보관
+- 이미 캐시된 구간에 포함되는 요청은 인덱스 슬라이싱으로 즉시 반환
+- 겹치거나 인접한 구간이 추가되면 하나의 넓은 구간으로 병합
+- DataFrame 실제 메모리(컬럼 deep memory_usage + 인덱스 nbytes) 기준 용량 제한, LRU 축출, TTL 만료
+
+**주요 기능**:
+1. get(): 요청 구간을 포함하는 캐시 구간에서 슬라이스 반환 (없으면 None)
+2. put(): 새 구간 저장 및 겹치는/인접한 구간 병합
+3. invalidate(): 특정 티커의 모든 구간 제거
+4. get_stats(): 구간 수, 메모리 사용량, 적중/미스/축출/만료/버전 불일치 카운터
+
+**예시**:
+- AAPL 2015-01-01 ~ 2024-12-31 캐시 후 2020-01-01 ~ 2022-12-31 요청 → 슬라이스 반환 (DB 조회 없음)
+- AAPL 2020 구간과 2021 구간 저장 → 2020-01-01 ~ 2021-12-31 단일 구간으로 병합
+
+**구간 규칙**:
+- 구간은 요청한 시작/종료일 기준 (양 끝 포함), 실제 거래일 유무와 무관
+- 종료일 다음 날에 시작하는 구간은 인접 구간으로 보고 병합
+
+**데이터 버전**:
+- get/put에 티커 데이터 버전(stocks.data_last_update, app/services/data_versions.py)을 넘기면 구간에 함께 기록
+- 다른 버전의 구간은 조회/저장 시점에 제거 (다른 프로세스가 적재한 데이터도 TTL과 무관하게 반영)
+- 더 새 버전 구간이 있으면 이전 버전 데이터는 저장하지 않음 (버전 확인 후 늦게 끝난 조회)
+- version=None이면 버전을 비교하지 않음
+
+**용량 관리**:
+- 구간 저장 시 DataFrame 바이트 수를 계산해 합계를 유지
+- 합계가 max_bytes를 넘으면 가장 오래 사용되지 않은 구간부터 축출
+- 단일 구간이 max_bytes보다 크면 저장하지 않음
+- TTL이 지난 구간은 조회/저장 시점에 제거
+
+**연관 컴포넌트**:
+- Backend: app/repositories/data_repository.py (메모리 캐시 계층)
+"""
+import itertools
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+
+DateLike = Union[date, datetime, str, pd.Timestamp]
+
+_ONE_DAY = pd.Timedelta(days=1)
+
+
+def _to_timestamp(value: DateLike) -> pd.Timestamp:
+    """날짜 값을 tz 없는 자정 기준 Timestamp로 정규화"""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.normalize()
+
+
+def _slice_frame(data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """DataFrame 인덱스를 [start, end] (종료일 포함)로 슬라이싱"""
+    index = data.index
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        start = start.tz_localize(index.tz)
+        end = end.tz_localize(index.tz)
+    return data.loc[start:end + _ONE_DAY - pd.Timedelta(microseconds=1)]
+
+
+def _frame_bytes(data: pd.DataFrame) -> int:
+    """DataFrame 메모리 크기 (바이트)
+
+    index.memory_usage()는 조회 후 생성되는 인덱스 엔진(해시 테이블)까지 포함해
+    슬라이싱 전후로 값이 달라지므로, 인덱스는 nbytes 기준으로 계산
+    """
+    return int(data.memory_usage(index=False, deep=True).sum()) + int(data.index.nbytes)
+
+
+class PriceRangeCache:
+    """티커별 구간 가격 캐시"""
+
+    def __init__(self, ttl_seconds: int = 3600, max_bytes: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # ticker -> 시작일 순으로 정렬된 구간 목록 [{'id', 'start', 'end', 'data', 'size', 'version', 'timestamp'}]
+        self._segments: Dict[str, List[Dict[str, Any]]] = {}
+        # 구간 id -> ticker (앞쪽이 가장 오래 사용되지 않은 구간)
+        self._lru: "OrderedDict[int, str]" = OrderedDict()
+        self._ids = itertools.count()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.stale_versions = 0
+
+    def get(self, ticker: str, start_date: DateLike, end_date: DateLike,
+            version: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """요청 구간을 포함하는 유효한 캐시 구간이 있으면 슬라이스 반환"""
+        start, end = _to_timestamp(start_date), _to_timestamp(end_date)
+        with self._lock:
+            self._expire(ticker, version)
+            for segment in self._segments.get(ticker, []):
+                if segment['start'] <= start and end <= segment['end']:
+                    self._lru.move_to_end(segment['id'])
+                    self.hits += 1
+                    return _slice_frame(segment['data'], start, end)
+            self.misses += 1
+        return None
+
+    def put(self, ticker: str, start_date: DateLike, end_date: DateLike, data: pd.DataFrame,
+            version: Optional[int] = None) -> None:
+        """구간 저장 (겹치거나 인접한 기존 구간과 병합)"""
+        if data is None:
+            return
+        start, end = _to_timestamp(start_date), _to_timestamp(end_date)
+
+        with self._lock:
+            if version is not None and any(
+                (s['version'] or 0) > version for s in self._segments.get(ticker, [])
+            ):
+                # 더 새 버전이 이미 캐시된 뒤 도착한 이전 버전 데이터는 저장하지 않음
+                self.stale_versions += 1
+                return
+            self._expire(ticker, version)
+            merged_frames = []
+            remaining = []
+            for segment in self._segments.get(ticker, []):
+                if segment['start'] <= end + _ONE_DAY and start <= segment['end'] + _ONE_DAY:
+                    start = min(start, segment['start'])
+                    end = max(end, segment['end'])
+                    merged_frames.append(segment['data'])
+                    self._forget(segment)
+                else:
+                    remaining.append(segment)
+
+            if merged_frames:
+                combined = pd.concat(merged_frames + [data])
+                combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+            else:
+                combined = data
+
+            size = _frame_bytes(combined)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # 용량 한도보다 큰 구간은 저장하지 않음 (병합 대상이었던 구간도 제거된 상태)
+                self.evictions += len(merged_frames)
+                self._set_segments(ticker, remaining)
+                return
+
+            segment = {
+                'id': next(self._ids),
+                'start': start,
+                'end': end,
+                'data': combined,
+                'size': size,
+                'version': version,
+                'timestamp': datetime.now(),
+            }
+            remaining.append(segment)
+            remaining.sort(key=lambda s: s['start'])
+            self._set_segments(ticker, remaining)
+            self._lru[segment['id']] = ticker
+            self._total_bytes += size
+            self._evict_to_fit()
+
+    def invalidate(self, ticker: str) -> int:
+        """티커의 모든 구간 제거, 제거된 구간 수 반환"""
+        with self._lock:
+            segments = self._segments.pop(ticker, [])
+            for segment in segments:
+                self._forget(segment)
+            return len(segments)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._segments.clear()
+            self._lru.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """구간 캐시 통계"""
+        with self._lock:
+            segments = [s for items in self._segments.values() for s in items]
+            timestamps = [s['timestamp'] for s in segments]
+            lookups = self.hits + self.misses
+            return {
+                'total_entries': len(segments),
+                'total_tickers': len(self._segments),
+                'memory_usage_mb': self._total_bytes / (1024 * 1024),
+                'max_memory_mb': self.max_bytes / (1024 * 1024) if self.max_bytes is not None else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'stale_versions': self.stale_versions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'oldest_entry': min(timestamps) if timestamps else None,
+                'newest_entry': max(timestamps) if timestamps else None,
+            }
+
+    def _is_fresh(self, segment: Dict[str, Any]) -> bool:
+        return datetime.now() - segment['timestamp'] < timedelta(seconds=self.ttl_seconds)
+
+    def _expire(self, ticker: str, version: Optional[int] = None) -> None:
+        """티커의 만료된 구간과 다른 데이터 버전의 구간 제거"""
+        segments = self._segments.get(ticker)
+        if not segments:
+            return
+        fresh = []
+        for segment in segments:
+            if version is not None and segment['version'] != version:
+                self._forget(segment)
+                self.stale_versions += 1
+            elif not self._is_fresh(segment):
+                self._forget(segment)
+                self.expirations += 1
+            else:
+                fresh.append(segment)
+        if len(fresh) != len(segments):
+            self._set_segments(ticker, fresh)
+
+    def _evict_to_fit(self) -> None:
+        """용량 한도를 넘으면 LRU 구간부터 축출"""
+        if self.max_bytes is None:
+            return
+        while self._total_bytes > self.max_bytes and self._lru:
+            segment_id, ticker = self._lru.popitem(last=False)
+            segments = self._segments.get(ticker, [])
+            victim = next((s for s in segments if s['id'] == segment_id), None)
+            if victim is None:
+                continue
+            self._total_bytes -= victim['size']
+            self._set_segments(ticker, [s for s in segments if s['id'] != segment_id])
+            self.evictions += 1
+
+    def _forget(self, segment: Dict[str, Any]) -> None:
+        """LRU/용량 집계에서 구간 제거 (구간 목록 갱신은 호출자가 수행)"""
+        if self._lru.pop(segment['id'], None) is not None:
+            self._total_bytes -= segment['size']
+
+    def _set_segments(self, ticker: str, segments: List[Dict[str, Any]]) -> None:
+        if segments:
+            self._segments[ticker] = segments
+        else:
+            self._segments.pop(ticker, None)
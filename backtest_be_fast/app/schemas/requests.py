@@ -18,6 +18,18 @@ class StrategyType(str, Enum):
     EMA_STRATEGY = "ema_strategy"
 
 
+class EngineMode(str, Enum):
+    """백테스트 실행 엔진"""
+    BACKTESTING = "backtesting"
+    VECTORIZED = "vectorized"
+
+
+class ChartFormat(str, Enum):
+    """차트 데이터 응답 형식"""
+    ROWS = "rows"
+    COLUMNAR = "columnar"
+
+
 class BacktestRequest(BaseModel):
     """백테스트 요청 모델"""
     ticker: str = Field(..., description="주식 티커 심볼 (예: AAPL, GOOGL)")
@@ -29,6 +41,9 @@ class BacktestRequest(BaseModel):
     commission: float = Field(default=0.002, ge=0, le=0.1, description="거래 수수료 (소수점)")
     spread: float = Field(default=0.0, ge=0, description="스프레드")
     benchmark_ticker: Optional[str] = Field(default=None, description="비교 벤치마크 티커 (예: MSFT, SPY)")
+    engine_mode: Optional[EngineMode] = Field(default=None, description="백테스트 엔진 (미지정 시 서버 설정 사용)")
+    chart_format: ChartFormat = Field(default=ChartFormat.ROWS, description="차트 데이터 형식 (rows: 포인트 객체 리스트, columnar: 컬럼 배열)")
+    max_points: Optional[int] = Field(default=None, ge=10, le=20000, description="차트 시계열 최대 포인트 수 (초과 시 서버에서 다운샘플링)")
     
     @field_validator('start_date', 'end_date', mode='before')
     @classmethod
@@ -65,6 +80,55 @@ class BacktestRequest(BaseModel):
         }
 
 
+class OptimizationObjective(str, Enum):
+    """파라미터 최적화 목적 함수"""
+    SHARPE_RATIO = "sharpe_ratio"
+    TOTAL_RETURN = "total_return"
+    CALMAR_RATIO = "calmar_ratio"
+
+
+class ParameterRange(BaseModel):
+    """최적화 파라미터 탐색 범위"""
+    min: Optional[float] = Field(default=None, description="최소값 (미지정 시 전략 정의의 min)")
+    max: Optional[float] = Field(default=None, description="최대값 (미지정 시 전략 정의의 max)")
+    step: Optional[float] = Field(default=None, gt=0, description="증분 (미지정 시 기본 격자 점 수로 분할)")
+    values: Optional[List[float]] = Field(default=None, description="명시적 후보 값 목록 (지정 시 min/max/step 무시)")
+
+
+class OptimizationRequest(BaseModel):
+    """전략 파라미터 최적화(그리드 스윕) 요청 모델"""
+    ticker: str = Field(..., description="주식 티커 심볼")
+    start_date: Union[date, str] = Field(..., description="시작 날짜")
+    end_date: Union[date, str] = Field(..., description="종료 날짜")
+    initial_cash: float = Field(default=10000.0, gt=0, description="초기 투자금액")
+    strategy: StrategyType = Field(..., description="최적화할 전략")
+    param_ranges: Optional[Dict[str, ParameterRange]] = Field(
+        default=None, description="파라미터별 탐색 범위 (미지정 파라미터는 전략 정의의 min/max 사용)"
+    )
+    objective: OptimizationObjective = Field(default=OptimizationObjective.SHARPE_RATIO, description="최적화 목적 함수")
+    top_n: int = Field(default=10, ge=1, le=100, description="상위 결과 개수")
+    commission: float = Field(default=0.002, ge=0, le=0.1, description="거래 수수료 (소수점)")
+    spread: float = Field(default=0.0, ge=0, description="스프레드")
+    stream: bool = Field(default=True, description="결과를 완료 순서대로 NDJSON 스트림으로 반환")
+
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
+    def parse_date(cls, v):
+        if isinstance(v, str):
+            try:
+                return datetime.strptime(v, '%Y-%m-%d').date()
+            except ValueError:
+                raise ValueError('날짜 형식은 YYYY-MM-DD여야 합니다')
+        return v
+
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info):
+        if 'start_date' in info.data and v <= info.data['start_date']:
+            raise ValueError('종료 날짜는 시작 날짜보다 이후여야 합니다')
+        return v
+
+
 class PlotRequest(BaseModel):
     """차트 생성 요청 모델"""
     ticker: str = Field(..., description="주식 티커 심볼")
@@ -103,7 +167,7 @@ class UnifiedBacktestRequest(BaseModel):
     strategy: StrategyType = Field(StrategyType.BUY_HOLD_STRATEGY, description="사용할 전략")
     strategy_params: Optional[Dict[str, Any]] = Field(default=None, description="전략 파라미터")
     commission: float = Field(default=0.002, ge=0, le=0.1, description="거래 수수료")
-    rebalance_frequency: Optional[str] = Field("monthly", description="리밸런싱 주기")
+    rebalance_frequency: Optional[str] = Field("none", description="리밸런싱 주기")
     
     @field_validator('start_date', 'end_date', mode='before')
     @classmethod
@@ -17,6 +17,7 @@ API 응답 모델 정의
    - ohlc_data: OHLC 캔들 데이터
    - equity_data: 자산 곡선 데이터
    - indicators: 기술 지표 데이터
+   - columns: 컬럼 배열 형식 차트 데이터 (chart_format=columnar)
 
 3. HealthResponse: 헬스 체크 응답
    - status: healthy / unhealthy
@@ -84,6 +85,9 @@ class BacktestResult(BaseModel):
 
     # 거래 로그
     trade_log: List[Dict[str, Any]] = Field(default_factory=list, description="거래 내역")
+
+    # 일별 자산 곡선 (포트폴리오 결합용 내부 데이터, 응답 직렬화에서 제외)
+    equity_curve: Optional[Any] = Field(None, exclude=True, description="일별 자산 곡선 (pandas Series)")
     
     # 메타데이터
     execution_time_seconds: float = Field(..., description="실행 시간 (초)")
@@ -245,6 +249,7 @@ class IndicatorData(BaseModel):
     type: str = Field(..., description="지표 타입 (line/area/scatter)")
     color: str = Field(..., description="색상")
     data: List[Dict[str, Union[str, float]]] = Field(..., description="지표 데이터")
+    value: Optional[float] = Field(None, description="상수 기준선 값 (RSI 과매수/과매도 등, 이 경우 data는 비어 있음)")
 
 
 class BenchmarkPoint(BaseModel):
@@ -253,6 +258,37 @@ class BenchmarkPoint(BaseModel):
     close: float = Field(..., description="종가")
 
 
+class IndicatorColumn(BaseModel):
+    """컬럼 형식 기술 지표 (values는 columns.dates와 같은 길이, 값이 없는 날은 null, 상수 기준선은 value)"""
+    name: str = Field(..., description="지표 이름")
+    type: str = Field(..., description="지표 타입 (line/area/scatter)")
+    color: str = Field(..., description="색상")
+    values: List[Optional[float]] = Field(default_factory=list, description="지표 값 배열")
+    value: Optional[float] = Field(None, description="상수 기준선 값 (이 경우 values는 비어 있음)")
+
+
+class BenchmarkColumns(BaseModel):
+    """컬럼 형식 벤치마크 데이터"""
+    dates: List[str] = Field(default_factory=list, description="날짜 배열 (YYYY-MM-DD)")
+    close: List[Optional[float]] = Field(default_factory=list, description="종가 배열")
+
+
+class ChartColumns(BaseModel):
+    """컬럼 배열 형식 차트 데이터 (같은 인덱스가 같은 거래일)"""
+    dates: List[str] = Field(..., description="날짜 배열 (YYYY-MM-DD)")
+    open: List[Optional[float]] = Field(..., description="시가 배열")
+    high: List[Optional[float]] = Field(..., description="고가 배열")
+    low: List[Optional[float]] = Field(..., description="저가 배열")
+    close: List[Optional[float]] = Field(..., description="종가 배열")
+    volume: List[int] = Field(..., description="거래량 배열")
+    equity: List[Optional[float]] = Field(..., description="자산 가치 배열")
+    return_pct: List[Optional[float]] = Field(..., description="수익률 배열 (%)")
+    drawdown_pct: List[Optional[float]] = Field(..., description="드로우다운 배열 (%)")
+    indicators: List[IndicatorColumn] = Field(default_factory=list, description="기술 지표")
+    sp500_benchmark: BenchmarkColumns = Field(default_factory=BenchmarkColumns, description="S&P 500 벤치마크")
+    nasdaq_benchmark: BenchmarkColumns = Field(default_factory=BenchmarkColumns, description="NASDAQ 벤치마크")
+
+
 class ChartDataResponse(BaseModel):
     """차트 데이터 응답 모델"""
     # 기본 정보
@@ -271,6 +307,9 @@ class ChartDataResponse(BaseModel):
     sp500_benchmark: List[BenchmarkPoint] = Field(default_factory=list, description="S&P 500 벤치마크 데이터")
     nasdaq_benchmark: List[BenchmarkPoint] = Field(default_factory=list, description="NASDAQ 벤치마크 데이터")
 
+    # 컬럼 배열 형식 (chart_format=columnar일 때만 채워지고 위 리스트들은 비어 있음)
+    columns: Optional[ChartColumns] = Field(None, description="컬럼 배열 형식 차트 데이터")
+
     # 통계 요약
     summary_stats: Dict[str, Any] = Field(..., description="주요 통계")
     
@@ -97,7 +97,7 @@ class PortfolioBacktestRequest(BaseModel):
     start_date: str = Field(..., description="시작 날짜 (YYYY-MM-DD)")
     end_date: str = Field(..., description="종료 날짜 (YYYY-MM-DD)")
     commission: float = Field(0.002, ge=0, lt=0.1, description="수수료율 (0 ~ 0.1)")
-    rebalance_frequency: str = Field("monthly", description="리밸런싱 주기 (monthly, quarterly, yearly)")
+    rebalance_frequency: str = Field("none", description="리밸런싱 주기 (none, daily, weekly, monthly, quarterly, yearly), 기본값 none은 리밸런싱 안함")
     strategy: str = Field("buy_and_hold", description="전략명")
     strategy_params: Optional[Dict[str, Any]] = Field(default_factory=dict, description="전략 파라미터")
     
@@ -133,6 +133,14 @@ class PortfolioBacktestRequest(BaseModel):
             raise ValueError('날짜는 YYYY-MM-DD 형식이어야 합니다.')
         return v
 
+    @field_validator('rebalance_frequency')
+    @classmethod
+    def validate_rebalance_frequency(cls, v):
+        v = v.lower()
+        if v not in ['none', 'never', 'daily', 'weekly', 'monthly', 'quarterly', 'yearly', 'annually']:
+            raise ValueError('리밸런싱 주기는 none, daily, weekly, monthly, quarterly, yearly 중 하나여야 합니다.')
+        return v
+
     @field_validator('end_date')
     @classmethod
     def validate_date_range(cls, v, info):
@@ -0,0 +1,99 @@
+"""
+요청 단위 가격 데이터 컨텍스트
+
+**역할**:
+- 단일 종목 백테스트 요청 하나에 필요한 가격 프레임(종목, 비교 벤치마크, S&P 500, NASDAQ)을 한 번에 로드
+- 백테스트 엔진과 차트 데이터 서비스가 같은 프레임을 공유해 같은 구간을 다시 조회하지 않음
+
+**주요 기능**:
+1. BacktestDataContext.load(): 종목/벤치마크 프레임을 캐시 Repository로 동시에 조회
+2. price_data: 백테스트 대상 종목 가격 프레임
+3. get() / has(): 벤치마크 프레임 조회 (로드 실패한 벤치마크는 None)
+
+**동작 규칙**:
+- 대상 종목 조회 실패 또는 빈 데이터는 ValidationError (백테스트 불가)
+- 벤치마크 조회 실패는 경고 로그 후 None으로 기록 (해당 벤치마크 섹션만 비움)
+- 같은 티커는 한 번만 조회 (예: benchmark_ticker가 ^GSPC인 경우)
+
+**의존성**:
+- app/repositories/data_repository.py: 캐시 우선 가격 데이터 조회 (메모리 → MySQL → yfinance)
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_service.py (run_backtest_with_chart)
+- Backend: app/services/backtest_engine.py (가격 데이터, benchmark_ticker 알파/베타)
+- Backend: app/services/chart_data_service.py (OHLC, S&P 500/NASDAQ 벤치마크)
+"""
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+from app.core.exceptions import ValidationError
+from app.repositories.data_repository import data_repository as default_repository
+from app.schemas.requests import BacktestRequest
+
+logger = logging.getLogger(__name__)
+
+# 차트에 항상 표시하는 시장 지수
+CHART_BENCHMARKS = ("^GSPC", "^IXIC")
+
+
+class BacktestDataContext:
+    """요청 하나가 공유하는 가격 프레임 묶음"""
+
+    def __init__(self, ticker: str, frames: Dict[str, Optional[pd.DataFrame]]):
+        self.ticker = ticker
+        self._frames = frames
+
+    @classmethod
+    async def load(
+        cls,
+        request: BacktestRequest,
+        repository=None,
+        benchmarks: Iterable[str] = CHART_BENCHMARKS,
+    ) -> "BacktestDataContext":
+        """
+        요청의 종목과 벤치마크 프레임을 동시에 로드
+
+        Args:
+            request: 백테스트 요청 (ticker, benchmark_ticker, 기간)
+            repository: 가격 데이터 Repository (기본값: 전역 캐시 Repository)
+            benchmarks: 함께 로드할 시장 지수 티커
+        """
+        repository = repository or default_repository
+        tickers = [request.ticker]
+        if getattr(request, 'benchmark_ticker', None):
+            tickers.append(request.benchmark_ticker)
+        tickers.extend(benchmarks)
+        tickers = list(dict.fromkeys(tickers))
+
+        outcomes = await asyncio.gather(
+            *(repository.get_stock_data(ticker, request.start_date, request.end_date) for ticker in tickers),
+            return_exceptions=True,
+        )
+
+        frames: Dict[str, Optional[pd.DataFrame]] = {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception) or outcome is None or outcome.empty:
+                if ticker == request.ticker:
+                    if isinstance(outcome, ValidationError):
+                        raise outcome
+                    raise ValidationError(f"'{ticker}' 종목의 가격 데이터를 찾을 수 없습니다.")
+                logger.warning(f"{ticker} 벤치마크 데이터 조회 실패: {outcome!r}" if isinstance(outcome, Exception)
+                               else f"{ticker} 벤치마크 데이터 없음")
+                outcome = None
+            frames[ticker] = outcome
+
+        return cls(request.ticker, frames)
+
+    @property
+    def price_data(self) -> pd.DataFrame:
+        return self._frames[self.ticker]
+
+    def has(self, ticker: str) -> bool:
+        """로드를 시도한 티커인지 여부 (실패한 벤치마크 포함)"""
+        return ticker in self._frames
+
+    def get(self, ticker: str) -> Optional[pd.DataFrame]:
+        return self._frames.get(ticker)
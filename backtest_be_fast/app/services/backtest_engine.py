@@ -18,13 +18,17 @@
 1. 데이터 로드 (yfinance or DB)
 2. Backtest 인스턴스 생성
 3. 전략 클래스 적용
-4. 백테스트 실행
+4. 백테스트 실행 (backtesting.py 또는 벡터화 엔진)
 5. 결과 추출 및 직렬화
 
 **의존성**:
 - backtesting.py: 백테스팅 라이브러리
 - app/utils/data_fetcher.py: 데이터 조회
 - app/services/strategy_service.py: 전략 관리
+- app/services/vectorized_engine.py: 내장 전략 벡터화 실행 (engine_mode="vectorized")
+- app/services/backtest_data_context.py: 요청 단위 가격/벤치마크 프레임 공유
+- app/repositories/data_repository.py: benchmark_ticker 캐시 조회
+- app/services/result_cache.py: 요청 지문 기반 결과 캐시 (가격 데이터를 직접 넘긴 실행은 제외)
 
 **연관 컴포넌트**:
 - Backend: app/services/backtest_service.py (서비스 레이어)
@@ -37,7 +41,7 @@
 """
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from uuid import uuid4
 import pandas as pd
 import numpy as np
@@ -45,12 +49,18 @@ import numpy as np
 from backtesting import Backtest
 from fastapi import HTTPException
 
-from app.schemas.requests import BacktestRequest
+from app.core.config import settings
+from app.core.exceptions import BacktestQueueFullError, ExecutionTimeoutError
+from app.core.executors import executor_manager
+from app.schemas.requests import BacktestRequest, EngineMode
 from app.schemas.responses import BacktestResult
 from app.utils.data_fetcher import data_fetcher
 from app.repositories.data_repository import data_repository
 from app.services.strategy_service import strategy_service
 from app.services.validation_service import validation_service
+from app.services.vectorized_engine import vectorized_engine
+from app.services.backtest_data_context import BacktestDataContext
+from app.services.result_cache import backtest_result_cache
 
 
 class BacktestEngine:
@@ -61,18 +71,36 @@ class BacktestEngine:
         data_repository=None,
         strategy_service_instance=None,
         validation_service_instance=None,
+        vectorized_engine_instance=None,
+        result_cache=None,
     ):
         self.data_repository = data_repository
         self.data_fetcher = data_fetcher
         self.strategy_service = strategy_service_instance or strategy_service
         self.validation_service = validation_service_instance or validation_service
+        self.vectorized_engine = vectorized_engine_instance or vectorized_engine
+        self.result_cache = result_cache
         self.logger = logging.getLogger(__name__)
     
-    async def run_backtest(self, request: BacktestRequest) -> BacktestResult:
-        """백테스트 실행"""
+    async def run_backtest(
+        self,
+        request: BacktestRequest,
+        data: Optional[pd.DataFrame] = None,
+        context: Optional[BacktestDataContext] = None,
+    ) -> BacktestResult:
+        """백테스트 실행 (data 또는 context가 주어지면 가격/벤치마크 데이터 조회 생략)"""
+        use_cache = data is None and self.result_cache is not None
+        if use_cache:
+            cached = await self.result_cache.get(await self.result_cache.key(request, self._engine_mode(request)))
+            if cached is not None:
+                self.logger.info("백테스트 결과 캐시 적중: %s %s", request.ticker, request.strategy)
+                return cached
+
         try:
-            # 요청 검증
-            self.validation_service.validate_backtest_request(request)
+            # 요청 검증 (티커 검증은 네트워크 I/O이므로 스레드 풀에서 실행)
+            await executor_manager.run_io(
+                self.validation_service.validate_backtest_request, request, stage="validation"
+            )
 
             # 데이터 가져오기 (캐시 우선)
             self.logger.info(
@@ -81,9 +109,15 @@ class BacktestEngine:
                 request.start_date,
                 request.end_date,
             )
-            data = await self._get_price_data(
-                request.ticker, request.start_date, request.end_date
-            )
+            if (data is None or data.empty) and context is not None:
+                data = context.price_data
+            if data is None or data.empty:
+                data = await self._get_price_data(
+                    request.ticker, request.start_date, request.end_date
+                )
+            benchmark = await self._get_benchmark_data(request, context)
+            # 저장용 캐시 키는 조회(누락 구간 보완 적재 포함)가 끝난 뒤의 데이터 버전으로 생성
+            cache_key = self.result_cache.loaded_key(request, self._engine_mode(request)) if use_cache else None
 
             self.logger.info(f"데이터 로드 완료: {len(data)} 행")
             self.logger.debug(f"데이터 컬럼: {list(data.columns)}")
@@ -91,23 +125,29 @@ class BacktestEngine:
             
             # 전략 클래스 가져오기
             strategy_name = request.strategy.value if hasattr(request.strategy, 'value') else str(request.strategy)
-            strategy_class = self._build_strategy(strategy_name, request.strategy_params)
+            base_strategy, overrides = self._strategy_spec(strategy_name, request.strategy_params)
+            strategy_class = _configure_strategy(base_strategy, overrides)
 
             self.logger.info(f"전략 클래스: {strategy_class.__name__}")
             self.logger.info(f"초기 자본: ${request.initial_cash}")
             
-            # 백테스트 실행
-            bt = Backtest(
-                data,
-                strategy_class,
-                cash=request.initial_cash,
-                commission=request.commission,
-            )
-            self.logger.debug("백테스트 객체 생성 완료")
+            # 백테스트 실행 (프로세스 풀, 벡터화 엔진 선택 시 backtesting.py 루프 생략)
+            use_vectorized = self._use_vectorized_engine(request, strategy_class)
             
             try:
-                run_kwargs = self._build_run_kwargs(request)
-                result = self._execute_backtest(bt, run_kwargs)
+                if use_vectorized:
+                    self.logger.info("벡터화 엔진으로 백테스트 실행")
+                result = await executor_manager.run_cpu(
+                    _run_backtest_job,
+                    data,
+                    base_strategy,
+                    overrides,
+                    request.initial_cash,
+                    request.commission,
+                    request.spread or 0.0,
+                    self._build_run_kwargs(request),
+                    self.vectorized_engine if use_vectorized else None,
+                )
                 self.logger.info("백테스트 실행 완료")
                 self.logger.info(f"거래 수: {result['# Trades']}")
                 self.logger.info(f"수익률: {result.get('Return [%]', 0):.2f}%")
@@ -121,11 +161,16 @@ class BacktestEngine:
                 
                 # 결과가 유효한지 확인
                 if result is not None and '# Trades' in result:
-                    return self._convert_result_to_response(result, request)
+                    response = self._convert_result_to_response(result, request, benchmark)
+                    if cache_key is not None:
+                        await self.result_cache.put(cache_key, response)
+                    return response
                 else:
                     self.logger.warning("백테스트 결과가 유효하지 않음, fallback 사용")
                     raise Exception("Invalid backtest result")
                     
+            except (BacktestQueueFullError, ExecutionTimeoutError):
+                raise
             except Exception as e:
                 self.logger.error(f"백테스트 실행 중 오류: {e}")
                 self.logger.info("Fallback 통계 생성 중...")
@@ -167,10 +212,12 @@ class BacktestEngine:
         if self.data_repository:
             data = await self.data_repository.get_stock_data(ticker, start_date, end_date)
         else:
-            data = self.data_fetcher.get_stock_data(
+            data = await executor_manager.run_io(
+                self.data_fetcher.get_stock_data,
                 ticker=ticker,
                 start_date=start_date,
                 end_date=end_date,
+                stage="data",
             )
 
         if data is None or data.empty:
@@ -178,13 +225,36 @@ class BacktestEngine:
 
         return data
 
+    async def _get_benchmark_data(
+        self, request: BacktestRequest, context: Optional[BacktestDataContext] = None
+    ) -> Optional[pd.DataFrame]:
+        """benchmark_ticker 가격 데이터 (컨텍스트 우선, 없으면 캐시 Repository 조회, 실패 시 None)"""
+        ticker = getattr(request, 'benchmark_ticker', None)
+        if not ticker:
+            return None
+        if context is not None and context.has(ticker):
+            return context.get(ticker)
+        try:
+            return await (self.data_repository or data_repository).get_stock_data(
+                ticker, request.start_date, request.end_date
+            )
+        except Exception as e:
+            self.logger.warning(f"벤치마크 데이터 조회 실패({ticker}): {e}")
+            return None
+
     def _build_strategy(
         self, strategy_name: str, params: Optional[Dict[str, Any]]
     ):
         """요청 파라미터를 적용한 전략 클래스를 생성"""
+        return _configure_strategy(*self._strategy_spec(strategy_name, params))
+
+    def _strategy_spec(
+        self, strategy_name: str, params: Optional[Dict[str, Any]]
+    ) -> Tuple[type, Dict[str, Any]]:
+        """요청 파라미터를 검증해 (기본 전략 클래스, 클래스 속성 오버라이드)로 반환 (프로세스 풀로 전달 가능)"""
         base_strategy = self.strategy_service.get_strategy_class(strategy_name)
         if not params:
-            return base_strategy
+            return base_strategy, {}
 
         sanitized_params: Dict[str, Any] = {}
         try:
@@ -205,17 +275,26 @@ class BacktestEngine:
             )
             sanitized_params = params
 
-        overrides = {
-            key: value
-            for key, value in sanitized_params.items()
-            if hasattr(base_strategy, key)
-        }
-
-        if not overrides:
-            return base_strategy
-
-        configured_name = f"{base_strategy.__name__}Configured_{uuid4().hex[:8]}"
-        return type(configured_name, (base_strategy,), overrides)
+        attribute_map = self.strategy_service.get_attribute_map(strategy_name)
+        overrides = {}
+        for key, value in sanitized_params.items():
+            attribute = attribute_map.get(key, key)
+            if hasattr(base_strategy, attribute):
+                overrides[attribute] = value
+        return base_strategy, overrides
+
+    def _engine_mode(self, request: BacktestRequest) -> str:
+        """요청 엔진 모드 (미지정 시 서버 설정)"""
+        return request.engine_mode.value if request.engine_mode else settings.backtest_engine_mode
+
+    def _use_vectorized_engine(self, request: BacktestRequest, strategy_class) -> bool:
+        """요청 또는 서버 설정에 따라 벡터화 엔진 사용 여부 결정"""
+        if self._engine_mode(request) != EngineMode.VECTORIZED.value:
+            return False
+        if not self.vectorized_engine.supports(strategy_class):
+            self.logger.info("벡터화 엔진 미지원 전략(%s) - backtesting.py로 실행", strategy_class.__name__)
+            return False
+        return True
 
     def _build_run_kwargs(self, request: BacktestRequest) -> Dict[str, Any]:
         """Backtest.run 호출 시 사용할 부가 인자 구성"""
@@ -224,7 +303,8 @@ class BacktestEngine:
             run_kwargs["spread"] = request.spread
         return run_kwargs
 
-    def _execute_backtest(self, bt: Backtest, run_kwargs: Dict[str, Any]):
+    @staticmethod
+    def _execute_backtest(bt: Backtest, run_kwargs: Dict[str, Any]):
         """Backtest 실행 래퍼 (옵션 인자 호환성 처리)"""
         try:
             if run_kwargs:
@@ -233,7 +313,7 @@ class BacktestEngine:
         except TypeError as error:
             # 일부 backtesting 버전은 spread 매개변수를 지원하지 않음
             if "spread" in run_kwargs and "spread" in str(error):
-                self.logger.warning("Backtest.run spread 인자 미지원 - spread 제외 후 재시도")
+                logging.getLogger(__name__).warning("Backtest.run spread 인자 미지원 - spread 제외 후 재시도")
                 safe_kwargs = {k: v for k, v in run_kwargs.items() if k != "spread"}
                 return bt.run(**safe_kwargs) if safe_kwargs else bt.run()
             raise
@@ -320,8 +400,10 @@ class BacktestEngine:
                 timestamp=datetime.now()
             )
 
-    def _convert_result_to_response(self, stats: pd.Series, request: BacktestRequest) -> BacktestResult:
-        """백테스트 결과를 API 응답 형식으로 변환"""
+    def _convert_result_to_response(
+        self, stats: pd.Series, request: BacktestRequest, benchmark: Optional[pd.DataFrame] = None
+    ) -> BacktestResult:
+        """백테스트 결과를 API 응답 형식으로 변환 (benchmark: benchmark_ticker 가격 데이터)"""
         def safe_float(key: str, default: float = 0.0) -> float:
             try:
                 value = stats.get(key, default)
@@ -360,11 +442,6 @@ class BacktestEngine:
 
             if getattr(request, 'benchmark_ticker', None):
                 try:
-                    benchmark = self.data_fetcher.get_stock_data(
-                        ticker=request.benchmark_ticker,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
                     equity_curve = stats.get('_equity_curve') if hasattr(stats, 'get') else None
                     if (
                         benchmark is not None and not benchmark.empty
@@ -387,6 +464,11 @@ class BacktestEngine:
                 except Exception:
                     pass
 
+            equity_series = None
+            equity_frame = stats.get('_equity_curve') if hasattr(stats, 'get') else None
+            if isinstance(equity_frame, pd.DataFrame) and 'Equity' in equity_frame.columns:
+                equity_series = equity_frame['Equity'].astype(float)
+
             return BacktestResult(
                 ticker=request.ticker,
                 strategy=request.strategy,
@@ -416,6 +498,7 @@ class BacktestEngine:
                 kelly_criterion=None,  # 추후 계산 추가
                 sqn=safe_float('SQN') if 'SQN' in stats else None,
                 trade_log=trade_log,
+                equity_curve=equity_series,
                 execution_time_seconds=0.5,  # 추후 실제 시간 측정 추가
                 timestamp=datetime.now()
             )
@@ -424,5 +507,49 @@ class BacktestEngine:
             return self._create_fallback_result(pd.DataFrame(), request)
 
 
+def _configure_strategy(base_strategy: type, overrides: Dict[str, Any]) -> type:
+    """클래스 속성 오버라이드를 적용한 전략 하위 클래스 생성 (오버라이드가 없으면 기본 클래스)"""
+    if not overrides:
+        return base_strategy
+    configured_name = f"{base_strategy.__name__}Configured_{uuid4().hex[:8]}"
+    return type(configured_name, (base_strategy,), overrides)
+
+
+def _run_backtest_job(
+    data: pd.DataFrame,
+    base_strategy: type,
+    overrides: Dict[str, Any],
+    cash: float,
+    commission: float,
+    spread: float,
+    run_kwargs: Dict[str, Any],
+    vectorized=None,
+) -> pd.Series:
+    """
+    프로세스 풀 워커에서 실행되는 백테스트 작업
+
+    파라미터가 적용된 전략 클래스는 동적으로 생성되어 pickle할 수 없으므로 호출자의 전략 서비스로
+    만든 (기본 전략 클래스, 속성 오버라이드)를 받아 워커 안에서 다시 생성하고, 반환 통계의 전략
+    인스턴스는 이름으로 대체합니다. vectorized가 주어지면(호출자의 벡터화 엔진) 그 엔진으로 실행합니다.
+    자산 곡선(_equity_curve)은 Equity 열만 남겨 반환합니다.
+    """
+    strategy_class = _configure_strategy(base_strategy, overrides)
+    if vectorized is not None:
+        stats = vectorized.run(
+            data, strategy_class, cash=cash, commission=commission, spread=spread
+        )
+    else:
+        bt = Backtest(data, strategy_class, cash=cash, commission=commission)
+        stats = BacktestEngine._execute_backtest(bt, run_kwargs)
+    stats['_strategy'] = strategy_class.__name__
+    # 자산 곡선은 Equity 열만 반환 (프로세스 간 전달 크기 축소)
+    equity_curve = stats.get('_equity_curve')
+    if isinstance(equity_curve, pd.DataFrame) and 'Equity' in equity_curve.columns:
+        stats['_equity_curve'] = equity_curve[['Equity']]
+    return stats
+
+
 # 글로벌 인스턴스
-backtest_engine = BacktestEngine()
+backtest_engine = BacktestEngine(
+    result_cache=backtest_result_cache if settings.backtest_result_cache_enabled else None
+)
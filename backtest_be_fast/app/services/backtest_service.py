@@ -10,10 +10,12 @@
 1. 백테스트 실행: 주어진 전략과 파라미터로 백테스트 수행
 2. 통계 계산: 수익률, 샤프 비율, 최대 낙폭 등 성과 지표 계산
 3. 거래 로그 변환: 백테스트 거래 기록을 JSON 직렬화 가능한 형식으로 변환
+4. run_backtest_with_chart(): 요청 단위 데이터 컨텍스트를 한 번 로드해 백테스트와 차트 생성이 공유
 
 **의존성**:
 - app/repositories/data_repository.py: 주가 데이터 조회
 - app/services/strategy_service.py: 백테스트 전략 검증
+- app/services/backtest_data_context.py: 종목/벤치마크 프레임 동시 로드 및 공유
 - backtesting.py: 외부 백테스팅 라이브러리
 
 **연관 컴포넌트**:
@@ -28,7 +30,7 @@
 import time
 import signal
 from datetime import datetime, date
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import pandas as pd
 import numpy as np
 import logging
@@ -115,11 +117,16 @@ from app.utils.data_fetcher import data_fetcher
 from app.services.strategy_service import strategy_service
 from app.core.config import settings
 from app.core.exceptions import ValidationError
+from app.core.executors import executor_manager
 
 # 분리된 서비스들 import
 from app.services.backtest_engine import backtest_engine
 from app.services.chart_data_service import chart_data_service
 from app.services.validation_service import validation_service
+from app.services.backtest_data_context import BacktestDataContext
+from app.utils.indicator_cache import indicator_cache
+from app.services.result_cache import backtest_result_cache
+from app.services.data_versions import data_versions
 
 logger = logging.getLogger(__name__)
 
@@ -151,13 +158,35 @@ class BacktestService:
 
         logger.info("백테스트 서비스가 초기화되었습니다")
     
-    async def run_backtest(self, request: BacktestRequest) -> BacktestResult:
-        """백테스트 실행 - Repository Pattern이 적용된 BacktestEngine에 위임"""
-        return await self.backtest_engine.run_backtest(request)
+    async def run_backtest(
+        self,
+        request: BacktestRequest,
+        data: Optional[pd.DataFrame] = None,
+        context: Optional[BacktestDataContext] = None,
+    ) -> BacktestResult:
+        """백테스트 실행 - Repository Pattern이 적용된 BacktestEngine에 위임 (data: 미리 로드한 가격 데이터)"""
+        return await self.backtest_engine.run_backtest(request, data=data, context=context)
     
-    async def generate_chart_data(self, request: BacktestRequest, backtest_result: BacktestResult = None) -> ChartDataResponse:
+    async def generate_chart_data(
+        self,
+        request: BacktestRequest,
+        backtest_result: BacktestResult = None,
+        context: Optional[BacktestDataContext] = None,
+    ) -> ChartDataResponse:
         """차트 데이터 생성 - Repository Pattern이 적용된 ChartDataService에 위임"""
-        return await self.chart_data_service.generate_chart_data(request, backtest_result)
+        return await self.chart_data_service.generate_chart_data(request, backtest_result, context=context)
+
+    async def run_backtest_with_chart(self, request: BacktestRequest) -> Tuple[BacktestResult, ChartDataResponse]:
+        """
+        백테스트 실행 후 차트 데이터 생성
+
+        종목/benchmark_ticker/S&P 500/NASDAQ 프레임을 캐시 Repository로 한 번에 동시 로드하고,
+        백테스트와 차트 생성이 같은 프레임을 사용합니다. 차트 자산 곡선은 백테스트 결과의 일별 자산 곡선입니다.
+        """
+        context = await BacktestDataContext.load(request, self.data_repository)
+        result = await self.run_backtest(request, context=context)
+        chart = await self.generate_chart_data(request, result, context=context)
+        return result, chart
     
     def validate_backtest_request(self, request: BacktestRequest) -> None:
         """백테스트 요청 검증 - ValidationService에 위임"""
@@ -188,7 +217,11 @@ class BacktestService:
             },
             'strategy_stats': {
                 'available_strategies': len(strategy_service.get_all_strategies())
-            }
+            },
+            'executor_stats': executor_manager.get_stats(),
+            'indicator_cache': indicator_cache.get_stats(),
+            'result_cache': backtest_result_cache.get_stats(),
+            'data_versions': data_versions.get_stats()
         }
     
     # 호환성을 위한 유틸리티 메서드들 (ValidationService 위임)
@@ -12,10 +12,21 @@
 
 2. 데이터 생성 메서드:
    - _generate_ohlc_data(): OHLC 캔들스틱 차트 데이터
-   - _generate_equity_data(): 자산 가치 곡선 데이터
+   - _generate_equity_data(): 자산 가치 곡선 데이터 (백테스트 결과의 일별 자산 곡선, 없으면 Buy & Hold)
    - _generate_trade_markers(): 매수/매도 거래 표시
    - _generate_indicators(): 기술 지표 데이터 (SMA, RSI, Bollinger, MACD, EMA)
    - _generate_benchmark_data(): 벤치마크 지수 데이터
+   - _generate_columnar_data(): 컬럼 배열 형식 차트 데이터 (chart_format=columnar)
+
+**다운샘플링 (max_points)**:
+- 요청에 max_points가 있고 포인트가 더 많으면 선 시계열(자산 곡선, 지표, 벤치마크)은 LTTB,
+  캔들은 구간별 OHLC 집계로 줄임
+- 거래 마커는 줄이지 않으며, 마커 날짜는 캔들/자산 곡선 포인트로 항상 남김
+
+**응답 형식 (chart_format)**:
+- rows (기본값): 날짜별 ChartDataPoint/EquityPoint/BenchmarkPoint 객체 리스트
+- columnar: dates[], open[], close[] 같은 컬럼 배열을 NumPy로 한 번에 생성
+  (포인트별 Pydantic 객체 생성/검증 없음, 값이 없는 날은 null)
 
 **지원 기술 지표**:
 - SMA (단순 이동평균): 추세 파악
@@ -27,6 +38,10 @@
 **의존성**:
 - app/services/strategy_service.py: 전략 파라미터 검증
 - app/utils/data_fetcher.py: 주가 데이터 조회
+- app/services/backtest_data_context.py: 백테스트와 공유하는 요청 단위 가격/벤치마크 프레임
+- app/utils/serializers.py: 컬럼 배열 변환 (NaN → None, 날짜 문자열)
+- app/utils/downsampling.py: LTTB / OHLC 구간 집계
+- app/utils/indicators.py: 기술 지표 배열 계산 (전략별 지표 라인 정의)
 - pandas, numpy: 데이터 처리 및 지표 계산
 
 **연관 컴포넌트**:
@@ -40,19 +55,26 @@
 - NaN/Infinity는 None으로 변환
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, date
 import pandas as pd
 import numpy as np
 
-from app.schemas.requests import BacktestRequest
+from app.schemas.requests import BacktestRequest, ChartFormat
 from app.schemas.responses import (
     BacktestResult, ChartDataResponse, ChartDataPoint,
-    EquityPoint, TradeMarker, IndicatorData, BenchmarkPoint
+    EquityPoint, TradeMarker, IndicatorData, BenchmarkPoint,
+    ChartColumns, IndicatorColumn, BenchmarkColumns
 )
 from app.utils.data_fetcher import data_fetcher
+from app.utils.serializers import to_nullable_list, format_dates
+from app.utils.indicators import IndicatorLine, strategy_indicator_lines
+from app.utils.indicator_cache import indicator_cache
+from app.utils.downsampling import lttb_indices, bucket_ends, merge_positions, aggregate_ohlc
 from app.services.strategy_service import strategy_service
 from app.core.exceptions import ValidationError
+from app.core.executors import executor_manager
+from app.services.backtest_data_context import BacktestDataContext
 
 
 class ChartDataService:
@@ -64,9 +86,17 @@ class ChartDataService:
         self.strategy_service = strategy_service_instance or strategy_service
         self.logger = logging.getLogger(__name__)
     
-    async def generate_chart_data(self, request: BacktestRequest, backtest_result: BacktestResult = None) -> ChartDataResponse:
+    async def generate_chart_data(
+        self,
+        request: BacktestRequest,
+        backtest_result: BacktestResult = None,
+        context: Optional[BacktestDataContext] = None,
+    ) -> ChartDataResponse:
         """
         백테스트 결과로부터 Recharts용 차트 데이터를 생성합니다.
+
+        context가 주어지면 백테스트 단계에서 로드한 종목/벤치마크 프레임을 그대로 사용하고,
+        backtest_result에 일별 자산 곡선이 있으면 자산 곡선은 Buy & Hold 대신 그 값을 사용합니다.
         
         ★ 주요 금융 용어 설명:
         
@@ -110,27 +140,45 @@ class ChartDataService:
             
             # 데이터 가져오기
             self.logger.info("차트 데이터 생성 시작: %s", request.ticker)
-            data = await self._get_price_data(
-                request.ticker, request.start_date, request.end_date
-            )
+            if context is not None:
+                data = context.price_data
+            else:
+                data = await self._get_price_data(
+                    request.ticker, request.start_date, request.end_date
+                )
             self.logger.info("차트용 데이터 로드 완료: %s 행", len(data))
+            equity_curve = getattr(backtest_result, 'equity_curve', None) if backtest_result else None
+            columnar = getattr(request, 'chart_format', ChartFormat.ROWS) == ChartFormat.COLUMNAR
+            max_points = getattr(request, 'max_points', None)
             
-            # 1. OHLC 데이터 생성
-            ohlc_data = self._generate_ohlc_data(data)
-            self.logger.info(f"OHLC 데이터 생성 완료: {len(ohlc_data)} 포인트")
-            
-            # 2. 자산 곡선 데이터 생성 (Buy & Hold 기준)
-            equity_data = self._generate_equity_data(data, request.initial_cash)
-            self.logger.info(f"자산 곡선 데이터 생성 완료: {len(equity_data)} 포인트")
-            
-            # 3. 거래 마커 생성
+            # 1. 거래 마커 생성 (다운샘플링 시에도 마커 날짜는 그대로 유지)
             trade_log = backtest_result.trade_log if backtest_result else []
             trade_markers = self._generate_trade_markers(data, strategy_name, trade_log)
             self.logger.info(f"거래 마커 생성 완료: {len(trade_markers)} 개")
+            marker_positions = self._marker_positions(data.index, trade_markers) if max_points else None
             
-            # 4. 기술 지표 데이터 생성
-            indicators = self._generate_indicators(data, strategy_name, request.strategy_params or {})
-            self.logger.info(f"기술 지표 생성 완료: {len(indicators)} 개")
+            # 2~4. OHLC / 자산 곡선 / 기술 지표 생성 (컬럼 형식은 7단계에서 함께 생성)
+            ohlc_data: List[ChartDataPoint] = []
+            equity_data: List[EquityPoint] = []
+            indicators: List[IndicatorData] = []
+            if not columnar:
+                ohlc_data = self._generate_ohlc_data(
+                    self._downsample_ohlc(data, max_points, marker_positions) if max_points else data
+                )
+                self.logger.info(f"OHLC 데이터 생성 완료: {len(ohlc_data)} 포인트")
+                equity_data = self._generate_equity_data(data, request.initial_cash, equity_curve)
+                if max_points:
+                    equity_data = self._lttb_points(
+                        equity_data, [point.equity for point in equity_data], max_points, marker_positions
+                    )
+                self.logger.info(f"자산 곡선 데이터 생성 완료: {len(equity_data)} 포인트")
+                indicators = self._generate_indicators(data, strategy_name, request.strategy_params or {})
+                if max_points:
+                    for indicator in indicators:
+                        indicator.data = self._lttb_points(
+                            indicator.data, [point["value"] for point in indicator.data], max_points
+                        )
+                self.logger.info(f"기술 지표 생성 완료: {len(indicators)} 개")
             
             # 5. 백테스트 통계 계산
             # 통계 정보 생성
@@ -157,10 +205,8 @@ class ChartDataService:
             benchmark_ticker = getattr(request, 'benchmark_ticker', None)
             if benchmark_ticker:
                 try:
-                    bm_data = await self._get_price_data(
-                        benchmark_ticker,
-                        request.start_date,
-                        request.end_date,
+                    bm_data = await self._get_benchmark_frame(
+                        benchmark_ticker, request.start_date, request.end_date, context
                     )
                     if bm_data is not None and not bm_data.empty:
                         bm_initial = float(bm_data['Close'].iloc[0])
@@ -176,8 +222,24 @@ class ChartDataService:
                     self.logger.warning(f"벤치마크 계산 중 오류({benchmark_ticker}): {e}")
 
             # 7. 벤치마크 데이터 생성 (S&P 500, NASDAQ)
-            sp500_benchmark = await self._generate_benchmark_data("^GSPC", request.start_date, request.end_date)
-            nasdaq_benchmark = await self._generate_benchmark_data("^IXIC", request.start_date, request.end_date)
+            columns: Optional[ChartColumns] = None
+            if columnar:
+                sp500_benchmark: List[BenchmarkPoint] = []
+                nasdaq_benchmark: List[BenchmarkPoint] = []
+                columns = self._generate_columnar_data(
+                    data,
+                    request.initial_cash,
+                    self._indicator_lines(data, strategy_name, request.strategy_params or {}),
+                    await self._get_benchmark_frame("^GSPC", request.start_date, request.end_date, context),
+                    await self._get_benchmark_frame("^IXIC", request.start_date, request.end_date, context),
+                    max_points=max_points,
+                    keep_positions=marker_positions,
+                    equity_curve=equity_curve,
+                )
+                self.logger.info(f"컬럼 형식 차트 데이터 생성 완료: {len(columns.dates)} 포인트")
+            else:
+                sp500_benchmark = await self._generate_benchmark_data("^GSPC", request.start_date, request.end_date, max_points, context)
+                nasdaq_benchmark = await self._generate_benchmark_data("^IXIC", request.start_date, request.end_date, max_points, context)
 
             return ChartDataResponse(
                 ticker=request.ticker,
@@ -190,6 +252,7 @@ class ChartDataService:
                 indicators=indicators,
                 sp500_benchmark=sp500_benchmark,
                 nasdaq_benchmark=nasdaq_benchmark,
+                columns=columns,
                 summary_stats=backtest_stats
             )
             
@@ -202,10 +265,12 @@ class ChartDataService:
         if self.data_repository:
             data = await self.data_repository.get_stock_data(ticker, start_date, end_date)
         else:
-            data = self.data_fetcher.get_stock_data(
+            data = await executor_manager.run_io(
+                self.data_fetcher.get_stock_data,
                 ticker=ticker,
                 start_date=start_date,
                 end_date=end_date,
+                stage="data",
             )
 
         if data is None or data.empty:
@@ -213,10 +278,33 @@ class ChartDataService:
 
         return data
 
-    async def _generate_benchmark_data(self, ticker: str, start_date, end_date) -> List[BenchmarkPoint]:
-        """벤치마크 데이터 생성 (S&P 500, NASDAQ 등)"""
+    async def _get_benchmark_frame(
+        self, ticker: str, start_date, end_date, context: Optional[BacktestDataContext] = None
+    ) -> Optional[pd.DataFrame]:
+        """벤치마크 가격 데이터 조회 (컨텍스트에 로드된 티커는 재조회하지 않음, 실패 시 None)"""
+        if context is not None and context.has(ticker):
+            return context.get(ticker)
         try:
-            data = await self._get_price_data(ticker, start_date, end_date)
+            return await self._get_price_data(ticker, start_date, end_date)
+        except Exception as e:
+            self.logger.warning(f"{ticker} 벤치마크 데이터 조회 실패: {e}")
+            return None
+
+    async def _generate_benchmark_data(
+        self,
+        ticker: str,
+        start_date,
+        end_date,
+        max_points: Optional[int] = None,
+        context: Optional[BacktestDataContext] = None,
+    ) -> List[BenchmarkPoint]:
+        """벤치마크 데이터 생성 (S&P 500, NASDAQ 등, max_points 초과 시 LTTB 다운샘플링)"""
+        try:
+            data = await self._get_benchmark_frame(ticker, start_date, end_date, context)
+            if data is None or data.empty:
+                return []
+            if max_points:
+                data = data.iloc[lttb_indices(data['Close'], max_points)]
             benchmark_data = []
 
             for idx, row in data.iterrows():
@@ -247,33 +335,133 @@ class ChartDataService:
             ))
         return ohlc_data
     
-    def _generate_equity_data(self, data: pd.DataFrame, initial_cash: float) -> List[EquityPoint]:
-        """자산 곡선 데이터 생성 (Buy & Hold 기준)"""
-        equity_data = []
-        initial_price = float(data['Close'].iloc[0])
-        initial_equity = initial_cash
-        max_price_so_far = initial_price
-        
-        for i, (idx, row) in enumerate(data.iterrows()):
-            current_price = float(row['Close'])
-            equity = initial_equity * (current_price / initial_price)
-            return_pct = ((current_price / initial_price) - 1) * 100
-            
-            # 드로우다운 계산
-            max_price_so_far = max(max_price_so_far, current_price)
-            max_return_so_far = ((max_price_so_far / initial_price) - 1) * 100
-            drawdown_pct = return_pct - max_return_so_far
-            
-            equity_data.append(EquityPoint(
+    def _generate_equity_data(
+        self, data: pd.DataFrame, initial_cash: float, equity_curve: Optional[pd.Series] = None
+    ) -> List[EquityPoint]:
+        """자산 곡선 데이터 생성 (equity_curve가 없으면 Buy & Hold 기준)"""
+        ratio, return_pct, drawdown_pct = self._equity_arrays(data, initial_cash, equity_curve)
+        equity = initial_cash * ratio
+        return [
+            EquityPoint(
                 timestamp=idx.isoformat(),
                 date=idx.strftime('%Y-%m-%d'),
-                equity=equity,
-                return_pct=return_pct,
-                drawdown_pct=drawdown_pct
-            ))
-        
-        return equity_data
+                equity=float(equity[i]),
+                return_pct=float(return_pct[i]),
+                drawdown_pct=float(drawdown_pct[i])
+            )
+            for i, idx in enumerate(data.index)
+        ]
+
+    @staticmethod
+    def _equity_arrays(
+        data: pd.DataFrame, initial_cash: float, equity_curve: Optional[pd.Series] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        자산 배율(초기 자본 대비), 수익률(%), 드로우다운(%) 배열
+
+        equity_curve(백테스트 엔진의 일별 Equity)가 있으면 가격 데이터 날짜에 맞춰 사용하고,
+        없으면 종가 기준 Buy & Hold로 계산합니다. 드로우다운은 현재 수익률 - 지금까지의 최고 수익률입니다.
+        """
+        if equity_curve is not None and len(equity_curve):
+            curve = pd.Series(equity_curve, dtype='float64').reindex(data.index).ffill().fillna(initial_cash)
+            ratio = curve.to_numpy() / initial_cash
+        else:
+            close = data['Close'].to_numpy(dtype='float64')
+            ratio = close / close[0]
+        return_pct = (ratio - 1) * 100
+        running_max = np.fmax.accumulate(np.append(1.0, ratio))[1:]
+        drawdown_pct = return_pct - (running_max - 1) * 100
+        return ratio, return_pct, drawdown_pct
     
+    def _generate_columnar_data(
+        self,
+        data: pd.DataFrame,
+        initial_cash: float,
+        indicator_lines: List[IndicatorLine],
+        sp500: Optional[pd.DataFrame] = None,
+        nasdaq: Optional[pd.DataFrame] = None,
+        max_points: Optional[int] = None,
+        keep_positions: Optional[np.ndarray] = None,
+        equity_curve: Optional[pd.Series] = None,
+    ) -> ChartColumns:
+        """
+        컬럼 배열 형식 차트 데이터 생성
+
+        OHLC, 자산 곡선(equity_curve, 없으면 Buy & Hold 기준), 지표, 벤치마크를 행 순회 없이 NumPy 배열 연산으로 만듭니다.
+        지표 값은 dates와 같은 길이로 정렬되며 계산 구간 이전 값은 null, 상수 기준선은 value 하나만 보냅니다.
+
+        max_points를 넘으면 종가 LTTB로 고른 날짜(+ keep_positions)만 남깁니다. 모든 컬럼이 dates를
+        공유하므로 선 시계열은 선택된 날짜의 값을, 캔들은 직전 선택 날짜 다음 날부터의 OHLC 집계를 사용합니다.
+        """
+        close = data['Close'].to_numpy(dtype='float64')
+        equity_ratio, return_pct, drawdown_pct = self._equity_arrays(data, initial_cash, equity_curve)
+
+        positions = np.arange(len(data))
+        ohlc = data
+        if max_points and len(data) > max_points:
+            positions = merge_positions(lttb_indices(close, max_points), keep_positions)
+            ohlc = aggregate_ohlc(data, positions)
+
+        if 'Volume' in ohlc.columns:
+            volume = ohlc['Volume'].fillna(0).to_numpy(dtype='float64').astype('int64').tolist()
+        else:
+            volume = [0] * len(ohlc)
+
+        return ChartColumns(
+            dates=format_dates(ohlc.index),
+            open=to_nullable_list(ohlc['Open']),
+            high=to_nullable_list(ohlc['High']),
+            low=to_nullable_list(ohlc['Low']),
+            close=to_nullable_list(ohlc['Close']),
+            volume=volume,
+            equity=to_nullable_list(initial_cash * equity_ratio[positions]),
+            return_pct=to_nullable_list(return_pct[positions]),
+            drawdown_pct=to_nullable_list(drawdown_pct[positions]),
+            indicators=[
+                IndicatorColumn(
+                    name=line.name, type="line", color=line.color,
+                    values=to_nullable_list(line.values[positions]) if line.values is not None else [],
+                    value=line.value,
+                )
+                for line in indicator_lines
+            ],
+            sp500_benchmark=self._benchmark_columns(sp500, max_points),
+            nasdaq_benchmark=self._benchmark_columns(nasdaq, max_points),
+        )
+
+    @staticmethod
+    def _benchmark_columns(data: Optional[pd.DataFrame], max_points: Optional[int] = None) -> BenchmarkColumns:
+        if data is None or data.empty:
+            return BenchmarkColumns()
+        if max_points:
+            data = data.iloc[lttb_indices(data['Close'], max_points)]
+        return BenchmarkColumns(dates=format_dates(data.index), close=to_nullable_list(data['Close']))
+
+    @staticmethod
+    def _marker_positions(index: pd.DatetimeIndex, trade_markers: List[TradeMarker]) -> np.ndarray:
+        """거래 마커 날짜의 가격 데이터 내 위치 (데이터에 없는 날짜는 제외)"""
+        if not trade_markers:
+            return np.empty(0, dtype='int64')
+        days = pd.DatetimeIndex(index).normalize()
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        positions = days.get_indexer(pd.to_datetime([marker.date for marker in trade_markers]))
+        return np.unique(positions[positions >= 0])
+
+    @staticmethod
+    def _downsample_ohlc(data: pd.DataFrame, max_points: int, keep_positions: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """캔들 다운샘플링: 균등 구간(+ 마커 날짜에서 끝나는 구간)별 OHLC 집계"""
+        if len(data) <= max_points:
+            return data
+        return aggregate_ohlc(data, merge_positions(bucket_ends(len(data), max_points), keep_positions))
+
+    @staticmethod
+    def _lttb_points(points: list, values: List[float], max_points: int, keep_positions: Optional[np.ndarray] = None) -> list:
+        """선 차트 포인트 리스트를 LTTB로 다운샘플링"""
+        if len(points) <= max_points:
+            return points
+        return [points[i] for i in merge_positions(lttb_indices(values, max_points), keep_positions)]
+
     def _generate_trade_markers(self, data: pd.DataFrame, strategy: str, trade_log: List[Dict[str, Any]]) -> List[TradeMarker]:
         """거래 마커 생성"""
         markers: List[TradeMarker] = []
@@ -351,245 +539,64 @@ class ChartDataService:
     
     def _generate_indicators(self, data: pd.DataFrame, strategy: str, strategy_params: Dict[str, Any]) -> List[IndicatorData]:
         """기술 지표 데이터 생성"""
-        indicators = []
-        
-        if strategy == "sma_crossover":
-            indicators.extend(self._generate_sma_indicators(data, strategy_params))
-        elif strategy == "rsi_strategy":
-            indicators.extend(self._generate_rsi_indicators(data, strategy_params))
-        elif strategy == "bollinger_bands":
-            indicators.extend(self._generate_bollinger_indicators(data, strategy_params))
-        elif strategy == "macd_strategy":
-            indicators.extend(self._generate_macd_indicators(data, strategy_params))
-        elif strategy == "ema_crossover":
-            indicators.extend(self._generate_ema_indicators(data, strategy_params))
+        return self._to_indicator_data(data.index, self._indicator_lines(data, strategy, strategy_params))
 
-        return indicators
-    
-    def _generate_sma_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
-        """SMA 지표 생성"""
-        indicators = []
-        short_window = params.get('short_window', 10)
-        long_window = params.get('long_window', 20)
-        
-        # 단기 SMA
-        sma_short = data['Close'].rolling(window=short_window).mean()
-        short_data = []
-        for idx, sma_value in sma_short.items():
-            if not pd.isna(sma_value):
-                short_data.append({
-                    "timestamp": idx.isoformat(),
-                    "date": idx.strftime('%Y-%m-%d'),
-                    "value": self.safe_float(sma_value)
-                })
-        
-        if short_data:
-            indicators.append(IndicatorData(
-                name=f"SMA_{short_window}",
-                type="line",
-                color="#8884d8",
-                data=short_data
-            ))
-        
-        # 장기 SMA
-        sma_long = data['Close'].rolling(window=long_window).mean()
-        long_data = []
-        for idx, sma_value in sma_long.items():
-            if not pd.isna(sma_value):
-                long_data.append({
-                    "timestamp": idx.isoformat(),
-                    "date": idx.strftime('%Y-%m-%d'),
-                    "value": self.safe_float(sma_value)
-                })
-        
-        if long_data:
-            indicators.append(IndicatorData(
-                name=f"SMA_{long_window}",
-                type="line",
-                color="#82ca9d",
-                data=long_data
-            ))
-        
-        return indicators
-    
-    def _generate_rsi_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
-        """RSI 지표 생성"""
+    def _indicator_lines(self, data: pd.DataFrame, strategy: str, params: Dict[str, Any]) -> List[IndicatorLine]:
+        """전략별 기술 지표 라인 계산 (백테스트와 공유하는 지표 캐시 사용, 실패 시 빈 리스트)"""
         try:
-            period = int(params.get('rsi_period', 14))
-            overbought = float(params.get('rsi_overbought', 70))
-            oversold = float(params.get('rsi_oversold', 30))
-
-            close = pd.Series(data['Close'])
-            delta = close.diff()
-            gain = delta.where(delta > 0, 0.0)
-            loss = -delta.where(delta < 0, 0.0)
-            avg_gain = gain.ewm(alpha=1 / period, adjust=False).mean()
-            avg_loss = loss.ewm(alpha=1 / period, adjust=False).mean()
-            avg_loss = avg_loss.replace(0, np.finfo(float).eps)
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-
-            rsi_data = []
-            for idx, val in rsi.items():
-                if not pd.isna(val):
-                    rsi_data.append({
-                        "timestamp": idx.isoformat(),
-                        "date": idx.strftime('%Y-%m-%d'),
-                        "value": float(val)
-                    })
+            return strategy_indicator_lines(data['Close'], strategy, params, calc=indicator_cache)
+        except Exception as e:
+            self.logger.warning(f"기술 지표 계산 실패({strategy}): {e}")
+            return []
 
-            indicators: List[IndicatorData] = []
-            if rsi_data:
-                indicators.append(IndicatorData(
-                    name=f"RSI_{period}",
-                    type="line",
-                    color="#EC4899",  # pink-500
-                    data=rsi_data
-                ))
+    def _generate_sma_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
+        """SMA 지표 생성"""
+        return self._to_indicator_data(data.index, self._indicator_lines(data, "sma_crossover", params))
 
-                # Overbought/Oversold reference lines
-                ob_data = []
-                os_data = []
-                for idx in data.index:
-                    ob_data.append({
-                        "timestamp": idx.isoformat(),
-                        "date": idx.strftime('%Y-%m-%d'),
-                        "value": overbought
-                    })
-                    os_data.append({
-                        "timestamp": idx.isoformat(),
-                        "date": idx.strftime('%Y-%m-%d'),
-                        "value": oversold
-                    })
-
-                indicators.append(IndicatorData(
-                    name="RSI_OVERBOUGHT",
-                    type="line",
-                    color="#EF4444",  # red-500
-                    data=ob_data
-                ))
-                indicators.append(IndicatorData(
-                    name="RSI_OVERSOLD",
-                    type="line",
-                    color="#10B981",  # green-500
-                    data=os_data
-                ))
+    def _generate_rsi_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
+        """RSI 지표 생성 (과매수/과매도 기준선은 상수 value로 전송)"""
+        return self._to_indicator_data(data.index, self._indicator_lines(data, "rsi_strategy", params))
 
-            return indicators
-        except Exception:
-            return []
-    
     def _generate_bollinger_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
         """볼린저 밴드 지표 생성"""
-        try:
-            period = int(params.get('period', 20))
-            std_dev = float(params.get('std_dev', 2.0))
+        return self._to_indicator_data(data.index, self._indicator_lines(data, "bollinger_bands", params))
 
-            close = pd.Series(data['Close'])
-            sma = close.rolling(window=period).mean()
-            std = close.rolling(window=period).std()
-            upper = sma + (std_dev * std)
-            lower = sma - (std_dev * std)
-
-            indicators: List[IndicatorData] = []
-
-            def make_line(series: pd.Series, name: str, color: str) -> IndicatorData:
-                line = []
-                for idx, val in series.items():
-                    if not pd.isna(val):
-                        line.append({
-                            "timestamp": idx.isoformat(),
-                            "date": idx.strftime('%Y-%m-%d'),
-                            "value": float(val)
-                        })
-                return IndicatorData(name=name, type="line", color=color, data=line)
-
-            indicators.append(make_line(sma, f"SMA_{period}", "#8884d8"))
-            indicators.append(make_line(upper, "BB_UPPER", "#6B7280"))  # gray-500
-            indicators.append(make_line(lower, "BB_LOWER", "#6B7280"))
-
-            return indicators
-        except Exception:
-            return []
-    
     def _generate_macd_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
         """MACD 지표 생성"""
-        try:
-            fast = int(params.get('fast_period', 12))
-            slow = int(params.get('slow_period', 26))
-            signal = int(params.get('signal_period', 9))
-
-            close = pd.Series(data['Close'])
-            ema_fast = close.ewm(span=fast).mean()
-            ema_slow = close.ewm(span=slow).mean()
-            macd = ema_fast - ema_slow
-            sig = macd.ewm(span=signal).mean()
-
-            macd_data = []
-            sig_data = []
-            for idx in data.index:
-                mv = macd.loc[idx] if idx in macd.index else np.nan
-                sv = sig.loc[idx] if idx in sig.index else np.nan
-                if not pd.isna(mv):
-                    macd_data.append({
-                        "timestamp": idx.isoformat(),
-                        "date": idx.strftime('%Y-%m-%d'),
-                        "value": float(mv)
-                    })
-                if not pd.isna(sv):
-                    sig_data.append({
-                        "timestamp": idx.isoformat(),
-                        "date": idx.strftime('%Y-%m-%d'),
-                        "value": float(sv)
-                    })
-
-            indicators: List[IndicatorData] = []
-            if macd_data:
-                indicators.append(IndicatorData(
-                    name="MACD",
-                    type="line",
-                    color="#8B5CF6",  # violet-500
-                    data=macd_data
-                ))
-            if sig_data:
-                indicators.append(IndicatorData(
-                    name="MACD_SIGNAL",
-                    type="line",
-                    color="#F59E0B",  # amber-500
-                    data=sig_data
-                ))
-
-            return indicators
-        except Exception:
-            return []
+        return self._to_indicator_data(data.index, self._indicator_lines(data, "macd_strategy", params))
 
     def _generate_ema_indicators(self, data: pd.DataFrame, params: Dict[str, Any]) -> List[IndicatorData]:
         """EMA 지표 생성"""
-        try:
-            fast = int(params.get('fast_window', 12))
-            slow = int(params.get('slow_window', 26))
-
-            close = pd.Series(data['Close'])
-            ema_fast = close.ewm(span=fast, adjust=False).mean()
-            ema_slow = close.ewm(span=slow, adjust=False).mean()
-
-            def make_line(series: pd.Series, name: str, color: str) -> IndicatorData:
-                line = []
-                for idx, val in series.items():
-                    if not pd.isna(val):
-                        line.append({
-                            "timestamp": idx.isoformat(),
-                            "date": idx.strftime('%Y-%m-%d'),
-                            "value": float(val)
-                        })
-                return IndicatorData(name=name, type="line", color=color, data=line)
-
-            return [
-                make_line(ema_fast, f"EMA_{fast}", "#8B5CF6"),
-                make_line(ema_slow, f"EMA_{slow}", "#F59E0B"),
-            ]
-        except Exception:
+        return self._to_indicator_data(data.index, self._indicator_lines(data, "ema_crossover", params))
+
+    @staticmethod
+    def _to_indicator_data(index: pd.DatetimeIndex, lines: List[IndicatorLine]) -> List[IndicatorData]:
+        """
+        지표 라인을 행 형식으로 변환
+
+        날짜 문자열은 모든 라인이 한 번만 만들어 공유하고, 각 라인은 NaN이 아닌 위치만 골라
+        배열에서 한 번에 꺼냅니다. 상수 기준선은 날짜별 포인트 없이 value 하나만 보냅니다.
+        """
+        if not lines:
             return []
+        dates = format_dates(index)
+        timestamps = [ts.isoformat() for ts in index]
+        indicators: List[IndicatorData] = []
+        for line in lines:
+            if line.values is None:
+                indicators.append(IndicatorData(name=line.name, type="line", color=line.color, data=[], value=line.value))
+                continue
+            positions = np.flatnonzero(~np.isnan(line.values))
+            indicators.append(IndicatorData(
+                name=line.name,
+                type="line",
+                color=line.color,
+                data=[
+                    {"timestamp": timestamps[i], "date": dates[i], "value": value}
+                    for i, value in zip(positions.tolist(), line.values[positions].tolist())
+                ],
+            ))
+        return indicators
     
     def _calculate_backtest_stats(self, data: pd.DataFrame, initial_cash: float) -> Dict[str, Any]:
         """백테스트 통계 계산"""
@@ -8,10 +8,11 @@
 
 **주요 기능**:
 1. get_ticker_data(): 주식 데이터 조회
-   - DB에서 먼저 조회 시도
+   - DB에서 먼저 조회 시도 (load_ticker_data_async: 비동기 엔진 또는 I/O 스레드 풀, 이벤트 루프 블로킹 없음)
    - 데이터가 없으면 yfinance API 호출
    - 조회한 데이터를 DB에 캐싱
-2. 에러 핸들링: 데이터 조회 실패 시 예외 발생
+2. get_many_ticker_data_sync(): 여러 종목 일괄 조회 (DB 일괄 조회 후 빠진 종목만 개별 조회)
+3. 에러 핸들링: 데이터 조회 실패 시 예외 발생
 
 **데이터 소스 우선순위**:
 1. MySQL 데이터베이스 (캐시, 빠름)
@@ -33,15 +34,16 @@ data_service = DataService()
 df = await data_service.get_ticker_data("AAPL", "2023-01-01", "2023-12-31")
 ```
 """
-from typing import Union
+from typing import Dict, List, Union
 from datetime import date
 import pandas as pd
 import logging
 
 from app.repositories.data_repository import data_repository
-from app.services.yfinance_db import load_ticker_data
+from app.services.yfinance_db import load_ticker_data, load_ticker_data_async, load_many_tickers
 from app.utils.data_fetcher import data_fetcher
 from app.core.exceptions import DataNotFoundError
+from app.core.executors import executor_manager
 
 logger = logging.getLogger(__name__)
 
@@ -78,14 +80,16 @@ class DataService:
         try:
             if use_db_first:
                 # 1. DB 캐시에서 조회 시도
-                df = load_ticker_data(ticker, start_date, end_date)
+                df = await load_ticker_data_async(ticker, start_date, end_date)
                 if df is not None and not df.empty:
                     logger.debug(f"DB 캐시에서 데이터 반환: {ticker}")
                     return df
             
             # 2. yfinance에서 실시간 조회
             logger.info(f"yfinance에서 데이터 조회: {ticker}")
-            df = self.data_fetcher.get_stock_data(ticker, start_date, end_date)
+            df = await executor_manager.run_io(
+                self.data_fetcher.get_stock_data, ticker, start_date, end_date, stage="yfinance"
+            )
             
             if df is None or df.empty:
                 raise DataNotFoundError(ticker, str(start_date), str(end_date))
@@ -133,6 +137,37 @@ class DataService:
             logger.error(f"데이터 조회 실패: {ticker}, {e}")
             raise DataNotFoundError(ticker, str(start_date), str(end_date))
 
+    
+    def get_many_ticker_data_sync(
+        self,
+        tickers: List[str],
+        start_date: Union[date, str],
+        end_date: Union[date, str]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목 주식 데이터 조회 (동기 버전)
+        
+        load_many_tickers로 DB 일괄 조회 후, 결과에 없는 종목만 get_ticker_data_sync로 개별 조회합니다.
+        
+        Returns:
+            {티커: DataFrame} (개별 조회에도 실패한 종목은 제외)
+        """
+        frames: Dict[str, pd.DataFrame] = {}
+        try:
+            frames = load_many_tickers(tickers, start_date, end_date)
+        except Exception as e:
+            logger.warning(f"일괄 데이터 조회 실패, 개별 조회로 진행: {e}")
+        
+        for ticker in dict.fromkeys(tickers):
+            if ticker in frames:
+                continue
+            try:
+                frames[ticker] = self.get_ticker_data_sync(ticker, start_date, end_date)
+            except DataNotFoundError as e:
+                logger.warning(f"데이터 조회 실패: {ticker}, {e}")
+        
+        return frames
+
 
 # 전역 인스턴스
 data_service = DataService()
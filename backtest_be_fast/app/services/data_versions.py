@@ -0,0 +1,148 @@
+"""
+티커별 가격 데이터 버전
+
+**역할**:
+- stocks.data_last_update를 티커별 데이터 버전으로 사용 (daily_prices에 행을 쓸 때마다 단조 증가)
+- 프로세스 내 버전 맵을 짧은 주기로 한 번의 일괄 쿼리로 갱신
+- 메모리 가격 캐시, 컬럼 저장소, 백테스트 결과 캐시가 캐시 키/메타에 버전을 포함해
+  다른 프로세스가 적재한 데이터도 갱신 주기 안에 반영 (긴 TTL에서도 오래된 이력 미제공)
+
+**주요 기능**:
+1. bump_version(): 적재 트랜잭션 안에서 data_last_update 증가 후 새 버전 반환
+2. DataVersionMap.get() / get_many(): 갱신 주기가 지난 티커를 일괄 조회 후 버전 반환
+3. DataVersionMap.peek() / set(): DB 조회 없이 현재 버전 확인, 커밋 후 로컬 반영
+4. get_stats(): 추적 티커 수, 일괄 갱신/오류 횟수
+
+**버전 규칙**:
+- 버전 = data_last_update (마이크로초 정수), 기록이 없거나 등록되지 않은 티커는 0
+- 적재 시 GREATEST(NOW(), 기존 값 + 1초)로 갱신 → 같은 초에 여러 번 적재해도 항상 증가
+- 갱신 주기(DATA_VERSION_REFRESH_SECONDS) 안에서는 DB를 조회하지 않음
+- DB 조회 실패 시 마지막으로 알던 버전을 사용하고 다음 주기에 재시도
+- 같은 티커 목록의 동시 갱신은 single-flight로 병합 (조회 1회)
+
+**의존성**:
+- SQLAlchemy: stocks 테이블 접근
+- app/services/yfinance_db.py: DB 엔진
+- app/core/executors.py: 일괄 조회를 I/O 스레드 풀에서 실행
+
+**연관 컴포넌트**:
+- Backend: app/services/yfinance_db.py (save_ticker_data 버전 증가)
+- Backend: app/repositories/data_repository.py (메모리 가격 캐시 버전)
+- Backend: app/repositories/columnar_store.py (컬럼 저장소 버전)
+- Backend: app/services/result_cache.py (결과 캐시 키)
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+
+from app.core.config import settings
+from app.core.executors import executor_manager
+from app.services.yfinance_db import _get_engine
+from app.utils.single_flight import AsyncSingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def _to_version(value) -> int:
+    """data_last_update 값을 마이크로초 정수 버전으로 변환 (없으면 0)"""
+    if value is None:
+        return 0
+    return int(pd.Timestamp(value).value // 1000)
+
+
+def bump_version(conn, stock_id: int) -> int:
+    """data_last_update를 단조 증가시키고 새 버전 반환 (호출자 트랜잭션 안에서 실행)"""
+    conn.execute(
+        text(
+            "UPDATE stocks SET data_last_update = "
+            "GREATEST(NOW(), COALESCE(data_last_update + INTERVAL 1 SECOND, NOW())) WHERE id = :sid"
+        ),
+        {"sid": stock_id},
+    )
+    row = conn.execute(text("SELECT data_last_update FROM stocks WHERE id = :sid"), {"sid": stock_id}).fetchone()
+    return _to_version(row[0] if row else None)
+
+
+class DataVersionMap:
+    """stocks.data_last_update 기반 프로세스 내 티커 버전 맵"""
+
+    def __init__(self, refresh_seconds: Optional[float] = None):
+        self.refresh_seconds = (
+            refresh_seconds if refresh_seconds is not None else settings.data_version_refresh_seconds
+        )
+        self._versions: Dict[str, int] = {}
+        self._checked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._inflight = AsyncSingleFlight()
+        self._stats = {'refreshes': 0, 'errors': 0}
+
+    async def get(self, ticker: str) -> int:
+        return (await self.get_many([ticker]))[ticker]
+
+    async def get_many(self, tickers: Iterable[str]) -> Dict[str, int]:
+        """티커별 버전 (갱신 주기가 지난 티커가 있으면 추적 중인 티커 전체를 한 번에 갱신)"""
+        tickers = list(dict.fromkeys(tickers))
+        now = time.monotonic()
+        with self._lock:
+            stale = [t for t in tickers if t not in self._checked or now - self._checked[t] >= self.refresh_seconds]
+            if stale:
+                stale = list(dict.fromkeys(stale + [
+                    t for t, checked in self._checked.items() if now - checked >= self.refresh_seconds
+                ]))
+        if stale:
+            await self._inflight.do(tuple(sorted(stale)), self._refresh, stale)
+        with self._lock:
+            return {ticker: self._versions.get(ticker, 0) for ticker in tickers}
+
+    def peek(self, ticker: str) -> int:
+        """DB 조회 없이 현재 알고 있는 버전"""
+        with self._lock:
+            return self._versions.get(ticker, 0)
+
+    def set(self, ticker: str, version: int) -> None:
+        """적재 커밋 후 새 버전 반영 (더 낮은 버전으로는 되돌리지 않음)"""
+        with self._lock:
+            self._versions[ticker] = max(self._versions.get(ticker, 0), version)
+            self._checked[ticker] = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'tracked_tickers': len(self._versions), 'refresh_seconds': self.refresh_seconds, **self._stats}
+
+    async def _refresh(self, tickers: List[str]) -> None:
+        """티커 목록 버전 일괄 조회 후 반영 (실패 시 기존 버전 유지)"""
+        checked = time.monotonic()
+        try:
+            versions = await executor_manager.run_io(self._query_versions, tickers, stage="mysql")
+        except Exception as e:
+            self._stats['errors'] += 1
+            logger.warning(f"데이터 버전 조회 실패: {e}")
+            versions = {}
+        else:
+            self._stats['refreshes'] += 1
+        with self._lock:
+            for ticker in tickers:
+                self._versions[ticker] = max(self._versions.get(ticker, 0), versions.get(ticker, 0))
+                self._checked[ticker] = checked
+
+    def _query_versions(self, tickers: List[str]) -> Dict[str, int]:
+        """stocks에서 티커 목록의 data_last_update 일괄 조회"""
+        conn = _get_engine().connect()
+        try:
+            rows = conn.execute(
+                text("SELECT ticker, data_last_update FROM stocks WHERE ticker IN :tickers").bindparams(
+                    bindparam("tickers", expanding=True)
+                ),
+                {"tickers": tickers},
+            ).fetchall()
+            return {row[0]: _to_version(row[1]) for row in rows}
+        finally:
+            conn.close()
+
+
+# 전역 인스턴스
+data_versions = DataVersionMap()
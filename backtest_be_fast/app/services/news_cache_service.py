@@ -0,0 +1,176 @@
+"""
+최신 뉴스 읽기 캐시 서비스
+
+**역할**:
+- 종목 최신 뉴스를 stock_news 테이블에서 먼저 조회하고, 필요할 때만 네이버 검색 API 호출
+- 오래된 캐시는 즉시 응답하고 백그라운드에서 갱신 (stale-while-revalidate)
+- 같은 종목의 동시 갱신은 하나의 API 호출로 병합
+- 급등/급락 이벤트 날짜의 뉴스를 백그라운드에서 stock_news에 보완 (kind='event', 최신 뉴스 캐시와 분리)
+
+**캐시 규칙**:
+- 가장 최근 저장 후 news_cache_fresh_minutes 이내: 캐시 그대로 반환 (API 호출 없음)
+- news_cache_max_age_hours 이내: 캐시 반환 후 백그라운드 갱신
+- 캐시 없음: API 호출 결과를 저장 후 반환 (동일 종목 동시 요청은 병합)
+
+**주요 기능**:
+1. get_latest_news(): 종목 최신 뉴스 조회 (읽기 캐시)
+2. schedule_event_news_backfill(): 이벤트 날짜별 뉴스 보완 작업 예약 (날짜별 검색, 이미 있는 날짜 제외)
+   - 예약 이력은 최근 volatility_news_backfill_history_size개만 유지 (오래된 이력부터 제거)
+3. get_stats(): 캐시 적중/만료/미스 횟수
+
+**의존성**:
+- app/services/news_service.py: 네이버 뉴스 비동기 검색 (공유 커넥션 풀, 분당 호출 한도)
+- app/repositories/news_repository.py: stock_news 조회 및 일괄 저장 (*_async 메서드)
+- app/core/executors.py: 블로킹 날짜별 뉴스 검색을 I/O 스레드 풀에서 실행
+- app/utils/single_flight.py: 종목별 갱신 병합
+
+**연관 컴포넌트**:
+- Backend: app/services/unified_data_service.py (latest_news 섹션, 급등락 이벤트 뉴스 보완 예약)
+- Backend: app/api/v1/endpoints/backtest.py (서비스 주입)
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Set, Tuple
+
+from ..core.config import settings
+from ..core.executors import executor_manager
+from ..repositories.news_repository import news_repository
+from ..utils.single_flight import AsyncSingleFlight
+from .news_service import naver_rate_limiter, news_service
+
+logger = logging.getLogger(__name__)
+
+
+class NewsCacheService:
+    """stock_news 테이블 기반 최신 뉴스 읽기 캐시"""
+
+    def __init__(self, news_service=None, repository=None):
+        """
+        Args:
+            news_service: 뉴스 검색 서비스 (search_news_async 제공)
+            repository: 뉴스 Repository (get_latest_news_async / save_latest_news_async 등 비동기 메서드 제공)
+        """
+        self.news_service = news_service
+        self.repository = repository
+        self._flight = AsyncSingleFlight()
+        self._background: Set[asyncio.Task] = set()
+        # 예약한 (종목, 날짜) 이력 (앞쪽이 가장 오래된 예약)
+        self._backfill_requested: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def get_latest_news(self, symbol: str, display: int = 15) -> List[Dict[str, Any]]:
+        """
+        종목 최신 뉴스 조회
+
+        Args:
+            symbol: 종목 심볼
+            display: 반환할 뉴스 개수
+
+        Returns:
+            뉴스 리스트 [{'title', 'link', 'description', 'pubDate'}]
+        """
+        cached = await self._load_cached(symbol)
+        if cached:
+            ages = [item['age_seconds'] for item in cached if item.get('age_seconds') is not None]
+            if ages and min(ages) < settings.news_cache_fresh_minutes * 60:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self._refresh_in_background(symbol, display)
+            return [self._to_news_item(item) for item in cached[:display]]
+
+        self.misses += 1
+        news_list = await self._flight.do(symbol, self._refresh, symbol, display)
+        return news_list[:display]
+
+    def schedule_event_news_backfill(self, symbol: str, event_dates: List[str]) -> None:
+        """
+        급등/급락 이벤트 날짜의 뉴스 보완 작업을 백그라운드로 예약
+
+        이미 예약한 (종목, 날짜)는 제외하고, 한 번에 최대 volatility_news_backfill_max_dates개 날짜만 처리합니다.
+        """
+        pending = [
+            news_date for news_date in dict.fromkeys(event_dates)
+            if (symbol, news_date) not in self._backfill_requested
+        ][:settings.volatility_news_backfill_max_dates]
+        if not pending:
+            return
+        for news_date in pending:
+            self._backfill_requested[(symbol, news_date)] = None
+        while len(self._backfill_requested) > settings.volatility_news_backfill_history_size:
+            self._backfill_requested.popitem(last=False)
+        task = asyncio.get_running_loop().create_task(self._backfill_event_news(symbol, pending))
+        self._background.add(task)
+        task.add_done_callback(self._finish_background)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'refreshing': len(self._background),
+        }
+
+    async def _load_cached(self, symbol: str) -> List[Dict[str, Any]]:
+        try:
+            return await self.repository.get_latest_news_async(symbol, settings.news_cache_max_age_hours)
+        except Exception as e:
+            logger.warning(f"{symbol} 뉴스 캐시 조회 실패: {e}")
+            return []
+
+    async def _refresh(self, symbol: str, display: int) -> List[Dict[str, Any]]:
+        """네이버 검색 후 stock_news에 저장 (저장 실패는 응답에 영향 없음)"""
+        query = self.news_service.TICKER_MAPPING.get(symbol, symbol)
+        news_list = await self.news_service.search_news_async(query, display=display)
+        try:
+            await self.repository.save_latest_news_async(symbol, news_list)
+        except Exception as e:
+            logger.warning(f"{symbol} 뉴스 캐시 저장 실패: {e}")
+        return news_list
+
+    async def _backfill_event_news(self, symbol: str, event_dates: List[str]) -> int:
+        """이벤트 날짜별 네이버 검색 결과를 stock_news에 저장 (이미 저장된 날짜는 건너뜀)"""
+        query = self.news_service.get_ticker_query(symbol)
+        saved = 0
+        for news_date in event_dates:
+            try:
+                day = date.fromisoformat(news_date)
+                if await self.repository.check_news_exists_async(symbol, day):
+                    continue
+                await naver_rate_limiter.acquire()
+                news_list = await executor_manager.run_io(
+                    self.news_service.search_news_by_date, query, news_date, stage="news"
+                )
+                saved += await self.repository.save_news_async(symbol, day, news_list)
+            except Exception as e:
+                logger.warning(f"{symbol} {news_date} 이벤트 뉴스 보완 실패: {e}")
+        logger.info(f"{symbol} 이벤트 뉴스 보완 완료: {len(event_dates)}개 날짜, {saved}건 저장")
+        return saved
+
+    def _refresh_in_background(self, symbol: str, display: int) -> None:
+        task = asyncio.get_running_loop().create_task(self._flight.do(symbol, self._refresh, symbol, display))
+        self._background.add(task)
+        task.add_done_callback(self._finish_background)
+
+    def _finish_background(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"뉴스 캐시 백그라운드 갱신 실패: {task.exception()}")
+
+    @staticmethod
+    def _to_news_item(row: Dict[str, Any]) -> Dict[str, Any]:
+        """stock_news 행을 검색 API 응답과 같은 형태로 변환 (pubDate는 발행일)"""
+        return {
+            'title': row['title'],
+            'link': row['link'],
+            'description': row['description'],
+            'pubDate': row['news_date']
+        }
+
+
+# 전역 인스턴스
+news_cache_service = NewsCacheService(news_service, news_repository)
@@ -11,25 +11,32 @@
    - 네이버 검색 API 호출
    - HTML 태그 제거 (<b>, &quot; 등)
    - 뉴스 메타데이터 파싱 (제목, 링크, 설명, 날짜)
-2. 뉴스 필터링: 관련성 낮은 뉴스 제외
-3. 날짜별 검색: 특정 기간의 뉴스만 조회
+2. search_news_async(): 비동기 뉴스 검색 (요청 경로용)
+   - 공유 httpx.AsyncClient 커넥션 풀 사용
+   - 프로세스 공유 호출 한도(naver_rate_limiter) 적용, asyncio.sleep 지수 백오프
+3. 뉴스 필터링: 관련성 낮은 뉴스 제외
+4. 날짜별 검색: 특정 기간의 뉴스만 조회
 
 **API 설정**:
 - 네이버 검색 API 키: 환경 변수 (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
-- 요청 제한: 분당 100건, 일일 25,000건
+- 요청 제한: 분당 100건, 일일 25,000건 (NAVER_NEWS_RATE_LIMIT_PER_MINUTE)
 
 **의존성**:
 - app/repositories/news_repository.py: DB에 뉴스 저장 (선택적)
 - app/core/config.py: API 키 설정
+- httpx: 비동기 HTTP 클라이언트
+- app/utils/rate_limiter.py: 분당 호출 한도
 
 **연관 컴포넌트**:
 - Backend: app/services/unified_data_service.py (뉴스 수집 호출)
+- Backend: app/services/news_cache_service.py (DB 캐시 갱신 시 비동기 검색 호출)
 - Backend: app/api/v1/endpoints/backtest.py (뉴스 데이터 응답)
 - Frontend: src/features/backtest/components/NewsSection.tsx (뉴스 표시)
 
 **외부 API**:
 - Naver Search API: https://developers.naver.com/docs/serviceapi/search/news/news.md
 """
+import asyncio
 import logging
 import urllib.request
 import urllib.parse
@@ -37,13 +44,21 @@ import json
 import re
 import time
 import socket
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+import httpx
+
 from ..core.config import settings
+from ..utils.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+NAVER_NEWS_URL = "https://openapi.naver.com/v1/search/news"
+
+# 네이버 검색 API 분당 호출 한도 (모든 요청이 공유)
+naver_rate_limiter = AsyncRateLimiter(settings.naver_news_rate_limit_per_minute, 60.0)
+
 
 class NaverNewsService:
     """네이버 검색 API를 사용한 뉴스 서비스"""
@@ -132,6 +147,9 @@ class NaverNewsService:
         if not self.client_id or not self.client_secret:
             logger.warning("네이버 API 키가 설정되지 않았습니다.")
 
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def remove_html_tags(self, text: str) -> str:
         """HTML 태그 제거"""
         clean = re.compile('<.*?>')
@@ -203,28 +221,9 @@ class NaverNewsService:
                 response = urllib.request.urlopen(request, timeout=10)
                 response_body = response.read()
                 
-                # JSON 파싱
+                # JSON 파싱 후 HTML 태그 제거 및 데이터 정리
                 result = json.loads(response_body.decode('utf-8'))
-                
-                # HTML 태그 제거 및 데이터 정리
-                news_list = []
-                for item in result.get('items', []):
-                    title = self.remove_html_tags(item['title'])
-                    description = self.remove_html_tags(item['description'])
-                    
-                    # 관련성 필터링
-                    if not self.is_relevant_news(title, description):
-                        continue
-                    
-                    news_item = {
-                        'title': title,
-                        'link': item['link'],
-                        'description': description,
-                        'pubDate': item['pubDate']
-                    }
-                    news_list.append(news_item)
-                    
-                return news_list
+                return self._parse_news_items(result)
                 
             except (urllib.error.URLError, socket.gaierror, socket.timeout) as e:
                 if attempt < max_retries - 1:
@@ -239,6 +238,83 @@ class NaverNewsService:
                 logger.error(f"네이버 뉴스 검색 오류: {str(e)}")
                 raise
 
+    async def search_news_async(self, query: str, display: int = 10, sort: str = "date") -> List[Dict[str, Any]]:
+        """네이버 뉴스 검색 (비동기, 공유 커넥션 풀과 분당 호출 한도 사용)"""
+        if not self.client_id or not self.client_secret:
+            raise Exception("네이버 API 키가 설정되지 않았습니다.")
+        
+        max_retries = 3
+        retry_delay = 1
+        
+        for attempt in range(max_retries):
+            await naver_rate_limiter.acquire()
+            try:
+                response = await self._get_async_client().get(
+                    NAVER_NEWS_URL,
+                    params={'query': query, 'display': display, 'sort': sort}
+                )
+                response.raise_for_status()
+                return self._parse_news_items(response.json())
+                
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                # 네트워크 오류, 호출 한도 초과(429), 서버 오류(5xx)만 재시도
+                retryable = (
+                    isinstance(e, httpx.TransportError)
+                    or e.response.status_code == 429
+                    or e.response.status_code >= 500
+                )
+                if retryable and attempt < max_retries - 1:
+                    logger.warning(f"네이버 뉴스 검색 오류 (시도 {attempt + 1}/{max_retries}): {e}")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # 지수 백오프
+                    continue
+                logger.error(f"네이버 뉴스 검색 실패: {str(e)}")
+                raise Exception(f"네이버 뉴스 검색 실패: {str(e)}")
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """이벤트 루프별 공유 비동기 HTTP 클라이언트 (커넥션 재사용)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=settings.naver_news_http_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.naver_news_max_connections,
+                    max_keepalive_connections=settings.naver_news_max_connections
+                ),
+                headers={
+                    "X-Naver-Client-Id": self.client_id,
+                    "X-Naver-Client-Secret": self.client_secret
+                }
+            )
+            self._client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """공유 비동기 HTTP 클라이언트 종료 (애플리케이션 종료 시)"""
+        if self._async_client is not None and not self._async_client.is_closed:
+            await self._async_client.aclose()
+        self._async_client = None
+        self._client_loop = None
+
+    def _parse_news_items(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """검색 API 응답에서 HTML 태그를 제거하고 관련성 낮은 뉴스를 제외"""
+        news_list = []
+        for item in result.get('items', []):
+            title = self.remove_html_tags(item['title'])
+            description = self.remove_html_tags(item['description'])
+            
+            # 관련성 필터링
+            if not self.is_relevant_news(title, description):
+                continue
+            
+            news_list.append({
+                'title': title,
+                'link': item['link'],
+                'description': description,
+                'pubDate': item['pubDate']
+            })
+        return news_list
+
     def search_news_by_date(self, query: str, start_date: str, end_date: str = None, display: int = 100, sort: str = "date") -> List[Dict[str, Any]]:
         """
         날짜별 네이버 뉴스 검색 (검색 후 날짜 필터링)
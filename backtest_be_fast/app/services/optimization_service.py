@@ -0,0 +1,311 @@
+"""
+전략 파라미터 최적화 서비스
+
+**역할**:
+- 전략 파라미터 격자(grid)를 생성하고 각 조합의 백테스트를 프로세스 풀에서 병렬 실행
+- 목적 함수(샤프 비율, 총 수익률, 칼마 비율) 기준으로 결과 순위 산정
+- 완료되는 순서대로 결과를 스트리밍하여 클라이언트 반복 호출 제거
+
+**주요 기능**:
+1. build_parameter_grid(): STRATEGIES 파라미터 정의(min/max)와 요청 범위로 조합 생성
+2. load_price_data(): 가격 데이터 1회 로드 (캐시 저장소 경유)
+3. stream_optimization(): 조합별 결과를 완료 순서대로 비동기 반환
+4. run_optimization(): 전체 결과 테이블과 상위 N개 요약 반환
+
+**실행 방식**:
+- 가격 데이터는 워커 프로세스 초기화 시 1회만 전달 (조합마다 직렬화하지 않음)
+- SMA 기반 전략은 워커 초기화 시 SMA 2~200일을 누적합 1회로 계산해 지표 캐시에 저장 (조합 간 재사용)
+- 조합 검증은 부모 프로세스에서 1회 수행, 워커는 전략 클래스 생성 후 바로 실행
+- 내장 전략은 벡터화 엔진으로 실행, 그 외 전략은 backtesting.py로 실행
+
+**의존성**:
+- concurrent.futures.ProcessPoolExecutor: CPU 바운드 백테스트 병렬화
+- app/services/vectorized_engine.py: 내장 전략 고속 실행
+- app/services/strategy_service.py: 파라미터 정의 및 제약 조건 검증
+
+**연관 컴포넌트**:
+- Backend: app/api/v1/endpoints/backtest.py (POST /api/v1/backtest/optimize)
+- Backend: app/schemas/requests.py (OptimizationRequest)
+"""
+import asyncio
+import itertools
+import logging
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, AsyncIterator
+
+import numpy as np
+import pandas as pd
+from backtesting import Backtest
+
+from app.core.config import settings
+from app.core.exceptions import DataNotFoundError, ValidationError
+from app.repositories.data_repository import data_repository
+from app.schemas.requests import OptimizationRequest, OptimizationObjective, ParameterRange
+from app.services.backtest_engine import backtest_engine
+from app.services.strategy_service import strategy_service
+from app.services.vectorized_engine import vectorized_engine
+from app.strategies.bollinger_strategy import BollingerBandsStrategy
+from app.strategies.sma_strategy import SMACrossStrategy
+from app.utils.indicator_cache import SMA_FAMILY_WINDOWS, indicator_cache
+
+
+logger = logging.getLogger(__name__)
+
+# 목적 함수 → 결과 행의 지표 키
+OBJECTIVE_METRICS = {
+    OptimizationObjective.SHARPE_RATIO: 'sharpe_ratio',
+    OptimizationObjective.TOTAL_RETURN: 'total_return_pct',
+    OptimizationObjective.CALMAR_RATIO: 'calmar_ratio',
+}
+
+# 워커 프로세스별 가격 데이터 (initializer에서 1회 설정)
+_WORKER_PRICE_DATA: Optional[pd.DataFrame] = None
+
+
+def _init_worker(data: pd.DataFrame, warm_sma: bool = False) -> None:
+    """워커 프로세스 초기화 - 가격 데이터 1회 수신 (warm_sma이면 SMA 기간 일괄 계산)"""
+    global _WORKER_PRICE_DATA
+    _WORKER_PRICE_DATA = data
+    if warm_sma:
+        indicator_cache.sma_family(data['Close'], SMA_FAMILY_WINDOWS)
+
+
+def _to_metric(value) -> Optional[float]:
+    """NaN/inf를 None으로 변환한 float"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _evaluate_parameters(
+    strategy_name: str,
+    params: Dict[str, Any],
+    cash: float,
+    commission: float,
+    spread: float,
+) -> Dict[str, Any]:
+    """단일 파라미터 조합 백테스트 (워커 프로세스에서 실행)"""
+    data = _WORKER_PRICE_DATA
+    strategy_class = backtest_engine._build_strategy(strategy_name, params)
+
+    if vectorized_engine.supports(strategy_class):
+        stats = vectorized_engine.run(data, strategy_class, cash=cash, commission=commission, spread=spread)
+    else:
+        stats = Backtest(data, strategy_class, cash=cash, commission=commission, spread=spread).run()
+
+    return {
+        'params': params,
+        'sharpe_ratio': _to_metric(stats['Sharpe Ratio']),
+        'total_return_pct': _to_metric(stats['Return [%]']),
+        'calmar_ratio': _to_metric(stats['Calmar Ratio']),
+        'max_drawdown_pct': _to_metric(stats['Max. Drawdown [%]']),
+        'win_rate_pct': _to_metric(stats['Win Rate [%]']),
+        'total_trades': int(stats['# Trades']),
+        'final_equity': _to_metric(stats['Equity Final [$]']),
+    }
+
+
+class OptimizationService:
+    """전략 파라미터 그리드 최적화 서비스"""
+
+    def __init__(self, data_repository_instance=None, strategy_service_instance=None):
+        self.data_repository = data_repository_instance or data_repository
+        self.strategy_service = strategy_service_instance or strategy_service
+        self.logger = logging.getLogger(__name__)
+
+    def build_parameter_grid(
+        self,
+        strategy_name: str,
+        param_ranges: Optional[Dict[str, ParameterRange]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        파라미터 조합 목록 생성
+
+        Args:
+            strategy_name: 전략 이름
+            param_ranges: 파라미터별 탐색 범위 (미지정 파라미터는 전략 정의의 min/max)
+
+        Returns:
+            제약 조건을 통과한 파라미터 조합 리스트
+        """
+        definitions = self.strategy_service.get_strategy_info(strategy_name)['parameters']
+        param_ranges = param_ranges or {}
+
+        unknown = set(param_ranges) - set(definitions)
+        if unknown:
+            raise ValidationError(f"{strategy_name} 전략에 없는 파라미터: {', '.join(sorted(unknown))}")
+
+        names = list(definitions)
+        axes = [self._axis_values(name, definitions[name], param_ranges.get(name)) for name in names]
+
+        total = math.prod(len(axis) for axis in axes)
+        if total > settings.optimization_max_combinations:
+            raise ValidationError(
+                f"파라미터 조합 수({total})가 최대 허용치({settings.optimization_max_combinations})를 초과합니다"
+            )
+
+        grid = []
+        for values in itertools.product(*axes):
+            params = dict(zip(names, values))
+            try:
+                self.strategy_service.validate_strategy_params(strategy_name, params)
+            except ValueError:
+                continue
+            grid.append(params)
+
+        if not grid:
+            raise ValidationError("제약 조건을 만족하는 파라미터 조합이 없습니다")
+        return grid
+
+    def _axis_values(
+        self, name: str, definition: Dict[str, Any], spec: Optional[ParameterRange]
+    ) -> List[Any]:
+        """단일 파라미터 축의 후보 값 계산 (전략 정의 min/max 범위로 제한)"""
+        param_type = definition['type']
+        lower, upper = definition.get('min'), definition.get('max')
+
+        if spec is not None and spec.values:
+            values = sorted({param_type(v) for v in spec.values})
+        else:
+            low = spec.min if spec is not None and spec.min is not None else lower
+            high = spec.max if spec is not None and spec.max is not None else upper
+            if low is None or high is None:
+                return [definition['default']]
+            if low > high:
+                raise ValidationError(f"{name}의 범위가 올바르지 않습니다: {low} > {high}")
+
+            if spec is not None and spec.step:
+                step = max(1, int(round(spec.step))) if param_type is int else spec.step
+                values = np.arange(low, high + step / 2, step)
+            else:
+                # 증분 미지정 시 양 끝점을 포함해 균등 분할
+                values = np.linspace(low, high, max(settings.optimization_default_grid_points, 2))
+            if param_type is int:
+                values = sorted({int(round(v)) for v in values})
+            else:
+                values = sorted({round(float(v), 6) for v in values})
+
+        values = [
+            v for v in values
+            if (lower is None or v >= lower) and (upper is None or v <= upper)
+        ]
+        if not values:
+            raise ValidationError(f"{name}의 탐색 값이 허용 범위({lower} ~ {upper})를 벗어났습니다")
+        return values
+
+    async def load_price_data(self, request: OptimizationRequest) -> pd.DataFrame:
+        """최적화 대상 가격 데이터 1회 로드"""
+        data = await self.data_repository.get_stock_data(
+            request.ticker, request.start_date, request.end_date
+        )
+        if data is None or data.empty:
+            raise DataNotFoundError(request.ticker, str(request.start_date), str(request.end_date))
+        return data
+
+    async def stream_optimization(
+        self,
+        request: OptimizationRequest,
+        data: pd.DataFrame,
+        grid: List[Dict[str, Any]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        파라미터 조합별 결과를 완료 순서대로 반환
+
+        각 조합 결과는 {'type': 'result', ...} 형태로, 모든 조합 완료 후
+        {'type': 'summary', ...} 형태의 요약(상위 N개 + 전체 결과 테이블)을 반환합니다.
+        """
+        strategy_name = request.strategy.value
+        objective_key = request.objective.value
+        metric_key = OBJECTIVE_METRICS[request.objective]
+
+        max_workers = min(settings.optimization_max_workers or os.cpu_count() or 1, len(grid))
+        started = time.perf_counter()
+        results: List[Dict[str, Any]] = []
+        failed = 0
+
+        self.logger.info(
+            "파라미터 최적화 시작: %s %s, 조합 %d개, 워커 %d개",
+            request.ticker, strategy_name, len(grid), max_workers,
+        )
+
+        strategy_class = self.strategy_service.get_strategy_class(strategy_name)
+        warm_sma = issubclass(strategy_class, (SMACrossStrategy, BollingerBandsStrategy))
+
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(data, warm_sma)
+        )
+        try:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    _evaluate_parameters,
+                    strategy_name,
+                    params,
+                    request.initial_cash,
+                    request.commission,
+                    request.spread,
+                )
+                for params in grid
+            ]
+            for completed in asyncio.as_completed(futures):
+                try:
+                    row = await completed
+                except Exception as e:
+                    failed += 1
+                    self.logger.warning(f"파라미터 조합 평가 실패: {e}")
+                    continue
+                row['objective'] = objective_key
+                row['objective_value'] = row[metric_key]
+                results.append(row)
+                yield {'type': 'result', 'completed': len(results) + failed, 'total': len(grid), **row}
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        ranked = sorted(
+            results,
+            key=lambda r: (r['objective_value'] is None, -(r['objective_value'] or 0.0)),
+        )
+        for rank, row in enumerate(ranked, start=1):
+            row['rank'] = rank
+
+        yield {
+            'type': 'summary',
+            'ticker': request.ticker,
+            'strategy': strategy_name,
+            'objective': objective_key,
+            'total_combinations': len(grid),
+            'failed_combinations': failed,
+            'elapsed_seconds': round(time.perf_counter() - started, 3),
+            'best_params': ranked[0]['params'] if ranked else None,
+            'top_results': ranked[:request.top_n],
+            'results': ranked,
+        }
+
+    async def run_optimization(
+        self,
+        request: OptimizationRequest,
+        data: Optional[pd.DataFrame] = None,
+        grid: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """최적화를 끝까지 실행하고 요약 결과만 반환"""
+        if data is None:
+            data = await self.load_price_data(request)
+        if grid is None:
+            grid = self.build_parameter_grid(request.strategy.value, request.param_ranges)
+
+        summary: Dict[str, Any] = {}
+        async for event in self.stream_optimization(request, data, grid):
+            if event['type'] == 'summary':
+                summary = event
+        summary.pop('type', None)
+        return summary
+
+
+# 글로벌 인스턴스
+optimization_service = OptimizationService()
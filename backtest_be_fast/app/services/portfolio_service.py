@@ -21,8 +21,9 @@
 - dca: 분할 매수 (Dollar Cost Averaging, 정기적으로 나누어 투자)
 
 **리밸런싱**:
-- 주기적으로 포트폴리오 비중을 원래대로 조정
-- 지원 주기: monthly, quarterly, annually, none
+- 주기적으로 포트폴리오 비중을 원래대로 조정 (일시불 포트폴리오, app/services/rebalance_engine.py)
+- 지원 주기: none, daily, weekly, monthly, quarterly, yearly
+- 리밸런싱 매매 금액에 commission 적용 (현금 제외)
 
 **의존성**:
 - app/services/backtest_service.py: 단일 종목 백테스트
@@ -40,16 +41,19 @@
 - 최대 낙폭(Max Drawdown): 최고점 대비 최대 하락폭
 - 승률, 평균 수익/손실
 """
+import asyncio
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, date
 import logging
 from decimal import Decimal
 
 from app.schemas.schemas import PortfolioBacktestRequest, PortfolioStock
 from app.schemas.requests import BacktestRequest
-from app.services.yfinance_db import load_ticker_data
+from app.services.yfinance_db import load_ticker_data, load_many_tickers, build_price_matrix
+from app.services.rebalance_engine import rebalance_engine, REBALANCE_FREQUENCIES
+from app.core.executors import executor_manager
 from app.services.backtest_service import backtest_service
 from app.utils.serializers import recursive_serialize
 from app.core.exceptions import (
@@ -61,6 +65,14 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def _calendar_days(index: pd.Index) -> np.ndarray:
+    """날짜 인덱스를 (현지 시각 기준) 일 단위 datetime64 배열로 변환"""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype('datetime64[D]')
+
 class DCACalculator:
     """분할 매수(DCA) 계산 유틸리티"""
     
@@ -108,161 +120,220 @@ class PortfolioService:
         dca_info: Dict[str, Dict],
         start_date: str,
         end_date: str,
-        rebalance_frequency: str = "monthly"
+        rebalance_frequency: str = "none",
+        commission: float = 0.0
     ) -> pd.DataFrame:
         """
         분할 매수(DCA)를 고려한 포트폴리오 수익률을 계산합니다.
         
+        날짜별 반복 대신 종목마다 거래일/종가 배열을 한 번 만들고, 기준일 종가(searchsorted)와
+        회차별 누적 매수 수량(cumsum)을 날짜 배열 전체에 대해 한 번에 계산합니다.
+        모든 주식 종목이 일시불이고 리밸런싱 주기가 지정되면 rebalance_engine으로 주기
+        리밸런싱(수수료 반영)을 적용합니다. 분할 매수 종목이 있으면 리밸런싱하지 않습니다.
+        
         Args:
             portfolio_data: 각 종목의 가격 데이터 {symbol: DataFrame}
             amounts: 각 종목의 총 투자 금액 {symbol: amount}
             dca_info: 분할 매수 정보 {symbol: {investment_type, dca_periods, monthly_amount}}
             start_date: 시작 날짜
             end_date: 종료 날짜
-            rebalance_frequency: 리밸런싱 주기
+            rebalance_frequency: 리밸런싱 주기 (none, daily, weekly, monthly, quarterly, yearly)
+            commission: 리밸런싱 매매 수수료율
             
         Returns:
             포트폴리오 가치와 수익률이 포함된 DataFrame
         """
+        frequency = (rebalance_frequency or 'none').lower()
+        if frequency not in REBALANCE_FREQUENCIES:
+            raise ValueError(f"지원하지 않는 리밸런싱 주기입니다: {rebalance_frequency}")
+        
         # 현금 처리: asset_type이 'cash'인 항목들은 수익률 0%로 처리
         cash_amount = 0
         for unique_key, amount in amounts.items():
             if dca_info[unique_key].get('asset_type') == 'cash':
                 cash_amount += amount
         
-        stock_amounts = {k: v for k, v in amounts.items() if dca_info[k].get('asset_type') != 'cash'}
+        # 모든 주식 종목의 날짜 범위를 통합 (현금 자산 제외)
+        indexes = [
+            df.index for unique_key, df in portfolio_data.items()
+            if dca_info.get(unique_key, {}).get('asset_type') != 'cash'
+        ]
+        all_dates = indexes[0].append(indexes[1:]).unique().sort_values() if indexes else pd.DatetimeIndex([])
         
-        # 모든 주식 종목의 날짜 범위를 통합
-        all_dates = set()
-        for unique_key, df in portfolio_data.items():
-            # 현금 자산 제외
-            if dca_info.get(unique_key, {}).get('asset_type') != 'cash':
-                all_dates.update(df.index)
-        
-        if not all_dates and cash_amount == 0:
+        if len(all_dates) == 0 and cash_amount == 0:
             raise ValueError("유효한 데이터가 없습니다.")
         
         # 현금만 있는 경우 처리
-        if not all_dates and cash_amount > 0:
+        if len(all_dates) == 0 and cash_amount > 0:
             # 기본 날짜 범위 생성 (1일)
             today = datetime.now().date()
             date_range = pd.DatetimeIndex([today])
         else:
-            date_range = pd.DatetimeIndex(sorted(all_dates))
+            date_range = pd.DatetimeIndex(all_dates)
         
         # 총 투자 금액 계산
         total_amount = sum(amounts.values())
         
-        # 시작/종료 날짜 파싱
-        start_date_obj = datetime.strptime(start_date, '%Y-%m-%d')
-        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d')
+        # 시작/종료 날짜 파싱 (일 단위 datetime64로 비교)
+        start_day = np.datetime64(datetime.strptime(start_date, '%Y-%m-%d').date(), 'D')
+        end_day = np.datetime64(datetime.strptime(end_date, '%Y-%m-%d').date(), 'D')
+        
+        days = _calendar_days(date_range)
+        in_range = (days >= start_day) & (days <= end_day)
+        valid_dates = date_range[in_range]
+        days = days[in_range]
         
-        # 포트폴리오 가치 시뮬레이션
-        portfolio_values = []
-        daily_returns = []
-        prev_portfolio_value = 0
+        stock_items = [
+            info for info in dca_info.values()
+            if info.get('asset_type') != 'cash' and info['symbol'] in portfolio_data
+        ]
+        if (
+            REBALANCE_FREQUENCIES[frequency] is not None
+            and stock_items
+            and all(info['investment_type'] == 'lump_sum' for info in stock_items)
+        ):
+            rebalanced = PortfolioService._calculate_rebalanced_values(
+                portfolio_data, amounts, dca_info, cash_amount, start_day, end_day, frequency, commission
+            )
+            if rebalanced is not None:
+                return PortfolioService._portfolio_returns_frame(
+                    rebalanced.index, rebalanced.to_numpy(), total_amount
+                )
+        
+        # 시작월 대비 경과 개월 수 (분할 매수 회차 계산용)
+        months_passed = days.astype('datetime64[M]').astype(np.int64) - start_day.astype('datetime64[M]').astype(np.int64)
+        
+        # 포트폴리오 가치 시뮬레이션: 종목별 보유 수량 × 기준일 종가를 날짜 배열 전체에 대해 한 번에 계산
+        portfolio_values = np.full(len(days), cash_amount, dtype=float)  # 현금부터 시작
+        price_columns: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
         
-        for current_date in date_range:
-            if current_date.date() < start_date_obj.date():
+        # 각 포트폴리오 항목의 가치 계산 (중복 종목 지원)
+        for unique_key, amount in amounts.items():
+            if dca_info[unique_key].get('asset_type') == 'cash':
                 continue
-            if current_date.date() > end_date_obj.date():
-                break
                 
-            current_portfolio_value = cash_amount  # 현금부터 시작
+            symbol = dca_info[unique_key]['symbol']
+            info = dca_info[unique_key]
+            investment_type = info['investment_type']
             
-            # 각 포트폴리오 항목의 현재 가치 계산 (중복 종목 지원)
-            for unique_key, amount in amounts.items():
-                if dca_info[unique_key].get('asset_type') == 'cash':
+            if symbol not in portfolio_data:
+                continue
+            
+            try:
+                # 같은 종목의 정렬된 거래일/종가 배열은 한 번만 생성
+                if symbol not in price_columns:
+                    df = portfolio_data[symbol]
+                    price_columns[symbol] = (_calendar_days(df.index), df['Close'].to_numpy(dtype=float))
+                price_days, closes = price_columns[symbol]
+                if len(closes) == 0:
                     continue
-                    
-                symbol = dca_info[unique_key]['symbol']
-                info = dca_info[unique_key]
-                investment_type = info['investment_type']
                 
-                if symbol not in portfolio_data:
-                    continue
-                    
-                df = portfolio_data[symbol]
+                # 각 날짜 이전(포함) 마지막 거래일의 종가, 거래 이력이 없는 날은 가치 0
+                position = np.searchsorted(price_days, days, side='right') - 1
+                has_price = position >= 0
+                current_prices = closes[np.maximum(position, 0)]
                 
-                try:
-                    # 해당 날짜의 가격 찾기
-                    price_data = df[df.index.date <= current_date.date()]
-                    if price_data.empty:
-                        continue
-                        
-                    current_price = price_data['Close'].iloc[-1]
+                if investment_type == 'lump_sum':
+                    # 일시불 투자: 시작일 이후 첫 거래일 종가로 전액 매수
+                    first = np.searchsorted(price_days, start_day, side='left')
+                    shares = np.full(len(days), amount / closes[first] if first < len(closes) else 0.0)
+                    # 시작일 당일은 데이터 첫 종가 기준 (기존 계산 방식 유지)
+                    shares[days == start_day] = amount / closes[0]
                     
-                    if investment_type == 'lump_sum':
-                        # 일시불 투자: 시작일에 전액 투자
-                        if current_date.date() == start_date_obj.date():
-                            # 시작 가격으로 주식 수량 계산
-                            start_price = price_data['Close'].iloc[0] if not price_data.empty else current_price
-                            shares = amount / start_price
-                        else:
-                            # 이전에 계산된 주식 수량 유지 (간단히 첫날 기준으로 계산)
-                            first_price_data = df[df.index.date >= start_date_obj.date()]
-                            if not first_price_data.empty:
-                                start_price = first_price_data['Close'].iloc[0]
-                                shares = amount / start_price
-                            else:
-                                shares = 0
-                        
-                        stock_value = shares * current_price
-                        
-                    else:  # DCA
-                        # 분할 매수: 매월 일정 금액씩 투자
-                        dca_periods = info['dca_periods']
-                        monthly_amount = info['monthly_amount']
-                        
-                        # 현재까지 투자한 개월 수 계산
-                        months_passed = (current_date.year - start_date_obj.year) * 12 + (current_date.month - start_date_obj.month)
-                        months_invested = min(months_passed + 1, dca_periods)  # 시작월 포함
-                        
-                        # 매월 투자한 주식의 누적 가치 계산
-                        total_shares = 0
-                        for month in range(months_invested):
-                            # 각 월의 첫 거래일 가격으로 매수
-                            investment_date = start_date_obj + timedelta(days=30 * month)
-                            month_price_data = df[df.index.date >= investment_date.date()]
-                            
-                            if not month_price_data.empty:
-                                month_price = month_price_data['Close'].iloc[0]
-                                shares_bought = monthly_amount / month_price
-                                total_shares += shares_bought
-                        
-                        stock_value = total_shares * current_price
+                else:  # DCA
+                    # 분할 매수: 30일 간격 매수일마다 그 이후 첫 거래일 종가로 매수
+                    dca_periods = info['dca_periods']
+                    monthly_amount = info['monthly_amount']
                     
-                    current_portfolio_value += stock_value
+                    purchase_days = start_day + 30 * np.arange(dca_periods)
+                    purchase = np.searchsorted(price_days, purchase_days, side='left')
+                    filled = purchase < len(closes)
+                    shares_bought = np.zeros(dca_periods)
+                    shares_bought[filled] = monthly_amount / closes[purchase[filled]]
                     
-                except Exception as e:
-                    logger.warning(f"포트폴리오 항목 {unique_key} (종목: {symbol}) 가치 계산 오류 ({current_date}): {e}")
-                    continue
-            
-            # 일일 수익률 계산
-            if prev_portfolio_value > 0:
-                daily_return = (current_portfolio_value - prev_portfolio_value) / prev_portfolio_value
-            else:
-                daily_return = 0.0
-            
-            portfolio_values.append(current_portfolio_value / total_amount)  # 정규화된 가치
-            daily_returns.append(daily_return)
-            prev_portfolio_value = current_portfolio_value
+                    # 현재까지 투자한 회차(시작월 포함, 최대 dca_periods)의 누적 수량
+                    cumulative_shares = np.concatenate(([0.0], np.cumsum(shares_bought)))
+                    shares = cumulative_shares[np.clip(months_passed + 1, 0, dca_periods)]
+                
+                portfolio_values += np.where(has_price, shares * current_prices, 0.0)
+                
+            except Exception as e:
+                logger.warning(f"포트폴리오 항목 {unique_key} (종목: {symbol}) 가치 계산 오류: {e}")
+                continue
         
-        # 결과 DataFrame 생성
-        valid_dates = [d for d in date_range if start_date_obj.date() <= d.date() <= end_date_obj.date()]
+        return PortfolioService._portfolio_returns_frame(valid_dates, portfolio_values, total_amount)
+    
+    @staticmethod
+    def _calculate_rebalanced_values(
+        portfolio_data: Dict[str, pd.DataFrame],
+        amounts: Dict[str, float],
+        dca_info: Dict[str, Dict],
+        cash_amount: float,
+        start_day: np.datetime64,
+        end_day: np.datetime64,
+        frequency: str,
+        commission: float
+    ) -> Optional[pd.Series]:
+        """
+        일시불 포트폴리오의 주기 리밸런싱 가치 곡선 계산 (금액 단위)
+        
+        종목별 목표 비중은 투자 금액 합으로 정하고(중복 종목 합산), 현금은 가격 1.0 자산으로 포함합니다
+        (현금 매매분에는 수수료 없음).
+        모든 종목 가격이 있는 첫 거래일부터 시뮬레이션하며, 그런 날이 없으면 None을 반환합니다.
+        """
+        symbol_amounts: Dict[str, float] = {}
+        for unique_key, amount in amounts.items():
+            info = dca_info[unique_key]
+            if info.get('asset_type') == 'cash' or info['symbol'] not in portfolio_data:
+                continue
+            symbol_amounts[info['symbol']] = symbol_amounts.get(info['symbol'], 0) + amount
+        
+        prices = build_price_matrix({symbol: portfolio_data[symbol] for symbol in symbol_amounts})
+        if prices.empty:
+            return None
+        days = _calendar_days(prices.index)
+        prices = prices[(days >= start_day) & (days <= end_day)].ffill()
+        complete = prices.notna().all(axis=1).to_numpy()
+        if not complete.any():
+            return None
+        first = int(complete.argmax())
+        if first > 0:
+            logger.info(f"리밸런싱 시뮬레이션은 모든 종목 가격이 있는 {prices.index[first]}부터 시작합니다")
+        prices = prices.iloc[first:]
+        
+        invested = dict(symbol_amounts)
+        if cash_amount > 0:
+            prices = prices.assign(CASH=1.0)
+            invested['CASH'] = cash_amount
+        initial_value = sum(invested.values())
+        weights = np.array([invested[column] for column in prices.columns], dtype=float) / initial_value
         
-        if len(portfolio_values) != len(valid_dates):
-            # 길이가 맞지 않으면 기본값으로 채움
-            portfolio_values = [1.0] * len(valid_dates)
-            daily_returns = [0.0] * len(valid_dates)
+        commission_free = (prices.columns == 'CASH') if cash_amount > 0 else None
         
-        result = pd.DataFrame({
-            'Date': valid_dates,
-            'Portfolio_Value': portfolio_values,
-            'Daily_Return': daily_returns,
-            'Cumulative_Return': [(v - 1) * 100 for v in portfolio_values]
-        })
-        result.set_index('Date', inplace=True)
+        return rebalance_engine.simulate(prices, weights, frequency, commission, initial_value, commission_free)
+    
+    @staticmethod
+    def _portfolio_returns_frame(dates: pd.Index, portfolio_values: np.ndarray, total_amount: float) -> pd.DataFrame:
+        """금액 단위 가치 배열로 Portfolio_Value/Daily_Return/Cumulative_Return DataFrame 생성"""
+        # 일일 수익률 계산 (직전 가치가 0 이하인 날은 0)
+        prev_portfolio_values = np.concatenate(([0.0], portfolio_values[:-1]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            daily_returns = np.where(
+                prev_portfolio_values > 0,
+                (portfolio_values - prev_portfolio_values) / prev_portfolio_values,
+                0.0,
+            )
+        normalized_values = portfolio_values / total_amount  # 정규화된 가치
+        
+        # 결과 DataFrame 생성
+        result = pd.DataFrame(
+            {
+                'Portfolio_Value': normalized_values,
+                'Daily_Return': daily_returns,
+                'Cumulative_Return': (normalized_values - 1) * 100,
+            },
+            index=pd.DatetimeIndex(dates, name='Date'),
+        )
         
         return result
     
@@ -341,71 +412,128 @@ class PortfolioService:
         
         return max_count
     
-    async def _calculate_realistic_equity_curve(self, request: PortfolioBacktestRequest, 
-                                              portfolio_results: Dict, total_amount: float) -> Tuple[Dict, Dict]:
+    async def _load_many_ticker_data(self, symbols: List[str], start_date, end_date) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목 가격 데이터 일괄 로드 (stock_id/가격 조회를 종목 수와 무관하게 한 번씩)
+        
+        일괄 조회에 실패하거나 결과에 없는 종목은 호출자가 load_ticker_data로 개별 조회합니다.
         """
-        실제 종목 데이터를 기반으로 포트폴리오 equity curve 계산
+        if not symbols:
+            return {}
+        try:
+            return await executor_manager.run_io(
+                load_many_tickers, list(dict.fromkeys(symbols)), start_date, end_date, stage="data"
+            )
+        except Exception as e:
+            logger.warning(f"종목 일괄 로드 실패, 개별 로드로 진행: {e}")
+            return {}
+    
+    async def _load_portfolio_price_data(self, symbols: List[str], start_date, end_date) -> Dict[str, pd.DataFrame]:
         """
-        from datetime import datetime
-        import pandas as pd
+        포트폴리오 종목 가격 데이터 로드 {symbol: DataFrame} (일괄 조회 후 빠진 종목만 개별 조회)
         
-        # 각 종목의 실제 가격 데이터 로드
-        portfolio_data = {}
+        데이터가 없거나 조회에 실패한 종목은 결과에서 제외합니다.
+        """
+        loaded = await self._load_many_ticker_data(symbols, start_date, end_date)
+        price_data = {}
+        for symbol in dict.fromkeys(symbols):
+            df = loaded.get(symbol)
+            if df is None:
+                try:
+                    df = await executor_manager.run_io(
+                        load_ticker_data, symbol, start_date, end_date, stage="data"
+                    )
+                except Exception as e:
+                    logger.warning(f"종목 {symbol} 데이터 로드 실패: {e}")
+                    continue
+            if df is not None and not df.empty:
+                price_data[symbol] = df
+        return price_data
+    
+    async def _run_asset_backtests(self, backtest_jobs: Dict[Tuple[str, float], BacktestRequest],
+                                   price_data: Dict[str, pd.DataFrame]) -> Dict[Tuple[str, float], Any]:
+        """
+        종목별 전략 백테스트 동시 실행
+        
+        동시에 실행하는 백테스트 수는 settings.portfolio_backtest_concurrency로 제한하고
+        (실제 실행은 executor_manager의 백테스트 풀), 미리 로드한 가격 데이터를 전달합니다.
+        실패한 항목은 예외 객체를 결과로 반환합니다.
+        """
+        semaphore = asyncio.Semaphore(max(1, settings.portfolio_backtest_concurrency))
+        
+        async def run(symbol: str, backtest_req: BacktestRequest):
+            async with semaphore:
+                return await backtest_service.run_backtest(backtest_req, data=price_data.get(symbol))
+        
+        outcomes = await asyncio.gather(
+            *(run(symbol, backtest_req) for (symbol, _), backtest_req in backtest_jobs.items()),
+            return_exceptions=True
+        )
+        return dict(zip(backtest_jobs.keys(), outcomes))
+    
+    async def _calculate_realistic_equity_curve(self, request: PortfolioBacktestRequest, 
+                                              portfolio_results: Dict, total_amount: float,
+                                              price_data: Optional[Dict[str, pd.DataFrame]] = None) -> Tuple[Dict, Dict]:
+        """
+        종목별 전략 자산 곡선을 결합해 포트폴리오 equity curve 계산
+        
+        각 종목 백테스트의 자산 곡선(equity_curve)을 날짜 합집합으로 정렬해 전진 채움한 뒤 합산합니다.
+        자산 곡선이 없는 종목(fallback 결과)은 보유 가정(투자금 × 종가 / 시작 종가)으로, 현금은 투자금으로 반영합니다.
+        (price_data: 종목 백테스트 단계에서 로드한 가격 데이터, 없으면 필요한 종목만 새로 로드)
+        """
+        curves: Dict[str, pd.Series] = {}
+        missing = []
         for unique_key, result in portfolio_results.items():
-            # original_symbol을 사용하여 실제 티커로 데이터 로드
-            original_symbol = result.get('original_symbol', result.get('symbol'))
-            if original_symbol and original_symbol not in portfolio_data:
-                df = load_ticker_data(original_symbol, request.start_date, request.end_date)
+            if result.get('asset_type') == 'cash':
+                continue
+            equity = result.get('equity_curve')
+            if isinstance(equity, pd.Series) and not equity.empty:
+                curves[unique_key] = equity
+            else:
+                missing.append(unique_key)
+        
+        if missing:
+            if price_data is None:
+                symbols = [
+                    portfolio_results[unique_key].get('original_symbol', portfolio_results[unique_key].get('symbol'))
+                    for unique_key in missing
+                ]
+                price_data = await self._load_portfolio_price_data(
+                    [symbol for symbol in symbols if symbol], request.start_date, request.end_date
+                )
+            for unique_key in missing:
+                result = portfolio_results[unique_key]
+                df = price_data.get(result.get('original_symbol', result.get('symbol')))
                 if df is not None and not df.empty:
-                    portfolio_data[unique_key] = df
+                    close = df['Close'].astype(float)
+                    curves[unique_key] = result['amount'] * close / close.iloc[0]
         
-        if not portfolio_data:
+        if not curves:
             # 데이터가 없으면 기본 선형 계산으로 fallback
             return self._fallback_equity_curve(request, portfolio_results, total_amount)
         
-        # 모든 데이터의 공통 날짜 범위 찾기
-        all_dates = set()
-        for df in portfolio_data.values():
-            all_dates.update(df.index.strftime('%Y-%m-%d'))
+        # 날짜(일 단위) x 종목 행렬로 정렬: 곡선 시작 전은 투자금, 이후 거래가 없는 날은 직전 값
+        aligned = {}
+        for unique_key, curve in curves.items():
+            index = pd.DatetimeIndex(_calendar_days(curve.index))
+            series = pd.Series(curve.to_numpy(dtype=float), index=index)
+            aligned[unique_key] = series[~index.duplicated(keep='last')]
+        matrix = pd.concat(aligned, axis=1).sort_index().ffill()
+        matrix = matrix.fillna({unique_key: portfolio_results[unique_key]['amount'] for unique_key in matrix.columns})
         
-        date_range = sorted(all_dates)
+        cash_value = sum(
+            result['amount'] for result in portfolio_results.values() if result.get('asset_type') == 'cash'
+        )
+        portfolio_values = matrix.to_numpy().sum(axis=1) + cash_value
         
-        equity_curve = {}
-        daily_returns = {}
-        prev_portfolio_value = total_amount
-        
-        for i, date_str in enumerate(date_range):
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-            portfolio_value = 0
-            
-            # 각 종목의 해당 날짜 가치 계산
-            for unique_key, result in portfolio_results.items():
-                if unique_key in portfolio_data:
-                    df = portfolio_data[unique_key]
-                    try:
-                        # 해당 날짜의 가격 찾기
-                        price_data = df[df.index.strftime('%Y-%m-%d') == date_str]
-                        if not price_data.empty:
-                            current_price = price_data['Close'].iloc[0]
-                            initial_price = df['Close'].iloc[0]
-                            
-                            # 해당 종목의 투자 금액 기준 현재 가치
-                            stock_value = result['amount'] * (current_price / initial_price)
-                            portfolio_value += stock_value
-                    except:
-                        # 데이터가 없으면 초기값 유지
-                        portfolio_value += result['amount']
-            
-            # 일일 수익률 계산
-            if i == 0:
-                daily_return = 0.0
-            else:
-                daily_return = (portfolio_value - prev_portfolio_value) / prev_portfolio_value * 100 if prev_portfolio_value > 0 else 0.0
-            
-            equity_curve[date_str] = portfolio_value
-            daily_returns[date_str] = daily_return
-            prev_portfolio_value = portfolio_value
+        # 일일 수익률 (%)
+        prev_values = np.concatenate(([portfolio_values[0]], portfolio_values[:-1]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            daily = np.where(prev_values > 0, (portfolio_values - prev_values) / prev_values * 100, 0.0)
         
+        dates = matrix.index.strftime('%Y-%m-%d')
+        equity_curve = dict(zip(dates, portfolio_values.tolist()))
+        daily_returns = dict(zip(dates, daily.tolist()))
         return equity_curve, daily_returns
     
     def _fallback_equity_curve(self, request: PortfolioBacktestRequest, 
@@ -444,12 +572,14 @@ class PortfolioService:
         
         return equity_curve, daily_returns
     
-    async def run_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
+    async def run_portfolio_backtest(self, request: PortfolioBacktestRequest,
+                                     price_frames: Optional[Dict[str, pd.DataFrame]] = None) -> Dict[str, Any]:
         """
         포트폴리오 백테스트 실행
         
         Args:
             request: 포트폴리오 백테스트 요청
+            price_frames: 요청 단위 가격 데이터 맵 (주어지면 로드한 종목 데이터를 채워 이후 단계와 공유)
             
         Returns:
             백테스트 결과
@@ -460,9 +590,9 @@ class PortfolioService:
 
             # 전략이 buy_hold_strategy가 아닌 경우 개별 종목별로 전략 백테스트 실행
             if strategy_name != "buy_hold_strategy":
-                return await self.run_strategy_portfolio_backtest(request)
+                return await self.run_strategy_portfolio_backtest(request, price_frames)
             else:
-                return await self.run_buy_and_hold_portfolio_backtest(request)
+                return await self.run_buy_and_hold_portfolio_backtest(request, price_frames)
                 
         except Exception as e:
             logger.exception("포트폴리오 백테스트 실행 중 오류 발생")
@@ -472,7 +602,8 @@ class PortfolioService:
                 'code': 'PORTFOLIO_BACKTEST_ERROR'
             }
     
-    async def run_strategy_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
+    async def run_strategy_portfolio_backtest(self, request: PortfolioBacktestRequest,
+                                              price_frames: Optional[Dict[str, pd.DataFrame]] = None) -> Dict[str, Any]:
         """
         전략 기반 포트폴리오 백테스트 실행
         각 종목에 동일한 전략을 적용하고 투자 금액으로 결합
@@ -496,7 +627,34 @@ class PortfolioService:
             strategy_name = request.strategy.value if hasattr(request.strategy, 'value') else str(request.strategy)
             logger.info(f"전략 기반 백테스트: {strategy_name}, 총 투자금액: ${total_amount:,.2f}")
             
-            # 각 종목별로 전략 백테스트 실행 (중복 종목 지원)
+            # 현금이 아닌 종목의 가격 데이터는 한 번만 로드 (종목 백테스트와 equity curve 단계에서 재사용)
+            price_data = await self._load_portfolio_price_data(
+                [item.symbol for item in request.portfolio if item.asset_type != 'cash'],
+                request.start_date, request.end_date
+            )
+            if price_frames is not None:
+                price_frames.update(price_data)
+            
+            # 동일한 (종목, 투자금액) 항목은 한 번만 백테스트 (전략/파라미터는 포트폴리오 공통)
+            backtest_jobs = {}
+            for idx, item in enumerate(request.portfolio):
+                if item.asset_type == 'cash':
+                    continue
+                job_key = (item.symbol, amounts[f"{item.symbol}_{idx}"])
+                if job_key not in backtest_jobs:
+                    backtest_jobs[job_key] = BacktestRequest(
+                        ticker=item.symbol,
+                        start_date=request.start_date,
+                        end_date=request.end_date,
+                        initial_cash=job_key[1],
+                        strategy=strategy_name,
+                        strategy_params=request.strategy_params or {}
+                    )
+            
+            # 종목 백테스트 동시 실행 (동시 실행 수 제한)
+            backtest_outcomes = await self._run_asset_backtests(backtest_jobs, price_data)
+            
+            # 각 종목별 결과 결합 (중복 종목 지원)
             for idx, item in enumerate(request.portfolio):
                 symbol = item.symbol
                 # amount/weight 동시 지원
@@ -517,6 +675,7 @@ class PortfolioService:
                         'return_pct': 0.0,  # 현금 수익률 0%
                         'weight': weight,
                         'amount': amount,
+                        'asset_type': 'cash',
                         'strategy_stats': {
                             'total_trades': 0,
                             'win_rate_pct': 0.0,
@@ -543,20 +702,11 @@ class PortfolioService:
                 
                 logger.info(f"종목 {symbol} (#{idx+1}) 전략 백테스트 실행 (투자금액: ${amount:,.2f}, 비중: {weight:.3f})")
                 
-                # 개별 종목 백테스트 요청 생성
-                strategy_value = strategy_name  # 이미 위에서 변환한 strategy_name 사용
-                backtest_req = BacktestRequest(
-                    ticker=symbol,
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                    initial_cash=amount,
-                    strategy=strategy_value,
-                    strategy_params=request.strategy_params or {}
-                )
-                
                 try:
-                    # 개별 종목 백테스트 실행
-                    result = await backtest_service.run_backtest(backtest_req)
+                    # 동시 실행된 개별 종목 백테스트 결과 (실패 시 예외 객체)
+                    result = backtest_outcomes.get((symbol, amount))
+                    if isinstance(result, BaseException):
+                        raise result
                     
                     if result and hasattr(result, 'final_equity'):
                         final_value = result.final_equity
@@ -571,7 +721,10 @@ class PortfolioService:
                             'return_pct': stock_return,
                             'weight': weight,
                             'amount': amount,
-                            'strategy_stats': result.__dict__  # 객체를 딕셔너리로 변환
+                            'equity_curve': getattr(result, 'equity_curve', None),  # 일별 자산 곡선 (equity curve 결합용)
+                            'strategy_stats': {  # 객체를 딕셔너리로 변환 (자산 곡선 제외)
+                                key: value for key, value in result.__dict__.items() if key != 'equity_curve'
+                            }
                         }
                         
                         individual_returns[unique_key] = {
@@ -662,7 +815,7 @@ class PortfolioService:
             # 실제 포트폴리오 equity curve 생성
             # 각 종목의 실제 가격 데이터를 기반으로 일일 포트폴리오 가치 계산
             equity_curve, daily_returns = await self._calculate_realistic_equity_curve(
-                request, portfolio_results, total_amount
+                request, portfolio_results, total_amount, price_data
             )
 
             # individual_results를 리스트 형태로 변환 (테스트 호환성)
@@ -715,7 +868,8 @@ class PortfolioService:
                 'code': 'STRATEGY_PORTFOLIO_BACKTEST_ERROR'
             }
     
-    async def run_buy_and_hold_portfolio_backtest(self, request: PortfolioBacktestRequest) -> Dict[str, Any]:
+    async def run_buy_and_hold_portfolio_backtest(self, request: PortfolioBacktestRequest,
+                                                  price_frames: Optional[Dict[str, pd.DataFrame]] = None) -> Dict[str, Any]:
         """
         Buy & Hold 포트폴리오 백테스트 실행 (투자 금액 기반)
         현금(CASH)과 주식을 함께 처리, 분할 매수(DCA) 지원
@@ -735,6 +889,12 @@ class PortfolioService:
                 raise ValidationError('포트폴리오 내 모든 종목은 amount 또는 weight 중 하나만 입력해야 합니다.')
             cash_amount = 0
             
+            # 현금이 아닌 종목은 DB에서 한 번에 일괄 조회
+            loaded = await self._load_many_ticker_data(
+                [item.symbol for item in request.portfolio if getattr(item, 'asset_type', 'stock') != 'cash'],
+                request.start_date, request.end_date
+            )
+            
             # 분할 매수 정보 수집 (중복 종목 지원)
             dca_info = {}
             
@@ -770,7 +930,11 @@ class PortfolioService:
                 
                 # DB에서 데이터 로드 (동일 종목은 한 번만 로드)
                 if symbol not in portfolio_data:
-                    df = load_ticker_data(symbol, request.start_date, request.end_date)
+                    df = loaded.get(symbol)
+                    if df is None:
+                        df = await executor_manager.run_io(
+                            load_ticker_data, symbol, request.start_date, request.end_date, stage="data"
+                        )
                     
                     if df is None or df.empty:
                         logger.warning(f"종목 {symbol}의 데이터가 없습니다.")
@@ -781,6 +945,9 @@ class PortfolioService:
                 
                 amounts[unique_key] = amount
             
+            if price_frames is not None:
+                price_frames.update(portfolio_data)
+            
             # 현금만 있는 경우 처리
             if not portfolio_data and cash_amount > 0:
                 logger.info("현금만 있는 포트폴리오로 백테스트 실행")
@@ -858,7 +1025,8 @@ class PortfolioService:
             # 분할 매수를 고려한 포트폴리오 수익률 계산
             logger.info("분할 매수를 고려한 포트폴리오 수익률 계산 중...")
             portfolio_result = self.calculate_dca_portfolio_returns(
-                portfolio_data, amounts, dca_info, request.start_date, request.end_date, request.rebalance_frequency
+                portfolio_data, amounts, dca_info, request.start_date, request.end_date,
+                request.rebalance_frequency, request.commission
             )
             
             # 통계 계산
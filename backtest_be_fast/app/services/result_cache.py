@@ -0,0 +1,346 @@
+"""
+백테스트 결과 캐시
+
+**역할**:
+- 같은 요청(종목, 기간, 전략, 파라미터, 자본, 수수료, 스프레드, 벤치마크, 엔진)과 같은 가격 데이터에 대한
+  BacktestResult를 재계산 없이 반환
+- 프로세스 내 LRU 계층 + MySQL backtest_results 테이블 영속 계층 (재시작/다른 워커 프로세스와 공유)
+- save_ticker_data가 새 가격 행을 저장하면 해당 티커(대상 또는 벤치마크)의 결과를 자동 무효화
+- 캐시 키에 티커별 데이터 버전(stocks.data_last_update)을 포함해 다른 프로세스의 적재도 반영
+
+**주요 기능**:
+1. request_fingerprint(): 요청의 결과에 영향을 주는 필드만 정규화한 SHA-256 해시
+2. key(): 요청 지문 + 티커별 데이터 버전으로 캐시 키 생성 (조회용)
+   loaded_key(): 데이터 조회 직후 알고 있는 버전으로 캐시 키 생성 (저장용, 조회 중 적재로 바뀐 버전 반영)
+3. get() / put(): 메모리 → MySQL 순서 조회, 양쪽 계층 저장
+4. delete_rows() / invalidate(): 적재 트랜잭션 안에서 영속 행 삭제, 커밋 후 메모리 항목 제거
+5. get_stats(): 계층별 적중/미스/저장/무효화 카운터
+
+**캐시 키 규칙**:
+- chart_format, max_points 등 차트 전용 필드는 제외 (같은 결과)
+- 파라미터는 키 정렬 JSON, 정수 값 float(10.0)는 int(10)로 정규화
+- 데이터 버전은 DataVersionMap(app/services/data_versions.py)의 티커별 버전
+  (계산 중 버전이 바뀐 결과는 저장하지 않음, 이전 버전 키의 영속 행은 조회되지 않음)
+
+**저장 형식**:
+- payload: BacktestResult JSON + 일별 자산 곡선(equity_curve, 응답 직렬화에서 제외되는 필드)
+- 가격 데이터를 직접 넘긴 실행(data 인자)과 fallback 결과는 캐시하지 않음 (BacktestEngine에서 처리)
+
+**DB 스키마**:
+- 테이블: backtest_results (cache_key, ticker, benchmark_ticker, payload, created_at)
+- 인덱스: ticker, benchmark_ticker (무효화 삭제용)
+
+**의존성**:
+- SQLAlchemy: backtest_results 접근
+- app/services/yfinance_db.py: DB 엔진
+- app/core/executors.py: DB 조회/저장을 I/O 스레드 풀에서 실행
+- app/services/data_versions.py: 티커별 데이터 버전
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_engine.py (run_backtest 조회/저장)
+- Backend: app/services/yfinance_db.py (save_ticker_data 무효화)
+- Database: database/schema.sql (테이블 정의)
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.executors import executor_manager
+from app.schemas.requests import BacktestRequest
+from app.schemas.responses import BacktestResult
+from app.services.data_versions import DataVersionMap, data_versions
+from app.services.yfinance_db import _get_engine
+
+logger = logging.getLogger(__name__)
+
+_RESULTS_DDL = """
+CREATE TABLE IF NOT EXISTS backtest_results (
+    cache_key CHAR(64) NOT NULL,
+    ticker VARCHAR(20) NOT NULL,
+    benchmark_ticker VARCHAR(20) NULL,
+    payload MEDIUMTEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (cache_key),
+    INDEX idx_ticker (ticker),
+    INDEX idx_benchmark_ticker (benchmark_ticker)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+"""
+
+
+class ResultCacheKey(NamedTuple):
+    """캐시 키 (계산 시점의 티커별 데이터 버전 포함)"""
+    digest: str
+    ticker: str
+    benchmark_ticker: Optional[str]
+    versions: Tuple[int, ...]
+
+    @property
+    def tickers(self) -> Tuple[str, ...]:
+        return (self.ticker, self.benchmark_ticker) if self.benchmark_ticker else (self.ticker,)
+
+
+def _canonical(value: Any) -> Any:
+    """지문 계산용 값 정규화 (정수 값 float → int, 중첩 dict/list 재귀)"""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return int(value) if float(value).is_integer() else float(value)
+    if hasattr(value, 'value'):  # Enum
+        return value.value
+    return value
+
+
+def request_fingerprint(request: BacktestRequest, engine_mode: str) -> str:
+    """결과에 영향을 주는 요청 필드의 정규화 SHA-256 해시"""
+    payload = {
+        'ticker': request.ticker,
+        'start_date': str(request.start_date),
+        'end_date': str(request.end_date),
+        'strategy': _canonical(request.strategy),
+        'strategy_params': _canonical(request.strategy_params or {}),
+        'initial_cash': _canonical(request.initial_cash),
+        'commission': _canonical(request.commission),
+        'spread': _canonical(request.spread or 0.0),
+        'benchmark_ticker': request.benchmark_ticker or None,
+        'engine_mode': engine_mode,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps가 처리하지 못하는 numpy/pandas 값 변환"""
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.isoformat()
+    if isinstance(value, pd.Timedelta):
+        return str(value)
+    return str(value)
+
+
+def _dump_payload(result: BacktestResult) -> str:
+    equity_curve = None
+    if isinstance(result.equity_curve, pd.Series):
+        equity_curve = {
+            'dates': [ts.isoformat() for ts in result.equity_curve.index],
+            'values': result.equity_curve.astype(float).tolist(),
+        }
+    return json.dumps({'result': result.model_dump(), 'equity_curve': equity_curve}, default=_json_default)
+
+
+def _load_payload(payload: str) -> BacktestResult:
+    data = json.loads(payload)
+    result = BacktestResult.model_validate(data['result'])
+    curve = data.get('equity_curve')
+    if curve:
+        result.equity_curve = pd.Series(curve['values'], index=pd.DatetimeIndex(curve['dates']), dtype=float)
+    return result
+
+
+class BacktestResultCache:
+    """요청 지문 기반 백테스트 결과 캐시 (메모리 LRU + MySQL)"""
+
+    def __init__(self, max_entries: Optional[int] = None, persistent: Optional[bool] = None,
+                 versions: Optional[DataVersionMap] = None):
+        self.max_entries = max_entries if max_entries is not None else settings.backtest_result_cache_max_entries
+        self.persistent = persistent if persistent is not None else settings.backtest_result_cache_persistent
+        self.versions = versions if versions is not None else data_versions
+        # digest -> (키, 결과) (앞쪽이 가장 오래 사용되지 않은 항목)
+        self._entries: "OrderedDict[str, Tuple[ResultCacheKey, BacktestResult]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._table_ready = False
+        self._stats = {
+            'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'stores': 0,
+            'stale_skips': 0, 'invalidations': 0, 'evictions': 0, 'db_errors': 0,
+        }
+
+    # ========================================
+    # 키
+    # ========================================
+
+    async def key(self, request: BacktestRequest, engine_mode: str) -> ResultCacheKey:
+        """요청 지문 + 현재 티커별 데이터 버전으로 캐시 키 생성 (버전 맵 갱신 주기가 지났으면 일괄 조회)"""
+        current = await self.versions.get_many(self._tickers(request))
+        return self._make_key(request, engine_mode, current)
+
+    def loaded_key(self, request: BacktestRequest, engine_mode: str) -> ResultCacheKey:
+        """가격/벤치마크 데이터 조회 직후의 버전(DB 조회 없이 현재 알고 있는 값)으로 저장용 캐시 키 생성
+
+        조회 중 누락 구간 보완 적재로 버전이 바뀔 수 있으므로 조회 전 키 대신 사용합니다.
+        """
+        return self._make_key(
+            request, engine_mode, {ticker: self.versions.peek(ticker) for ticker in self._tickers(request)}
+        )
+
+    @staticmethod
+    def _tickers(request: BacktestRequest) -> Tuple[str, ...]:
+        benchmark = request.benchmark_ticker or None
+        return (request.ticker, benchmark) if benchmark else (request.ticker,)
+
+    def _make_key(self, request: BacktestRequest, engine_mode: str, current: Dict[str, int]) -> ResultCacheKey:
+        """요청 지문 + 티커별 버전으로 캐시 키 생성"""
+        versions = tuple(current[ticker] for ticker in self._tickers(request))
+        source = f"{request_fingerprint(request, engine_mode)}:{':'.join(map(str, versions))}"
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        return ResultCacheKey(digest, request.ticker, request.benchmark_ticker or None, versions)
+
+    def _is_current(self, key: ResultCacheKey) -> bool:
+        return all(self.versions.peek(t) == v for t, v in zip(key.tickers, key.versions))
+
+    # ========================================
+    # 조회 / 저장
+    # ========================================
+
+    async def get(self, key: ResultCacheKey) -> Optional[BacktestResult]:
+        """메모리 → MySQL 순서로 조회 (MySQL 적중 시 메모리 계층에 저장)"""
+        with self._lock:
+            entry = self._entries.get(key.digest)
+            if entry is not None:
+                self._entries.move_to_end(key.digest)
+                self._stats['memory_hits'] += 1
+                return entry[1].model_copy()
+
+        if self.persistent:
+            try:
+                result = await executor_manager.run_io(self._load_row, key.digest, stage="mysql")
+            except Exception as e:
+                self._stats['db_errors'] += 1
+                logger.warning(f"백테스트 결과 캐시 조회 실패: {e}")
+                result = None
+            if result is not None and self._is_current(key):
+                self._stats['db_hits'] += 1
+                self._remember(key, result)
+                return result.model_copy()
+
+        self._stats['misses'] += 1
+        return None
+
+    async def put(self, key: ResultCacheKey, result: BacktestResult) -> None:
+        """결과 저장 (계산 중 해당 티커 데이터 버전이 바뀌었으면 저장하지 않음)"""
+        if not self._is_current(key):
+            self._stats['stale_skips'] += 1
+            return
+        self._remember(key, result)
+        self._stats['stores'] += 1
+
+        if self.persistent:
+            try:
+                await executor_manager.run_io(self._store_row, key, _dump_payload(result), stage="mysql")
+            except Exception as e:
+                self._stats['db_errors'] += 1
+                logger.warning(f"백테스트 결과 캐시 저장 실패: {e}")
+
+    # ========================================
+    # 무효화
+    # ========================================
+
+    def ensure_table(self, conn) -> None:
+        """backtest_results 테이블이 없으면 생성 (DDL은 암묵적 커밋이므로 트랜잭션 밖에서 호출)"""
+        if self._table_ready:
+            return
+        conn.execute(text(_RESULTS_DDL))
+        conn.commit()
+        self._table_ready = True
+
+    def delete_rows(self, conn, ticker: str) -> int:
+        """티커를 대상 또는 벤치마크로 쓴 영속 결과 삭제 (호출자 트랜잭션 안에서 실행)"""
+        deleted = conn.execute(
+            text("DELETE FROM backtest_results WHERE ticker = :t OR benchmark_ticker = :t"), {"t": ticker}
+        )
+        return deleted.rowcount or 0
+
+    def invalidate(self, ticker: Optional[str] = None) -> int:
+        """메모리 항목 제거 (ticker가 None이면 전체), 제거된 항목 수 반환
+
+        이전 버전 항목은 키가 달라 조회되지 않으므로 메모리 회수 목적
+        """
+        with self._lock:
+            if ticker is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                victims = [digest for digest, (key, _) in self._entries.items() if ticker in key.tickers]
+                for digest in victims:
+                    del self._entries[digest]
+                removed = len(victims)
+            self._stats['invalidations'] += 1
+            return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """결과 캐시 통계"""
+        with self._lock:
+            lookups = self._stats['memory_hits'] + self._stats['db_hits'] + self._stats['misses']
+            hits = self._stats['memory_hits'] + self._stats['db_hits']
+            return {
+                'total_entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'persistent': self.persistent,
+                **self._stats,
+                'hit_rate': hits / lookups if lookups else 0.0,
+            }
+
+    # ========================================
+    # Private Helper Methods
+    # ========================================
+
+    def _remember(self, key: ResultCacheKey, result: BacktestResult) -> None:
+        with self._lock:
+            self._entries[key.digest] = (key, result)
+            self._entries.move_to_end(key.digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _load_row(self, digest: str) -> Optional[BacktestResult]:
+        conn = _get_engine().connect()
+        try:
+            self.ensure_table(conn)
+            row = conn.execute(
+                text("SELECT payload FROM backtest_results WHERE cache_key = :k"), {"k": digest}
+            ).fetchone()
+            return _load_payload(row[0]) if row else None
+        finally:
+            conn.close()
+
+    def _store_row(self, key: ResultCacheKey, payload: str) -> None:
+        conn = _get_engine().connect()
+        try:
+            self.ensure_table(conn)
+            conn.execute(
+                text(
+                    "REPLACE INTO backtest_results (cache_key, ticker, benchmark_ticker, payload) "
+                    "VALUES (:k, :t, :b, :p)"
+                ),
+                {"k": key.digest, "t": key.ticker, "b": key.benchmark_ticker, "p": payload},
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+# 전역 인스턴스
+backtest_result_cache = BacktestResultCache()
@@ -74,7 +74,9 @@ STRATEGIES: Dict[str, Dict[str, Any]] = {
                 'description': '장기 이동평균 기간'
             }
         },
-        'constraints': ['short_window < long_window']
+        'constraints': ['short_window < long_window'],
+        # 요청 파라미터명 → 전략 클래스 속성명
+        'attribute_map': {'short_window': 'sma_short', 'long_window': 'sma_long'}
     },
     'rsi_strategy': {
         'class': RSIStrategy,
@@ -204,8 +206,15 @@ class StrategyService:
         
         strategy_data = STRATEGIES[strategy_name].copy()
         strategy_data.pop('class')
+        strategy_data.pop('attribute_map', None)
         return strategy_data
     
+    def get_attribute_map(self, strategy_name: str) -> Dict[str, str]:
+        """요청 파라미터명과 전략 클래스 속성명이 다른 경우의 매핑 반환"""
+        if strategy_name not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 전략: {strategy_name}")
+        return STRATEGIES[strategy_name].get('attribute_map', {})
+    
     def get_all_strategies(self) -> Dict[str, Dict[str, Any]]:
         """모든 전략 정보 반환"""
         result = {}
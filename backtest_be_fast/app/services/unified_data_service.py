@@ -13,13 +13,17 @@
 5. news: 종목 관련 최신 뉴스 (네이버 검색 API)
 
 **주요 기능**:
-- collect_all_data(): 모든 데이터를 병렬로 수집하여 딕셔너리로 반환
+- collect_all_unified_data(): 모든 데이터를 순차로 수집하여 딕셔너리로 반환
+- collect_all_unified_data_async(): 섹션별 동시 수집 (섹션별 제한 시간, 요청 단위 가격 프레임 공유)
 - 에러 발생 시 빈 데이터 반환으로 백테스트 결과는 보존
 
 **의존성**:
 - app/services/data_service.py: 주가 데이터 조회
 - app/services/news_service.py: 뉴스 데이터 조회
+- app/services/news_cache_service.py: 최신 뉴스 읽기 캐시 (stock_news)
+- app/services/volatility_index.py: 급등/급락 이벤트 인덱스
 - app/utils/data_fetcher.py: 환율/벤치마크 데이터 페칭
+- app/core/executors.py: 블로킹 조회를 통합 데이터 전용 I/O 스레드 풀에서 실행
 
 **연관 컴포넌트**:
 - Backend: app/api/v1/endpoints/backtest.py (데이터 수집 호출)
@@ -28,15 +32,21 @@
 
 **최적화**:
 - 병렬 요청으로 전체 응답 시간 단축
+- 종목 가격은 요청당 한 번만 로드해 주가/급등락 섹션과 백테스트 단계가 공유
+- 급등/급락 이벤트는 미리 계산된 인덱스 조회 (이벤트 날짜 뉴스는 백그라운드 보완)
+- 느린 섹션(예: 네이버 뉴스)은 제한 시간 초과 시 빈 값으로 대체해 가격 섹션을 지연시키지 않음
 - 개별 데이터 소스 실패 시에도 나머지 데이터 반환
 """
+import asyncio
 import logging
 import pandas as pd
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .data_service import data_service
+from .volatility_index import VolatilityEventIndex, volatility_event_index
 from ..core.config import settings
+from ..core.executors import executor_manager
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +54,21 @@ logger = logging.getLogger(__name__)
 class UnifiedDataService:
     """통합 데이터 수집 서비스"""
     
-    def __init__(self, news_service=None):
+    def __init__(self, news_service=None, news_cache=None):
         """
         Args:
             news_service: 뉴스 서비스 인스턴스 (의존성 주입)
+            news_cache: 최신 뉴스 읽기 캐시 인스턴스 (비동기 수집에서 사용, 의존성 주입)
         """
         self.news_service = news_service
+        self.news_cache = news_cache
     
     def collect_stock_data(
         self, 
         symbols: List[str], 
         start_date: str, 
-        end_date: str
+        end_date: str,
+        frames: Optional[Dict[str, pd.DataFrame]] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         주가 데이터 수집
@@ -64,14 +77,18 @@ class UnifiedDataService:
             symbols: 종목 심볼 리스트
             start_date: 시작 날짜 (YYYY-MM-DD)
             end_date: 종료 날짜 (YYYY-MM-DD)
+            frames: 이미 로드한 종목별 가격 데이터 (없으면 조회)
             
         Returns:
             종목별 주가 데이터 딕셔너리
         """
         stock_data = {}
+        if frames is None:
+            # 종목별 개별 조회 대신 DB 일괄 조회 (빠진 종목만 개별 조회)
+            frames = data_service.get_many_ticker_data_sync(symbols, start_date, end_date)
         for symbol in symbols:
             try:
-                df = data_service.get_ticker_data_sync(symbol, start_date, end_date)
+                df = frames.get(symbol)
                 if df is not None and not df.empty:
                     stock_data[symbol] = self._transform_stock_data(df)
                 else:
@@ -124,7 +141,8 @@ class UnifiedDataService:
         start_date: str,
         end_date: str,
         threshold: float = 5.0,
-        max_events_per_symbol: int = 10
+        max_events_per_symbol: int = 10,
+        frames: Optional[Dict[str, pd.DataFrame]] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         급등/급락 이벤트 수집
@@ -135,6 +153,7 @@ class UnifiedDataService:
             end_date: 종료 날짜 (YYYY-MM-DD)
             threshold: 급등/급락 기준 (%) - 기본값 5%
             max_events_per_symbol: 종목당 최대 이벤트 수
+            frames: 이미 로드한 종목별 가격 데이터 (없으면 조회)
             
         Returns:
             종목별 급등/급락 이벤트 딕셔너리
@@ -142,20 +161,26 @@ class UnifiedDataService:
         volatility_events = {}
         
         for symbol in symbols:
+            # 미리 계산된 이벤트 인덱스 우선 (저장 기준보다 낮은 임계값이거나 DB 오류 시 가격 데이터로 계산)
             try:
-                df = data_service.get_ticker_data_sync(symbol, start_date, end_date)
-                if df is not None and not df.empty:
-                    events = self._calculate_volatility_events(
-                        df, 
-                        threshold, 
-                        max_events_per_symbol
-                    )
-                    volatility_events[symbol] = events
-                else:
-                    volatility_events[symbol] = []
+                events = volatility_event_index.get_events(
+                    symbol, start_date, end_date, threshold, max_events_per_symbol
+                )
             except Exception as e:
-                logger.warning(f"급등락 이벤트 수집 실패: {symbol} - {str(e)}")
-                volatility_events[symbol] = []
+                logger.debug(f"급등락 이벤트 인덱스 조회 실패, 가격 데이터로 계산: {symbol} - {str(e)}")
+                events = None
+            
+            if events is None:
+                try:
+                    if frames is None:
+                        frames = data_service.get_many_ticker_data_sync(symbols, start_date, end_date)
+                    events = VolatilityEventIndex.format_events(
+                        frames.get(symbol), threshold, max_events_per_symbol
+                    )
+                except Exception as e:
+                    logger.warning(f"급등락 이벤트 수집 실패: {symbol} - {str(e)}")
+                    events = []
+            volatility_events[symbol] = events
         
         return volatility_events
     
@@ -211,6 +236,38 @@ class UnifiedDataService:
         
         return latest_news
     
+    async def collect_latest_news_async(
+        self,
+        symbols: List[str],
+        display: int = 15
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        최신 뉴스 비동기 수집 (읽기 캐시가 주입되면 stock_news 캐시 우선 사용)
+        
+        Args:
+            symbols: 종목 심볼 리스트
+            display: 종목당 뉴스 개수
+            
+        Returns:
+            종목별 뉴스 딕셔너리
+        """
+        if self.news_cache is None:
+            return await executor_manager.run_unified_io(
+                self.collect_latest_news, symbols, display, stage="unified_news"
+            )
+        
+        outcomes = await asyncio.gather(
+            *(self.news_cache.get_latest_news(symbol, display) for symbol in symbols),
+            return_exceptions=True
+        )
+        latest_news = {}
+        for symbol, outcome in zip(symbols, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"{symbol} 뉴스 수집 실패: {str(outcome)}")
+                outcome = []
+            latest_news[symbol] = outcome
+        return latest_news
+    
     def collect_all_unified_data(
         self,
         symbols: List[str],
@@ -232,14 +289,17 @@ class UnifiedDataService:
         Returns:
             모든 통합 데이터를 포함하는 딕셔너리
         """
+        # 종목 가격은 한 번만 로드해 주가/급등락 섹션에서 공유
+        frames = data_service.get_many_ticker_data_sync(symbols, start_date, end_date)
+        
         # 주가 데이터
-        stock_data = self.collect_stock_data(symbols, start_date, end_date)
+        stock_data = self.collect_stock_data(symbols, start_date, end_date, frames=frames)
         
         # 환율 데이터 및 통계
         exchange_rates, exchange_stats = self.collect_exchange_data(start_date, end_date)
         
         # 급등/급락 이벤트
-        volatility_events = self.collect_volatility_events(symbols, start_date, end_date)
+        volatility_events = self.collect_volatility_events(symbols, start_date, end_date, frames=frames)
         
         # 벤치마크 데이터
         sp500_benchmark, nasdaq_benchmark = self.collect_benchmark_data(start_date, end_date)
@@ -266,6 +326,117 @@ class UnifiedDataService:
             'latest_news': latest_news
         }
     
+    async def collect_all_unified_data_async(
+        self,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        include_news: bool = True,
+        news_display_count: int = 15,
+        frames: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Dict[str, Any]:
+        """
+        모든 통합 데이터를 섹션별로 동시에 수집
+        
+        frames는 요청 단위 가격 데이터 맵으로, 백테스트 단계에서 이미 로드한 종목은
+        다시 조회하지 않고 빠진 종목만 일괄 조회해 같은 맵에 채웁니다.
+        각 섹션은 통합 데이터 전용 I/O 스레드 풀에서 제한 시간 안에 실행되며, 초과하거나 실패한
+        섹션만 빈 값으로 대체합니다. (제한 시간을 넘겨 계속 실행되는 공급자 호출이 백테스트/가격
+        조회용 I/O 풀 슬롯을 점유하지 않도록 풀을 분리)
+        
+        Args:
+            symbols: 종목 심볼 리스트
+            start_date: 시작 날짜 (YYYY-MM-DD)
+            end_date: 종료 날짜 (YYYY-MM-DD)
+            include_news: 뉴스 포함 여부
+            news_display_count: 종목당 뉴스 개수
+            frames: 요청 단위 종목별 가격 데이터 맵 {symbol: DataFrame}
+            
+        Returns:
+            모든 통합 데이터를 포함하는 딕셔너리
+        """
+        frames = frames if frames is not None else {}
+        section_timeout = settings.unified_data_section_timeout_seconds
+        
+        async def load_prices() -> Dict[str, pd.DataFrame]:
+            missing = [symbol for symbol in symbols if symbol not in frames]
+            if missing:
+                frames.update(await executor_manager.run_unified_io(
+                    data_service.get_many_ticker_data_sync, missing, start_date, end_date,
+                    timeout=section_timeout, stage="unified_prices"
+                ))
+            return frames
+        
+        async def price_sections() -> tuple:
+            loaded = await load_prices()
+            stock_data, volatility_events = await executor_manager.run_unified_io(
+                lambda: (
+                    self.collect_stock_data(symbols, start_date, end_date, frames=loaded),
+                    self.collect_volatility_events(symbols, start_date, end_date, frames=loaded),
+                ),
+                timeout=section_timeout, stage="unified_prices"
+            )
+            if include_news and self.news_cache is not None:
+                # 이벤트 날짜 뉴스는 응답을 기다리지 않고 백그라운드에서 보완
+                for symbol, events in volatility_events.items():
+                    if events:
+                        self.news_cache.schedule_event_news_backfill(symbol, [event['date'] for event in events])
+            return stock_data, volatility_events
+        
+        async def news_section() -> Dict[str, List[Dict[str, Any]]]:
+            if not include_news:
+                return {}
+            return await asyncio.wait_for(
+                self.collect_latest_news_async(symbols, news_display_count),
+                settings.unified_news_timeout_seconds
+            )
+        
+        sections = {
+            'prices': (price_sections(), ({symbol: [] for symbol in symbols}, {symbol: [] for symbol in symbols})),
+            'exchange': (executor_manager.run_unified_io(
+                self.collect_exchange_data, start_date, end_date,
+                timeout=section_timeout, stage="unified_exchange"
+            ), ([], {})),
+            'sp500': (executor_manager.run_unified_io(
+                self._collect_single_benchmark, '^GSPC', start_date, end_date,
+                timeout=section_timeout, stage="unified_benchmark"
+            ), []),
+            'nasdaq': (executor_manager.run_unified_io(
+                self._collect_single_benchmark, '^IXIC', start_date, end_date,
+                timeout=section_timeout, stage="unified_benchmark"
+            ), []),
+            'news': (news_section(), {symbol: [] for symbol in symbols} if include_news else {}),
+        }
+        outcomes = await asyncio.gather(*(task for task, _ in sections.values()), return_exceptions=True)
+        
+        results = {}
+        for (name, (_, default)), outcome in zip(sections.items(), outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"통합 데이터 {name} 섹션 수집 실패, 빈 값으로 대체: {outcome!r}")
+                outcome = default
+            results[name] = outcome
+        
+        stock_data, volatility_events = results['prices']
+        exchange_rates, exchange_stats = results['exchange']
+        latest_news = results['news']
+        
+        logger.info(
+            f"통합 데이터 동시 수집 완료: "
+            f"{len(symbols)}개 종목, "
+            f"{len(exchange_rates)}개 환율 데이터, "
+            f"{len(latest_news)}개 종목 뉴스"
+        )
+        
+        return {
+            'stock_data': stock_data,
+            'exchange_rates': exchange_rates,
+            'exchange_stats': exchange_stats,
+            'volatility_events': volatility_events,
+            'sp500_benchmark': results['sp500'],
+            'nasdaq_benchmark': results['nasdaq'],
+            'latest_news': latest_news
+        }
+    
     # ========================================
     # Private Helper Methods
     # ========================================
@@ -325,31 +496,6 @@ class UnifiedDataService:
             }
         }
     
-    def _calculate_volatility_events(
-        self,
-        df: pd.DataFrame,
-        threshold: float,
-        max_events: int
-    ) -> List[Dict[str, Any]]:
-        """급등/급락 이벤트 계산"""
-        df = df.copy()
-        df['daily_return'] = df['Close'].pct_change() * 100
-        significant_moves = df[abs(df['daily_return']) >= threshold].copy()
-        
-        events = []
-        for date, row in significant_moves.iterrows():
-            events.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'daily_return': float(row['daily_return']),
-                'close_price': float(row['Close']),
-                'volume': int(row.get('Volume', 0)) if pd.notna(row.get('Volume', 0)) else 0,
-                'event_type': '급등' if row['daily_return'] > 0 else '급락'
-            })
-        
-        # 날짜 역순 정렬 후 상위 N개만 반환
-        events.sort(key=lambda x: x['date'], reverse=True)
-        return events[:max_events]
-    
     def _collect_single_benchmark(
         self,
         ticker: str,
@@ -0,0 +1,373 @@
+"""
+벡터화 백테스트 엔진
+
+**역할**:
+- 내장 전략(SMA, EMA, RSI, MACD, Bollinger, Buy & Hold)의 매매 신호를 NumPy 배열로 한 번에 계산
+- backtesting.py의 `Strategy.next()` 봉 단위 루프 없이 진입/청산, 포지션 크기, 수수료, 스프레드 처리
+- backtesting.py와 동일한 통계 Series를 반환하여 BacktestEngine의 결과 변환 로직을 그대로 재사용
+
+**주요 기능**:
+1. supports(): 전략 클래스의 벡터화 실행 지원 여부 확인
+2. run(): 벡터화 백테스트 실행 (backtesting.py `Backtest.run()`과 동일한 형식의 통계 반환)
+
+**체결 규칙 (backtesting.py 기본 설정과 동일)**:
+- i번째 봉에서 발생한 신호는 i+1번째 봉 시가에 체결
+- 진입가: 시가 × (1 + spread), 청산가: 시가
+- 수수료: 진입/청산 시 각각 체결 금액 × commission
+- 신호 평가는 지표 워밍업 구간(첫 유효값 인덱스 + 1) 이후부터 시작
+- 종료 시점까지 열린 포지션은 거래 통계에서 제외하고 자산 곡선에만 반영
+
+**의존성**:
+- numpy, pandas: 신호 및 자산 곡선 계산
+- backtesting._stats.compute_stats: 통계 지표 계산 (backtesting.py와 동일한 수식)
+- app/utils/indicator_cache.py: 지표 배열 캐시 (전략 `self.I`, 차트와 공유)
+
+**연관 컴포넌트**:
+- Backend: app/services/backtest_engine.py (엔진 모드 선택)
+- Backend: app/strategies/*.py (전략 파라미터 및 신호 정의)
+- Backend: app/core/config.py (backtest_engine_mode 설정)
+"""
+import logging
+from typing import Dict, Any, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+from backtesting import Strategy
+from backtesting._stats import compute_stats
+
+from app.strategies.sma_strategy import SMACrossStrategy
+from app.strategies.rsi_strategy import RSIStrategy
+from app.strategies.bollinger_strategy import BollingerBandsStrategy
+from app.strategies.macd_strategy import MACDStrategy
+from app.strategies.ema_strategy import EMAStrategy
+from app.strategies.buy_hold_strategy import BuyAndHoldStrategy
+from app.utils.indicator_cache import indicator_cache
+
+
+logger = logging.getLogger(__name__)
+
+# Buy & Hold의 self.buy()는 backtesting.py 기본 size(0.9999)를 사용
+_BUY_HOLD_FRACTION = 0.9999
+
+
+def _first_valid_index(values: np.ndarray) -> int:
+    """첫 번째 유효값(NaN 아님) 인덱스 - backtesting.py 워밍업 계산과 동일"""
+    return int(np.isnan(values.astype(float)).argmin())
+
+
+def _crossover(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """backtesting.lib.crossover의 벡터화 버전 (각 봉 기준 상향 돌파 여부)"""
+    result = np.zeros(len(series1), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        result[1:] = (series1[:-1] < series2[:-1]) & (series1[1:] > series2[1:])
+    return result
+
+
+def _sma(close: pd.Series, period: int) -> np.ndarray:
+    return indicator_cache.sma(close, period)
+
+
+def _ema(close: pd.Series, period: int, adjust: bool) -> np.ndarray:
+    return indicator_cache.ema(close, period, adjust)
+
+
+def _rsi(close: pd.Series, period: int) -> np.ndarray:
+    return indicator_cache.rsi(close, period, fill_value=50.0)
+
+
+class VectorizedBacktestEngine:
+    """NumPy 배열 기반 고속 백테스트 엔진"""
+
+    SUPPORTED_STRATEGIES = (
+        SMACrossStrategy,
+        EMAStrategy,
+        RSIStrategy,
+        MACDStrategy,
+        BollingerBandsStrategy,
+        BuyAndHoldStrategy,
+    )
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def supports(self, strategy_class: Type[Strategy]) -> bool:
+        """전략 클래스(파라미터가 적용된 서브클래스 포함)의 벡터화 지원 여부"""
+        return isinstance(strategy_class, type) and issubclass(strategy_class, self.SUPPORTED_STRATEGIES)
+
+    def run(
+        self,
+        data: pd.DataFrame,
+        strategy_class: Type[Strategy],
+        cash: float,
+        commission: float = 0.0,
+        spread: float = 0.0,
+    ) -> pd.Series:
+        """
+        벡터화 백테스트 실행
+
+        Args:
+            data: OHLCV DataFrame (DatetimeIndex)
+            strategy_class: 파라미터가 적용된 전략 클래스
+            cash: 초기 자본
+            commission: 거래 수수료 비율
+            spread: 매수 시 적용되는 스프레드 비율
+
+        Returns:
+            backtesting.py `Backtest.run()`과 동일한 키를 가진 통계 Series
+        """
+        if not self.supports(strategy_class):
+            raise ValueError(f"벡터화 엔진이 지원하지 않는 전략: {strategy_class.__name__}")
+        if cash <= 0:
+            raise ValueError(f"초기 자본은 0보다 커야 합니다: {cash}")
+
+        open_ = data['Open'].to_numpy(dtype=float)
+        close_series = data['Close'].astype(float).reset_index(drop=True)
+        close = close_series.to_numpy()
+
+        entries, exits, warmup = self._compute_signals(close_series, strategy_class)
+        start = 1 + warmup
+
+        trades, open_trade = self._simulate_trades(
+            entries, exits, start, open_, close, strategy_class, cash, commission, spread
+        )
+        equity = self._build_equity_curve(trades, open_trade, close, cash)
+        trades_df = self._build_trades_frame(trades, data.index)
+
+        stats = compute_stats(
+            trades=trades_df,
+            equity=equity,
+            ohlc_data=data,
+            strategy_instance=None,
+            risk_free_rate=0.0,
+        )
+
+        # compute_stats는 전략 인스턴스가 없으면 워밍업을 0으로 간주하므로 직접 보정
+        if len(close) > warmup:
+            buy_hold = (close[-1] - close[warmup]) / close[warmup] * 100
+            stats['Buy & Hold Return [%]'] = buy_hold
+            stats['Alpha [%]'] = stats['Return [%]'] - stats['Beta'] * buy_hold
+        stats['_strategy'] = strategy_class.__name__
+
+        self.logger.debug(
+            "벡터화 백테스트 완료: %s, 거래 수 %s, 워밍업 %s봉",
+            strategy_class.__name__, len(trades), warmup,
+        )
+        return stats
+
+    def _compute_signals(
+        self, close: pd.Series, strategy_class: Type[Strategy]
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """전략별 진입/청산 신호 배열과 워밍업 봉 수 계산"""
+        n = len(close)
+        closes = close.to_numpy()
+
+        if issubclass(strategy_class, BuyAndHoldStrategy):
+            entries = np.zeros(n, dtype=bool)
+            if n > 1:
+                entries[1] = True
+            return entries, np.zeros(n, dtype=bool), 0
+
+        if issubclass(strategy_class, SMACrossStrategy):
+            fast = _sma(close, strategy_class.sma_short)
+            slow = _sma(close, strategy_class.sma_long)
+            indicators = [fast, slow]
+            entries = _crossover(fast, slow)
+            exits = _crossover(slow, fast)
+
+        elif issubclass(strategy_class, EMAStrategy):
+            fast = _ema(close, strategy_class.fast_window, adjust=False)
+            slow = _ema(close, strategy_class.slow_window, adjust=False)
+            indicators = [fast, slow]
+            entries = _crossover(fast, slow)
+            exits = _crossover(slow, fast)
+
+        elif issubclass(strategy_class, MACDStrategy):
+            macd, signal = indicator_cache.macd(
+                closes, strategy_class.fast_period, strategy_class.slow_period, strategy_class.signal_period
+            )
+            indicators = [macd, signal]
+            valid = ~np.isnan(macd) & ~np.isnan(signal)
+            entries = _crossover(macd, signal) & valid
+            exits = _crossover(signal, macd) & valid
+
+        elif issubclass(strategy_class, RSIStrategy):
+            rsi = _rsi(close, strategy_class.rsi_period)
+            indicators = [rsi]
+            prev_rsi = np.r_[np.nan, rsi[:-1]]
+            with np.errstate(invalid='ignore'):
+                active = np.arange(n) >= strategy_class.rsi_period
+                entries = active & (rsi < strategy_class.rsi_oversold)
+                exits = active & (
+                    (rsi > strategy_class.rsi_overbought)
+                    | ((rsi >= 50) & (prev_rsi < 50))
+                )
+
+        elif issubclass(strategy_class, BollingerBandsStrategy):
+            period = strategy_class.period
+            sma = _sma(close, period)
+            std = indicator_cache.rolling_std(closes, period)
+            upper = sma + (strategy_class.std_dev * std)
+            lower = sma - (strategy_class.std_dev * std)
+            indicators = [sma, std, upper, lower]
+            with np.errstate(invalid='ignore'):
+                valid = ~np.isnan(upper) & ~np.isnan(lower) & (np.arange(n) >= period - 1)
+                entries = valid & (closes < lower)
+                exits = valid & ((closes > upper) | (closes >= sma))
+
+        else:
+            raise ValueError(f"벡터화 엔진이 지원하지 않는 전략: {strategy_class.__name__}")
+
+        warmup = max((_first_valid_index(ind) for ind in indicators), default=0)
+        return entries, exits, warmup
+
+    def _simulate_trades(
+        self,
+        entries: np.ndarray,
+        exits: np.ndarray,
+        start: int,
+        open_: np.ndarray,
+        close: np.ndarray,
+        strategy_class: Type[Strategy],
+        cash: float,
+        commission: float,
+        spread: float,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        신호 배열로부터 거래 목록 생성
+
+        봉 단위가 아닌 거래 단위로만 반복합니다. 다음 진입/청산 신호 위치는
+        np.searchsorted로 찾고, 포지션 크기는 직전 거래까지 반영된 현금으로 계산합니다.
+        """
+        n = len(close)
+        entry_bars = np.flatnonzero(entries[start:]) + start
+        exit_bars = np.flatnonzero(exits[start:]) + start
+        is_buy_hold = issubclass(strategy_class, BuyAndHoldStrategy)
+        position_size = getattr(strategy_class, 'position_size', 0.95)
+
+        trades: List[Dict[str, Any]] = []
+        open_trade: Optional[Dict[str, Any]] = None
+        cursor = start
+
+        while True:
+            k = np.searchsorted(entry_bars, cursor)
+            if k >= len(entry_bars):
+                break
+            signal_bar = int(entry_bars[k])
+            fill_bar = signal_bar + 1
+            if fill_bar >= n:
+                break
+
+            fill_open = open_[fill_bar]
+            adjusted_price = fill_open * (1 + spread)
+
+            # 포지션이 없을 때의 equity는 현금과 같음
+            if is_buy_hold:
+                fee = abs(_BUY_HOLD_FRACTION) * fill_open * commission
+                price_plus_commission = adjusted_price + fee / abs(_BUY_HOLD_FRACTION)
+                size = int((cash * _BUY_HOLD_FRACTION) // price_plus_commission)
+            else:
+                size = int((cash * position_size) / close[signal_bar])
+                if size > 0:
+                    fee = size * fill_open * commission
+                    price_plus_commission = adjusted_price + fee / size
+
+            # 수량 0 또는 증거금 부족 시 주문 취소 → 다음 봉부터 다시 신호 탐색
+            if size <= 0 or size * price_plus_commission > cash:
+                cursor = signal_bar + 1
+                continue
+
+            entry_commission = size * adjusted_price * commission
+            cash -= entry_commission
+            trade = {
+                'size': size,
+                'entry_bar': fill_bar,
+                'entry_price': adjusted_price,
+                'entry_commission': entry_commission,
+                'cash_after_entry': cash,
+            }
+
+            j = np.searchsorted(exit_bars, fill_bar)
+            if j >= len(exit_bars) or exit_bars[j] + 1 >= n:
+                open_trade = trade
+                break
+
+            exit_bar = int(exit_bars[j]) + 1
+            exit_price = open_[exit_bar]
+            gross_pnl = size * (exit_price - adjusted_price)
+            exit_commission = size * exit_price * commission
+            cash += gross_pnl - exit_commission
+
+            commissions = entry_commission + exit_commission
+            trade.update({
+                'exit_bar': exit_bar,
+                'exit_price': exit_price,
+                'pnl': gross_pnl - commissions,
+                'commission': commissions,
+                'return_pct': (exit_price / adjusted_price - 1) - commissions / (size * adjusted_price),
+                'cash_after_exit': cash,
+            })
+            trades.append(trade)
+            cursor = exit_bar
+
+        return trades, open_trade
+
+    def _build_equity_curve(
+        self,
+        trades: List[Dict[str, Any]],
+        open_trade: Optional[Dict[str, Any]],
+        close: np.ndarray,
+        initial_cash: float,
+    ) -> np.ndarray:
+        """거래 이벤트로부터 봉별 자산 곡선을 누적합으로 계산"""
+        n = len(close)
+        cash_level = np.zeros(n)
+        position = np.zeros(n)
+        cost_basis = np.zeros(n)
+        cash_level[0] = initial_cash
+        prev_cash = initial_cash
+
+        events = list(trades) + ([open_trade] if open_trade else [])
+        for trade in events:
+            entry_bar = trade['entry_bar']
+            cash_level[entry_bar] += trade['cash_after_entry'] - prev_cash
+            position[entry_bar] += trade['size']
+            cost_basis[entry_bar] += trade['size'] * trade['entry_price']
+            prev_cash = trade['cash_after_entry']
+            if 'exit_bar' in trade:
+                exit_bar = trade['exit_bar']
+                cash_level[exit_bar] += trade['cash_after_exit'] - prev_cash
+                position[exit_bar] -= trade['size']
+                cost_basis[exit_bar] -= trade['size'] * trade['entry_price']
+                prev_cash = trade['cash_after_exit']
+
+        cash_level = np.cumsum(cash_level)
+        position = np.cumsum(position)
+        cost_basis = np.cumsum(cost_basis)
+        return cash_level + position * close - cost_basis
+
+    def _build_trades_frame(self, trades: List[Dict[str, Any]], index: pd.Index) -> pd.DataFrame:
+        """backtesting.py `_trades`와 동일한 컬럼 구성의 거래 DataFrame 생성"""
+        entry_bars = np.array([t['entry_bar'] for t in trades], dtype=np.int64)
+        exit_bars = np.array([t['exit_bar'] for t in trades], dtype=np.int64)
+
+        trades_df = pd.DataFrame({
+            'Size': np.array([t['size'] for t in trades], dtype=np.int64),
+            'EntryBar': entry_bars,
+            'ExitBar': exit_bars,
+            'EntryPrice': np.array([t['entry_price'] for t in trades], dtype=float),
+            'ExitPrice': np.array([t['exit_price'] for t in trades], dtype=float),
+            'SL': np.nan,
+            'TP': np.nan,
+            'PnL': np.array([t['pnl'] for t in trades], dtype=float),
+            'Commission': np.array([t['commission'] for t in trades], dtype=float),
+            'ReturnPct': np.array([t['return_pct'] for t in trades], dtype=float),
+            'EntryTime': index[entry_bars],
+            'ExitTime': index[exit_bars],
+        })
+        trades_df['Duration'] = trades_df['ExitTime'] - trades_df['EntryTime']
+        trades_df['Tag'] = None
+        return trades_df
+
+
+# 글로벌 인스턴스
+vectorized_engine = VectorizedBacktestEngine()
@@ -0,0 +1,377 @@
+"""
+급등/급락 이벤트 인덱스
+
+**역할**:
+- 종목별 일간 변동률 이벤트를 volatility_events 테이블에 미리 계산해 저장
+- 프로세스 내 인덱스(티커별 날짜 배열 + 절대 변동률 내림차순 정렬)로 요청마다
+  pct_change/필터링/iterrows를 반복하지 않고 조회
+- save_ticker_data가 새 봉을 적재할 때 해당 구간만 증분 갱신
+
+**주요 기능**:
+1. get_events(): 기간 내 임계값 이상 이벤트 조회 (최근순 또는 변동 폭순 상위 N개)
+2. record_window(): 적재 트랜잭션 안에서 구간 이벤트 재계산 및 테이블 반영
+3. apply_window(): 커밋 후 메모리 인덱스의 해당 구간 교체
+4. events_from_frame() / format_events(): 가격 DataFrame 기반 벡터화 계산 (인덱스 미사용 시)
+
+**저장 규칙**:
+- 변동률 = 전 거래일 종가 대비 종가 변동률 (%), 조회 구간 첫날도 직전 거래일 기준
+- 테이블에는 |변동률| >= VOLATILITY_EVENT_MIN_PCT 인 날짜만 저장
+  (그보다 낮은 임계값 조회는 None을 반환하고 호출자가 가격 데이터로 계산)
+- 구간 [start, end] 갱신 시 end 다음 거래일 변동률도 함께 재계산
+- 티커별 전체 인덱싱 완료 여부를 volatility_index_state에 기록
+  (기록이 없는 티커는 증분 갱신 행이 일부 있어도 첫 조회 시 daily_prices 전체로 한 번 재구성)
+- 증분 갱신 구간이 티커의 전체 가격 범위를 덮으면(최초 적재) 그 자리에서 완료로 기록
+
+**DB 스키마**:
+- 테이블: volatility_events (stock_id, date, daily_return, abs_return, close, volume)
+- 인덱스: (stock_id, abs_return)
+- 테이블: volatility_index_state (stock_id, indexed_at) — 전체 인덱싱 완료 티커
+
+**의존성**:
+- numpy, pandas: 변동률 계산 및 정렬 인덱스
+- SQLAlchemy: volatility_events / daily_prices 접근
+- app/services/yfinance_db.py: DB 엔진
+
+**연관 컴포넌트**:
+- Backend: app/services/yfinance_db.py (save_ticker_data에서 증분 갱신)
+- Backend: app/services/unified_data_service.py (volatility_events 섹션)
+- Backend: app/services/news_cache_service.py (이벤트 날짜 뉴스 백그라운드 보완)
+- Database: database/schema.sql (테이블 정의)
+"""
+import logging
+import threading
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.services.yfinance_db import _get_engine
+
+logger = logging.getLogger(__name__)
+
+_EVENTS_DDL = """
+CREATE TABLE IF NOT EXISTS volatility_events (
+    stock_id INT NOT NULL,
+    date DATE NOT NULL,
+    daily_return DECIMAL(10, 4) NOT NULL,
+    abs_return DECIMAL(10, 4) NOT NULL,
+    close DECIMAL(19, 4) NOT NULL,
+    volume BIGINT UNSIGNED DEFAULT 0,
+    PRIMARY KEY (stock_id, date),
+    INDEX idx_stock_abs_return (stock_id, abs_return),
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+"""
+
+_STATE_DDL = """
+CREATE TABLE IF NOT EXISTS volatility_index_state (
+    stock_id INT NOT NULL PRIMARY KEY,
+    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+"""
+
+_EVENT_COLUMNS = ['daily_return', 'close', 'volume']
+
+
+class _TickerEvents:
+    """티커 하나의 이벤트 배열 (날짜순) + 절대 변동률 내림차순 정렬 인덱스"""
+
+    __slots__ = ('frame', 'dates', 'abs_order', 'abs_sorted')
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame.sort_index()
+        self.dates = self.frame.index.to_numpy(dtype='datetime64[D]')
+        abs_returns = np.abs(self.frame['daily_return'].to_numpy(dtype=float))
+        self.abs_order = np.argsort(-abs_returns, kind='stable')
+        self.abs_sorted = abs_returns[self.abs_order]
+
+
+class VolatilityEventIndex:
+    """volatility_events 테이블 기반 급등/급락 이벤트 인덱스"""
+
+    def __init__(self, min_return_pct: Optional[float] = None):
+        self.min_return_pct = min_return_pct if min_return_pct is not None else settings.volatility_event_min_pct
+        self._entries: Dict[str, _TickerEvents] = {}
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+    # ========================================
+    # 조회
+    # ========================================
+
+    def get_events(
+        self,
+        ticker: str,
+        start_date,
+        end_date,
+        threshold: float = 5.0,
+        max_events: int = 10,
+        order: str = 'recent'
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        기간 내 임계값 이상 이벤트 조회
+
+        Args:
+            ticker: 종목 티커
+            start_date: 시작 날짜 (포함)
+            end_date: 종료 날짜 (포함)
+            threshold: 급등/급락 기준 (%)
+            max_events: 최대 이벤트 수
+            order: 'recent'(최근 날짜순) 또는 'magnitude'(변동 폭순)
+
+        Returns:
+            이벤트 리스트 (threshold가 저장 기준보다 낮으면 None)
+        """
+        if threshold < self.min_return_pct:
+            return None
+        entry = self._get_entry(ticker)
+
+        # 절대 변동률 내림차순 배열에서 임계값 이상은 앞부분 구간
+        count = int(np.searchsorted(-entry.abs_sorted, -threshold, side='right'))
+        positions = entry.abs_order[:count]
+        start = np.datetime64(pd.Timestamp(start_date).date(), 'D')
+        end = np.datetime64(pd.Timestamp(end_date).date(), 'D')
+        in_range = (entry.dates[positions] >= start) & (entry.dates[positions] <= end)
+        positions = positions[in_range]
+        if order == 'recent':
+            positions = np.sort(positions)[::-1]
+        return self._to_events(entry.frame.iloc[positions[:max_events]])
+
+    def invalidate(self, ticker: Optional[str] = None) -> None:
+        """메모리 인덱스 무효화 (ticker가 None이면 전체)"""
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ticker, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'tickers': len(self._entries),
+                'events': sum(len(entry.frame) for entry in self._entries.values()),
+            }
+
+    # ========================================
+    # 적재 시 증분 갱신
+    # ========================================
+
+    def ensure_table(self, conn) -> None:
+        """volatility_events / volatility_index_state 테이블이 없으면 생성 (DDL은 암묵적 커밋이므로 트랜잭션 밖에서 호출)"""
+        if self._table_ready:
+            return
+        conn.execute(text(_EVENTS_DDL))
+        conn.execute(text(_STATE_DDL))
+        conn.commit()
+        self._table_ready = True
+
+    def record_window(self, conn, stock_id: int, start, end) -> Tuple[date, date, pd.DataFrame]:
+        """
+        [start, end]에 새 봉이 적재된 뒤 해당 구간 이벤트를 재계산해 테이블에 반영
+
+        end 다음 거래일의 변동률도 바뀌므로 함께 재계산합니다.
+        구간 앞뒤에 다른 가격 행이 없으면(티커 전체 재계산) 전체 인덱싱 완료로 기록합니다.
+
+        Returns:
+            (갱신 구간 시작, 갱신 구간 끝, 구간 이벤트 DataFrame)
+        """
+        params = {"sid": stock_id, "start": str(start), "end": str(end)}
+        bounds = conn.execute(
+            text(
+                "SELECT (SELECT MAX(date) FROM daily_prices WHERE stock_id = :sid AND date < :start), "
+                "(SELECT MIN(date) FROM daily_prices WHERE stock_id = :sid AND date > :end)"
+            ),
+            params,
+        ).fetchone()
+        window_start = pd.Timestamp(start).date()
+        window_end = pd.Timestamp(bounds[1] or end).date()
+        rows = conn.execute(
+            text(
+                "SELECT date, close, volume FROM daily_prices "
+                "WHERE stock_id = :sid AND date >= :from_date AND date <= :to_date ORDER BY date ASC"
+            ),
+            {"sid": stock_id, "from_date": str(bounds[0] or window_start), "to_date": str(window_end)},
+        ).fetchall()
+
+        events = self.events_from_frame(self._rows_to_prices(rows), self.min_return_pct)
+        events = events[events.index >= pd.Timestamp(window_start)]
+
+        conn.execute(
+            text("DELETE FROM volatility_events WHERE stock_id = :sid AND date >= :start AND date <= :end"),
+            {"sid": stock_id, "start": str(window_start), "end": str(window_end)},
+        )
+        self._insert_events(conn, stock_id, events)
+        if bounds[0] is None and bounds[1] is None:
+            self._mark_indexed(conn, stock_id)
+        return window_start, window_end, events
+
+    def apply_window(self, ticker: str, start, end, events: pd.DataFrame) -> None:
+        """커밋된 구간 이벤트로 메모리 인덱스 교체 (아직 로드하지 않은 티커는 무시)"""
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is None:
+                return
+            frame = entry.frame
+            outside = (frame.index < pd.Timestamp(start)) | (frame.index > pd.Timestamp(end))
+            frame = frame[outside]
+            if not events.empty:
+                frame = pd.concat([frame, events[_EVENT_COLUMNS]])
+            self._entries[ticker] = _TickerEvents(frame)
+
+    # ========================================
+    # 가격 DataFrame 기반 계산
+    # ========================================
+
+    @staticmethod
+    def events_from_frame(df: pd.DataFrame, threshold: float) -> pd.DataFrame:
+        """가격 DataFrame에서 |변동률| >= threshold 인 날짜의 이벤트 DataFrame 계산 (벡터화)"""
+        if df is None or df.empty or 'Close' not in df.columns:
+            return pd.DataFrame(columns=_EVENT_COLUMNS, index=pd.DatetimeIndex([]))
+        closes = pd.to_numeric(df['Close'], errors='coerce')
+        daily_return = closes.pct_change() * 100
+        if 'Volume' in df.columns:
+            volume = pd.to_numeric(df['Volume'], errors='coerce').fillna(0).astype('int64')
+        else:
+            volume = pd.Series(0, index=df.index, dtype='int64')
+        events = pd.DataFrame({'daily_return': daily_return, 'close': closes, 'volume': volume})
+        return events[daily_return.abs() >= threshold]
+
+    @classmethod
+    def format_events(cls, df: pd.DataFrame, threshold: float, max_events: int) -> List[Dict[str, Any]]:
+        """가격 DataFrame에서 임계값 이상 이벤트를 최근 날짜순 상위 N개로 반환"""
+        events = cls.events_from_frame(df, threshold)
+        return cls._to_events(events.sort_index(ascending=False).iloc[:max_events])
+
+    # ========================================
+    # Private Helper Methods
+    # ========================================
+
+    def _get_entry(self, ticker: str) -> _TickerEvents:
+        with self._lock:
+            entry = self._entries.get(ticker)
+        if entry is not None:
+            return entry
+        entry = _TickerEvents(self._load_events(ticker))
+        with self._lock:
+            return self._entries.setdefault(ticker, entry)
+
+    def _load_events(self, ticker: str) -> pd.DataFrame:
+        """테이블에서 티커 이벤트 로드 (전체 인덱싱 기록이 없으면 daily_prices 전체로 재구성)"""
+        conn = _get_engine().connect()
+        try:
+            self.ensure_table(conn)
+            stock_row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
+            if stock_row is None:
+                return self.events_from_frame(None, self.min_return_pct)
+            stock_id = stock_row[0]
+
+            indexed = conn.execute(
+                text("SELECT 1 FROM volatility_index_state WHERE stock_id = :sid"), {"sid": stock_id}
+            ).fetchone()
+            if indexed is None:
+                return self._rebuild(conn, ticker, stock_id)
+
+            rows = conn.execute(
+                text(
+                    "SELECT date, daily_return, close, volume FROM volatility_events "
+                    "WHERE stock_id = :sid ORDER BY date ASC"
+                ),
+                {"sid": stock_id},
+            ).fetchall()
+            if not rows:
+                return self.events_from_frame(None, self.min_return_pct)
+            frame = pd.DataFrame(rows, columns=['date'] + _EVENT_COLUMNS)
+            frame.index = pd.DatetimeIndex(pd.to_datetime(frame.pop('date')))
+            return frame.astype({'daily_return': float, 'close': float, 'volume': 'int64'})
+        finally:
+            conn.close()
+
+    def _rebuild(self, conn, ticker: str, stock_id: int) -> pd.DataFrame:
+        """인덱스 도입 전 적재된 티커(증분 갱신 행만 일부 있을 수 있음)를 전체 가격으로 재구성하고 완료 기록"""
+        conn.rollback()
+        prices = conn.execute(
+            text("SELECT date, close, volume FROM daily_prices WHERE stock_id = :sid ORDER BY date ASC"),
+            {"sid": stock_id},
+        ).fetchall()
+        events = self.events_from_frame(self._rows_to_prices(prices), self.min_return_pct)
+        try:
+            conn.execute(text("DELETE FROM volatility_events WHERE stock_id = :sid"), {"sid": stock_id})
+            self._insert_events(conn, stock_id, events)
+            self._mark_indexed(conn, stock_id)
+            conn.commit()
+            logger.info(f"급등락 이벤트 인덱스 재구성: {ticker} - {len(events)}건")
+        except Exception as e:
+            # 다른 프로세스가 동시에 재구성한 경우 등: 계산한 이벤트는 그대로 사용하고 다음 로드 때 다시 확인
+            conn.rollback()
+            logger.warning(f"급등락 이벤트 인덱스 재구성 저장 실패: {ticker} - {e}")
+        return events
+
+    @staticmethod
+    def _mark_indexed(conn, stock_id: int) -> None:
+        """티커 전체 인덱싱 완료 기록 (이미 있으면 유지)"""
+        exists = conn.execute(
+            text("SELECT 1 FROM volatility_index_state WHERE stock_id = :sid"), {"sid": stock_id}
+        ).fetchone()
+        if exists is None:
+            conn.execute(text("INSERT INTO volatility_index_state (stock_id) VALUES (:sid)"), {"sid": stock_id})
+
+    @staticmethod
+    def _rows_to_prices(rows) -> pd.DataFrame:
+        frame = pd.DataFrame(rows, columns=['date', 'Close', 'Volume'])
+        frame.index = pd.DatetimeIndex(pd.to_datetime(frame.pop('date')))
+        return frame.astype({'Close': float})
+
+    @staticmethod
+    def _insert_events(conn, stock_id: int, events: pd.DataFrame) -> None:
+        if events.empty:
+            return
+        conn.execute(
+            text(
+                """
+                INSERT INTO volatility_events (stock_id, date, daily_return, abs_return, close, volume)
+                VALUES (:sid, :date, :daily_return, :abs_return, :close, :volume)
+                """
+            ),
+            [
+                {
+                    "sid": stock_id,
+                    "date": d,
+                    "daily_return": r,
+                    "abs_return": abs(r),
+                    "close": c,
+                    "volume": v,
+                }
+                for d, r, c, v in zip(
+                    events.index.strftime('%Y-%m-%d'),
+                    events['daily_return'].astype(float).tolist(),
+                    events['close'].astype(float).tolist(),
+                    events['volume'].astype('int64').tolist(),
+                )
+            ],
+        )
+
+    @staticmethod
+    def _to_events(events: pd.DataFrame) -> List[Dict[str, Any]]:
+        return [
+            {
+                'date': d,
+                'daily_return': r,
+                'close_price': c,
+                'volume': v,
+                'event_type': '급등' if r > 0 else '급락'
+            }
+            for d, r, c, v in zip(
+                events.index.strftime('%Y-%m-%d'),
+                events['daily_return'].astype(float).tolist(),
+                events['close'].astype(float).tolist(),
+                events['volume'].astype('int64').tolist(),
+            )
+        ]
+
+
+# 전역 인스턴스
+volatility_event_index = VolatilityEventIndex()
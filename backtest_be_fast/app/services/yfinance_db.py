@@ -8,16 +8,35 @@ yfinance 데이터 MySQL 저장 서비스
 
 **주요 기능**:
 1. load_ticker_data(): 주가 데이터 조회 (DB 우선)
-   - DB에서 먼저 조회
-   - 누락 기간이 있으면 yfinance로 보완
+   - 같은 티커/구간 동시 호출은 single-flight로 한 번만 실행
+   - price_coverage(티커별 적재 구간 목록, 프로세스 내 캐시)로 누락 구간 판단
+   - 양 끝뿐 아니라 중간 구멍까지 누락 구간별로 yfinance에서 보완
+   - 적재 구간에는 실제로 반환된 행의 날짜 범위만 기록 (다운로드 실패는 기록 없이 호출자에 전달)
+   - 행 없이 응답한 구간(상장 전 등)은 PRICE_EMPTY_RANGE_TTL_SECONDS 동안만 프로세스 내에서 적재된 것으로 간주
+   - 당일(장 마감 전)은 적재 구간에 기록하지 않고, 수집 후 PRICE_OPEN_DAY_TTL_SECONDS 동안만 적재된 것으로 간주
+   - 최종 조회는 (stock_id, date) 인덱스 범위 스캔 한 번
    - 새로 가져온 데이터를 DB에 저장
-2. save_ticker_data(): DataFrame을 DB에 저장
-3. get_date_range(): DB에 저장된 데이터 범위 조회
+2. load_many_tickers(): 여러 티커 일괄 조회
+   - stock_id/적재 구간 IN 쿼리 한 번, 누락 구간은 yf.download 일괄 보완, 가격은 범위 스캔 한 번
+   - build_price_matrix(): 날짜 x 티커 가격 행렬로 정렬
+3. save_ticker_data(): DataFrame을 DB에 저장
+   - 컬럼 단위 NumPy 변환 후 배치 executemany upsert (PRICE_UPSERT_BATCH_SIZE)
+   - stocks.info_json은 last_info_update가 오래된 경우에만 갱신 (TICKER_INFO_REFRESH_HOURS)
+   - 기존 행과 값(DECIMAL(19,4) 기준)이 같은 행은 건너뛰고 새 행/바뀐 행만 upsert
+   - 적재 구간의 급등/급락 이벤트(volatility_events)를 같은 트랜잭션에서 증분 갱신
+   - 바뀐 행이 있을 때만 데이터 버전 증가 및 백테스트 결과 캐시 삭제
+4. get_date_range(): DB에 저장된 데이터 범위 조회
+5. load_ticker_data_async() / save_ticker_data_async(): 비동기 버전 (async 엔드포인트/Repository용)
+   - DATABASE_ASYNC_ENABLED이면 SQLAlchemy asyncio 엔진(aiomysql/asyncmy)으로 이벤트 루프에서 직접 실행
+   - 아니면 동기 버전을 I/O 스레드 풀에서 실행
+   - 동기 버전은 스크립트/워커 프로세스용으로 유지
 
 **DB 스키마**:
 - 테이블: daily_prices
 - 컬럼: ticker, date, open, high, low, close, volume, adj_close
 - 복합 기본키: (ticker, date)
+- 테이블: price_coverage (stock_id, start_date, end_date) — 적재 완료 구간 목록
+- 테이블: volatility_events — 급등/급락 이벤트 (app/services/volatility_index.py)
 
 **최적화 전략**:
 - 배치 삽입: 대량 데이터를 한 번에 저장
@@ -36,19 +55,43 @@ yfinance 데이터 MySQL 저장 서비스
 
 **환경 설정**:
 - DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME: 환경 변수
+- DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_POOL_RECYCLE: 커넥션 풀 (엔진별)
+- DATABASE_ASYNC_ENABLED, DATABASE_ASYNC_DRIVER: 비동기 엔진 사용 여부와 드라이버
 """
 import os
 import json
 import logging
-from typing import Optional
-from sqlalchemy import create_engine, text
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import bindparam, create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
 
+from app.utils.single_flight import AsyncSingleFlight, SingleFlight
+
 logger = logging.getLogger(__name__)
 
 _ENGINE_CACHE: Optional[Engine] = None
+_ASYNC_ENGINE_CACHE: Optional[AsyncEngine] = None
+
+# 동일 티커/구간 동시 조회 병합 (동기/비동기 경로별)
+_load_flight = SingleFlight()
+_async_load_flight = AsyncSingleFlight()
+
+
+def _pool_options() -> dict:
+    """커넥션 풀 설정 (동기/비동기 엔진 각각 적용)"""
+    from app.core.config import settings
+    return {
+        "pool_pre_ping": True,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
+    }
 
 
 def _get_engine() -> Engine:
@@ -133,103 +176,525 @@ def _get_engine() -> Engine:
         pass
     logger.error(f"[yfinance_db] SQLAlchemy URL (masked): {masked_db_url}")
 
-    _ENGINE_CACHE = create_engine(db_url, pool_pre_ping=True, future=True)
+    _ENGINE_CACHE = create_engine(db_url, future=True, **_pool_options())
     return _ENGINE_CACHE
 
 
-def save_ticker_data(ticker: str, df: pd.DataFrame) -> int:
-    """stocks 테이블에 티커 등록 및 daily_prices에 행을 upsert 합니다.
+def _get_async_engine() -> AsyncEngine:
+    """비동기 엔진 (동기 엔진과 같은 접속 정보, 드라이버만 DATABASE_ASYNC_DRIVER로 교체)"""
+    global _ASYNC_ENGINE_CACHE
+    if _ASYNC_ENGINE_CACHE is not None:
+        return _ASYNC_ENGINE_CACHE
+    from app.core.config import settings
+    url = _get_engine().url
+    url = url.set(drivername=f"{url.get_backend_name()}+{settings.database_async_driver}")
+    _ASYNC_ENGINE_CACHE = create_async_engine(url, **_pool_options())
+    return _ASYNC_ENGINE_CACHE
 
-    Returns: 저장된 행 수
-    """
-    engine = _get_engine()
-    conn = engine.connect()
-    trans = conn.begin()
+
+async def dispose_async_engine() -> None:
+    """비동기 엔진 커넥션 풀 정리 (애플리케이션 종료 시)"""
+    global _ASYNC_ENGINE_CACHE
+    if _ASYNC_ENGINE_CACHE is not None:
+        await _ASYNC_ENGINE_CACHE.dispose()
+        _ASYNC_ENGINE_CACHE = None
+
+
+_ADJ_CLOSE_COLUMNS = ('Adj Close', 'AdjClose', 'Adj_Close')
+
+
+def _nullable_floats(df: pd.DataFrame, column: Optional[str]) -> list:
+    """컬럼을 float 리스트로 변환 (NaN/누락 컬럼은 None)"""
+    if column is None or column not in df.columns:
+        return [None] * len(df)
+    values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
+
+
+def _prepare_price_rows(df: pd.DataFrame, stock_id: int) -> List[dict]:
+    """OHLCV DataFrame을 daily_prices upsert 파라미터 목록으로 변환 (컬럼 단위 NumPy 변환)"""
+    if df is None or df.empty:
+        return []
+    if 'Date' in df.columns:
+        dates = pd.DatetimeIndex(pd.to_datetime(df['Date']))
+    else:
+        dates = pd.DatetimeIndex(pd.to_datetime(df.index))
+    date_strs = dates.strftime('%Y-%m-%d').tolist()
+
+    adj_column = next((c for c in _ADJ_CLOSE_COLUMNS if c in df.columns), None)
+    if 'Volume' in df.columns:
+        volumes = pd.to_numeric(df['Volume'], errors='coerce').fillna(0).to_numpy().astype('int64').tolist()
+    else:
+        volumes = [0] * len(df)
+
+    columns = zip(
+        date_strs,
+        _nullable_floats(df, 'Open'),
+        _nullable_floats(df, 'High'),
+        _nullable_floats(df, 'Low'),
+        _nullable_floats(df, 'Close'),
+        _nullable_floats(df, adj_column),
+        volumes,
+    )
+    return [
+        {
+            'stock_id': stock_id,
+            'date': d,
+            'open': o,
+            'high': h,
+            'low': l,
+            'close': c,
+            'adj_close': ac,
+            'volume': v,
+        }
+        for d, o, h, l, c, ac, v in columns
+    ]
+
+
+def _price_values(open_, high, low, close, adj_close, volume) -> tuple:
+    """daily_prices 저장 정밀도(DECIMAL(19,4), BIGINT) 기준 비교용 값"""
+    prices = tuple(None if v is None else round(float(v), 4) for v in (open_, high, low, close, adj_close))
+    return prices + (int(volume or 0),)
+
+
+def _changed_price_rows(conn, stock_id: int, rows: List[dict]) -> List[dict]:
+    """DB에 없는 날짜이거나 저장된 값과 다른 행만 반환 (같은 값 재적재는 버전/캐시에 영향 없음)"""
+    stored = conn.execute(
+        text(
+            "SELECT date, open, high, low, close, adj_close, volume FROM daily_prices "
+            "WHERE stock_id = :sid AND date >= :start AND date <= :end"
+        ),
+        {"sid": stock_id, "start": min(r['date'] for r in rows), "end": max(r['date'] for r in rows)},
+    ).fetchall()
+    existing = {str(pd.Timestamp(row[0]).date()): _price_values(*row[1:]) for row in stored}
+    return [
+        r for r in rows
+        if existing.get(r['date']) != _price_values(r['open'], r['high'], r['low'], r['close'], r['adj_close'], r['volume'])
+    ]
+
+
+def _info_is_stale(last_info_update, now: datetime, max_age_hours: int) -> bool:
+    """stocks.info_json 갱신이 필요한지 여부 (기록이 없거나 max_age_hours 경과)"""
+    if last_info_update is None:
+        return True
+    return now - pd.Timestamp(last_info_update).to_pydatetime() >= timedelta(hours=max_age_hours)
+
+
+def _fetch_ticker_info(ticker: str) -> dict:
+    """yfinance 티커 info 조회 (실패 시 빈 dict)"""
     try:
-        # ensure stock exists
-        info = {}
-        try:
-            from app.utils.data_fetcher import data_fetcher
-            info = data_fetcher.get_ticker_info(ticker)
-        except Exception:
-            logger.warning("티커 info 조회 실패")
+        from app.utils.data_fetcher import data_fetcher
+        return data_fetcher.get_ticker_info(ticker)
+    except Exception:
+        logger.warning("티커 info 조회 실패")
+        return {}
 
-        # insert or update stocks
-        insert_stock = text(
-            """
-            INSERT INTO stocks (ticker, name, exchange, sector, industry, summary, info_json, last_info_update)
-            VALUES (:ticker, :name, :exchange, :sector, :industry, :summary, :info_json, :now)
-            ON DUPLICATE KEY UPDATE name=VALUES(name), exchange=VALUES(exchange), sector=VALUES(sector),
-              industry=VALUES(industry), summary=VALUES(summary), info_json=VALUES(info_json), last_info_update=VALUES(last_info_update)
-            """
-        )
-        now = datetime.utcnow()
-        conn.execute(insert_stock, {
-            "ticker": ticker,
-            "name": info.get("company_name"),
-            "exchange": info.get("exchange"),
-            "sector": info.get("sector"),
-            "industry": info.get("industry"),
-            "summary": None,
-            "info_json": json.dumps(info),
-            "now": now
-        })
-
-        # get stock_id
-        stock_id_row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
-        if not stock_id_row:
-            raise RuntimeError("stock_id를 찾을 수 없습니다.")
-        stock_id = stock_id_row[0]
-
-        # prepare daily prices upsert
-        rows = []
-        df_proc = df.copy()
-        if 'Date' in df_proc.columns:
-            df_proc['date'] = pd.to_datetime(df_proc['Date']).dt.date
+
+def _upsert_stock(conn, ticker: str, now: datetime, refresh_hours: int, info: Optional[dict] = None) -> int:
+    """stocks 행을 보장하고 stock_id 반환
+
+    info_json은 last_info_update가 refresh_hours보다 오래된 경우에만 yfinance에서 다시 조회합니다.
+    (누락 구간 보완처럼 잦은 증분 저장에서 네트워크 호출 생략)
+    info를 넘기면 조회 대신 그 값을 사용합니다. (비동기 경로에서 네트워크 호출을 미리 수행)
+    """
+    row = conn.execute(
+        text("SELECT id, last_info_update FROM stocks WHERE ticker = :t"), {"t": ticker}
+    ).fetchone()
+    if row and not _info_is_stale(row[1], now, refresh_hours):
+        return row[0]
+
+    if info is None:
+        info = _fetch_ticker_info(ticker)
+
+    insert_stock = text(
+        """
+        INSERT INTO stocks (ticker, name, exchange, sector, industry, summary, info_json, last_info_update)
+        VALUES (:ticker, :name, :exchange, :sector, :industry, :summary, :info_json, :now)
+        ON DUPLICATE KEY UPDATE name=VALUES(name), exchange=VALUES(exchange), sector=VALUES(sector),
+          industry=VALUES(industry), summary=VALUES(summary), info_json=VALUES(info_json), last_info_update=VALUES(last_info_update)
+        """
+    )
+    conn.execute(insert_stock, {
+        "ticker": ticker,
+        "name": info.get("company_name"),
+        "exchange": info.get("exchange"),
+        "sector": info.get("sector"),
+        "industry": info.get("industry"),
+        "summary": None,
+        "info_json": json.dumps(info),
+        "now": now
+    })
+    if row:
+        return row[0]
+
+    stock_id_row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
+    if not stock_id_row:
+        raise RuntimeError("stock_id를 찾을 수 없습니다.")
+    return stock_id_row[0]
+
+
+# ticker -> (stock_id, 커버된 날짜 구간 목록 [(start, end)], 시작일 순)
+_COVERAGE_CACHE: Dict[str, Tuple[int, List[Tuple[date, date]]]] = {}
+_COVERAGE_LOCK = threading.Lock()
+_COVERAGE_TABLE_READY = False
+# ticker -> (수집한 당일 날짜, 수집 시각 monotonic) — 장 마감 전 당일 데이터 재수집 억제용
+_OPEN_DAY_FETCHES: Dict[str, Tuple[date, float]] = {}
+# ticker -> [(시작, 끝, 수집 시각 monotonic)] — 행 없이 응답한 구간 재수집 억제용 (price_coverage에는 기록하지 않음)
+_EMPTY_FETCHES: Dict[str, List[Tuple[date, date, float]]] = {}
+
+_COVERAGE_DDL = """
+CREATE TABLE IF NOT EXISTS price_coverage (
+    stock_id INT NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_id, start_date),
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci
+"""
+
+
+def _merge_intervals(intervals: List[Tuple[date, date]],
+                     new: Optional[Tuple[date, date]] = None) -> List[Tuple[date, date]]:
+    """겹치거나 인접한(하루 차이) 구간을 병합해 시작일 순 목록으로 반환"""
+    items = sorted(list(intervals) + ([new] if new else []))
+    merged: List[Tuple[date, date]] = []
+    for s, e in items:
+        if merged and s <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
         else:
-            df_proc = df_proc.reset_index()
-            df_proc['date'] = pd.to_datetime(df_proc[df_proc.columns[0]]).dt.date
-
-        for _, r in df_proc.iterrows():
-            o = None if pd.isna(r.get('Open')) else float(r.get('Open'))
-            h = None if pd.isna(r.get('High')) else float(r.get('High'))
-            l = None if pd.isna(r.get('Low')) else float(r.get('Low'))
-            c = None if pd.isna(r.get('Close')) else float(r.get('Close'))
-            ac = None
-            if 'Adj Close' in r or 'AdjClose' in r or 'Adj_Close' in r:
-                ac = r.get('Adj Close') or r.get('AdjClose') or r.get('Adj_Close')
-                ac = None if pd.isna(ac) else float(ac)
-            vol = 0 if pd.isna(r.get('Volume')) else int(r.get('Volume'))
-            rows.append({
-                'stock_id': stock_id,
-                'date': r['date'].isoformat(),
-                'open': o,
-                'high': h,
-                'low': l,
-                'close': c,
-                'adj_close': ac,
-                'volume': vol
-            })
-
-        if rows:
-            # batch upsert
-            insert_stmt = text(
+            merged.append((s, e))
+    return merged
+
+
+def _missing_intervals(covered: List[Tuple[date, date]], start: date, end: date) -> List[Tuple[date, date]]:
+    """[start, end] 중 커버되지 않은 구간 (양 끝과 중간 구멍 모두)
+
+    평일이 하나도 없는 구간(주말)은 거래일이 없으므로 제외합니다.
+    """
+    gaps = []
+    cursor = start
+    for s, e in covered:
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s - timedelta(days=1)))
+        cursor = max(cursor, e + timedelta(days=1))
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return [(s, e) for s, e in gaps if np.busday_count(s, e + timedelta(days=1)) > 0]
+
+
+def _ensure_coverage_table(conn) -> None:
+    """price_coverage 테이블이 없으면 생성 (기존 DB 호환)"""
+    global _COVERAGE_TABLE_READY
+    if _COVERAGE_TABLE_READY:
+        return
+    conn.execute(text(_COVERAGE_DDL))
+    conn.commit()
+    _COVERAGE_TABLE_READY = True
+
+
+def _get_coverage(conn, ticker: str) -> Optional[Tuple[int, List[Tuple[date, date]]]]:
+    """티커의 (stock_id, 커버 구간 목록) 조회 (프로세스 내 캐시 우선, 티커가 없으면 None)"""
+    return _get_coverages(conn, [ticker]).get(ticker)
+
+
+def _get_coverages(conn, tickers: List[str]) -> Dict[str, Tuple[int, List[Tuple[date, date]]]]:
+    """여러 티커의 (stock_id, 커버 구간 목록)을 IN 쿼리로 한 번에 조회 (DB에 없는 티커는 제외)"""
+    result: Dict[str, Tuple[int, List[Tuple[date, date]]]] = {}
+    with _COVERAGE_LOCK:
+        for ticker in tickers:
+            if ticker in _COVERAGE_CACHE:
+                result[ticker] = _COVERAGE_CACHE[ticker]
+    pending = [t for t in dict.fromkeys(tickers) if t not in result]
+    if not pending:
+        return result
+
+    _ensure_coverage_table(conn)
+    id_rows = conn.execute(
+        text("SELECT id, ticker FROM stocks WHERE ticker IN :tickers").bindparams(
+            bindparam("tickers", expanding=True)
+        ),
+        {"tickers": pending},
+    ).fetchall()
+    stock_ids = {ticker: stock_id for stock_id, ticker in id_rows}
+    if not stock_ids:
+        return result
+
+    ids = list(stock_ids.values())
+    intervals: Dict[int, List[Tuple[date, date]]] = {sid: [] for sid in ids}
+    coverage_rows = conn.execute(
+        text(
+            "SELECT stock_id, start_date, end_date FROM price_coverage "
+            "WHERE stock_id IN :ids ORDER BY stock_id, start_date"
+        ).bindparams(bindparam("ids", expanding=True)),
+        {"ids": ids},
+    ).fetchall()
+    for sid, s, e in coverage_rows:
+        intervals[sid].append((pd.to_datetime(s).date(), pd.to_datetime(e).date()))
+
+    legacy = [sid for sid in ids if not intervals[sid]]
+    if legacy:
+        # 커버리지 기록 도입 이전에 적재된 데이터는 MIN/MAX 범위를 한 번만 등록
+        range_rows = conn.execute(
+            text(
+                "SELECT stock_id, MIN(date), MAX(date) FROM daily_prices "
+                "WHERE stock_id IN :ids GROUP BY stock_id"
+            ).bindparams(bindparam("ids", expanding=True)),
+            {"ids": legacy},
+        ).fetchall()
+        for sid, s, e in range_rows:
+            if s is not None:
+                intervals[sid] = [(pd.to_datetime(s).date(), pd.to_datetime(e).date())]
+                _write_coverage(conn, sid, intervals[sid])
+        if range_rows:
+            conn.commit()
+
+    with _COVERAGE_LOCK:
+        for ticker, sid in stock_ids.items():
+            result[ticker] = (sid, intervals[sid])
+            _COVERAGE_CACHE[ticker] = result[ticker]
+    return result
+
+
+def _write_coverage(conn, stock_id: int, intervals: List[Tuple[date, date]]) -> None:
+    conn.execute(text("DELETE FROM price_coverage WHERE stock_id = :sid"), {"sid": stock_id})
+    if intervals:
+        conn.execute(
+            text(
                 """
-                INSERT INTO daily_prices (stock_id, date, open, high, low, close, adj_close, volume)
-                VALUES (:stock_id, :date, :open, :high, :low, :close, :adj_close, :volume)
-                ON DUPLICATE KEY UPDATE open=VALUES(open), high=VALUES(high), low=VALUES(low), close=VALUES(close), adj_close=VALUES(adj_close), volume=VALUES(volume)
+                INSERT INTO price_coverage (stock_id, start_date, end_date)
+                VALUES (:sid, :start, :end)
+                ON DUPLICATE KEY UPDATE end_date = GREATEST(end_date, VALUES(end_date))
                 """
-            )
-            # chunking
-            chunk_size = 500
-            total = 0
-            for i in range(0, len(rows), chunk_size):
-                batch = rows[i:i+chunk_size]
-                conn.execute(insert_stmt, batch)
-                total += len(batch)
+            ),
+            [{"sid": stock_id, "start": str(s), "end": str(e)} for s, e in intervals],
+        )
+
+
+def _record_coverage(conn, stock_id: int, start: date, end: date) -> List[Tuple[date, date]]:
+    """save_ticker_data 트랜잭션 안에서 커버 구간 추가 (행 잠금 후 병합)"""
+    result = conn.execute(
+        text("SELECT start_date, end_date FROM price_coverage WHERE stock_id = :sid FOR UPDATE"),
+        {"sid": stock_id},
+    ).fetchall()
+    existing = [(pd.to_datetime(s).date(), pd.to_datetime(e).date()) for s, e in result]
+    merged = _merge_intervals(existing, (start, end))
+    _write_coverage(conn, stock_id, merged)
+    return merged
+
+
+def invalidate_coverage_cache(ticker: Optional[str] = None) -> None:
+    """프로세스 내 커버리지 캐시 무효화 (ticker가 None이면 전체)"""
+    with _COVERAGE_LOCK:
+        if ticker is None:
+            _COVERAGE_CACHE.clear()
+            _OPEN_DAY_FETCHES.clear()
+            _EMPTY_FETCHES.clear()
+        else:
+            _COVERAGE_CACHE.pop(ticker, None)
+            _OPEN_DAY_FETCHES.pop(ticker, None)
+            _EMPTY_FETCHES.pop(ticker, None)
+
+
+def _mark_open_day_fetched(ticker: str) -> None:
+    """당일까지 수집했음을 기록 (적재 구간에는 어제까지만 기록되므로 당일은 TTL 동안만 적재된 것으로 간주)"""
+    with _COVERAGE_LOCK:
+        _OPEN_DAY_FETCHES[ticker] = (date.today(), time.monotonic())
+
+
+def _mark_empty_range(ticker: str, start: date, end: date) -> None:
+    """행 없이 응답한 구간(상장 전, 휴장 등)을 PRICE_EMPTY_RANGE_TTL_SECONDS 동안만 적재된 것으로 기록
+
+    빈 응답은 일시적인 공급자 오류와 구분할 수 없으므로 price_coverage에는 남기지 않습니다.
+    """
+    if start > end:
+        return
+    with _COVERAGE_LOCK:
+        _EMPTY_FETCHES.setdefault(ticker, []).append((start, end, time.monotonic()))
+
+
+def _with_recent_fetches(ticker: str, covered: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """최근 수집 기록을 커버 구간에 추가
+
+    - PRICE_OPEN_DAY_TTL_SECONDS 안에 당일까지 수집했으면 당일
+    - PRICE_EMPTY_RANGE_TTL_SECONDS 안에 행 없이 응답한 구간 (만료된 기록은 제거)
+    """
+    from app.core.config import settings
+    today = date.today()
+    now = time.monotonic()
+    with _COVERAGE_LOCK:
+        fetched = _OPEN_DAY_FETCHES.get(ticker)
+        empty = [
+            entry for entry in _EMPTY_FETCHES.get(ticker, ())
+            if now - entry[2] < settings.price_empty_range_ttl_seconds
+        ]
+        if empty:
+            _EMPTY_FETCHES[ticker] = empty
+        else:
+            _EMPTY_FETCHES.pop(ticker, None)
+    recent = [(s, e) for s, e, _ in empty]
+    if fetched is not None and fetched[0] == today and now - fetched[1] < settings.price_open_day_ttl_seconds:
+        recent.append((today, today))
+    if not recent:
+        return covered
+    return _merge_intervals(list(covered) + recent)
+
+
+def _index_days(df: pd.DataFrame) -> pd.DatetimeIndex:
+    """가격 DataFrame 인덱스를 (현지 시각 기준) 자정 날짜 인덱스로 변환"""
+    index = df.index.tz_localize(None) if getattr(df.index, 'tz', None) is not None else df.index
+    return pd.DatetimeIndex(index).normalize()
+
+
+def _store_fetched(ticker: str, df: Optional[pd.DataFrame], fetch_start: date, fetch_end: date) -> None:
+    """yfinance 수집 결과 저장
+
+    price_coverage에는 반환된 행의 첫 날짜~마지막 날짜만 기록하고, 수집 구간 중 행이 없는 앞뒤 구간은
+    프로세스 내에서 TTL 동안만 적재된 것으로 봅니다. 당일까지 수집했으면 당일 수집 시각을 기록합니다.
+    """
+    if df is not None and not df.empty:
+        days = _index_days(df)
+        first, last = days.min().date(), days.max().date()
+        save_ticker_data(ticker, df, coverage_start=first, coverage_end=last)
+        _mark_empty_range(ticker, fetch_start, first - timedelta(days=1))
+        _mark_empty_range(ticker, last + timedelta(days=1), fetch_end)
+    else:
+        _mark_empty_range(ticker, fetch_start, fetch_end)
+    if fetch_end >= date.today():
+        _mark_open_day_fetched(ticker)
+
+
+class _SaveOutcome(NamedTuple):
+    """save_ticker_data 트랜잭션 결과 (커밋 후 프로세스 내 캐시 반영용)"""
+    rows: int
+    stock_id: int
+    covered: Optional[List[Tuple[date, date]]]
+    volatility_window: Optional[tuple]
+    data_version: Optional[int]
+
+
+def _ensure_save_tables(conn) -> None:
+    """save_ticker_data가 쓰는 보조 테이블 확인 (DDL은 암묵적으로 커밋되므로 트랜잭션 시작 전에 호출)"""
+    from app.services.volatility_index import volatility_event_index
+    from app.services.result_cache import backtest_result_cache
+    _ensure_coverage_table(conn)
+    volatility_event_index.ensure_table(conn)
+    backtest_result_cache.ensure_table(conn)
+
+
+def _write_ticker_data(conn, ticker: str, df: pd.DataFrame, batch_size: int,
+                       coverage_start=None, coverage_end=None, info: Optional[dict] = None) -> _SaveOutcome:
+    """save_ticker_data의 트랜잭션 본문 (호출자가 커밋/롤백, 동기/비동기 연결 공용)"""
+    from app.core.config import settings
+    from app.services.volatility_index import volatility_event_index
+    from app.services.result_cache import backtest_result_cache
+    from app.services.data_versions import bump_version
+
+    now = datetime.utcnow()
+    stock_id = _upsert_stock(conn, ticker, now, settings.ticker_info_refresh_hours, info)
+
+    rows = _prepare_price_rows(df, stock_id)
+    changed = _changed_price_rows(conn, stock_id, rows) if rows else []
+    if changed:
+        insert_stmt = text(
+            """
+            INSERT INTO daily_prices (stock_id, date, open, high, low, close, adj_close, volume)
+            VALUES (:stock_id, :date, :open, :high, :low, :close, :adj_close, :volume)
+            ON DUPLICATE KEY UPDATE open=VALUES(open), high=VALUES(high), low=VALUES(low), close=VALUES(close), adj_close=VALUES(adj_close), volume=VALUES(volume)
+            """
+        )
+        for i in range(0, len(changed), batch_size):
+            conn.execute(insert_stmt, changed[i:i + batch_size])
+
+    volatility_window = None
+    if changed:
+        try:
+            with conn.begin_nested():
+                volatility_window = volatility_event_index.record_window(
+                    conn, stock_id, min(r['date'] for r in changed), max(r['date'] for r in changed)
+                )
+        except Exception:
+            logger.exception(f"급등락 이벤트 갱신 실패: {ticker}")
 
+    covered = None
+    if rows:
+        cov_start = pd.Timestamp(coverage_start or min(r['date'] for r in rows)).date()
+        cov_end = pd.Timestamp(coverage_end or max(r['date'] for r in rows)).date()
+        cov_end = min(cov_end, date.today() - timedelta(days=1))
+        if cov_start <= cov_end:
+            covered = _record_coverage(conn, stock_id, cov_start, cov_end)
+
+    data_version = None
+    if changed:
+        data_version = bump_version(conn, stock_id)
+        backtest_result_cache.delete_rows(conn, ticker)
+
+    return _SaveOutcome(len(changed), stock_id, covered, volatility_window, data_version)
+
+
+def _apply_saved(ticker: str, outcome: _SaveOutcome) -> None:
+    """커밋 후 프로세스 내 캐시 반영 (적재 구간, 급등락 인덱스, 데이터 버전, 결과 캐시)"""
+    from app.services.volatility_index import volatility_event_index
+    from app.services.result_cache import backtest_result_cache
+    from app.services.data_versions import data_versions
+
+    if outcome.covered is not None:
+        with _COVERAGE_LOCK:
+            _COVERAGE_CACHE[ticker] = (outcome.stock_id, outcome.covered)
+    if outcome.volatility_window is not None:
+        volatility_event_index.apply_window(ticker, *outcome.volatility_window)
+    elif outcome.rows:
+        volatility_event_index.invalidate(ticker)
+    if outcome.data_version is not None:
+        data_versions.set(ticker, outcome.data_version)
+        backtest_result_cache.invalidate(ticker)
+
+
+def save_ticker_data(ticker: str, df: pd.DataFrame, batch_size: Optional[int] = None,
+                     coverage_start=None, coverage_end=None) -> int:
+    """stocks 테이블에 티커 등록 및 daily_prices에 행을 upsert 합니다.
+
+    가격 행은 컬럼 단위로 한 번에 변환한 뒤 같은 날짜 구간의 기존 행과 비교해, 새 행과 값이 바뀐 행만
+    batch_size 행씩 executemany로 전송합니다.
+    (PyMySQL은 INSERT ... VALUES executemany를 다중 행 VALUES 문으로 재작성)
+
+    같은 트랜잭션에서 price_coverage에 [coverage_start, coverage_end] 구간을 병합 기록합니다.
+    (미지정 시 저장한 행의 첫/마지막 날짜, 종료일은 장 마감 전 데이터를 고려해 어제까지만 기록)
+
+    저장한 날짜 구간의 급등/급락 이벤트도 세이브포인트 안에서 재계산합니다.
+    (이벤트 갱신 실패는 가격 저장을 되돌리지 않고 메모리 인덱스만 무효화)
+
+    바뀐 행을 저장하면 같은 트랜잭션에서 stocks.data_last_update(티커 데이터 버전)를 단조 증가시키고
+    해당 티커의 백테스트 결과 캐시(backtest_results)를 삭제하며, 커밋 후 프로세스 내 버전 맵에
+    새 버전을 반영하고 결과 캐시 메모리 항목을 제거합니다.
+
+    Returns: 저장된(새로 추가되거나 값이 바뀐) 행 수
+    """
+    from app.core.config import settings
+    batch_size = batch_size or settings.price_upsert_batch_size
+
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        # DDL은 암묵적으로 커밋되므로 트랜잭션 시작 전에 확인
+        _ensure_save_tables(conn)
+    except Exception:
+        conn.close()
+        raise
+    trans = conn.begin()
+    try:
+        outcome = _write_ticker_data(conn, ticker, df, batch_size, coverage_start, coverage_end)
         trans.commit()
-        return len(rows)
+        _apply_saved(ticker, outcome)
+        return outcome.rows
 
     except Exception as e:
         trans.rollback()
@@ -239,50 +704,136 @@ def save_ticker_data(ticker: str, df: pd.DataFrame) -> int:
         conn.close()
 
 
+async def save_ticker_data_async(ticker: str, df: pd.DataFrame, batch_size: Optional[int] = None,
+                                 coverage_start=None, coverage_end=None) -> int:
+    """save_ticker_data의 비동기 버전
+
+    비동기 엔진을 쓰면 같은 트랜잭션 본문을 AsyncConnection.run_sync로 실행합니다.
+    (티커 info 갱신이 필요하면 yfinance 조회만 I/O 스레드 풀에서 먼저 실행)
+    비동기 엔진을 쓰지 않으면 동기 버전을 I/O 스레드 풀에서 실행합니다.
+
+    Returns: 저장된 행 수
+    """
+    from app.core.config import settings
+    from app.core.executors import executor_manager
+    if not settings.database_async_enabled:
+        return await executor_manager.run_io(
+            save_ticker_data, ticker, df, batch_size, coverage_start, coverage_end, stage="mysql"
+        )
+    batch_size = batch_size or settings.price_upsert_batch_size
+
+    async with _get_async_engine().connect() as conn:
+        await conn.run_sync(_ensure_save_tables)
+        try:
+            row = (await conn.execute(
+                text("SELECT last_info_update FROM stocks WHERE ticker = :t"), {"t": ticker}
+            )).fetchone()
+            info = None
+            if row is None or _info_is_stale(row[0], datetime.utcnow(), settings.ticker_info_refresh_hours):
+                info = await executor_manager.run_io(_fetch_ticker_info, ticker, stage="yfinance")
+            outcome = await conn.run_sync(
+                _write_ticker_data, ticker, df, batch_size, coverage_start, coverage_end, info
+            )
+            await conn.commit()
+        except Exception:
+            await conn.rollback()
+            logger.exception("save_ticker_data_async 실패")
+            raise
+    _apply_saved(ticker, outcome)
+    return outcome.rows
+
+
+def _to_date(d):
+    """date/문자열(YYYY-MM-DD)/Timestamp를 date로 정규화"""
+    if d is None:
+        return None
+    if isinstance(d, str):
+        return datetime.strptime(d, "%Y-%m-%d").date()
+    if isinstance(d, (pd.Timestamp, datetime)):
+        return pd.to_datetime(d).date()
+    if isinstance(d, date):
+        return d
+    return pd.to_datetime(d).date()
+
+
+def _resolve_date_range(start_date, end_date) -> Tuple[date, date]:
+    """조회 구간 정규화 (미지정 시 최근 1년)"""
+    start_date = _to_date(start_date)
+    end_date = _to_date(end_date)
+
+    # defaults: last 1 year if not provided
+    if end_date is None and start_date is None:
+        end_date = date.today()
+        start_date = end_date - timedelta(days=365)
+    elif start_date is None:
+        end_date = end_date or date.today()
+        start_date = end_date - timedelta(days=365)
+    elif end_date is None:
+        end_date = date.today()
+    return start_date, end_date
+
+
+def _rows_to_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """daily_prices 조회 결과를 OHLCV DataFrame(DatetimeIndex)으로 변환"""
+    df['date'] = pd.to_datetime(df['date'])
+    df = df.set_index('date')
+    # normalize column names to expected ones
+    df = df.rename(columns={
+        'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close', 'adj_close': 'Adj Close', 'volume': 'Volume'
+    })
+    # ensure types
+    for col in ['Open','High','Low','Close','Adj Close']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    if 'Volume' in df.columns:
+        df['Volume'] = pd.to_numeric(df['Volume'], errors='coerce').fillna(0).astype('int64')
+    return df
+
+
+_PRICE_RANGE_SQL = (
+    "SELECT date, open, high, low, close, adj_close, volume FROM daily_prices "
+    "WHERE stock_id = :sid AND date >= :start AND date <= :end ORDER BY date ASC"
+)
+_PRICE_COLUMNS = ["date", "open", "high", "low", "close", "adj_close", "volume"]
+
+
+def _load_flight_key(ticker: str, start_date, end_date) -> tuple:
+    """single-flight 키: 같은 티커/구간 요청을 같은 키로 정규화"""
+    def _normalize(d):
+        return None if d is None else pd.Timestamp(d).date()
+    return (ticker, _normalize(start_date), _normalize(end_date))
+
+
 def load_ticker_data(ticker: str, start_date=None, end_date=None) -> pd.DataFrame:
     """DB에서 ticker의 daily_prices를 조회해 pandas DataFrame으로 반환합니다.
 
     start_date/end_date는 date 또는 문자열(YYYY-MM-DD)을 받을 수 있습니다.
     반환 DataFrame은 DatetimeIndex(날짜)와 컬럼 ['Open','High','Low','Close','Adj_Close','Volume']를 가집니다.
+
+    같은 (ticker, 구간)에 대한 동시 호출은 하나의 조회로 병합되어 결과를 공유합니다.
+    (누락 구간 yfinance 수집과 save_ticker_data upsert가 한 번만 실행됨)
     """
+    key = _load_flight_key(ticker, start_date, end_date)
+    return _load_flight.do(key, _load_ticker_data, ticker, start_date, end_date)
+
+
+def _load_ticker_data(ticker: str, start_date=None, end_date=None) -> pd.DataFrame:
+    """load_ticker_data의 실제 조회 로직 (병합 없이 실행)"""
     engine = _get_engine()
     conn = engine.connect()
     try:
-        # normalize start/end to date objects
-        def _to_date(d):
-            if d is None:
-                return None
-            if isinstance(d, str):
-                return datetime.strptime(d, "%Y-%m-%d").date()
-            if isinstance(d, (pd.Timestamp, datetime)):
-                return pd.to_datetime(d).date()
-            if isinstance(d, date):
-                return d
-            return pd.to_datetime(d).date()
-
-        start_date = _to_date(start_date)
-        end_date = _to_date(end_date)
-
-        # defaults: last 1 year if not provided
-        if end_date is None and start_date is None:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=365)
-        elif start_date is None:
-            end_date = end_date or date.today()
-            start_date = end_date - timedelta(days=365)
-        elif end_date is None:
-            end_date = date.today()
-
-        # find stock_id; if missing, fetch from yfinance and save
-        row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
-        if not row:
+        start_date, end_date = _resolve_date_range(start_date, end_date)
+
+        # find stock_id and covered intervals; if missing, fetch from yfinance and save
+        coverage = _get_coverage(conn, ticker)
+        if coverage is None:
             logger.info(f"티커 '{ticker}'이 DB에 없음 — yfinance에서 수집 시도")
             try:
                 from app.utils.data_fetcher import data_fetcher
-                df_new = data_fetcher.get_stock_data(ticker, start_date, end_date, use_cache=True)
+                df_new = data_fetcher.get_stock_data(ticker, start_date, end_date, use_cache=True, min_rows=1)
                 if df_new is None or df_new.empty:
                     raise ValueError("yfinance에서 유효한 데이터가 반환되지 않았습니다.")
-                save_ticker_data(ticker, df_new)
+                _store_fetched(ticker, df_new, start_date, end_date)
             except Exception as e:
                 logger.exception("티커가 DB에 없고 yfinance 수집 실패")
                 raise ValueError(f"티커 '{ticker}'이(가) DB에 없고 yfinance 수집 실패: {e}")
@@ -292,99 +843,206 @@ def load_ticker_data(ticker: str, start_date=None, end_date=None) -> pd.DataFram
             #  by a different connection within the same snapshot)
             conn.close()
             conn = engine.connect()
-            row = conn.execute(text("SELECT id FROM stocks WHERE ticker = :t"), {"t": ticker}).fetchone()
-            if not row:
+            coverage = _get_coverage(conn, ticker)
+            if coverage is None:
                 raise ValueError(f"티커 '{ticker}'을(를) DB에 추가할 수 없습니다.")
 
-        stock_id = row[0]
+        stock_id, covered = coverage
 
-        # check existing coverage
-        date_row = conn.execute(text("SELECT MIN(date), MAX(date) FROM daily_prices WHERE stock_id = :sid"), {"sid": stock_id}).fetchone()
-        db_min, db_max = None, None
-        if date_row and date_row[0] is not None:
-            db_min = pd.to_datetime(date_row[0]).date()
-            db_max = pd.to_datetime(date_row[1]).date()
+        # back-fill every uncovered interval (both ends and interior holes)
+        missing_ranges = _missing_intervals(_with_recent_fetches(ticker, covered), start_date, end_date)
+        if missing_ranges:
+            _fill_missing_ranges(ticker, missing_ranges)
+            # 다른 연결에서 커밋된 행이 보이도록 읽기 스냅샷 종료
+            conn.commit()
 
-        # fetch missing ranges if any
-        try:
-            from app.utils.data_fetcher import data_fetcher
-        except Exception:
-            data_fetcher = None
+        # build query to return requested interval (single indexed range scan)
+        params = {"sid": stock_id, "start": str(start_date), "end": str(end_date)}
 
-        missing_ranges = []
-        if db_min is None:
-            # no data at all in DB for this ticker -> fetch full requested range
-            missing_ranges.append((start_date, end_date))
-        else:
-            if start_date < db_min:
-                missing_ranges.append((start_date, db_min - timedelta(days=1)))
-            if end_date > db_max:
-                missing_ranges.append((db_max + timedelta(days=1), end_date))
-
-        # If there are multiple small missing ranges, try to coalesce into one padded fetch
-        if missing_ranges and data_fetcher is not None:
-            min_start = min(s for s, _ in missing_ranges if s is not None)
-            max_end = max(e for _, e in missing_ranges if e is not None)
-            PAD_DAYS = 3
-            co_start = max(min_start - timedelta(days=PAD_DAYS), date(1970, 1, 1))
-            co_end = min(max_end + timedelta(days=PAD_DAYS), date.today())
-            try:
-                logger.info(f"DB에 누락된 기간을 yfinance에서 가져옵니다(통합+패드): {ticker} {co_start} -> {co_end}")
-                df_new = data_fetcher.get_stock_data(ticker, co_start, co_end, use_cache=True)
-                if df_new is not None and not df_new.empty:
-                    save_ticker_data(ticker, df_new)
-                else:
-                    logger.warning("통합 fetch가 빈 결과를 반환했습니다; 개별 구간으로 폴백합니다.")
-                    raise ValueError("empty result from consolidated fetch")
-            except Exception:
-                logger.exception("통합 누락 기간 수집 실패, 개별 구간 시도 중")
-                # fallback: try per-range fetch as before
-                for s, e in missing_ranges:
-                    if s is None or e is None:
-                        continue
-                    if s > e:
-                        continue
-                    try:
-                        logger.info(f"DB에 누락된 기간을 yfinance에서 가져옵니다: {ticker} {s} -> {e}")
-                        df_new = data_fetcher.get_stock_data(ticker, s, e, use_cache=True)
-                        if df_new is not None and not df_new.empty:
-                            save_ticker_data(ticker, df_new)
-                    except Exception:
-                        logger.exception("누락 기간 수집 실패")
-        else:
-            if data_fetcher is None and missing_ranges:
-                logger.warning("data_fetcher 모듈을 찾을 수 없어 누락 데이터를 가져올 수 없습니다.")
-
-        # build query to return requested interval
-        q = "SELECT date, open, high, low, close, adj_close, volume FROM daily_prices WHERE stock_id = :sid"
-        params = {"sid": stock_id}
-        if start_date:
-            q += " AND date >= :start"
-            params["start"] = str(start_date)
-        if end_date:
-            q += " AND date <= :end"
-            params["end"] = str(end_date)
-        q += " ORDER BY date ASC"
-
-        res = conn.execute(text(q), params)
+        res = conn.execute(text(_PRICE_RANGE_SQL), params)
         rows = res.fetchall()
         if not rows:
             raise ValueError(f"티커 '{ticker}'에 대한 데이터가 없습니다. (요청 범위: {start_date} - {end_date})")
 
-        df = pd.DataFrame(rows, columns=["date", "open", "high", "low", "close", "adj_close", "volume"])
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.set_index('date')
-        # normalize column names to expected ones
-        df = df.rename(columns={
-            'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close', 'adj_close': 'Adj Close', 'volume': 'Volume'
-        })
-        # ensure types
-        for col in ['Open','High','Low','Close','Adj Close']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        if 'Volume' in df.columns:
-            df['Volume'] = pd.to_numeric(df['Volume'], errors='coerce').fillna(0).astype('int64')
-
-        return df
+        df = pd.DataFrame(rows, columns=_PRICE_COLUMNS)
+        return _rows_to_frame(df)
+    finally:
+        conn.close()
+
+
+async def load_ticker_data_async(ticker: str, start_date=None, end_date=None) -> pd.DataFrame:
+    """load_ticker_data의 비동기 버전 (반환 형식과 예외는 동기 버전과 같음)
+
+    비동기 엔진을 쓰면 적재 구간 확인과 가격 범위 스캔을 이벤트 루프에서 직접 실행하고,
+    미등록 티커나 누락 구간이 있으면(yfinance 수집 + upsert) 동기 버전을 I/O 스레드 풀에서 실행합니다.
+    같은 (ticker, 구간)에 대한 동시 호출은 하나의 조회로 병합됩니다.
+    비동기 엔진을 쓰지 않으면 동기 버전을 I/O 스레드 풀에서 실행합니다.
+    """
+    from app.core.config import settings
+    from app.core.executors import executor_manager
+    if not settings.database_async_enabled:
+        return await executor_manager.run_io(load_ticker_data, ticker, start_date, end_date, stage="mysql")
+    key = _load_flight_key(ticker, start_date, end_date)
+    return await _async_load_flight.do(key, _load_ticker_data_async, ticker, start_date, end_date)
+
+
+async def _load_ticker_data_async(ticker: str, start_date=None, end_date=None) -> pd.DataFrame:
+    """load_ticker_data_async의 실제 조회 로직 (병합 없이 실행)"""
+    from app.core.executors import executor_manager
+    start_date, end_date = _resolve_date_range(start_date, end_date)
+
+    async with _get_async_engine().connect() as conn:
+        coverage = await conn.run_sync(_get_coverage, ticker)
+        if coverage is not None and not _missing_intervals(_with_recent_fetches(ticker, coverage[1]), start_date, end_date):
+            params = {"sid": coverage[0], "start": str(start_date), "end": str(end_date)}
+            rows = (await conn.execute(text(_PRICE_RANGE_SQL), params)).fetchall()
+            if rows:
+                return _rows_to_frame(pd.DataFrame(rows, columns=_PRICE_COLUMNS))
+
+    # 미등록 티커/누락 구간 보완(yfinance 수집 + upsert)과 오류 처리는 동기 경로에 위임
+    return await executor_manager.run_io(load_ticker_data, ticker, start_date, end_date, stage="mysql")
+
+
+def _fill_missing_ranges(ticker: str, missing_ranges: List[Tuple[date, date]]) -> None:
+    """누락 구간별로 yfinance에서 가져와 저장 (구간 양쪽에 PAD_DAYS 여유)
+
+    행이 1개뿐인 응답도 저장합니다. 다운로드 실패(DataFetchError)와 요청 제한(YFinanceRateLimitError)은
+    아무것도 기록하지 않고 호출자에게 전달합니다.
+    """
+    try:
+        from app.utils.data_fetcher import (
+            DataFetchError, DataNotFoundError, YFinanceRateLimitError, data_fetcher,
+        )
+    except Exception:
+        logger.warning("data_fetcher 모듈을 찾을 수 없어 누락 데이터를 가져올 수 없습니다.")
+        return
+
+    PAD_DAYS = 3
+    for s, e in missing_ranges:
+        fetch_start = max(s - timedelta(days=PAD_DAYS), date(1970, 1, 1))
+        fetch_end = min(e + timedelta(days=PAD_DAYS), date.today())
+        if fetch_start > fetch_end:
+            continue
+        try:
+            logger.info(f"DB에 누락된 기간을 yfinance에서 가져옵니다: {ticker} {s} -> {e}")
+            try:
+                df_new = data_fetcher.get_stock_data(ticker, fetch_start, fetch_end, use_cache=True, min_rows=1)
+            except (DataFetchError, YFinanceRateLimitError):
+                raise
+            except DataNotFoundError:
+                logger.info(f"누락 기간에 데이터 없음: {ticker} {fetch_start} -> {fetch_end}")
+                df_new = None
+            _store_fetched(ticker, df_new, fetch_start, fetch_end)
+        except (DataFetchError, YFinanceRateLimitError) as error:
+            logger.warning(f"누락 기간 수집 실패(적재 구간 기록 안 함): {ticker} {s} -> {e}: {error}")
+            raise
+        except Exception:
+            logger.exception("누락 기간 수집 실패")
+
+
+def load_many_tickers(symbols: List[str], start_date=None, end_date=None) -> Dict[str, pd.DataFrame]:
+    """여러 티커의 daily_prices를 한 번에 조회해 {티커: DataFrame}으로 반환합니다.
+
+    - stock_id와 적재 구간은 IN 쿼리 한 번으로 조회 (적재 구간 캐시 적중 시 생략)
+    - 누락 구간이 있는 티커들은 data_fetcher.get_many_stock_data(yf.download 일괄)로 한 번에 보완
+      (일괄 결과에 없는 티커는 개별 수집으로 폴백)
+    - 가격은 stock_id IN (...) AND date 범위 스캔 한 번으로 조회
+    - 데이터를 얻지 못한 티커는 결과에서 제외 (호출자가 load_ticker_data로 개별 처리)
+
+    반환 DataFrame 형식은 load_ticker_data와 같습니다. 정렬된 가격 행렬이 필요하면 build_price_matrix를 사용합니다.
+    """
+    tickers = list(dict.fromkeys(symbols))
+    if not tickers:
+        return {}
+    start_date, end_date = _resolve_date_range(start_date, end_date)
+
+    engine = _get_engine()
+    conn = engine.connect()
+    try:
+        coverages = _get_coverages(conn, tickers)
+
+        # 티커별 누락 구간 (DB에 없는 티커는 요청 구간 전체)
+        missing_ranges = {}
+        for ticker in tickers:
+            if ticker in coverages:
+                gaps = _missing_intervals(_with_recent_fetches(ticker, coverages[ticker][1]), start_date, end_date)
+            else:
+                gaps = [(start_date, end_date)]
+            if gaps:
+                missing_ranges[ticker] = gaps
+
+        if missing_ranges:
+            _fill_many_missing_ranges(missing_ranges)
+            # 다른 연결에서 커밋된 행이 보이도록 읽기 스냅샷 종료
+            conn.commit()
+            coverages = _get_coverages(conn, tickers)
+        if not coverages:
+            return {}
+
+        id_to_ticker = {stock_id: ticker for ticker, (stock_id, _) in coverages.items()}
+        q = text(
+            "SELECT stock_id, date, open, high, low, close, adj_close, volume FROM daily_prices "
+            "WHERE stock_id IN :ids AND date >= :start AND date <= :end ORDER BY stock_id, date ASC"
+        ).bindparams(bindparam("ids", expanding=True))
+        rows = conn.execute(
+            q, {"ids": list(id_to_ticker), "start": str(start_date), "end": str(end_date)}
+        ).fetchall()
+        if not rows:
+            return {}
+
+        df = pd.DataFrame(rows, columns=["stock_id", "date", "open", "high", "low", "close", "adj_close", "volume"])
+        frames = {
+            id_to_ticker[stock_id]: _rows_to_frame(group.drop(columns="stock_id"))
+            for stock_id, group in df.groupby("stock_id", sort=False)
+        }
+        return {ticker: frames[ticker] for ticker in tickers if ticker in frames}
     finally:
         conn.close()
+
+
+def _fill_many_missing_ranges(missing_ranges: Dict[str, List[Tuple[date, date]]]) -> None:
+    """여러 티커의 누락 구간을 한 번의 일괄 다운로드로 보완 (티커가 하나면 개별 수집)"""
+    if len(missing_ranges) == 1:
+        ticker, gaps = next(iter(missing_ranges.items()))
+        _fill_missing_ranges(ticker, gaps)
+        return
+
+    try:
+        from app.utils.data_fetcher import data_fetcher
+    except Exception:
+        logger.warning("data_fetcher 모듈을 찾을 수 없어 누락 데이터를 가져올 수 없습니다.")
+        return
+
+    PAD_DAYS = 3
+    all_gaps = [gap for gaps in missing_ranges.values() for gap in gaps]
+    window_start = max(min(s for s, _ in all_gaps) - timedelta(days=PAD_DAYS), date(1970, 1, 1))
+    window_end = min(max(e for _, e in all_gaps) + timedelta(days=PAD_DAYS), date.today())
+    try:
+        batch = data_fetcher.get_many_stock_data(list(missing_ranges), window_start, window_end)
+    except Exception:
+        logger.exception("일괄 누락 기간 수집 실패, 개별 수집으로 폴백")
+        batch = {}
+
+    for ticker, gaps in missing_ranges.items():
+        df = batch.get(ticker.upper())
+        if df is None:
+            _fill_missing_ranges(ticker, gaps)
+            continue
+
+        days = _index_days(df)
+        for s, e in gaps:
+            fetch_start = max(s - timedelta(days=PAD_DAYS), date(1970, 1, 1))
+            fetch_end = min(e + timedelta(days=PAD_DAYS), date.today())
+            part = df[(days >= pd.Timestamp(fetch_start)) & (days <= pd.Timestamp(fetch_end))]
+            try:
+                _store_fetched(ticker, part, fetch_start, fetch_end)
+            except Exception:
+                logger.exception(f"누락 기간 저장 실패: {ticker}")
+
+
+def build_price_matrix(frames: Dict[str, pd.DataFrame], column: str = 'Close') -> pd.DataFrame:
+    """{티커: DataFrame}을 날짜 x 티커 가격 행렬로 정렬 (거래일 합집합, 없는 날은 NaN)"""
+    series = {ticker: df[column] for ticker, df in frames.items() if df is not None and column in df.columns}
+    if not series:
+        return pd.DataFrame()
+    return pd.concat(series, axis=1).sort_index()
@@ -28,7 +28,8 @@
 import pandas as pd
 import numpy as np
 from backtesting import Strategy
-from backtesting.test import SMA
+
+from app.utils.indicator_cache import indicator_cache
 
 
 class BollingerBandsStrategy(Strategy):
@@ -39,10 +40,10 @@ class BollingerBandsStrategy(Strategy):
 
     def init(self):
         close = self.data.Close
-        # 중심선 (SMA) 계산
-        self.sma = self.I(SMA, close, self.period)
-        # 표준편차 계산
-        self.std = self.I(self._std, close, self.period)
+        # 중심선 (SMA) 계산 (지표 캐시 공유)
+        self.sma = self.I(indicator_cache.sma, close, self.period, name=f"SMA({self.period})")
+        # 표준편차 계산 (_std와 같은 계산)
+        self.std = self.I(indicator_cache.rolling_std, close, self.period, name=f"STD({self.period})")
         # 상단/하단 밴드 계산 (SMA와 STD 재사용)
         self.upper_band = self.I(lambda: self.sma + (self.std_dev * self.std))
         self.lower_band = self.I(lambda: self.sma - (self.std_dev * self.std))
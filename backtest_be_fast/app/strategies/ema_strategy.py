@@ -28,6 +28,8 @@ import pandas as pd
 from backtesting import Strategy
 from backtesting.lib import crossover
 
+from app.utils.indicator_cache import indicator_cache
+
 
 class EMAStrategy(Strategy):
     """EMA 교차 전략"""
@@ -38,8 +40,8 @@ class EMAStrategy(Strategy):
 
     def init(self):
         close = self.data.Close
-        self.ema_fast = self.I(self._ema, close, self.fast_window)
-        self.ema_slow = self.I(self._ema, close, self.slow_window)
+        self.ema_fast = self.I(indicator_cache.ema, close, self.fast_window, name=f"EMA({self.fast_window})")
+        self.ema_slow = self.I(indicator_cache.ema, close, self.slow_window, name=f"EMA({self.slow_window})")
 
     def next(self):
         # 빠른 EMA가 느린 EMA를 상향 돌파: 골든크로스 → 매수
@@ -31,6 +31,8 @@ import numpy as np
 from backtesting import Strategy
 from backtesting.lib import crossover
 
+from app.utils.indicator_cache import indicator_cache
+
 
 class MACDStrategy(Strategy):
     """MACD 전략"""
@@ -41,8 +43,11 @@ class MACDStrategy(Strategy):
     
     def init(self):
         close = self.data.Close
-        self.macd_line = self.I(self._macd_line, close, self.fast_period, self.slow_period)
-        self.signal_line = self.I(self._signal_line, close, self.fast_period, self.slow_period, self.signal_period)
+        # _macd_line / _signal_line과 같은 계산, 지표 캐시 공유
+        self.macd_line = self.I(indicator_cache.macd_line, close, self.fast_period, self.slow_period, name="MACD")
+        self.signal_line = self.I(
+            indicator_cache.macd_signal, close, self.fast_period, self.slow_period, self.signal_period, name="Signal"
+        )
     
     def _macd_line(self, close: pd.Series, fast: int, slow: int) -> pd.Series:
         """MACD 라인 계산"""
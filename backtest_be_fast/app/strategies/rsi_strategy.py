@@ -30,6 +30,8 @@ import pandas as pd
 import numpy as np
 from backtesting import Strategy
 
+from app.utils.indicator_cache import indicator_cache
+
 
 class RSIStrategy(Strategy):
     """
@@ -44,7 +46,8 @@ class RSIStrategy(Strategy):
 
     def init(self):
         close = self.data.Close
-        self.rsi = self.I(self._rsi, close, self.rsi_period)
+        # _rsi와 같은 계산 (NaN은 50), 지표 캐시 공유
+        self.rsi = self.I(indicator_cache.rsi, close, self.rsi_period, 50.0, name=f"RSI({self.rsi_period})")
 
     def _rsi(self, close: pd.Series, period: int) -> pd.Series:
         """RSI 계산 - 안정성 개선"""
@@ -30,6 +30,8 @@ import pandas as pd
 from backtesting import Strategy
 from backtesting.lib import crossover
 
+from app.utils.indicator_cache import indicator_cache
+
 
 def SMA(values, n):
     """
@@ -75,9 +77,9 @@ class SMACrossStrategy(Strategy):
         - 이동평균 계산
         - 지표 등록
         """
-        # 이동평균 계산
-        self.sma1 = self.I(SMA, self.data.Close, self.sma_short)
-        self.sma2 = self.I(SMA, self.data.Close, self.sma_long)
+        # 이동평균 계산 (지표 캐시 공유)
+        self.sma1 = self.I(indicator_cache.sma, self.data.Close, self.sma_short, name=f"SMA({self.sma_short})")
+        self.sma2 = self.I(indicator_cache.sma, self.data.Close, self.sma_long, name=f"SMA({self.sma_long})")
 
     def next(self):
         """
@@ -8,6 +8,7 @@
 
 **주요 기능**:
 1. fetch_ticker_data(): 주식 데이터 다운로드
+   - get_many_stock_data(): 여러 종목을 한 번의 yf.download로 일괄 다운로드
 2. fetch_exchange_rate(): 환율 데이터 (USD/KRW=X)
 3. fetch_benchmark(): 벤치마크 지수 (^GSPC, ^IXIC)
 4. 데이터 검증 및 정제
@@ -35,7 +36,7 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 from pathlib import Path
 import os
@@ -43,6 +44,10 @@ class DataNotFoundError(Exception):
     """데이터를 찾을 수 없을 때 발생하는 예외"""
     pass
 
+class DataFetchError(DataNotFoundError):
+    """다운로드 자체가 실패해 데이터 유무를 확인하지 못했을 때 발생하는 예외 (DataNotFoundError로도 처리 가능)"""
+    pass
+
 class InvalidSymbolError(Exception):
     """잘못된 종목 심볼일 때 발생하는 예외"""
     pass
@@ -66,7 +71,8 @@ class DataFetcher:
         start_date: date,
         end_date: date,
         use_cache: bool = True,
-        cache_hours: int = 24
+        cache_hours: int = 24,
+        min_rows: int = 2
     ) -> pd.DataFrame:
         """
         주식 데이터를 가져옵니다.
@@ -77,9 +83,14 @@ class DataFetcher:
             end_date: 종료 날짜
             use_cache: 캐시 사용 여부
             cache_hours: 캐시 유효 시간 (시간)
+            min_rows: 최소 레코드 수 (미만이면 DataNotFoundError)
             
         Returns:
             OHLCV 데이터프레임
+            
+        Raises:
+            DataNotFoundError: 요청이 성공했지만 데이터가 없거나 부족할 때
+            DataFetchError: 다운로드 시도가 예외로 실패해 데이터 유무를 확인하지 못했을 때
         """
         try:
             # 티커를 대문자로 변환
@@ -163,11 +174,13 @@ class DataFetcher:
                 # 그 외의 경우는 데이터 없음으로 처리
                 error_detail = f"'{ticker}' 종목에 대한 {start_str}부터 {end_str}까지의 데이터를 찾을 수 없습니다."
                 if error_messages:
+                    # 다운로드 예외가 있었으면 빈 응답으로 확정할 수 없음
                     error_detail += f" 오류: {'; '.join(error_messages)}"
+                    raise DataFetchError(error_detail)
                 raise DataNotFoundError(error_detail)
             
             # 데이터가 너무 적은 경우 체크
-            if len(data) < 2:
+            if len(data) < min_rows:
                 raise DataNotFoundError(f"'{ticker}' 종목의 데이터가 부족합니다. ({len(data)}개 레코드)")
             
             # MultiIndex 컬럼 처리 (yfinance는 때때로 MultiIndex를 반환)
@@ -236,7 +249,70 @@ class DataFetcher:
                 raise YFinanceRateLimitError(f"야후 파이낸스 연결 오류: {str(e)}")
             else:
                 logger.error(f"데이터 수집 예상치 못한 오류: {ticker}, {str(e)}")
-                raise DataNotFoundError(f"'{ticker}' 종목 데이터 수집 실패: {str(e)}")
+                raise DataFetchError(f"'{ticker}' 종목 데이터 수집 실패: {str(e)}")
+    
+    def get_many_stock_data(
+        self,
+        tickers: List[str],
+        start_date: date,
+        end_date: date,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 종목의 주식 데이터를 한 번의 yf.download 호출로 가져옵니다.
+        
+        Args:
+            tickers: 티커 심볼 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            
+        Returns:
+            {티커: OHLCV 데이터프레임} (데이터가 없는 티커는 제외, 호출자가 개별 조회로 보완)
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        if not tickers:
+            return {}
+        
+        start_str = pd.Timestamp(start_date).strftime('%Y-%m-%d')
+        end_str = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')  # 종료일 포함
+        logger.info(f"Yahoo Finance 일괄 다운로드: {len(tickers)}개 종목 ({start_str} -> {end_str})")
+        
+        try:
+            data = yf.download(
+                tickers, start=start_str, end=end_str, auto_adjust=True, prepost=False,
+                progress=False, threads=True, group_by='ticker'
+            )
+        except Exception as e:
+            logger.warning(f"일괄 다운로드 실패: {e}")
+            return {}
+        if data is None or data.empty:
+            return {}
+        
+        results = {}
+        for ticker in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    continue
+                frame = data[ticker].copy()
+            elif len(tickers) == 1:
+                frame = data.copy()
+            else:
+                continue
+            
+            frame.columns = [str(col).replace(' ', '') for col in frame.columns]
+            if 'Close' not in frame.columns:
+                continue
+            for col in ['Open', 'High', 'Low']:
+                if col not in frame.columns:
+                    frame[col] = frame['Close']
+            if 'Volume' not in frame.columns:
+                frame['Volume'] = 0
+            frame = frame[['Open', 'High', 'Low', 'Close', 'Volume']]
+            frame = frame.replace([np.inf, -np.inf], np.nan).dropna()
+            if not frame.empty:
+                results[ticker] = frame
+        
+        logger.info(f"일괄 다운로드 완료: {len(results)}/{len(tickers)}개 종목")
+        return results
     
     def validate_ticker(self, ticker: str) -> bool:
         """
@@ -0,0 +1,98 @@
+"""
+차트 시계열 다운샘플링 유틸리티
+
+**역할**:
+- 화면 폭보다 훨씬 많은 일봉 포인트를 차트 모양을 유지하면서 max_points개 안팎으로 축소
+- 선 차트는 LTTB(Largest-Triangle-Three-Buckets), 캔들 차트는 구간별 OHLC 집계 사용
+
+**주요 기능**:
+1. lttb_indices(): LTTB로 남길 포인트 위치 선택 (첫/마지막 포인트 항상 포함)
+2. bucket_ends(): 균등 구간 끝 위치 계산
+3. merge_positions(): 반드시 남길 위치(거래 마커 날짜 등)를 선택 결과에 합침
+4. aggregate_ohlc(): 구간별 시가(첫 값)/고가(최대)/저가(최소)/종가(마지막 값)/거래량(합계) 집계
+   (구간은 끝 위치로 지정하고 끝 날짜로 표시하므로, 선택된 날짜의 종가가 선 차트 값과 일치)
+
+**동작 규칙**:
+- 입력 길이가 max_points 이하이면 원본 위치를 그대로 반환
+- NaN 값은 (버킷 전체가 NaN이 아니면) LTTB 선택에서 제외되고, OHLC 집계의 고가/저가 계산에서 무시됨
+- 반드시 남길 위치를 합치면 결과가 max_points보다 조금 많을 수 있음
+
+**의존성**:
+- numpy, pandas
+
+**연관 컴포넌트**:
+- Backend: app/services/chart_data_service.py (max_points 요청 옵션)
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def lttb_indices(values, max_points: int) -> np.ndarray:
+    """LTTB로 남길 포인트 위치(오름차순) 선택"""
+    y = np.asarray(values, dtype='float64')
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype='float64')
+    # 첫/마지막 포인트를 제외한 구간을 max_points - 2개 버킷으로 나눔
+    edges = np.linspace(1, n - 1, max_points - 1).astype('int64')
+    selected = np.empty(max_points, dtype='int64')
+    selected[0], selected[-1] = 0, n - 1
+
+    prev = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        next_y = y[next_start:next_end]
+        next_y = next_y[~np.isnan(next_y)]
+        avg_x = x[next_start:next_end].mean()
+        avg_y = next_y.mean() if len(next_y) else y[prev]
+
+        # 직전 선택 포인트, 버킷 후보, 다음 버킷 평균이 이루는 삼각형 넓이가 최대인 후보 선택
+        area = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        area = np.where(np.isnan(area), -1.0, area)
+        prev = start + int(np.argmax(area))
+        selected[i + 1] = prev
+
+    return selected
+
+
+def bucket_ends(length: int, max_points: int) -> np.ndarray:
+    """길이 length를 max_points개 균등 구간으로 나눈 끝 위치 (마지막 위치 포함)"""
+    if max_points >= length:
+        return np.arange(length)
+    return np.unique(np.linspace(length - 1, 0, max_points, endpoint=False).astype('int64'))
+
+
+def merge_positions(positions: np.ndarray, keep: Optional[Iterable[int]] = None) -> np.ndarray:
+    """선택 위치에 반드시 남길 위치를 합쳐 정렬"""
+    if keep is None:
+        return positions
+    keep = np.asarray(list(keep), dtype='int64')
+    if not len(keep):
+        return positions
+    return np.union1d(positions, keep)
+
+
+def aggregate_ohlc(data: pd.DataFrame, ends: np.ndarray) -> pd.DataFrame:
+    """
+    구간별 OHLC 집계
+
+    구간 k는 ends[k-1] + 1부터 ends[k]까지(첫 구간은 0부터)이며, 결과 인덱스는 각 구간의 끝 날짜입니다.
+    마지막 구간 이후의 행은 버립니다.
+    """
+    ends = np.asarray(ends, dtype='int64')
+    starts = np.append(0, ends[:-1] + 1)
+    data = data.iloc[:ends[-1] + 1]
+    result = pd.DataFrame({
+        'Open': data['Open'].to_numpy(dtype='float64')[starts],
+        'High': np.fmax.reduceat(data['High'].to_numpy(dtype='float64'), starts),
+        'Low': np.fmin.reduceat(data['Low'].to_numpy(dtype='float64'), starts),
+        'Close': data['Close'].to_numpy(dtype='float64')[ends],
+    }, index=data.index[ends])
+    if 'Volume' in data.columns:
+        result['Volume'] = np.add.reduceat(data['Volume'].fillna(0).to_numpy(dtype='float64'), starts)
+    return result
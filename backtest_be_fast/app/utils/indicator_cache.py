@@ -0,0 +1,255 @@
+"""
+기술 지표 메모리 캐시
+
+**역할**:
+- 같은 가격 데이터에 대한 같은 지표(이름 + 파라미터)를 한 번만 계산하고 재사용
+- backtesting.py 전략(`self.I`), 벡터화 엔진, 차트 데이터 서비스, 파라미터 최적화 워커가 하나의 캐시를 공유
+- 배열 실제 크기(nbytes) 기준 용량 제한, LRU 축출
+
+**주요 기능**:
+1. sma() / ema() / rsi() / rolling_std() / bollinger() / macd(): app/utils/indicators.py와 같은 시그니처의 캐시 버전
+2. sma_family(): 여러 SMA 기간(예: 2~200일)을 한 번에 계산해 저장 (최적화 워커 초기화용)
+3. get_or_compute(): 임의 지표 계산 결과 캐시
+4. invalidate() / clear() / get_stats(): 티커별 무효화, 전체 비우기, 적중/미스/축출 카운터
+
+**캐시 키**:
+- (데이터 키, 지표 이름, 파라미터 튜플)
+- 데이터 키는 종가 배열 내용 해시(blake2b) + 길이. 같은 티커/데이터 버전/기간이면 같은 키,
+  데이터가 갱신되거나 기간이 다르면 다른 키가 되므로 (티커, 데이터 버전) 대신 사용
+- 호출자가 넘긴 ticker는 invalidate(ticker)용으로만 기록
+
+**SMA 계산 규칙**:
+- 모든 기간을 indicators.sma()와 같은 pandas rolling 평균으로 계산 (전략/벡터화 엔진/차트와 비트 단위로 같은 값)
+- 누적합 차분은 부동소수점 오차가 달라 두 SMA가 같은 날(교차 경계)의 부호가 바뀔 수 있으므로 사용하지 않음
+
+**반환 배열**:
+- 캐시에 저장된 배열은 읽기 전용 (공유 배열이 호출자에 의해 수정되지 않도록)
+- 프로세스별 캐시 (최적화 워커는 워커 안에서 조합 간 공유)
+
+**연관 컴포넌트**:
+- Backend: app/strategies/*.py (init의 지표 계산)
+- Backend: app/services/vectorized_engine.py (신호 계산)
+- Backend: app/services/chart_data_service.py (차트 지표 라인)
+- Backend: app/services/optimization_service.py (워커 초기화 시 SMA 기간 일괄 계산)
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.utils import indicators
+
+
+# 최적화 워커가 미리 계산하는 SMA 기간 범위
+SMA_FAMILY_WINDOWS = range(2, 201)
+
+CachedValue = Union[np.ndarray, Tuple[np.ndarray, ...]]
+
+
+def _as_float_array(close) -> np.ndarray:
+    return np.ascontiguousarray(close, dtype='float64')
+
+
+def _readonly(value: CachedValue) -> CachedValue:
+    arrays = value if isinstance(value, tuple) else (value,)
+    for array in arrays:
+        array.flags.writeable = False
+    return value
+
+
+def _nbytes(value: CachedValue) -> int:
+    if isinstance(value, tuple):
+        return sum(array.nbytes for array in value)
+    return value.nbytes
+
+
+class IndicatorCache:
+    """가격 데이터별 기술 지표 캐시"""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        # (데이터 키, 지표 이름, 파라미터) -> 배열 (앞쪽이 가장 오래 사용되지 않은 항목)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], CachedValue]" = OrderedDict()
+        # 데이터 키 -> 티커 (invalidate용)
+        self._tickers: Dict[Hashable, str] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def data_key(close) -> Tuple[int, str]:
+        """종가 배열 내용 기반 데이터 키 (길이, blake2b 해시)"""
+        values = _as_float_array(close)
+        return len(values), hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+    def get_or_compute(
+        self,
+        name: str,
+        params: Tuple[Any, ...],
+        close,
+        compute: Callable[[np.ndarray], CachedValue],
+        ticker: Optional[str] = None,
+        data_key: Optional[Hashable] = None,
+    ) -> CachedValue:
+        """
+        캐시된 지표 반환, 없으면 compute(종가 배열)로 계산 후 저장
+
+        Args:
+            name: 지표 이름
+            params: 지표 파라미터 (해시 가능한 튜플)
+            close: 종가 배열
+            compute: float64 종가 배열을 받아 배열(또는 배열 튜플)을 반환하는 함수
+            ticker: 무효화용 티커 (선택)
+            data_key: 미리 계산한 데이터 키 (생략 시 종가 배열 해시)
+        """
+        values = _as_float_array(close)
+        data_key = data_key if data_key is not None else self.data_key(values)
+        key = (data_key, name, params)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = _readonly(compute(values))
+        self._store(key, result, ticker)
+        return result
+
+    def sma(self, close, window: int, ticker: Optional[str] = None) -> np.ndarray:
+        """단순 이동평균"""
+        return self.sma_family(close, (window,), ticker)[int(window)]
+
+    def sma_family(self, close, windows: Iterable[int], ticker: Optional[str] = None) -> Dict[int, np.ndarray]:
+        """여러 기간의 단순 이동평균을 한 번에 계산 (기간 → 배열, 데이터 해시와 Series는 1회만 생성)"""
+        values = _as_float_array(close)
+        data_key = self.data_key(values)
+        series = pd.Series(values)
+        return {
+            int(window): self.get_or_compute(
+                'sma', (int(window),), values,
+                lambda v, w=int(window): series.rolling(window=w).mean().to_numpy(),
+                ticker, data_key,
+            )
+            for window in windows
+        }
+
+    def rolling_std(self, close, window: int, ticker: Optional[str] = None) -> np.ndarray:
+        """이동 표준편차 (표본, ddof=1)"""
+        return self.get_or_compute(
+            'rolling_std', (int(window),), close,
+            lambda v: pd.Series(v).rolling(window=window).std().to_numpy(),
+            ticker,
+        )
+
+    def ema(self, close, span: int, adjust: bool = False, ticker: Optional[str] = None) -> np.ndarray:
+        """지수 이동평균"""
+        return self.get_or_compute(
+            'ema', (int(span), bool(adjust)), close, lambda v: indicators.ema(v, span, adjust), ticker
+        )
+
+    def rsi(self, close, period: int, fill_value: Optional[float] = None, ticker: Optional[str] = None) -> np.ndarray:
+        """RSI (fill_value 지정 시 NaN을 해당 값으로 채운 새 배열 반환)"""
+        values = self.get_or_compute('rsi', (int(period),), close, lambda v: indicators.rsi(v, period), ticker)
+        if fill_value is None:
+            return values
+        return np.where(np.isnan(values), fill_value, values)
+
+    def bollinger(
+        self, close, period: int, std_dev: float, ticker: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """볼린저 밴드 (중심선, 상단, 하단) - 중심선/표준편차는 캐시, 밴드는 매번 계산"""
+        middle = self.sma(close, period, ticker)
+        band = std_dev * self.rolling_std(close, period, ticker)
+        return middle, middle + band, middle - band
+
+    def macd(
+        self, close, fast: int, slow: int, signal: int, ticker: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """MACD 라인과 시그널 라인"""
+        return self.macd_line(close, fast, slow, ticker), self.macd_signal(close, fast, slow, signal, ticker)
+
+    def macd_line(self, close, fast: int, slow: int, ticker: Optional[str] = None) -> np.ndarray:
+        """MACD 라인 (빠른 EMA - 느린 EMA, adjust=True)"""
+        return self.get_or_compute(
+            'macd_line', (int(fast), int(slow)), close,
+            lambda v: self.ema(v, fast, adjust=True, ticker=ticker) - self.ema(v, slow, adjust=True, ticker=ticker),
+            ticker,
+        )
+
+    def macd_signal(self, close, fast: int, slow: int, signal: int, ticker: Optional[str] = None) -> np.ndarray:
+        """MACD 시그널 라인 (MACD 라인의 EMA, adjust=True)"""
+        return self.get_or_compute(
+            'macd_signal', (int(fast), int(slow), int(signal)), close,
+            lambda v: indicators.ema(self.macd_line(v, fast, slow, ticker), signal, adjust=True),
+            ticker,
+        )
+
+    def invalidate(self, ticker: str) -> int:
+        """티커로 기록된 모든 지표 제거, 제거된 항목 수 반환"""
+        with self._lock:
+            data_keys = {key for key, owner in self._tickers.items() if owner == ticker}
+            victims = [key for key in self._entries if key[0] in data_keys]
+            for key in victims:
+                self._total_bytes -= _nbytes(self._entries.pop(key))
+            for data_key in data_keys:
+                del self._tickers[data_key]
+            return len(victims)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tickers.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """지표 캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'total_entries': len(self._entries),
+                'total_datasets': len({key[0] for key in self._entries}),
+                'memory_usage_mb': self._total_bytes / (1024 * 1024),
+                'max_memory_mb': self.max_bytes / (1024 * 1024) if self.max_bytes is not None else None,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def _store(self, key: Tuple[Hashable, ...], value: CachedValue, ticker: Optional[str]) -> None:
+        size = _nbytes(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 용량 한도보다 큰 지표는 저장하지 않음
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= _nbytes(previous)
+            self._entries[key] = value
+            self._total_bytes += size
+            if ticker:
+                self._tickers[key[0]] = ticker
+            self._evict_to_fit()
+
+    def _evict_to_fit(self) -> None:
+        """용량 한도를 넘으면 LRU 항목부터 축출"""
+        if self.max_bytes is None:
+            return
+        while self._total_bytes > self.max_bytes and self._entries:
+            _, value = self._entries.popitem(last=False)
+            self._total_bytes -= _nbytes(value)
+            self.evictions += 1
+
+
+# 전역 인스턴스
+indicator_cache = IndicatorCache(max_bytes=settings.indicator_cache_max_mb * 1024 * 1024)
@@ -0,0 +1,163 @@
+"""
+기술 지표 계산 유틸리티
+
+**역할**:
+- SMA, EMA, RSI, Bollinger Bands, MACD를 pandas/NumPy 벡터 연산으로 한 번에 계산
+- 전략별 차트 지표 라인(이름, 색상, 값 배열)을 한 곳에서 정의
+
+**주요 기능**:
+1. sma() / ema() / rsi() / bollinger() / macd(): 종가 배열 → 지표 배열 (워밍업 구간은 NaN)
+2. strategy_indicator_lines(): 전략 이름과 파라미터로 차트에 그릴 IndicatorLine 리스트 생성
+   (calc에 app/utils/indicator_cache.py의 캐시를 넘기면 같은 메서드 이름으로 캐시된 배열 사용)
+
+**IndicatorLine 형식**:
+- values: 가격 데이터와 같은 길이의 float64 배열 (값이 없는 날은 NaN)
+- value: 상수 기준선(RSI 과매수/과매도 등)의 값. 이 경우 values는 None
+
+**의존성**:
+- pandas, numpy
+
+**연관 컴포넌트**:
+- Backend: app/services/chart_data_service.py (행/컬럼 형식 지표 데이터)
+"""
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class IndicatorLine(NamedTuple):
+    """차트 지표 라인 (values 또는 상수 value 중 하나)"""
+    name: str
+    color: str
+    values: Optional[np.ndarray] = None
+    value: Optional[float] = None
+
+
+def _series(close) -> pd.Series:
+    return pd.Series(np.asarray(close, dtype='float64'))
+
+
+def sma(close, window: int) -> np.ndarray:
+    """단순 이동평균"""
+    return _series(close).rolling(window=window).mean().to_numpy()
+
+
+def ema(close, span: int, adjust: bool = False) -> np.ndarray:
+    """지수 이동평균"""
+    return _series(close).ewm(span=span, adjust=adjust).mean().to_numpy()
+
+
+def rsi(close, period: int) -> np.ndarray:
+    """RSI (Wilder 평활, 하락폭 0은 machine epsilon으로 대체)"""
+    delta = _series(close).diff()
+    avg_gain = delta.where(delta > 0, 0.0).ewm(alpha=1 / period, adjust=False).mean()
+    avg_loss = (-delta.where(delta < 0, 0.0)).ewm(alpha=1 / period, adjust=False).mean()
+    avg_loss = avg_loss.replace(0, np.finfo(float).eps)
+    return (100 - (100 / (1 + avg_gain / avg_loss))).to_numpy()
+
+
+def bollinger(close, period: int, std_dev: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """볼린저 밴드 (중심선, 상단, 하단)"""
+    rolling = _series(close).rolling(window=period)
+    middle = rolling.mean().to_numpy()
+    band = std_dev * rolling.std().to_numpy()
+    return middle, middle + band, middle - band
+
+
+def macd(close, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray]:
+    """MACD 라인과 시그널 라인"""
+    series = _series(close)
+    line = series.ewm(span=fast).mean() - series.ewm(span=slow).mean()
+    return line.to_numpy(), line.ewm(span=signal).mean().to_numpy()
+
+
+def _sma_lines(close, params: Dict[str, Any], calc) -> List[IndicatorLine]:
+    short_window = params.get('short_window', 10)
+    long_window = params.get('long_window', 20)
+    return [
+        IndicatorLine(f"SMA_{short_window}", "#8884d8", calc.sma(close, short_window)),
+        IndicatorLine(f"SMA_{long_window}", "#82ca9d", calc.sma(close, long_window)),
+    ]
+
+
+def _rsi_lines(close, params: Dict[str, Any], calc) -> List[IndicatorLine]:
+    period = int(params.get('rsi_period', 14))
+    return [
+        IndicatorLine(f"RSI_{period}", "#EC4899", calc.rsi(close, period)),  # pink-500
+        IndicatorLine("RSI_OVERBOUGHT", "#EF4444", value=float(params.get('rsi_overbought', 70))),  # red-500
+        IndicatorLine("RSI_OVERSOLD", "#10B981", value=float(params.get('rsi_oversold', 30))),  # green-500
+    ]
+
+
+def _bollinger_lines(close, params: Dict[str, Any], calc) -> List[IndicatorLine]:
+    period = int(params.get('period', 20))
+    middle, upper, lower = calc.bollinger(close, period, float(params.get('std_dev', 2.0)))
+    return [
+        IndicatorLine(f"SMA_{period}", "#8884d8", middle),
+        IndicatorLine("BB_UPPER", "#6B7280", upper),  # gray-500
+        IndicatorLine("BB_LOWER", "#6B7280", lower),
+    ]
+
+
+def _macd_lines(close, params: Dict[str, Any], calc) -> List[IndicatorLine]:
+    line, signal = calc.macd(
+        close,
+        int(params.get('fast_period', 12)),
+        int(params.get('slow_period', 26)),
+        int(params.get('signal_period', 9)),
+    )
+    return [
+        IndicatorLine("MACD", "#8B5CF6", line),  # violet-500
+        IndicatorLine("MACD_SIGNAL", "#F59E0B", signal),  # amber-500
+    ]
+
+
+def _ema_lines(close, params: Dict[str, Any], calc) -> List[IndicatorLine]:
+    fast = int(params.get('fast_window', 12))
+    slow = int(params.get('slow_window', 26))
+    return [
+        IndicatorLine(f"EMA_{fast}", "#8B5CF6", calc.ema(close, fast)),
+        IndicatorLine(f"EMA_{slow}", "#F59E0B", calc.ema(close, slow)),
+    ]
+
+
+# 캐시 없이 바로 계산하는 기본 calc
+_DIRECT = SimpleNamespace(sma=sma, ema=ema, rsi=rsi, bollinger=bollinger, macd=macd)
+
+STRATEGY_INDICATORS: Dict[str, Callable[[Any, Dict[str, Any], Any], List[IndicatorLine]]] = {
+    "sma_crossover": _sma_lines,
+    "rsi_strategy": _rsi_lines,
+    "bollinger_bands": _bollinger_lines,
+    "macd_strategy": _macd_lines,
+    "ema_crossover": _ema_lines,
+}
+
+
+def strategy_indicator_lines(
+    close, strategy: str, params: Optional[Dict[str, Any]] = None, calc=None
+) -> List[IndicatorLine]:
+    """
+    전략별 차트 지표 라인 계산
+
+    Args:
+        close: 종가 배열
+        strategy: 전략 이름 (지표가 없는 전략은 빈 리스트)
+        params: 전략 파라미터
+        calc: sma/ema/rsi/bollinger/macd 메서드를 가진 계산기 (기본값: 이 모듈의 함수)
+
+    Returns:
+        값이 하나도 없는 라인을 제외한 IndicatorLine 리스트
+        (상수 기준선은 주 지표 라인이 있을 때만 포함)
+    """
+    builder = STRATEGY_INDICATORS.get(strategy)
+    if builder is None:
+        return []
+    lines = [
+        line for line in builder(close, params or {}, calc or _DIRECT)
+        if line.values is None or not np.isnan(line.values).all()
+    ]
+    if all(line.values is None for line in lines):
+        return []
+    return lines
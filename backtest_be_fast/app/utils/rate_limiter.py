@@ -0,0 +1,69 @@
+"""
+비동기 호출 빈도 제한 유틸리티
+
+**역할**:
+- 외부 API 호출 빈도를 프로세스 전체에서 하나의 한도로 제한
+- 한도를 넘는 호출은 실패시키지 않고 다음 호출 가능 시점까지 대기
+
+**주요 기능**:
+1. AsyncRateLimiter.acquire(): 호출 슬롯 확보 (슬라이딩 윈도우)
+2. get_stats(): 허용된 호출 수, 대기한 호출 수
+
+**동작 규칙**:
+- 최근 period초 동안 허용된 호출이 max_calls개 이상이면 가장 오래된 호출이
+  윈도우를 벗어날 때까지 대기
+- 여러 요청이 동시에 대기해도 Lock으로 순서대로 슬롯을 배정
+
+**연관 컴포넌트**:
+- Backend: app/services/news_service.py (네이버 검색 API 분당 호출 한도)
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class AsyncRateLimiter:
+    """슬라이딩 윈도우 방식 비동기 호출 빈도 제한기"""
+
+    def __init__(self, max_calls: int, period: float):
+        if max_calls <= 0 or period <= 0:
+            raise ValueError("max_calls와 period는 0보다 커야 합니다.")
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.acquired = 0
+        self.throttled = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        """호출 슬롯을 확보할 때까지 대기"""
+        async with self._get_lock():
+            waited = False
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    self.acquired += 1
+                    return
+                if not waited:
+                    self.throttled += 1
+                    waited = True
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'acquired': self.acquired,
+            'throttled': self.throttled,
+            'in_window': len(self._calls),
+        }
@@ -8,6 +8,8 @@ JSON 직렬화 유틸리티
 
 **주요 기능**:
 - recursive_serialize(): 모든 타입의 객체를 JSON 호환 형식으로 변환
+- to_nullable_list(): 숫자 배열을 NaN/Infinity → None 리스트로 일괄 변환 (컬럼 형식 응답)
+- format_dates(): DatetimeIndex를 YYYY-MM-DD 문자열 리스트로 일괄 변환
 
 **처리 타입**:
 - float: NaN → "NaN", Infinity → "Infinity"
@@ -24,6 +26,7 @@ JSON 직렬화 유틸리티
 
 **연관 컴포넌트**:
 - Backend: app/services/backtest_service.py (결과 직렬화)
+- Backend: app/services/chart_data_service.py (컬럼 형식 차트 데이터)
 - Backend: app/api/v1/endpoints/backtest.py (응답 변환)
 """
 
@@ -61,4 +64,20 @@ def recursive_serialize(obj):
     if hasattr(obj, "isoformat"):
         return obj.isoformat()
     # 위에 해당하지 않는 경우, str()로 변환
-    return str(obj) 
\ No newline at end of file
+    return str(obj)
+
+
+def to_nullable_list(values) -> list:
+    """숫자 배열을 JSON 호환 리스트로 변환 (NaN/Infinity는 None)"""
+    arr = np.asarray(values, dtype='float64')
+    mask = ~np.isfinite(arr)
+    if not mask.any():
+        return arr.tolist()
+    out = arr.astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def format_dates(index) -> list:
+    """DatetimeIndex를 'YYYY-MM-DD' 문자열 리스트로 변환"""
+    return pd.DatetimeIndex(index).strftime('%Y-%m-%d').tolist()
@@ -0,0 +1,127 @@
+"""
+단일 비행(single-flight) 요청 병합 유틸리티
+
+**역할**:
+- 같은 키(예: 티커 + 조회 구간)로 동시에 들어온 요청을 하나의 실제 실행으로 병합
+- 먼저 들어온 호출(리더)만 실제 함수를 실행하고, 나머지 호출은 그 결과(또는 예외)를 공유
+- 동일 티커 동시 백테스트 시 MySQL 조회/yfinance 다운로드/upsert 중복 실행 방지
+
+**주요 기능**:
+1. SingleFlight.do(): 동기 함수 병합 (스레드 풀 등 여러 스레드에서 호출)
+2. AsyncSingleFlight.do(): 코루틴 함수 병합 (이벤트 루프 내 여러 요청에서 호출)
+3. get_stats(): 실제 실행 수, 병합된 호출 수, 진행 중 키 수
+
+**동작 규칙**:
+- 결과는 캐시하지 않음: 실행이 끝나면 키가 제거되고 다음 호출은 새로 실행
+- 리더 실행이 실패하면 대기 중인 호출 모두 같은 예외를 받음
+- AsyncSingleFlight는 실제 실행을 별도 Task로 돌리므로, 한 호출자가 취소되어도
+  다른 대기자의 실행은 계속됨
+
+**연관 컴포넌트**:
+- Backend: app/repositories/data_repository.py (get_stock_data 병합)
+- Backend: app/services/yfinance_db.py (load_ticker_data 병합)
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """진행 중인 동기 호출"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """스레드 간 동기 함수 호출 병합"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """키에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 직접 실행"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+            }
+
+
+class AsyncSingleFlight:
+    """이벤트 루프 내 코루틴 호출 병합"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """키에 대해 진행 중인 Task가 있으면 그 결과를 기다리고, 없으면 새 Task 실행"""
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(func(*args, **kwargs))
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        # 호출자 취소가 공유 Task를 취소하지 않도록 shield
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._calls),
+        }
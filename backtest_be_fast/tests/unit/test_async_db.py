@@ -0,0 +1,146 @@
+"""
+비동기 DB 접근 계층 테스트 (SQLAlchemy asyncio, aiosqlite로 대체)
+
+**테스트 범위**:
+- load_ticker_data_async: 적재 구간이 요청을 덮으면 비동기 엔진으로 직접 범위 스캔
+- 누락 구간이 있으면 동기 load_ticker_data(yfinance 보완 포함)에 위임
+- 비동기 엔진 비활성화 시 동기 버전을 I/O 스레드 풀에서 실행
+- NewsRepository *_async 메서드가 비동기 엔진 연결에서 동기 버전과 같은 쿼리 실행
+- 최신 뉴스 캐시(kind='latest')와 이벤트 날짜 뉴스(kind='event') 분리
+"""
+from datetime import date
+
+import pandas as pd
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.repositories.news_repository import NewsRepository
+from app.services import yfinance_db
+
+
+_TABLES = (
+    'CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT, data_last_update TIMESTAMP)',
+    'CREATE TABLE price_coverage (stock_id INTEGER, start_date DATE, end_date DATE)',
+    'CREATE TABLE daily_prices (stock_id INTEGER, date DATE, open REAL, high REAL, low REAL, '
+    'close REAL, adj_close REAL, volume INTEGER)',
+    'CREATE TABLE stock_news (id INTEGER PRIMARY KEY AUTOINCREMENT, ticker TEXT, news_date DATE, title TEXT, '
+    'link TEXT, description TEXT, source TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)',
+)
+
+
+@pytest_asyncio.fixture
+async def async_db(monkeypatch):
+    """AAPL 2024-01-02 ~ 2024-01-31 가격과 적재 구간이 있는 비동기 SQLite DB (비동기 엔진 활성화)"""
+    engine = create_async_engine(
+        'sqlite+aiosqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool
+    )
+    index = pd.bdate_range('2024-01-02', '2024-01-31')
+    async with engine.begin() as conn:
+        for ddl in _TABLES:
+            await conn.execute(text(ddl))
+        await conn.execute(text("INSERT INTO stocks (id, ticker) VALUES (1, 'AAPL')"))
+        await conn.execute(text("INSERT INTO price_coverage VALUES (1, '2024-01-01', '2024-01-31')"))
+        await conn.execute(
+            text('INSERT INTO daily_prices VALUES (1, :d, :p, :p, :p, :p, :p, 100)'),
+            [{'d': str(day.date()), 'p': 100.0 + i} for i, day in enumerate(index)],
+        )
+
+    monkeypatch.setattr(settings, 'database_async_enabled', True)
+    monkeypatch.setattr(yfinance_db, '_get_async_engine', lambda: engine)
+    monkeypatch.setattr(yfinance_db, '_COVERAGE_TABLE_READY', True)
+    yfinance_db.invalidate_coverage_cache()
+    yield engine
+    yfinance_db.invalidate_coverage_cache()
+    await engine.dispose()
+
+
+class TestLoadTickerDataAsync:
+    """가격 데이터 비동기 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_covered_range_is_read_with_async_engine(self, async_db, monkeypatch):
+        """적재 구간에 포함된 요청은 동기 경로 없이 비동기 엔진에서 DataFrame으로 반환해야 한다"""
+        # Given: 동기 경로가 호출되면 실패
+        def sync_load(*args, **kwargs):
+            raise AssertionError('동기 load_ticker_data가 호출됨')
+        monkeypatch.setattr(yfinance_db, 'load_ticker_data', sync_load)
+
+        # When
+        frame = await yfinance_db.load_ticker_data_async('AAPL', '2024-01-08', '2024-01-12')
+
+        # Then
+        assert list(frame.index) == list(pd.bdate_range('2024-01-08', '2024-01-12'))
+        assert frame['Close'].tolist() == [104.0, 105.0, 106.0, 107.0, 108.0]
+        assert frame['Volume'].dtype == 'int64'
+
+    @pytest.mark.asyncio
+    async def test_missing_range_is_delegated_to_sync_loader(self, async_db, monkeypatch):
+        """적재 구간을 벗어난 요청은 yfinance 보완을 포함한 동기 load_ticker_data로 처리해야 한다"""
+        calls = []
+
+        def sync_load(ticker, start_date, end_date):
+            calls.append((ticker, start_date, end_date))
+            return 'synced'
+        monkeypatch.setattr(yfinance_db, 'load_ticker_data', sync_load)
+
+        result = await yfinance_db.load_ticker_data_async('AAPL', '2024-01-15', '2024-02-15')
+
+        assert result == 'synced'
+        assert calls == [('AAPL', date(2024, 1, 15), date(2024, 2, 15))]
+
+    @pytest.mark.asyncio
+    async def test_disabled_async_engine_runs_sync_loader(self, monkeypatch):
+        """비동기 엔진을 쓰지 않으면 동기 버전을 그대로 실행해야 한다"""
+        monkeypatch.setattr(settings, 'database_async_enabled', False)
+        monkeypatch.setattr(yfinance_db, 'load_ticker_data', lambda ticker, start, end: (ticker, start, end))
+
+        assert await yfinance_db.load_ticker_data_async('MSFT', '2024-01-01', '2024-01-31') == (
+            'MSFT', '2024-01-01', '2024-01-31'
+        )
+
+
+class TestNewsRepositoryAsync:
+    """뉴스 Repository 비동기 메서드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_save_and_query_with_async_engine(self, async_db):
+        """비동기 메서드로 저장한 뉴스를 비동기 메서드로 조회할 수 있어야 한다"""
+        # Given
+        repository = NewsRepository()
+        repository.async_engine = async_db
+        news = [{'title': '실적 발표', 'link': 'https://news/1', 'description': '요약'}]
+
+        # When
+        saved = await repository.save_news_async('AAPL', date(2024, 3, 5), news)
+
+        # Then
+        assert saved == 1
+        assert await repository.check_news_exists_async('AAPL', date(2024, 3, 5))
+        assert not await repository.check_news_exists_async('AAPL', date(2024, 3, 6))
+        rows = await repository.get_news_by_ticker_date_async('AAPL', date(2024, 3, 1), date(2024, 3, 31))
+        assert [row['title'] for row in rows] == ['실적 발표']
+
+    @pytest.mark.asyncio
+    async def test_latest_and_event_news_are_kept_apart(self, async_db):
+        """최신 뉴스 캐시 행과 이벤트 날짜 뉴스 행은 서로의 존재 확인/교체에 영향을 주지 않아야 한다"""
+        # Given: 이벤트 날짜(2024-03-05)에 발행된 최신 뉴스가 캐시됨 (kind 컬럼 없는 기존 테이블)
+        repository = NewsRepository()
+        repository.async_engine = async_db
+        latest = [{'title': '최신', 'link': 'https://news/1', 'description': '', 'pubDate': 'Tue, 05 Mar 2024 09:00:00 +0900'}]
+        await repository.save_latest_news_async('AAPL', latest)
+
+        # When / Then: 최신 뉴스는 이벤트 뉴스 보완 여부 판단에 쓰이지 않음
+        assert not await repository.check_news_exists_async('AAPL', date(2024, 3, 5))
+
+        # When: 같은 날짜의 이벤트 뉴스 저장 후 같은 링크의 최신 뉴스 재저장
+        await repository.save_news_async('AAPL', date(2024, 3, 5), [{'title': '이벤트', 'link': 'https://news/1'}])
+        await repository.save_latest_news_async('AAPL', latest)
+
+        # Then: 두 종류가 모두 남아 있음
+        rows = await repository.get_news_by_ticker_date_async('AAPL', date(2024, 3, 5))
+        assert sorted((row['kind'], row['title']) for row in rows) == [('event', '이벤트'), ('latest', '최신')]
+        assert await repository.check_news_exists_async('AAPL', date(2024, 3, 5))
@@ -0,0 +1,113 @@
+"""
+요청 단위 가격 데이터 컨텍스트(BacktestDataContext) 테스트
+
+**테스트 범위**:
+- 종목/벤치마크 프레임 동시 로드, 중복 티커 1회 조회, 벤치마크 실패 처리
+- 백테스트 엔진과 차트 서비스가 컨텍스트 프레임을 재조회 없이 사용하는지
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pandas as pd
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.schemas.requests import BacktestRequest
+from app.services.backtest_data_context import BacktestDataContext
+from app.services.backtest_engine import BacktestEngine
+from app.services.chart_data_service import ChartDataService
+
+
+def _frame(closes) -> pd.DataFrame:
+    index = pd.date_range('2024-01-01', periods=len(closes), freq='D')
+    return pd.DataFrame({
+        'Open': closes, 'High': closes, 'Low': closes, 'Close': closes, 'Volume': [1000] * len(closes)
+    }, index=index)
+
+
+class _FakeRepository:
+    def __init__(self, frames, delay: float = 0.05):
+        self.frames = frames
+        self.delay = delay
+        self.calls = []
+
+    async def get_stock_data(self, ticker, start_date, end_date):
+        self.calls.append(ticker)
+        await asyncio.sleep(self.delay)
+        frame = self.frames[ticker]
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+
+
+def _request(**overrides) -> BacktestRequest:
+    params = dict(ticker='AAPL', start_date='2024-01-01', end_date='2024-01-05', strategy='buy_hold_strategy')
+    params.update(overrides)
+    return BacktestRequest(**params)
+
+
+@pytest.mark.asyncio
+async def test_load_fetches_each_ticker_once_concurrently():
+    """종목과 벤치마크를 동시에 한 번씩 조회하고, 실패한 벤치마크는 None으로 기록해야 한다"""
+    # Given: benchmark_ticker가 ^GSPC와 같고 ^IXIC 조회는 실패
+    repository = _FakeRepository({
+        'AAPL': _frame([100, 101, 102]), '^GSPC': _frame([10, 11, 12]), '^IXIC': RuntimeError('timeout'),
+    })
+
+    # When
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    context = await BacktestDataContext.load(_request(benchmark_ticker='^GSPC'), repository)
+    elapsed = loop.time() - started
+
+    # Then
+    assert sorted(repository.calls) == ['AAPL', '^GSPC', '^IXIC']
+    assert elapsed < 0.15
+    assert list(context.price_data['Close']) == [100, 101, 102]
+    assert context.has('^IXIC') and context.get('^IXIC') is None
+    assert not context.has('MSFT')
+
+
+@pytest.mark.asyncio
+async def test_load_raises_validation_error_when_primary_missing():
+    """대상 종목 데이터가 없으면 ValidationError를 발생시켜야 한다"""
+    repository = _FakeRepository({'AAPL': pd.DataFrame(), '^GSPC': _frame([1]), '^IXIC': _frame([1])}, delay=0)
+
+    with pytest.raises(ValidationError):
+        await BacktestDataContext.load(_request(), repository)
+
+
+@pytest.mark.asyncio
+async def test_engine_and_chart_reuse_context_frames():
+    """엔진 벤치마크와 차트는 컨텍스트 프레임을 재조회 없이 쓰고, 차트 자산 곡선은 엔진 결과를 따라야 한다"""
+    # Given
+    repository = _FakeRepository({
+        'AAPL': _frame([100, 110, 99, 120, 121]), 'SPY': _frame([50, 51, 52, 53, 54]),
+        '^GSPC': _frame([10, 11, 12, 13, 14]), '^IXIC': _frame([20, 21, 22, 23, 24]),
+    }, delay=0)
+    request = _request(benchmark_ticker='SPY')
+    context = await BacktestDataContext.load(request, repository)
+    repository.calls.clear()
+
+    chart_service = ChartDataService()
+    chart_service._get_price_data = AsyncMock()
+    engine_curve = pd.Series([10000.0, 10000.0, 10500.0, 10200.0, 11000.0], index=context.price_data.index)
+    backtest_result = SimpleNamespace(
+        trade_log=[], equity_curve=engine_curve, total_return_pct=10.0, sharpe_ratio=0.0, max_drawdown_pct=-2.9,
+        total_trades=1, win_rate_pct=100.0, profit_factor=1.0, final_equity=11000.0, volatility_pct=0.0,
+        annualized_return_pct=0.0, sortino_ratio=0.0, calmar_ratio=0.0,
+    )
+
+    # When
+    benchmark = await BacktestEngine(data_repository=repository)._get_benchmark_data(request, context)
+    chart = await chart_service.generate_chart_data(request, backtest_result, context=context)
+
+    # Then
+    assert benchmark is context.get('SPY')
+    assert repository.calls == []
+    chart_service._get_price_data.assert_not_called()
+    assert [point.equity for point in chart.equity_data] == list(engine_curve)
+    assert chart.equity_data[3].drawdown_pct == pytest.approx(-3.0)
+    assert chart.summary_stats['benchmark_total_return_pct'] == pytest.approx(8.0)
+    assert [point.close for point in chart.nasdaq_benchmark] == [20, 21, 22, 23, 24]
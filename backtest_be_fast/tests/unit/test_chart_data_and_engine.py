@@ -1,5 +1,4 @@
 import pandas as pd
-from types import SimpleNamespace
 
 from faker import Faker
 import pytest
@@ -67,7 +66,7 @@ def test_rsi_indicator_generation_returns_lines():
     assert 'RSI_OVERSOLD' in names
 
 
-def test_convert_result_to_response_includes_alpha_beta_and_trade_log(monkeypatch):
+def test_convert_result_to_response_includes_alpha_beta_and_trade_log():
     engine = BacktestEngine()
 
     stats = pd.Series(
@@ -116,12 +115,6 @@ def test_convert_result_to_response_includes_alpha_beta_and_trade_log(monkeypatc
         index=pd.date_range('2024-01-01', periods=4, freq='D'),
     )
 
-    monkeypatch.setattr(
-        engine,
-        'data_fetcher',
-        SimpleNamespace(get_stock_data=lambda ticker, start_date, end_date: benchmark_prices),
-    )
-
     request = BacktestRequest(
         ticker='AAPL',
         start_date='2024-01-01',
@@ -134,7 +127,7 @@ def test_convert_result_to_response_includes_alpha_beta_and_trade_log(monkeypatc
         benchmark_ticker='SPY',
     )
 
-    result = engine._convert_result_to_response(stats, request)
+    result = engine._convert_result_to_response(stats, request, benchmark_prices)
 
     assert result.alpha_pct is not None
     assert result.beta is not None
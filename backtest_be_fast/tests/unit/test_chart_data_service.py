@@ -6,6 +6,7 @@
 - _generate_ohlc_data(): OHLC 데이터 생성
 - _generate_equity_data(): 자산 곡선 데이터 생성
 - _generate_indicators(): 기술 지표 데이터 생성
+- _generate_columnar_data(): 컬럼 배열 형식 차트 데이터 생성 (chart_format=columnar)
 
 **테스트 전략**:
 - 단위 테스트: 각 메서드 개별 검증
@@ -20,10 +21,13 @@
 import pytest
 import pandas as pd
 import numpy as np
+import time
 from datetime import datetime, date
 from typing import List, Dict, Any
+from unittest.mock import AsyncMock
 
 from app.services.chart_data_service import ChartDataService
+from app.schemas.requests import BacktestRequest
 from app.schemas.responses import TradeMarker
 
 
@@ -359,7 +363,7 @@ class TestIndicatorGeneration:
         """
         Given: RSI 전략 파라미터
         When: _generate_rsi_indicators() 호출
-        Then: RSI, 과매수, 과매도 라인 생성
+        Then: RSI 라인과 상수 과매수/과매도 기준선 생성
         """
         # Given
         params = {'rsi_period': 14, 'rsi_overbought': 70, 'rsi_oversold': 30}
@@ -375,8 +379,172 @@ class TestIndicatorGeneration:
         oversold = next(ind for ind in indicators if ind.name == "RSI_OVERSOLD")
 
         assert rsi_line.type == "line"
-        assert overbought.data[0]['value'] == 70, "과매수 기준선"
-        assert oversold.data[0]['value'] == 30, "과매도 기준선"
+        assert overbought.value == 70 and overbought.data == [], "과매수 기준선은 상수 값 하나"
+        assert oversold.value == 30 and oversold.data == [], "과매도 기준선은 상수 값 하나"
+
+
+class TestColumnarChartData:
+    """컬럼 배열 형식 차트 데이터 테스트"""
+
+    def test_columns_match_row_format(self, chart_service, sample_price_data):
+        """
+        Given: 같은 가격 데이터
+        When: 행 형식과 컬럼 형식으로 각각 생성
+        Then: 날짜별 OHLC/자산 곡선 값이 같아야 함
+        """
+        # When
+        ohlc = chart_service._generate_ohlc_data(sample_price_data)
+        equity = chart_service._generate_equity_data(sample_price_data, 10000.0)
+        columns = chart_service._generate_columnar_data(sample_price_data, 10000.0, [])
+
+        # Then
+        assert columns.dates == [p.date for p in ohlc]
+        assert columns.close == [p.close for p in ohlc]
+        assert columns.volume == [p.volume for p in ohlc]
+        assert columns.equity == pytest.approx([p.equity for p in equity])
+        assert columns.drawdown_pct == pytest.approx([p.drawdown_pct for p in equity])
+
+    def test_indicators_are_aligned_with_dates_and_nan_is_null(self, chart_service, sample_price_data):
+        """
+        Given: SMA(3/5) 파라미터와 종가 하나가 NaN인 데이터
+        When: 컬럼 형식 지표 생성
+        Then: 지표 값은 dates와 길이가 같고 계산 구간 이전 값과 NaN은 None
+        """
+        # Given
+        data = sample_price_data.copy()
+        data.iloc[2, data.columns.get_loc('Open')] = np.nan
+        series = chart_service._indicator_lines(data, "sma_crossover", {'short_window': 3, 'long_window': 5})
+
+        # When
+        columns = chart_service._generate_columnar_data(data, 10000.0, series)
+
+        # Then
+        assert columns.open[2] is None
+        sma_short = columns.indicators[0]
+        assert sma_short.name == "SMA_3"
+        assert len(sma_short.values) == len(columns.dates)
+        assert sma_short.values[:2] == [None, None]
+        assert sma_short.values[2] == pytest.approx(103.0)
+
+        rows = chart_service._generate_sma_indicators(data, {'short_window': 3, 'long_window': 5})
+        assert [v for v in sma_short.values if v is not None] == pytest.approx([d["value"] for d in rows[0].data])
+
+    @pytest.mark.asyncio
+    async def test_generate_chart_data_columnar_mode(self, chart_service, sample_price_data):
+        """
+        Given: chart_format=columnar 요청, 벤치마크 조회 실패
+        When: generate_chart_data() 호출
+        Then: 행 리스트는 비어 있고 columns만 채워지며, 실패한 벤치마크는 빈 배열
+        """
+        # Given
+        async def fake_price_data(ticker, start_date, end_date):
+            if ticker == "^IXIC":
+                raise ValueError("no data")
+            return sample_price_data
+
+        chart_service._get_price_data = AsyncMock(side_effect=fake_price_data)
+        request = BacktestRequest(
+            ticker="AAPL", start_date="2023-01-01", end_date="2023-01-10",
+            strategy="buy_hold_strategy", chart_format="columnar",
+        )
+
+        # When
+        response = await chart_service.generate_chart_data(request)
+
+        # Then
+        assert response.ohlc_data == [] and response.equity_data == [] and response.sp500_benchmark == []
+        assert len(response.columns.dates) == len(sample_price_data)
+        assert response.columns.sp500_benchmark.close == sample_price_data['Close'].astype(float).tolist()
+        assert response.columns.nasdaq_benchmark.dates == []
+        assert len(response.trade_markers) == 1
+
+    def test_columnar_is_faster_than_row_objects(self, chart_service):
+        """
+        Given: 10년치(2520 거래일) 가격 데이터
+        When: 행 형식과 컬럼 형식 생성 시간 비교
+        Then: 컬럼 형식이 훨씬 빨라야 함
+        """
+        # Given
+        index = pd.bdate_range('2014-01-01', periods=2520)
+        close = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, len(index))))
+        data = pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close, 'Volume': 1_000_000
+        }, index=index)
+
+        # When
+        started = time.perf_counter()
+        chart_service._generate_ohlc_data(data)
+        chart_service._generate_equity_data(data, 10000.0)
+        rows_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        chart_service._generate_columnar_data(data, 10000.0, [])
+        columnar_elapsed = time.perf_counter() - started
+
+        # Then
+        assert columnar_elapsed * 5 < rows_elapsed
+
+
+class TestChartDownsampling:
+    """max_points 다운샘플링 테스트"""
+
+    @pytest.fixture
+    def long_price_data(self):
+        index = pd.bdate_range('2014-01-01', periods=2520)
+        close = 100 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.01, len(index))))
+        return pd.DataFrame({
+            'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close, 'Volume': 1_000_000
+        }, index=index)
+
+    @pytest.fixture
+    def trade_log(self, long_price_data):
+        return [{
+            'EntryTime': long_price_data.index[1001].isoformat(), 'ExitTime': long_price_data.index[1777].isoformat(),
+            'EntryPrice': 100.0, 'ExitPrice': 110.0, 'Direction': 'Long', 'Size': 1.0,
+        }]
+
+    @pytest.mark.parametrize("chart_format", ["rows", "columnar"])
+    @pytest.mark.asyncio
+    async def test_series_are_reduced_and_marker_dates_kept(self, chart_service, long_price_data, trade_log, chart_format):
+        """
+        Given: 10년치 데이터, 거래 2건(진입/청산), max_points=200
+        When: generate_chart_data() 호출
+        Then: 모든 시계열이 약 200 포인트로 줄고, 마커 날짜는 캔들/자산 곡선에 남아야 함
+        """
+        # Given
+        chart_service._get_price_data = AsyncMock(return_value=long_price_data)
+        request = BacktestRequest(
+            ticker="AAPL", start_date="2014-01-01", end_date="2023-12-31", strategy="sma_strategy",
+            chart_format=chart_format, max_points=200,
+        )
+        backtest_result = type("Result", (), {
+            "trade_log": trade_log, "total_return_pct": 0.0, "sharpe_ratio": 0.0, "max_drawdown_pct": 0.0,
+            "total_trades": 1, "win_rate_pct": 100.0, "profit_factor": 1.0, "final_equity": 10000.0,
+            "volatility_pct": 0.0, "annualized_return_pct": 0.0, "sortino_ratio": 0.0, "calmar_ratio": 0.0,
+        })()
+
+        # When
+        response = await chart_service.generate_chart_data(request, backtest_result)
+
+        # Then
+        marker_dates = {marker.date for marker in response.trade_markers}
+        assert marker_dates == {long_price_data.index[1001].strftime('%Y-%m-%d'), long_price_data.index[1777].strftime('%Y-%m-%d')}
+        if chart_format == "rows":
+            series = {
+                "ohlc": [p.date for p in response.ohlc_data],
+                "equity": [p.date for p in response.equity_data],
+                "sp500": [p.date for p in response.sp500_benchmark],
+            }
+            assert response.ohlc_data[-1].close == pytest.approx(long_price_data['Close'].iloc[-1])
+        else:
+            series = {
+                "ohlc": response.columns.dates,
+                "equity": response.columns.dates,
+                "sp500": response.columns.sp500_benchmark.dates,
+            }
+            assert len(response.columns.equity) == len(response.columns.dates)
+        assert all(len(dates) <= 202 for dates in series.values())
+        assert marker_dates <= set(series["ohlc"]) and marker_dates <= set(series["equity"])
 
 
 @pytest.mark.integration
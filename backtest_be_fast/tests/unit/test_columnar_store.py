@@ -0,0 +1,101 @@
+"""
+컬럼형 디스크 가격 저장소(ColumnarPriceStore/ColumnarDataRepository) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.repositories.columnar_store import ColumnarDataRepository, ColumnarPriceStore
+from app.services import yfinance_db
+
+
+def _ohlcv(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end)
+    close = np.arange(len(index), dtype=float) + 100
+    return pd.DataFrame(
+        {
+            'Open': close - 0.5,
+            'High': close + 1,
+            'Low': close - 1,
+            'Close': close,
+            'Adj Close': close,
+            'Volume': np.arange(len(index), dtype='int64') * 10,
+        },
+        index=index,
+    )
+
+
+class TestColumnarPriceStore:
+    """컬럼 저장소 읽기/쓰기 테스트"""
+
+    def test_read_returns_memory_mapped_slice(self, tmp_path):
+        """저장 구간에 포함된 요청은 메모리 매핑 배열을 공유하는 슬라이스로 반환해야 한다"""
+        # Given
+        store = ColumnarPriceStore(tmp_path)
+        source = _ohlcv('2020-01-01', '2020-12-31')
+        store.write('AAPL', '2020-01-01', '2020-12-31', source)
+
+        # When
+        result = store.read('AAPL', '2020-03-01', '2020-03-31')
+
+        # Then
+        expected = source.loc['2020-03-01':'2020-03-31']
+        pd.testing.assert_frame_equal(result, expected, check_freq=False, check_index_type=False)
+        mapped = store._mapped['AAPL']
+        assert np.shares_memory(result['Close'].to_numpy(), mapped.columns['Close'])
+
+    def test_range_outside_stored_interval_misses(self, tmp_path):
+        """저장 구간 밖의 요청이나 없는 티커는 None을 반환해야 한다"""
+        store = ColumnarPriceStore(tmp_path)
+        store.write('AAPL', '2020-01-01', '2020-06-30', _ohlcv('2020-01-01', '2020-06-30'))
+
+        assert store.read('AAPL', '2020-05-01', '2020-07-31') is None
+        assert store.read('MSFT', '2020-02-01', '2020-03-01') is None
+
+    def test_other_data_version_misses(self, tmp_path):
+        """저장 시점과 다른 데이터 버전으로 읽으면 None을 반환해야 한다"""
+        store = ColumnarPriceStore(tmp_path)
+        store.write('AAPL', '2020-01-01', '2020-06-30', _ohlcv('2020-01-01', '2020-06-30'), data_version=7)
+
+        assert store.read('AAPL', '2020-02-01', '2020-03-01', data_version=7) is not None
+        assert store.read('AAPL', '2020-02-01', '2020-03-01', data_version=8) is None
+
+    def test_rewrite_switches_to_new_version(self, tmp_path):
+        """다시 쓰면 새 버전을 읽고, 이전에 반환된 슬라이스는 계속 유효해야 한다"""
+        store = ColumnarPriceStore(tmp_path)
+        store.write('AAPL', '2020-01-01', '2020-06-30', _ohlcv('2020-01-01', '2020-06-30'))
+        old = store.read('AAPL', '2020-01-01', '2020-01-31')
+
+        store.write('AAPL', '2019-01-01', '2020-12-31', _ohlcv('2019-01-01', '2020-12-31'))
+
+        assert store.coverage('AAPL') == (pd.Timestamp('2019-01-01'), pd.Timestamp('2020-12-31'))
+        assert store.read('AAPL', '2019-06-01', '2020-09-30') is not None
+        assert old['Close'].iloc[0] == 100.0
+        assert len([p for p in (tmp_path / 'AAPL').iterdir() if p.is_dir()]) == 1
+
+
+@pytest.mark.asyncio
+async def test_repository_syncs_union_range_from_mysql(tmp_path, monkeypatch):
+    """미스 시 기존 구간과 요청 구간을 합친 범위를 MySQL에서 읽어 동기화해야 한다"""
+    # Given
+    calls = []
+
+    def fake_load(ticker, start_date, end_date):
+        calls.append((str(start_date), str(end_date)))
+        return _ohlcv(start_date, end_date)
+
+    monkeypatch.setattr(yfinance_db, 'load_ticker_data', fake_load)
+    repository = ColumnarDataRepository(store_dir=tmp_path)
+
+    # When
+    await repository.get_stock_data('AAPL', '2020-01-01', '2020-06-30')
+    await repository.get_stock_data('AAPL', '2020-03-01', '2020-04-30')
+    result = await repository.get_stock_data('AAPL', '2020-05-01', '2020-09-30')
+
+    # Then
+    assert calls == [('2020-01-01', '2020-06-30'), ('2020-01-01', '2020-09-30')]
+    assert result.index[0] == pd.Timestamp('2020-05-01')
+    assert result.index[-1] == pd.Timestamp('2020-09-30')
+    stats = await repository.get_cache_stats()
+    assert stats['columnar_store']['hits'] == 1
+    assert stats['columnar_store']['syncs'] == 2
@@ -0,0 +1,149 @@
+"""
+티커별 데이터 버전 맵(app/services/data_versions.py) 테스트
+
+**테스트 범위**:
+- stocks.data_last_update 일괄 조회 (등록되지 않았거나 기록이 없는 티커는 0)
+- 갱신 주기 안에서는 DB를 다시 조회하지 않고, 주기가 지나면 다른 프로세스의 적재를 반영
+- 로컬 적재 반영(set)은 더 낮은 버전으로 되돌리지 않음
+- 동시 조회는 한 번의 일괄 조회로 병합
+- Repository는 조회(누락 구간 보완 적재 포함) 후 버전으로 캐시해 같은 요청을 다시 조회하지 않음
+"""
+import asyncio
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.repositories.columnar_store import ColumnarDataRepository
+from app.repositories.data_repository import YFinanceDataRepository
+from app.services import data_versions as data_versions_module
+from app.services import yfinance_db
+from app.services.data_versions import DataVersionMap, _to_version
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """stocks 테이블만 있는 SQLite DB"""
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    with engine.connect() as conn:
+        conn.execute(text('CREATE TABLE stocks (id INTEGER PRIMARY KEY, ticker TEXT, data_last_update TIMESTAMP)'))
+        conn.execute(text(
+            "INSERT INTO stocks (ticker, data_last_update) VALUES "
+            "('AAPL', '2024-05-01 10:00:00'), ('MSFT', NULL)"
+        ))
+        conn.commit()
+    monkeypatch.setattr(data_versions_module, '_get_engine', lambda: engine)
+    return engine
+
+
+def _touch(db, ticker: str, value: str) -> None:
+    with db.connect() as conn:
+        conn.execute(text('UPDATE stocks SET data_last_update = :v WHERE ticker = :t'), {'v': value, 't': ticker})
+        conn.commit()
+
+
+class TestDataVersionMap:
+    """버전 맵 조회/갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_bulk_query_returns_versions(self, db):
+        """여러 티커를 한 번에 조회하고, 기록이 없거나 미등록 티커는 0이어야 한다"""
+        # Given
+        versions = DataVersionMap(refresh_seconds=60)
+
+        # When
+        result = await versions.get_many(['AAPL', 'MSFT', 'NVDA'])
+
+        # Then
+        assert result == {'AAPL': _to_version('2024-05-01 10:00:00'), 'MSFT': 0, 'NVDA': 0}
+        assert versions.get_stats()['refreshes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_interval(self, db):
+        """갱신 주기 안에서는 이전 버전을, 주기가 지나면 다른 프로세스가 적재한 새 버전을 반환해야 한다"""
+        # Given
+        cached = DataVersionMap(refresh_seconds=60)
+        live = DataVersionMap(refresh_seconds=0)
+        before = await cached.get('AAPL')
+        await live.get('AAPL')
+
+        # When: 다른 프로세스가 적재
+        _touch(db, 'AAPL', '2024-05-02 09:00:00')
+
+        # Then
+        assert await cached.get('AAPL') == before
+        assert await live.get('AAPL') == _to_version('2024-05-02 09:00:00') > before
+        assert cached.get_stats()['refreshes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_is_monotonic(self, db):
+        """로컬 적재 반영은 버전을 올리기만 하고, DB의 이전 값으로 되돌리지 않아야 한다"""
+        versions = DataVersionMap(refresh_seconds=0)
+        newer = _to_version('2024-06-01 00:00:00')
+
+        versions.set('AAPL', newer)
+        versions.set('AAPL', newer - 1)
+
+        assert versions.peek('AAPL') == newer
+        assert await versions.get('AAPL') == newer
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self, db, monkeypatch):
+        """같은 티커 동시 조회는 DB를 한 번만 조회해야 한다"""
+        versions = DataVersionMap(refresh_seconds=60)
+        calls = []
+        query = versions._query_versions
+        monkeypatch.setattr(versions, '_query_versions', lambda tickers: calls.append(tickers) or query(tickers))
+
+        results = await asyncio.gather(*[versions.get('AAPL') for _ in range(10)])
+
+        assert len(calls) == 1
+        assert len(set(results)) == 1
+
+
+class TestRepositoryVersionAfterLoad:
+    """조회 중 적재로 버전이 바뀐 경우의 Repository 캐시 테스트"""
+
+    @staticmethod
+    def _bumping_load(versions: DataVersionMap, calls: list):
+        """호출될 때마다 누락 구간을 보완 적재한 것처럼 버전을 올리는 load_ticker_data"""
+        def load(ticker, start_date, end_date):
+            calls.append(ticker)
+            versions.set(ticker, versions.peek(ticker) + 1)
+            index = pd.bdate_range(start_date, end_date)
+            return pd.DataFrame({'Close': range(len(index))}, index=index, dtype=float)
+        return load
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_uses_version_after_load(self, db, monkeypatch):
+        """조회 중 버전이 바뀌어도 같은 요청은 메모리 캐시에서 반환해야 한다"""
+        # Given
+        repository = YFinanceDataRepository()
+        repository._versions = DataVersionMap(refresh_seconds=60)
+        calls = []
+        monkeypatch.setattr(yfinance_db, 'load_ticker_data', self._bumping_load(repository._versions, calls))
+
+        # When
+        for _ in range(5):
+            await repository.get_stock_data('AAPL', '2024-01-02', '2024-03-29')
+
+        # Then
+        assert calls == ['AAPL']
+
+    @pytest.mark.asyncio
+    async def test_columnar_store_uses_version_after_load(self, db, tmp_path, monkeypatch):
+        """조회 중 버전이 바뀌어도 컬럼 저장소는 새 버전으로 기록되어 다음 요청에 재사용되어야 한다"""
+        # Given
+        repository = ColumnarDataRepository(store_dir=tmp_path)
+        repository._versions = DataVersionMap(refresh_seconds=60)
+        calls = []
+        monkeypatch.setattr(yfinance_db, 'load_ticker_data', self._bumping_load(repository._versions, calls))
+
+        # When
+        for _ in range(3):
+            await repository.get_stock_data('AAPL', '2020-01-02', '2020-03-31')
+
+        # Then
+        assert calls == ['AAPL']
+        assert (await repository.get_cache_stats())['columnar_store']['hits'] == 2
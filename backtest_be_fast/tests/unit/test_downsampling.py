@@ -0,0 +1,65 @@
+"""
+차트 시계열 다운샘플링(LTTB, OHLC 구간 집계) 테스트
+"""
+import numpy as np
+import pandas as pd
+
+from app.utils.downsampling import aggregate_ohlc, bucket_ends, lttb_indices, merge_positions
+
+
+def _prices(length: int) -> pd.DataFrame:
+    index = pd.bdate_range('2015-01-01', periods=length)
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.01, length)))
+    return pd.DataFrame({
+        'Open': close * 0.995, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close, 'Volume': 1000.0
+    }, index=index)
+
+
+class TestLttb:
+    """LTTB 포인트 선택 테스트"""
+
+    def test_keeps_endpoints_and_requested_count(self):
+        """첫/마지막 포인트를 포함해 정확히 max_points개를 오름차순으로 선택해야 한다"""
+        values = _prices(2520)['Close']
+
+        selected = lttb_indices(values, 300)
+
+        assert len(selected) == 300
+        assert selected[0] == 0 and selected[-1] == 2519
+        assert np.all(np.diff(selected) > 0)
+
+    def test_preserves_spike(self):
+        """평탄한 시계열의 단일 급등 포인트는 반드시 선택되어야 한다"""
+        values = np.ones(1000)
+        values[437] = 50.0
+
+        assert 437 in lttb_indices(values, 50)
+
+    def test_short_series_and_nan_values(self):
+        """max_points 이하 길이는 그대로, NaN 포인트는 선택되지 않아야 한다"""
+        assert list(lttb_indices([1.0, 2.0, 3.0], 10)) == [0, 1, 2]
+
+        values = np.linspace(0, 10, 500)
+        values[1:-1:2] = np.nan
+        selected = lttb_indices(values, 40)
+        assert not np.isnan(values[selected]).any()
+
+
+class TestOhlcBuckets:
+    """OHLC 구간 집계 테스트"""
+
+    def test_aggregates_each_bucket(self):
+        """구간별 시가는 첫 값, 고가/저가는 최대/최소, 종가는 끝 값, 거래량은 합계여야 한다"""
+        data = _prices(100)
+        ends = merge_positions(bucket_ends(len(data), 10), [42])
+
+        result = aggregate_ohlc(data, ends)
+
+        assert result.index[-1] == data.index[-1]
+        assert data.index[42] in result.index
+        first = data.iloc[:ends[0] + 1]
+        assert result.iloc[0].to_dict() == {
+            'Open': first['Open'].iloc[0], 'High': first['High'].max(), 'Low': first['Low'].min(),
+            'Close': first['Close'].iloc[-1], 'Volume': first['Volume'].sum(),
+        }
+        assert result['Volume'].sum() == data['Volume'].sum()
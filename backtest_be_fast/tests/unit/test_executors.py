@@ -0,0 +1,82 @@
+"""
+실행기(ExecutorManager) 테스트
+"""
+import asyncio
+import math
+import time
+
+import pytest
+
+from app.core.exceptions import BacktestQueueFullError, ExecutionTimeoutError
+from app.core.executors import ExecutorManager
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_executes_in_process_pool():
+    """프로세스 풀에서 실행한 결과를 반환하고 완료 카운터를 증가시켜야 한다"""
+    manager = ExecutorManager(io_workers=2, cpu_workers=1, max_queue_depth=4)
+    try:
+        result = await manager.run_cpu(math.sqrt, 16.0)
+
+        assert result == 4.0
+        stats = manager.get_stats()
+        assert stats['backtest_executor'] == 'process'
+        assert stats['completed'] == 1
+        assert stats['in_flight'] == 0
+    finally:
+        manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_reports_in_flight_and_queued_counts():
+    """슬롯보다 많은 작업은 대기열에서 기다리며 통계에 반영되어야 한다"""
+    manager = ExecutorManager(io_workers=2, cpu_workers=1, max_queue_depth=4, use_processes=False)
+    try:
+        tasks = [asyncio.create_task(manager.run_cpu(time.sleep, 0.2)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        stats = manager.get_stats()
+        assert stats['in_flight'] == 1
+        assert stats['queued'] == 2
+
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0)
+        assert manager.get_stats()['in_flight'] == 0
+        assert manager.get_stats()['completed'] == 3
+    finally:
+        manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_cpu_rejects_when_queue_is_full():
+    """대기열이 가득 차면 BacktestQueueFullError(503)를 발생시켜야 한다"""
+    manager = ExecutorManager(io_workers=2, cpu_workers=1, max_queue_depth=1, use_processes=False)
+    try:
+        running = asyncio.create_task(manager.run_cpu(time.sleep, 0.2))
+        waiting = asyncio.create_task(manager.run_cpu(time.sleep, 0.0))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(BacktestQueueFullError) as exc_info:
+            await manager.run_cpu(time.sleep, 0.0)
+
+        assert exc_info.value.status_code == 503
+        assert manager.get_stats()['rejected'] == 1
+        await asyncio.gather(running, waiting)
+    finally:
+        manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_stage_timeouts_raise_execution_timeout():
+    """단계 제한 시간을 넘기면 ExecutionTimeoutError(504)를 발생시켜야 한다"""
+    manager = ExecutorManager(io_workers=2, cpu_workers=1, max_queue_depth=2, use_processes=False)
+    try:
+        with pytest.raises(ExecutionTimeoutError) as io_error:
+            await manager.run_io(time.sleep, 0.3, timeout=0.05, stage="data")
+        with pytest.raises(ExecutionTimeoutError):
+            await manager.run_cpu(time.sleep, 0.3, timeout=0.05)
+
+        assert io_error.value.status_code == 504
+        assert manager.get_stats()['timed_out'] == 2
+    finally:
+        manager.shutdown()
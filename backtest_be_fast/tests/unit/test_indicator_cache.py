@@ -0,0 +1,123 @@
+"""
+기술 지표 메모리 캐시(app/utils/indicator_cache.py) 테스트
+
+**테스트 범위**:
+- SMA 기간 일괄 계산이 pandas rolling과 비트 단위로 같고 교차 신호가 같은지 (보합 구간, NaN 포함)
+- 같은 데이터/지표/파라미터는 한 번만 계산하고, 데이터가 바뀌면 다시 계산하는지
+- 용량 한도 LRU 축출과 티커별 무효화
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.utils import indicators
+from app.utils.indicator_cache import IndicatorCache, SMA_FAMILY_WINDOWS
+
+
+@pytest.fixture
+def close():
+    values = np.round(100 * np.exp(np.cumsum(np.random.default_rng(5).normal(0, 0.02, 1000))), 2)
+    values[300:360] = values[300]  # 보합 구간
+    return pd.Series(values, index=pd.bdate_range('2018-01-01', periods=len(values)))
+
+
+class TestSmaFamily:
+    """SMA 기간 일괄 계산 테스트"""
+
+    def test_family_matches_rolling_mean(self, close):
+        """SMA 2~200일 일괄 계산 결과가 rolling 평균과 정확히 같고, 보합 구간은 같은 값이어야 한다"""
+        # Given
+        cache = IndicatorCache()
+
+        # When
+        family = cache.sma_family(close, SMA_FAMILY_WINDOWS)
+
+        # Then
+        assert sorted(family) == list(SMA_FAMILY_WINDOWS)
+        for window in (2, 20, 50, 200):
+            np.testing.assert_array_equal(family[window], close.rolling(window).mean().to_numpy())
+        assert family[20][359] == family[50][359]
+        assert cache.misses == len(SMA_FAMILY_WINDOWS)
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_crossovers_match_rolling_mean(self, seed):
+        """센트 단위 종가에서 캐시 SMA의 단기/장기 교차 신호가 pandas rolling 기준과 같아야 한다"""
+        # Given: 센트 단위로 반올림한 랜덤 워크 (교차 경계에서 두 SMA가 같아지는 날 포함)
+        rng = np.random.default_rng(seed)
+        values = np.round(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 3000))), 2)
+        values[1000:1100] = values[1000]
+        cache = IndicatorCache()
+
+        # When
+        family = cache.sma_family(values, SMA_FAMILY_WINDOWS)
+
+        # Then
+        series = pd.Series(values)
+        for short, long in ((5, 20), (10, 30), (20, 60), (50, 200)):
+            expected = np.sign(series.rolling(short).mean() - series.rolling(long).mean()).to_numpy()
+            np.testing.assert_array_equal(np.sign(family[short] - family[long]), expected)
+
+    def test_nan_values_fall_back_to_rolling(self, close):
+        """NaN이 있는 데이터는 rolling 기준 결과와 같아야 한다"""
+        values = close.to_numpy().copy()
+        values[100] = np.nan
+
+        np.testing.assert_array_equal(IndicatorCache().sma(values, 10), indicators.sma(values, 10))
+
+
+class TestIndicatorCache:
+    """캐시 동작 테스트"""
+
+    def test_reuses_arrays_for_same_data(self, close):
+        """같은 종가 데이터(다른 객체)로 다시 요청하면 계산 없이 같은 읽기 전용 배열을 반환해야 한다"""
+        # Given
+        cache = IndicatorCache()
+        first = cache.ema(close, 12)
+
+        # When
+        second = cache.ema(close.to_numpy().copy(), 12)
+        changed = cache.ema(close * 1.01, 12)
+
+        # Then
+        assert second is first
+        assert not first.flags.writeable
+        assert changed is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+        np.testing.assert_allclose(first, indicators.ema(close, 12))
+
+    def test_matches_indicator_functions(self, close):
+        """캐시 버전 MACD/볼린저/RSI는 app/utils/indicators.py 계산과 같아야 한다"""
+        cache = IndicatorCache()
+
+        for cached, direct in zip(cache.macd(close, 12, 26, 9), indicators.macd(close, 12, 26, 9)):
+            np.testing.assert_allclose(cached, direct)
+        for cached, direct in zip(cache.bollinger(close, 20, 2.0), indicators.bollinger(close, 20, 2.0)):
+            np.testing.assert_allclose(cached, direct, rtol=1e-12)
+        np.testing.assert_allclose(cache.rsi(close, 14), indicators.rsi(close, 14))
+
+    def test_evicts_least_recently_used(self, close):
+        """용량 한도를 넘으면 가장 오래 사용되지 않은 지표부터 축출해야 한다"""
+        # Given: 배열 2개 분량 한도
+        cache = IndicatorCache(max_bytes=2 * close.to_numpy().nbytes)
+        cache.ema(close, 5)
+        cache.ema(close, 10)
+        cache.ema(close, 5)
+
+        # When
+        cache.ema(close, 20)
+
+        # Then: ema(10) 축출, ema(5)는 유지
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1 and stats['total_entries'] == 2
+        cache.ema(close, 5)
+        assert cache.hits == 2
+
+    def test_invalidate_by_ticker(self, close):
+        """티커로 기록된 데이터의 지표만 제거해야 한다"""
+        cache = IndicatorCache()
+        cache.ema(close, 5, ticker='AAPL')
+        cache.rsi(close, 14, ticker='AAPL')
+        cache.ema(close * 2, 5, ticker='MSFT')
+
+        assert cache.invalidate('AAPL') == 2
+        assert cache.get_stats()['total_entries'] == 1
@@ -0,0 +1,79 @@
+"""
+기술 지표 계산 유틸리티(app/utils/indicators.py) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.chart_data_service import ChartDataService
+from app.utils.indicators import bollinger, macd, rsi, sma, strategy_indicator_lines
+
+
+@pytest.fixture
+def close():
+    index = pd.bdate_range('2020-01-01', periods=300)
+    return pd.Series(100 * np.exp(np.cumsum(np.random.default_rng(3).normal(0, 0.02, len(index)))), index=index)
+
+
+class TestIndicatorArrays:
+    """지표 배열 계산 테스트 (pandas 기준 계산과 비교)"""
+
+    def test_sma_and_bollinger(self, close):
+        """SMA와 볼린저 밴드는 rolling 기준 계산과 같아야 한다"""
+        middle, upper, lower = bollinger(close, 20, 2.0)
+
+        expected_std = close.rolling(20).std().to_numpy()
+        np.testing.assert_allclose(sma(close, 20), close.rolling(20).mean().to_numpy())
+        np.testing.assert_allclose(upper, middle + 2.0 * expected_std)
+        np.testing.assert_allclose(lower, middle - 2.0 * expected_std)
+        assert np.isnan(middle[:19]).all()
+
+    def test_macd_matches_per_index_lookup(self, close):
+        """MACD/시그널은 기존 인덱스별 조회 결과와 같아야 한다"""
+        line, signal = macd(close, 12, 26, 9)
+
+        expected = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+        np.testing.assert_allclose(line, [expected.loc[idx] for idx in close.index])
+        np.testing.assert_allclose(signal, expected.ewm(span=9).mean().to_numpy())
+
+    def test_rsi_is_bounded(self, close):
+        """RSI는 0~100 범위여야 한다"""
+        values = rsi(close, 14)
+
+        assert len(values) == len(close)
+        assert ((values >= 0) & (values <= 100)).all()
+
+
+class TestStrategyIndicatorLines:
+    """전략별 지표 라인 테스트"""
+
+    def test_rsi_reference_lines_are_scalars(self, close):
+        """RSI 과매수/과매도 기준선은 배열 없이 상수 값만 가져야 한다"""
+        lines = strategy_indicator_lines(close, "rsi_strategy", {'rsi_overbought': 75, 'rsi_oversold': 25})
+
+        assert [line.name for line in lines] == ["RSI_14", "RSI_OVERBOUGHT", "RSI_OVERSOLD"]
+        assert (lines[1].values, lines[1].value) == (None, 75.0)
+        assert (lines[2].values, lines[2].value) == (None, 25.0)
+
+    def test_lines_without_values_are_omitted(self, close):
+        """데이터가 기간보다 짧아 값이 없는 라인은 제외하고, 지표 없는 전략은 빈 리스트여야 한다"""
+        lines = strategy_indicator_lines(close[:15], "sma_crossover", {'short_window': 10, 'long_window': 20})
+
+        assert [line.name for line in lines] == ["SMA_10"]
+        assert strategy_indicator_lines(close, "buy_hold_strategy") == []
+
+    def test_row_and_columnar_formats_share_values(self, close):
+        """행 형식 포인트와 컬럼 형식 값은 같은 배열에서 나와야 한다"""
+        service = ChartDataService()
+        data = pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1}, index=close.index)
+        params = {'fast_period': 12, 'slow_period': 26, 'signal_period': 9}
+
+        rows = service._generate_macd_indicators(data, params)
+        columns = service._generate_columnar_data(data, 10000.0, service._indicator_lines(data, "macd_strategy", params))
+
+        assert [indicator.name for indicator in rows] == ["MACD", "MACD_SIGNAL"]
+        assert [point["value"] for point in rows[0].data] == columns.indicators[0].values
+        assert rows[0].data[0] == {
+            "timestamp": close.index[0].isoformat(), "date": close.index[0].strftime('%Y-%m-%d'),
+            "value": columns.indicators[0].values[0],
+        }
@@ -0,0 +1,199 @@
+"""
+최신 뉴스 읽기 캐시(NewsCacheService), 비동기 네이버 검색, 호출 한도(AsyncRateLimiter) 테스트
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.services.news_cache_service import NewsCacheService
+from app.services.news_service import NaverNewsService
+from app.utils.rate_limiter import AsyncRateLimiter
+
+
+class _FakeNewsService:
+    TICKER_MAPPING = {'AAPL': '애플'}
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.queries = []
+
+    def get_ticker_query(self, ticker):
+        return f'{ticker} 주식'
+
+    def search_news_by_date(self, query, start_date, end_date=None, display=100, sort='date'):
+        self.queries.append((query, start_date))
+        return [{'title': query, 'link': f'https://news/{start_date}', 'description': '', 'pubDate': start_date}]
+
+    async def search_news_async(self, query, display=10, sort='date'):
+        self.queries.append(query)
+        await asyncio.sleep(self.delay)
+        return [{'title': f'{query} 뉴스', 'link': 'https://news/1', 'description': '', 'pubDate': 'Mon, 01 Sep 2025 21:01:00 +0900'}]
+
+
+class _FakeRepository:
+    def __init__(self, cached=None):
+        self.cached = cached or []
+        self.saved = []
+
+    def get_latest_news(self, ticker, max_age_hours=24):
+        return list(self.cached)
+
+    def save_latest_news(self, ticker, news_list, source='naver'):
+        self.saved.append((ticker, news_list))
+        return len(news_list)
+
+    def check_news_exists(self, ticker, news_date):
+        return str(news_date) == '2024-03-01'
+
+    def save_news(self, ticker, news_date, news_list, source='naver'):
+        self.saved.append((ticker, str(news_date)))
+        return len(news_list)
+
+    async def get_latest_news_async(self, ticker, max_age_hours=24):
+        return self.get_latest_news(ticker, max_age_hours)
+
+    async def save_latest_news_async(self, ticker, news_list, source='naver'):
+        return self.save_latest_news(ticker, news_list, source)
+
+    async def check_news_exists_async(self, ticker, news_date):
+        return self.check_news_exists(ticker, news_date)
+
+    async def save_news_async(self, ticker, news_date, news_list, source='naver'):
+        return self.save_news(ticker, news_date, news_list, source)
+
+
+def _cached_row(age_seconds: int) -> dict:
+    return {
+        'ticker': 'AAPL', 'news_date': '2025-09-01', 'title': '캐시 뉴스', 'link': 'https://news/0',
+        'description': '요약', 'source': 'naver', 'created_at': '2025-09-01T12:00:00', 'age_seconds': age_seconds,
+    }
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_is_served_without_api_call():
+    """최근 저장된 캐시는 API 호출 없이 검색 응답 형태로 반환해야 한다"""
+    # Given
+    news, repository = _FakeNewsService(), _FakeRepository([_cached_row(60)])
+    service = NewsCacheService(news, repository)
+
+    # When
+    result = await service.get_latest_news('AAPL', display=5)
+
+    # Then
+    assert result == [{'title': '캐시 뉴스', 'link': 'https://news/0', 'description': '요약', 'pubDate': '2025-09-01'}]
+    assert news.queries == []
+    assert service.get_stats()['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_served_and_refreshed_in_background():
+    """오래된 캐시는 즉시 반환하고 백그라운드에서 검색 후 저장해야 한다"""
+    # Given
+    news, repository = _FakeNewsService(delay=0.05), _FakeRepository([_cached_row(3 * 3600)])
+    service = NewsCacheService(news, repository)
+
+    # When
+    result = await service.get_latest_news('AAPL')
+
+    # Then
+    assert result[0]['title'] == '캐시 뉴스'
+    assert repository.saved == []
+    await asyncio.gather(*service._background)
+    assert news.queries == ['애플']
+    assert repository.saved[0][0] == 'AAPL'
+    assert service.get_stats() == {'hits': 0, 'stale_hits': 1, 'misses': 0, 'refreshing': 0}
+
+
+@pytest.mark.asyncio
+async def test_cache_miss_coalesces_concurrent_requests():
+    """캐시가 없으면 같은 종목 동시 요청은 한 번만 검색하고 결과를 저장해야 한다"""
+    # Given
+    news, repository = _FakeNewsService(delay=0.05), _FakeRepository()
+    service = NewsCacheService(news, repository)
+
+    # When
+    results = await asyncio.gather(*(service.get_latest_news('MSFT') for _ in range(3)))
+
+    # Then
+    assert news.queries == ['MSFT']
+    assert len(repository.saved) == 1
+    assert all(result[0]['title'] == 'MSFT 뉴스' for result in results)
+
+
+@pytest.mark.asyncio
+async def test_event_news_backfill_runs_once_per_date_and_skips_stored_dates():
+    """이벤트 날짜 뉴스 보완은 저장되지 않은 날짜만 검색하고, 같은 날짜는 다시 예약하지 않아야 한다"""
+    # Given
+    news, repository = _FakeNewsService(), _FakeRepository()
+    service = NewsCacheService(news, repository)
+
+    # When
+    service.schedule_event_news_backfill('AAPL', ['2024-03-05', '2024-03-01'])
+    service.schedule_event_news_backfill('AAPL', ['2024-03-05'])
+    await asyncio.gather(*service._background)
+
+    # Then: 3/1은 이미 저장되어 있어 검색하지 않음
+    assert news.queries == [('AAPL 주식', '2024-03-05')]
+    assert repository.saved == [('AAPL', '2024-03-05')]
+
+
+
+@pytest.mark.asyncio
+async def test_event_news_backfill_history_is_bounded(monkeypatch):
+    """예약 이력이 한도를 넘으면 가장 오래된 (종목, 날짜)부터 잊어야 한다"""
+    # Given
+    monkeypatch.setattr(settings, 'volatility_news_backfill_history_size', 2)
+    news, repository = _FakeNewsService(), _FakeRepository()
+    service = NewsCacheService(news, repository)
+
+    # When
+    service.schedule_event_news_backfill('AAPL', ['2024-03-05'])
+    service.schedule_event_news_backfill('AAPL', ['2024-03-06', '2024-03-07'])
+    await asyncio.gather(*service._background)
+
+    # Then
+    assert list(service._backfill_requested) == [('AAPL', '2024-03-06'), ('AAPL', '2024-03-07')]
+
+@pytest.mark.asyncio
+async def test_search_news_async_uses_shared_client_and_parses_items(monkeypatch):
+    """비동기 검색은 공유 클라이언트로 요청하고 HTML 태그 제거 및 관련성 필터링을 적용해야 한다"""
+    # Given
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={'items': [
+            {'title': '<b>애플</b> 실적', 'link': 'https://news/1', 'description': '&quot;호실적&quot;', 'pubDate': 'd1'},
+            {'title': '[오늘의 역사] 애플', 'link': 'https://news/2', 'description': '', 'pubDate': 'd2'},
+        ]})
+
+    service = NaverNewsService()
+    service.client_id, service.client_secret = 'id', 'secret'
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(service, '_get_async_client', lambda: client)
+
+    # When
+    result = await service.search_news_async('애플', display=5)
+    await client.aclose()
+
+    # Then
+    assert [item['title'] for item in result] == ['애플 실적']
+    assert requests[0].url.params['query'] == '애플'
+    assert requests[0].url.params['display'] == '5'
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_window():
+    """윈도우 내 한도를 넘는 호출은 가장 오래된 호출이 윈도우를 벗어날 때까지 대기해야 한다"""
+    limiter = AsyncRateLimiter(max_calls=2, period=0.2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.18
+    assert limiter.get_stats()['acquired'] == 3
+    assert limiter.get_stats()['throttled'] == 1
@@ -0,0 +1,110 @@
+"""
+파라미터 최적화 서비스 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.exceptions import ValidationError
+from app.schemas.requests import OptimizationRequest, OptimizationObjective, ParameterRange, StrategyType
+from app.services.optimization_service import OptimizationService
+
+
+def _price_frame(periods: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    index = pd.bdate_range('2021-01-01', periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    return pd.DataFrame(
+        {
+            'Open': close * (1 + rng.normal(0, 0.003, periods)),
+            'High': close * 1.01,
+            'Low': close * 0.99,
+            'Close': close,
+            'Volume': rng.integers(1_000, 5_000, periods),
+        },
+        index=index,
+    )
+
+
+class _FakeRepository:
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    async def get_stock_data(self, ticker, start_date, end_date):
+        self.calls += 1
+        return self.data
+
+
+class TestParameterGrid:
+    """파라미터 격자 생성 테스트"""
+
+    def test_grid_respects_constraints(self):
+        """short_window < long_window 제약을 만족하는 조합만 생성되어야 한다"""
+        service = OptimizationService()
+
+        grid = service.build_parameter_grid(
+            'sma_strategy',
+            {
+                'short_window': ParameterRange(min=5, max=20, step=5),
+                'long_window': ParameterRange(values=[10, 20, 30]),
+            },
+        )
+
+        assert all(p['short_window'] < p['long_window'] for p in grid)
+        assert {'short_window': 5, 'long_window': 10} in grid
+        assert {'short_window': 20, 'long_window': 20} not in grid
+
+    def test_default_ranges_come_from_strategy_definition(self):
+        """범위 미지정 시 STRATEGIES의 min/max 범위 안에서 격자를 생성해야 한다"""
+        service = OptimizationService()
+
+        grid = service.build_parameter_grid('bollinger_strategy')
+
+        periods = {p['period'] for p in grid}
+        std_devs = {p['std_dev'] for p in grid}
+        assert min(periods) == 5 and max(periods) == 100
+        assert min(std_devs) == pytest.approx(0.5) and max(std_devs) == pytest.approx(4.0)
+
+    def test_unknown_parameter_raises(self):
+        """전략에 없는 파라미터는 ValidationError"""
+        service = OptimizationService()
+
+        with pytest.raises(ValidationError):
+            service.build_parameter_grid('ema_strategy', {'unknown': ParameterRange(min=1, max=2)})
+
+
+@pytest.mark.asyncio
+async def test_stream_optimization_returns_ranked_summary():
+    """조합별 결과를 스트리밍한 뒤 목적 함수 순으로 정렬된 요약을 반환해야 한다"""
+    # Given
+    repository = _FakeRepository(_price_frame())
+    service = OptimizationService(data_repository_instance=repository)
+    request = OptimizationRequest(
+        ticker='TEST',
+        start_date='2021-01-01',
+        end_date='2022-03-01',
+        strategy=StrategyType.EMA_STRATEGY,
+        param_ranges={
+            'fast_window': ParameterRange(values=[5, 10]),
+            'slow_window': ParameterRange(values=[20, 40]),
+        },
+        objective=OptimizationObjective.TOTAL_RETURN,
+        top_n=2,
+    )
+
+    # When
+    data = await service.load_price_data(request)
+    grid = service.build_parameter_grid(request.strategy.value, request.param_ranges)
+    events = [event async for event in service.stream_optimization(request, data, grid)]
+
+    # Then
+    results = [e for e in events if e['type'] == 'result']
+    summary = events[-1]
+    assert repository.calls == 1
+    assert len(results) == 4
+    assert summary['type'] == 'summary'
+    assert len(summary['top_results']) == 2
+    returns = [r['total_return_pct'] for r in summary['results']]
+    assert returns == sorted(returns, reverse=True)
+    assert summary['best_params'] == summary['results'][0]['params']
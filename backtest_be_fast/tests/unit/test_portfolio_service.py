@@ -0,0 +1,326 @@
+"""
+포트폴리오 서비스 테스트 (DCA 수익률 계산, 전략 포트폴리오 종목 백테스트 실행)
+"""
+import asyncio
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.schemas.schemas import PortfolioBacktestRequest, PortfolioStock
+from app.services.portfolio_service import PortfolioService
+
+
+def _prices(start: str, end: str, closes=None) -> pd.DataFrame:
+    index = pd.bdate_range(start, end)
+    if closes is None:
+        closes = np.linspace(100, 200, len(index))
+    return pd.DataFrame({'Close': closes}, index=index)
+
+
+def _reference_portfolio_values(portfolio_data, amounts, dca_info, start_date, end_date) -> pd.DataFrame:
+    """날짜 × 종목 반복으로 계산하던 기존 방식 (리밸런싱 없음)"""
+    cash_amount = sum(amount for key, amount in amounts.items() if dca_info[key].get('asset_type') == 'cash')
+    all_dates = set()
+    for key, df in portfolio_data.items():
+        if dca_info.get(key, {}).get('asset_type') != 'cash':
+            all_dates.update(df.index)
+    date_range = pd.DatetimeIndex(sorted(all_dates))
+    total_amount = sum(amounts.values())
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+
+    dates, values, returns, prev_value = [], [], [], 0
+    for current in date_range:
+        if not start.date() <= current.date() <= end.date():
+            continue
+        value = cash_amount
+        for key, amount in amounts.items():
+            info = dca_info[key]
+            if info.get('asset_type') == 'cash' or info['symbol'] not in portfolio_data:
+                continue
+            df = portfolio_data[info['symbol']]
+            price_data = df[df.index.date <= current.date()]
+            if price_data.empty:
+                continue
+            current_price = price_data['Close'].iloc[-1]
+            if info['investment_type'] == 'lump_sum':
+                if current.date() == start.date():
+                    shares = amount / price_data['Close'].iloc[0]
+                else:
+                    first = df[df.index.date >= start.date()]
+                    shares = amount / first['Close'].iloc[0] if not first.empty else 0
+            else:
+                months_passed = (current.year - start.year) * 12 + (current.month - start.month)
+                shares = 0
+                for month in range(min(months_passed + 1, info['dca_periods'])):
+                    month_data = df[df.index.date >= (start + timedelta(days=30 * month)).date()]
+                    if not month_data.empty:
+                        shares += info['monthly_amount'] / month_data['Close'].iloc[0]
+            value += shares * current_price
+        returns.append((value - prev_value) / prev_value if prev_value > 0 else 0.0)
+        values.append(value / total_amount)
+        dates.append(current)
+        prev_value = value
+
+    return pd.DataFrame(
+        {'Portfolio_Value': values, 'Daily_Return': returns, 'Cumulative_Return': [(v - 1) * 100 for v in values]},
+        index=pd.DatetimeIndex(dates, name='Date', dtype=date_range.dtype),
+    )
+
+
+def _random_portfolio(seed: int):
+    """일시불/분할 매수/현금/중복 종목이 섞인 임의 포트폴리오와 서로 다른 거래일의 가격 데이터"""
+    rng = np.random.default_rng(seed)
+    calendar = pd.bdate_range('2023-01-02', '2024-12-31')
+    portfolio_data = {}
+    for symbol in ('AAA', 'BBB', 'CCC'):
+        # 상장일이 다르고 중간중간 거래가 빠진 거래일
+        listed = calendar[int(rng.integers(0, 200)):]
+        days = listed[rng.random(len(listed)) > 0.1]
+        closes = np.round(50 * np.exp(np.cumsum(rng.normal(0, 0.02, len(days)))), 2)
+        portfolio_data[symbol] = pd.DataFrame({'Close': closes}, index=days)
+
+    amounts, dca_info = {}, {}
+    for i in range(int(rng.integers(1, 6))):
+        symbol = str(rng.choice(list(portfolio_data)))
+        amount = float(rng.integers(1, 50)) * 100
+        if rng.random() < 0.5:
+            info = {'symbol': symbol, 'investment_type': 'lump_sum'}
+        else:
+            periods = int(rng.integers(1, 13))
+            info = {'symbol': symbol, 'investment_type': 'dca', 'dca_periods': periods,
+                    'monthly_amount': amount / periods}
+        amounts[f'{symbol}_{i}'] = amount
+        dca_info[f'{symbol}_{i}'] = info
+    if rng.random() < 0.5:
+        amounts['CASH_9'] = float(rng.integers(1, 50)) * 100
+        dca_info['CASH_9'] = {'symbol': 'CASH', 'investment_type': 'lump_sum', 'asset_type': 'cash'}
+
+    start = calendar[0] + pd.Timedelta(days=int(rng.integers(0, 300)))
+    end = start + pd.Timedelta(days=int(rng.integers(30, 400)))
+    return portfolio_data, amounts, dca_info, start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+class TestCalculateDcaPortfolioReturns:
+    """DCA 포트폴리오 가치 시뮬레이션 테스트"""
+
+    def test_lump_sum_with_cash(self):
+        """일시불 종목은 시작일 종가 기준 수량으로, 현금은 고정 가치로 합산되어야 한다"""
+        # Given
+        data = {'AAA': _prices('2024-01-01', '2024-01-05', [10.0, 11.0, 12.0, 9.0, 15.0])}
+        amounts = {'AAA_0': 1000, 'CASH_1': 1000}
+        dca_info = {
+            'AAA_0': {'symbol': 'AAA', 'investment_type': 'lump_sum'},
+            'CASH_1': {'symbol': 'CASH', 'investment_type': 'lump_sum', 'asset_type': 'cash'},
+        }
+
+        # When
+        result = PortfolioService.calculate_dca_portfolio_returns(
+            data, amounts, dca_info, '2024-01-01', '2024-01-05'
+        )
+
+        # Then
+        assert list(result.columns) == ['Portfolio_Value', 'Daily_Return', 'Cumulative_Return']
+        assert result.index.name == 'Date'
+        expected = (np.array([10.0, 11.0, 12.0, 9.0, 15.0]) * 100 + 1000) / 2000
+        np.testing.assert_allclose(result['Portfolio_Value'], expected)
+        assert result['Daily_Return'].iloc[0] == 0.0
+        assert result['Daily_Return'].iloc[1] == pytest.approx(2100 / 2000 - 1)
+        np.testing.assert_allclose(result['Cumulative_Return'], (expected - 1) * 100)
+
+    def test_dca_buys_every_30_days_up_to_periods(self):
+        """분할 매수는 30일 간격 매수일 이후 첫 거래일 종가로 회차별 누적되어야 한다"""
+        # Given: 1월 10, 2월 20, 3월 이후 40
+        index = pd.bdate_range('2024-01-01', '2024-04-30')
+        closes = np.where(index < '2024-01-31', 10.0, np.where(index < '2024-03-01', 20.0, 40.0))
+        data = {'AAA': pd.DataFrame({'Close': closes}, index=index)}
+        amounts = {'AAA_0': 300}
+        dca_info = {'AAA_0': {'symbol': 'AAA', 'investment_type': 'dca', 'dca_periods': 3, 'monthly_amount': 100}}
+
+        # When
+        result = PortfolioService.calculate_dca_portfolio_returns(
+            data, amounts, dca_info, '2024-01-01', '2024-04-30'
+        )
+
+        # Then: 매수일 1/1(10), 1/31(20), 3/1(40) → 10 + 5 + 2.5주
+        value = result['Portfolio_Value'] * 300
+        assert value.loc['2024-01-15'] == pytest.approx(10 * 10)
+        assert value.loc['2024-02-15'] == pytest.approx(15 * 20)
+        assert value.loc['2024-03-15'] == pytest.approx(17.5 * 40)
+        assert value.loc['2024-04-30'] == pytest.approx(17.5 * 40)
+
+    def test_dates_are_union_clipped_to_period_and_carry_forward_prices(self):
+        """날짜는 종목 거래일 합집합을 기간으로 자른 것이고, 거래가 없는 날은 직전 종가를 사용해야 한다"""
+        # Given
+        a = pd.DataFrame({'Close': [10.0, 10.0, 10.0]}, index=pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04']))
+        b = pd.DataFrame({'Close': [5.0, 10.0]}, index=pd.to_datetime(['2024-01-03', '2024-01-05']))
+        amounts = {'A_0': 100, 'B_1': 100}
+        dca_info = {
+            'A_0': {'symbol': 'A', 'investment_type': 'lump_sum'},
+            'B_1': {'symbol': 'B', 'investment_type': 'lump_sum'},
+        }
+
+        # When
+        result = PortfolioService.calculate_dca_portfolio_returns(
+            {'A': a, 'B': b}, amounts, dca_info, '2024-01-02', '2024-01-05', rebalance_frequency='none'
+        )
+
+        # Then: 1/2에는 B 가격이 없어 A만 반영, 1/5에는 A의 1/4 종가를 이어 사용
+        assert list(result.index) == list(pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05']))
+        np.testing.assert_allclose(result['Portfolio_Value'] * 200, [100, 200, 200, 300])
+
+    @pytest.mark.parametrize('seed', range(12))
+    def test_matches_previous_loop_for_random_portfolios(self, seed):
+        """임의 포트폴리오(일시불, 분할 매수, 현금, 중복 종목)에서 기존 날짜별 반복 계산과 같아야 한다"""
+        # Given
+        portfolio_data, amounts, dca_info, start_date, end_date = _random_portfolio(seed)
+
+        # When
+        result = PortfolioService.calculate_dca_portfolio_returns(
+            portfolio_data, amounts, dca_info, start_date, end_date, rebalance_frequency='none'
+        )
+
+        # Then
+        expected = _reference_portfolio_values(portfolio_data, amounts, dca_info, start_date, end_date)
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12, check_freq=False)
+
+    def test_lump_sum_portfolio_is_rebalanced_monthly(self):
+        """일시불 포트폴리오는 매월 첫 거래일에 현금 포함 목표 비중으로 복원되어야 한다"""
+        # Given: 1월에 두 배가 된 뒤 2월부터 다시 두 배
+        index = pd.to_datetime(['2024-01-02', '2024-01-31', '2024-02-01', '2024-02-29'])
+        data = {'AAA': pd.DataFrame({'Close': [10.0, 20.0, 20.0, 40.0]}, index=index)}
+        amounts = {'AAA_0': 500, 'CASH_1': 500}
+        dca_info = {
+            'AAA_0': {'symbol': 'AAA', 'investment_type': 'lump_sum'},
+            'CASH_1': {'symbol': 'CASH', 'investment_type': 'lump_sum', 'asset_type': 'cash'},
+        }
+
+        # When
+        monthly = PortfolioService.calculate_dca_portfolio_returns(
+            data, amounts, dca_info, '2024-01-01', '2024-02-29', rebalance_frequency='monthly', commission=0.01
+        )
+        held = PortfolioService.calculate_dca_portfolio_returns(
+            data, amounts, dca_info, '2024-01-01', '2024-02-29', rebalance_frequency='none'
+        )
+
+        # Then: 2/1에 1500 → 750/750으로 복원 (매매 250 × 1% 비용), 2월 말 750 × 2 + 750
+        rebalanced_value = 1500 - 0.01 * 250
+        np.testing.assert_allclose(
+            monthly['Portfolio_Value'] * 1000,
+            [1000, 1500, rebalanced_value, rebalanced_value * 1.5],
+        )
+        np.testing.assert_allclose(held['Portfolio_Value'] * 1000, [1000, 1500, 1500, 2500])
+
+    def test_request_defaults_to_no_rebalancing(self):
+        """리밸런싱 주기를 보내지 않은 요청은 리밸런싱하지 않아야 한다 (기존 일시불 결과 유지)"""
+        request = PortfolioBacktestRequest(
+            portfolio=[PortfolioStock(symbol='AAPL', amount=1000)],
+            start_date='2024-01-01', end_date='2024-12-31',
+        )
+        assert request.rebalance_frequency == 'none'
+
+    def test_unknown_rebalance_frequency_raises(self):
+        """지원하지 않는 리밸런싱 주기는 ValueError가 발생해야 한다"""
+        data = {'AAA': _prices('2024-01-01', '2024-01-05')}
+        with pytest.raises(ValueError):
+            PortfolioService.calculate_dca_portfolio_returns(
+                data, {'AAA_0': 100}, {'AAA_0': {'symbol': 'AAA', 'investment_type': 'lump_sum'}},
+                '2024-01-01', '2024-01-05', rebalance_frequency='hourly'
+            )
+
+    def test_no_data_and_no_cash_raises(self):
+        """주식 데이터와 현금이 모두 없으면 ValueError가 발생해야 한다"""
+        with pytest.raises(ValueError):
+            PortfolioService.calculate_dca_portfolio_returns(
+                {}, {}, {}, '2024-01-01', '2024-01-31'
+            )
+
+
+@pytest.mark.asyncio
+async def test_strategy_portfolio_runs_unique_assets_concurrently(monkeypatch):
+    """전략 포트폴리오는 가격을 한 번 로드해 재사용하고, 중복 항목은 한 번만, 제한된 동시성으로 실행해야 한다"""
+    # Given
+    portfolio_module = importlib.import_module('app.services.portfolio_service')
+    frames = {symbol: _prices('2024-01-01', '2024-03-29') for symbol in ['AAPL', 'MSFT', 'GOOG', 'NVDA']}
+    load_calls, runs = [], []
+    in_flight = max_in_flight = 0
+
+    def fake_load_many(symbols, start, end):
+        load_calls.append(list(symbols))
+        return frames
+
+    async def fake_run_backtest(request, data=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        runs.append((request.ticker, request.initial_cash, data is frames[request.ticker]))
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return SimpleNamespace(final_equity=request.initial_cash * 1.1, total_trades=2, win_rate_pct=50.0)
+
+    def fail_single_load(*args, **kwargs):
+        raise AssertionError('개별 로드가 호출되면 안 됩니다')
+
+    monkeypatch.setattr(portfolio_module, 'load_many_tickers', fake_load_many)
+    monkeypatch.setattr(portfolio_module, 'load_ticker_data', fail_single_load)
+    monkeypatch.setattr(portfolio_module.backtest_service, 'run_backtest', fake_run_backtest)
+    monkeypatch.setattr(portfolio_module.settings, 'portfolio_backtest_concurrency', 2)
+
+    request = PortfolioBacktestRequest(
+        portfolio=[
+            PortfolioStock(symbol='AAPL', amount=1000),
+            PortfolioStock(symbol='AAPL', amount=1000),
+            PortfolioStock(symbol='MSFT', amount=500),
+            PortfolioStock(symbol='GOOG', amount=500),
+            PortfolioStock(symbol='NVDA', amount=500),
+            PortfolioStock(symbol='CASH', amount=100, asset_type='cash'),
+        ],
+        start_date='2024-01-01',
+        end_date='2024-03-29',
+        strategy='sma_strategy',
+    )
+
+    # When
+    result = await PortfolioService().run_strategy_portfolio_backtest(request)
+
+    # Then
+    assert result['status'] == 'success'
+    assert load_calls == [['AAPL', 'MSFT', 'GOOG', 'NVDA']]
+    assert sorted(r[:2] for r in runs) == [('AAPL', 1000), ('GOOG', 500), ('MSFT', 500), ('NVDA', 500)]
+    assert all(r[2] for r in runs)
+    assert max_in_flight == 2
+    assert len(result['data']['individual_returns']) == 6
+    assert result['data']['portfolio_result']['total_equity'] == pytest.approx(3500 * 1.1 + 100)
+
+
+@pytest.mark.asyncio
+async def test_equity_curve_combines_per_asset_strategy_curves():
+    """포트폴리오 곡선은 종목별 전략 자산 곡선을 정렬·전진 채움해 합산하고, 곡선이 없는 종목은 보유 가정, 현금은 고정이어야 한다"""
+    # Given
+    dates = pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04'])
+    portfolio_results = {
+        'AAA_0': {'symbol': 'AAA', 'amount': 1000, 'equity_curve': pd.Series([1000.0, 1100.0, 900.0], index=dates)},
+        'BBB_1': {'symbol': 'BBB', 'amount': 500, 'equity_curve': pd.Series([550.0], index=dates[1:2])},
+        'CCC_2': {'symbol': 'CCC', 'amount': 200, 'equity_curve': None},
+        'CASH_3': {'symbol': 'CASH', 'amount': 300, 'asset_type': 'cash'},
+    }
+    price_data = {'CCC': pd.DataFrame({'Close': [10.0, 15.0]}, index=dates[[0, 2]])}
+    request = SimpleNamespace(start_date='2024-01-02', end_date='2024-01-04')
+
+    # When
+    equity_curve, daily_returns = await PortfolioService()._calculate_realistic_equity_curve(
+        request, portfolio_results, 2000, price_data
+    )
+
+    # Then: BBB는 시작 전 투자금, 이후 직전 값 / CCC는 1/3에 직전 종가 유지
+    assert equity_curve == {
+        '2024-01-02': 1000 + 500 + 200 + 300,
+        '2024-01-03': 1100 + 550 + 200 + 300,
+        '2024-01-04': 900 + 550 + 300 + 300,
+    }
+    assert daily_returns['2024-01-02'] == 0.0
+    assert daily_returns['2024-01-03'] == pytest.approx((2150 / 2000 - 1) * 100)
@@ -0,0 +1,126 @@
+"""
+구간 인식 가격 캐시(PriceRangeCache) 테스트
+"""
+import pandas as pd
+
+from app.repositories.price_cache import PriceRangeCache
+
+
+def _frame(start: str, end: str) -> pd.DataFrame:
+    index = pd.bdate_range(start, end)
+    return pd.DataFrame({'Close': range(len(index))}, index=index, dtype=float)
+
+
+class TestPriceRangeCache:
+    """구간 캐시 조회/병합 테스트"""
+
+    def test_contained_range_is_served_by_slicing(self):
+        """넓은 구간이 캐시되어 있으면 포함된 구간을 슬라이스로 반환해야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2015-01-01', '2024-12-31', _frame('2015-01-01', '2024-12-31'))
+
+        result = cache.get('AAPL', '2020-01-01', '2022-12-31')
+
+        assert result is not None
+        assert result.index[0] == pd.Timestamp('2020-01-01')
+        assert result.index[-1] == pd.Timestamp('2022-12-30')
+
+    def test_range_outside_cached_interval_misses(self):
+        """캐시 구간을 벗어나는 요청은 None을 반환해야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+
+        assert cache.get('AAPL', '2020-06-01', '2021-01-31') is None
+        assert cache.get('MSFT', '2020-06-01', '2020-07-01') is None
+
+    def test_adjacent_and_overlapping_ranges_are_merged(self):
+        """인접하거나 겹치는 구간은 하나의 구간으로 병합되어야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+        cache.put('AAPL', '2021-01-01', '2021-06-30', _frame('2021-01-01', '2021-06-30'))
+        cache.put('AAPL', '2021-06-01', '2021-12-31', _frame('2021-06-01', '2021-12-31'))
+
+        result = cache.get('AAPL', '2020-03-01', '2021-11-30')
+
+        assert cache.get_stats()['total_entries'] == 1
+        assert result is not None
+        assert result.index.is_unique
+        assert result.index.is_monotonic_increasing
+
+    def test_disjoint_ranges_stay_separate(self):
+        """떨어진 구간은 병합하지 않아야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-03-31', _frame('2020-01-01', '2020-03-31'))
+        cache.put('AAPL', '2020-06-01', '2020-08-31', _frame('2020-06-01', '2020-08-31'))
+
+        assert cache.get_stats()['total_entries'] == 2
+        assert cache.get('AAPL', '2020-02-01', '2020-07-01') is None
+
+    def test_expired_segments_are_ignored(self):
+        """TTL이 지난 구간은 조회되지 않아야 한다"""
+        cache = PriceRangeCache(ttl_seconds=0)
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+
+        assert cache.get('AAPL', '2020-02-01', '2020-03-01') is None
+
+    def test_segments_of_other_data_version_are_dropped(self):
+        """다른 데이터 버전의 구간은 TTL과 무관하게 조회되지 않고, 이전 버전 데이터는 저장되지 않아야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'), version=1)
+
+        assert cache.get('AAPL', '2020-02-01', '2020-03-01', version=1) is not None
+        assert cache.get('AAPL', '2020-02-01', '2020-03-01', version=2) is None
+
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'), version=2)
+        cache.put('AAPL', '2021-01-01', '2021-12-31', _frame('2021-01-01', '2021-12-31'), version=1)
+        assert cache.get('AAPL', '2020-02-01', '2021-03-01', version=2) is None
+        assert cache.get_stats()['stale_versions'] == 2
+
+    def test_invalidate_removes_all_segments_of_ticker(self):
+        """invalidate는 해당 티커 구간만 제거해야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+        cache.put('MSFT', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+
+        assert cache.invalidate('AAPL') == 1
+        assert cache.get('AAPL', '2020-02-01', '2020-03-01') is None
+        assert cache.get('MSFT', '2020-02-01', '2020-03-01') is not None
+
+
+class TestPriceRangeCacheCapacity:
+    """용량 제한/LRU/카운터 테스트"""
+
+    def test_lru_segment_is_evicted_when_over_capacity(self):
+        """용량을 넘으면 가장 오래 사용되지 않은 구간부터 축출해야 한다"""
+        frame = _frame('2020-01-01', '2020-12-31')
+        size = int(frame.memory_usage(index=False, deep=True).sum()) + frame.index.nbytes
+        cache = PriceRangeCache(max_bytes=size * 2)
+        cache.put('AAPL', '2020-01-01', '2020-12-31', frame)
+        cache.put('MSFT', '2020-01-01', '2020-12-31', frame)
+        cache.get('AAPL', '2020-02-01', '2020-03-01')  # AAPL을 최근 사용으로 갱신
+
+        cache.put('GOOG', '2020-01-01', '2020-12-31', frame)
+
+        stats = cache.get_stats()
+        assert stats['evictions'] == 1
+        assert stats['memory_usage_mb'] * 1024 * 1024 <= size * 2
+        assert cache.get('MSFT', '2020-02-01', '2020-03-01') is None
+        assert cache.get('AAPL', '2020-02-01', '2020-03-01') is not None
+
+    def test_hit_miss_and_expiration_counters(self):
+        """적중/미스/만료 카운터가 집계되어야 한다"""
+        cache = PriceRangeCache()
+        cache.put('AAPL', '2020-01-01', '2020-12-31', _frame('2020-01-01', '2020-12-31'))
+        cache.get('AAPL', '2020-02-01', '2020-03-01')
+        cache.get('AAPL', '2019-02-01', '2020-03-01')
+
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses']) == (1, 1)
+        assert stats['hit_rate'] == 0.5
+
+        cache.ttl_seconds = 0
+        cache.get('AAPL', '2020-02-01', '2020-03-01')
+        stats = cache.get_stats()
+        assert stats['expirations'] == 1
+        assert stats['total_entries'] == 0
+        assert stats['memory_usage_mb'] == 0
@@ -0,0 +1,95 @@
+"""
+벡터화 주기 리밸런싱 엔진(RebalanceEngine) 테스트
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.rebalance_engine import rebalance_engine
+
+
+def _reference_rebalance(prices: pd.DataFrame, weights: np.ndarray, positions, commission: float) -> np.ndarray:
+    """날짜별 루프로 계산한 기준값 (보유 수량 방식)"""
+    values = prices.to_numpy(dtype=float)
+    shares = weights / values[0]
+    result = []
+    for t in range(len(values)):
+        value = float(shares @ values[t])
+        if t in positions:
+            held = shares * values[t]
+            value -= commission * np.abs(weights * value - held).sum()
+            shares = weights * value / values[t]
+        result.append(value)
+    return np.array(result)
+
+
+def _random_prices(days: int, assets: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2000-01-03', periods=days)
+    returns = rng.normal(0.0003, 0.01, size=(days, assets))
+    return pd.DataFrame(100 * np.exp(np.cumsum(returns, axis=0)), index=index)
+
+
+class TestRebalancePositions:
+    """기간 경계 리밸런싱 시점 테스트"""
+
+    def test_first_trading_day_of_each_period(self):
+        """각 기간의 첫 거래일이 리밸런싱 시점이고, 최초 매수일은 제외되어야 한다"""
+        index = pd.bdate_range('2024-01-15', '2024-07-15')
+
+        monthly = rebalance_engine.rebalance_positions(index, 'monthly')
+        quarterly = rebalance_engine.rebalance_positions(index, 'quarterly')
+
+        assert list(index[monthly].strftime('%Y-%m-%d')) == [
+            '2024-02-01', '2024-03-01', '2024-04-01', '2024-05-01', '2024-06-03', '2024-07-01'
+        ]
+        assert list(index[quarterly].strftime('%Y-%m-%d')) == ['2024-04-01', '2024-07-01']
+        assert len(rebalance_engine.rebalance_positions(index, 'none')) == 0
+
+    def test_unknown_frequency_raises(self):
+        """지원하지 않는 주기는 ValueError가 발생해야 한다"""
+        with pytest.raises(ValueError):
+            rebalance_engine.rebalance_positions(pd.bdate_range('2024-01-01', periods=5), 'hourly')
+
+
+class TestSimulate:
+    """리밸런싱 가치 곡선 테스트"""
+
+    def test_matches_loop_reference_with_commission(self):
+        """구간 누적곱 계산은 날짜별 루프 기준값과 같아야 한다"""
+        # Given
+        prices = _random_prices(600, 5)
+        weights = np.array([0.4, 0.3, 0.1, 0.1, 0.1])
+        positions = set(rebalance_engine.rebalance_positions(prices.index, 'monthly').tolist())
+
+        # When
+        result = rebalance_engine.simulate(prices, weights, 'monthly', commission=0.002, initial_value=10000)
+
+        # Then
+        expected = _reference_rebalance(prices, weights, positions, 0.002) * 10000
+        np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
+
+    def test_no_rebalance_is_buy_and_hold(self):
+        """리밸런싱 안 함은 최초 매수 수량을 그대로 보유한 가치와 같아야 한다"""
+        prices = _random_prices(300, 3, seed=1)
+        weights = np.array([0.5, 0.25, 0.25])
+
+        result = rebalance_engine.simulate(prices, weights, 'none', commission=0.01)
+
+        expected = (prices / prices.iloc[0]).to_numpy() @ weights
+        np.testing.assert_allclose(result.to_numpy(), expected)
+
+    def test_daily_rebalance_of_100_assets_over_20_years_is_fast(self):
+        """일간 리밸런싱 100개 자산 × 20년은 1초 이내에 계산되어야 한다"""
+        prices = _random_prices(252 * 20, 100, seed=2)
+        weights = np.full(100, 0.01)
+
+        started = time.perf_counter()
+        result = rebalance_engine.simulate(prices, weights, 'daily', commission=0.001)
+        elapsed = time.perf_counter() - started
+
+        assert len(result) == len(prices)
+        assert np.isfinite(result.to_numpy()).all()
+        assert elapsed < 1.0
@@ -314,4 +314,4 @@ class TestUnifiedBacktestRequest:
         # Then
         assert request.strategy == StrategyType.BUY_HOLD_STRATEGY
         assert request.commission == 0.002
-        assert request.rebalance_frequency == "monthly"
+        assert request.rebalance_frequency == "none"
@@ -0,0 +1,210 @@
+"""
+백테스트 결과 캐시(BacktestResultCache) 테스트
+
+**테스트 범위**:
+- 요청 지문 정규화 (차트 전용 필드 제외, 정수 값 float 정규화)
+- BacktestEngine.run_backtest 재호출 시 재계산 없이 캐시 결과 반환
+- 티커 무효화 및 계산 중 데이터 버전이 바뀐 결과 저장 생략
+- MySQL 계층 저장/복원 (자산 곡선 포함) 및 적재 시 행 삭제
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.schemas.requests import BacktestRequest
+from app.core.executors import executor_manager
+from app.services import result_cache as result_cache_module
+from app.services.backtest_engine import BacktestEngine
+from app.services.data_versions import DataVersionMap
+from app.services.result_cache import BacktestResultCache, request_fingerprint
+
+
+def _request(**overrides) -> BacktestRequest:
+    params = dict(
+        ticker='AAPL', start_date='2020-01-01', end_date='2021-07-01', strategy='sma_strategy',
+        strategy_params={'short_window': 10, 'long_window': 20}, commission=0.002,
+    )
+    params.update(overrides)
+    return BacktestRequest(**params)
+
+
+def _versions() -> DataVersionMap:
+    """DB 없이 모든 티커를 버전 0으로 조회하는 버전 맵"""
+    versions = DataVersionMap(refresh_seconds=60)
+    versions._query_versions = lambda tickers: {}
+    return versions
+
+
+def _prices(length: int = 400) -> pd.DataFrame:
+    index = pd.bdate_range('2020-01-01', periods=length)
+    close = 100 * np.exp(np.cumsum(np.random.default_rng(7).normal(0, 0.02, length)))
+    return pd.DataFrame({
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close, 'Volume': 1000
+    }, index=index)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """프로세스 풀 없이 실행하고 가격 조회/백테스트 실행 횟수를 세는 엔진"""
+    calls = SimpleNamespace(prices=0, runs=0)
+    data = _prices()
+
+    async def fake_price_data(ticker, start_date, end_date):
+        calls.prices += 1
+        return data
+
+    async def inline_run_cpu(func, *args, **kwargs):
+        calls.runs += 1
+        return func(*args)
+
+    instance = BacktestEngine(
+        validation_service_instance=SimpleNamespace(validate_backtest_request=lambda request: None),
+        result_cache=BacktestResultCache(max_entries=8, persistent=False, versions=_versions()),
+    )
+    monkeypatch.setattr(instance, '_get_price_data', fake_price_data)
+    monkeypatch.setattr(executor_manager, 'run_cpu', inline_run_cpu)
+    instance.calls = calls
+    return instance
+
+
+class TestFingerprint:
+    """요청 지문 테스트"""
+
+    def test_ignores_chart_fields_and_normalizes_numbers(self):
+        """차트 형식/포인트 수와 10 vs 10.0 차이는 같은 지문, 수수료 차이는 다른 지문이어야 한다"""
+        base = request_fingerprint(_request(), 'backtesting')
+
+        assert request_fingerprint(
+            _request(chart_format='columnar', max_points=500, strategy_params={'long_window': 20.0, 'short_window': 10}),
+            'backtesting',
+        ) == base
+        assert request_fingerprint(_request(commission=0.001), 'backtesting') != base
+        assert request_fingerprint(_request(), 'vectorized') != base
+
+
+class TestEngineResultCache:
+    """BacktestEngine 결과 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_is_served_from_cache(self, engine):
+        """같은 요청 재실행은 가격 조회/백테스트 없이 같은 결과(자산 곡선 포함)를 반환해야 한다"""
+        # Given
+        first = await engine.run_backtest(_request())
+
+        # When
+        second = await engine.run_backtest(_request(chart_format='columnar'))
+
+        # Then
+        assert (engine.calls.prices, engine.calls.runs) == (1, 1)
+        assert second.model_dump() == first.model_dump()
+        assert second.equity_curve is first.equity_curve
+        assert engine.result_cache.get_stats()['memory_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_forces_recompute(self, engine):
+        """티커 무효화 후에는 다시 계산해야 한다"""
+        await engine.run_backtest(_request())
+
+        assert engine.result_cache.invalidate('AAPL') == 1
+        await engine.run_backtest(_request())
+
+        assert engine.calls.runs == 2
+
+    @pytest.mark.asyncio
+    async def test_result_is_stored_under_version_after_data_load(self, engine, monkeypatch):
+        """가격 조회 중 적재로 버전이 바뀌면 바뀐 버전으로 저장해 다음 요청에서 적중해야 한다"""
+        # Given: 첫 가격 조회가 누락 구간을 보완 적재해 버전을 올림
+        versions = engine.result_cache.versions
+        fetch = engine._get_price_data
+
+        async def loading_price_data(ticker, start_date, end_date):
+            if engine.calls.prices == 0:
+                versions.set(ticker, 1)
+            return await fetch(ticker, start_date, end_date)
+
+        monkeypatch.setattr(engine, '_get_price_data', loading_price_data)
+
+        # When
+        await engine.run_backtest(_request())
+        await engine.run_backtest(_request())
+
+        # Then
+        assert engine.calls.runs == 1
+        assert engine.result_cache.get_stats()['stale_skips'] == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_data_is_not_cached(self, engine):
+        """가격 데이터를 직접 넘긴 실행은 캐시를 조회/저장하지 않아야 한다"""
+        await engine.run_backtest(_request(), data=_prices())
+        await engine.run_backtest(_request(), data=_prices())
+
+        assert engine.calls.runs == 2
+        assert engine.result_cache.get_stats()['total_entries'] == 0
+
+
+class TestResultCacheInvalidation:
+    """무효화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_result_computed_before_version_change_is_not_stored(self, engine):
+        """계산 시작 후 티커 데이터 버전이 바뀌면(적재) 그 결과는 저장하지 않아야 한다"""
+        # Given: 적재 전에 만든 키 (benchmark_ticker도 버전에 포함)
+        cache = engine.result_cache
+        request = _request(benchmark_ticker='SPY')
+        stale_key = await cache.key(request, 'backtesting')
+        result = await engine.run_backtest(_request(), data=_prices())
+
+        # When: SPY 적재로 버전 증가
+        cache.versions.set('SPY', 1)
+        await cache.put(stale_key, result)
+
+        # Then
+        fresh_key = await cache.key(request, 'backtesting')
+        assert fresh_key.digest != stale_key.digest and fresh_key.versions == (0, 1)
+        assert cache.get_stats()['stale_skips'] == 1
+        assert await cache.get(fresh_key) is None
+
+
+class TestPersistentTier:
+    """MySQL 계층 테스트 (SQLite로 대체)"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_delete_rows(self, engine, monkeypatch):
+        """다른 프로세스(빈 메모리)도 DB에서 결과와 자산 곡선을 복원하고, 적재 시 삭제된 행은 조회되지 않아야 한다"""
+        # Given
+        db = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+        with db.connect() as conn:
+            conn.execute(text(
+                'CREATE TABLE backtest_results (cache_key TEXT PRIMARY KEY, ticker TEXT, '
+                'benchmark_ticker TEXT, payload TEXT, created_at TIMESTAMP)'
+            ))
+            conn.commit()
+        monkeypatch.setattr(result_cache_module, '_get_engine', lambda: db)
+
+        writer = BacktestResultCache(persistent=True, versions=_versions())
+        writer._table_ready = True
+        request = _request()
+        result = await engine.run_backtest(request, data=_prices())
+        await writer.put(await writer.key(request, 'backtesting'), result)
+
+        # When
+        reader = BacktestResultCache(persistent=True, versions=_versions())
+        reader._table_ready = True
+        restored = await reader.get(await reader.key(request, 'backtesting'))
+
+        # Then
+        assert restored.model_dump(exclude={'trade_log', 'timestamp'}) == result.model_dump(
+            exclude={'trade_log', 'timestamp'}
+        )
+        assert len(restored.trade_log) == len(result.trade_log)
+        pd.testing.assert_series_equal(restored.equity_curve, result.equity_curve, check_names=False, check_freq=False)
+
+        with db.connect() as conn:
+            assert reader.delete_rows(conn, 'AAPL') == 1
+            conn.commit()
+        reader.clear()
+        assert await reader.get(await reader.key(request, 'backtesting')) is None
@@ -0,0 +1,111 @@
+"""
+단일 비행(single-flight) 요청 병합 테스트
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from app.services import yfinance_db
+from app.repositories.data_repository import YFinanceDataRepository
+from app.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    """동기(스레드) 병합 테스트"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """같은 키로 동시에 호출하면 함수는 한 번만 실행되어야 한다"""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def slow_load(value):
+            calls.append(value)
+            started.set()
+            time.sleep(0.2)
+            return value * 2
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            leader = pool.submit(flight.do, 'AAPL', slow_load, 21)
+            started.wait()
+            followers = [pool.submit(flight.do, 'AAPL', slow_load, 21) for _ in range(4)]
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert results == [42] * 5
+        assert calls == [21]
+        assert flight.get_stats() == {'executed': 1, 'coalesced': 4, 'in_flight': 0}
+
+    def test_error_is_shared_and_key_is_released(self):
+        """리더의 예외는 대기자에게 전달되고, 이후 호출은 새로 실행되어야 한다"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, 'key', failing)
+            started.wait()
+            follower = pool.submit(flight.do, 'key', failing)
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+
+        assert flight.do('key', lambda: 'ok') == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_caller_cancellation():
+    """한 호출자가 취소되어도 다른 대기자는 공유 결과를 받아야 한다"""
+    flight = AsyncSingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return 'data'
+
+    first = asyncio.create_task(flight.do('key', load))
+    second = asyncio.create_task(flight.do('key', load))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == 'data'
+    assert calls == 1
+    assert flight.get_stats()['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_repository_coalesces_concurrent_loads(monkeypatch):
+    """같은 티커/구간 동시 요청은 MySQL 조회를 한 번만 수행해야 한다"""
+    # Given
+    index = pd.bdate_range('2023-01-02', '2023-03-31')
+    frame = pd.DataFrame({'Close': range(len(index))}, index=index, dtype=float)
+    calls = []
+
+    def fake_load(ticker, start_date, end_date):
+        calls.append(ticker)
+        time.sleep(0.1)
+        return frame
+
+    monkeypatch.setattr(yfinance_db, 'load_ticker_data', fake_load)
+    repository = YFinanceDataRepository()
+
+    # When
+    results = await asyncio.gather(
+        *[repository.get_stock_data('AAPL', '2023-01-02', '2023-03-31') for _ in range(20)]
+    )
+
+    # Then
+    assert calls == ['AAPL']
+    assert all(result is frame for result in results)
+    stats = await repository.get_cache_stats()
+    assert stats['single_flight']['coalesced'] == 19
+    assert stats['mysql_cache']['hits'] == 1
@@ -163,3 +163,5 @@ class TestStrategyService:
         assert "name" in info
         assert "description" in info
         assert "parameters" in info
+        assert "class" not in info
+        assert "attribute_map" not in info
@@ -0,0 +1,127 @@
+"""
+통합 데이터 서비스 테스트 (섹션별 동시 수집, 가격 프레임 공유, 섹션 제한 시간, I/O 풀 분리)
+"""
+import importlib
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.executors import ExecutorManager
+from app.services.unified_data_service import UnifiedDataService
+
+
+def _prices(closes) -> pd.DataFrame:
+    index = pd.bdate_range('2024-01-01', periods=len(closes))
+    return pd.DataFrame({'Close': closes, 'Volume': np.full(len(closes), 100)}, index=index)
+
+
+class _SlowNewsService:
+    """제한 시간을 넘기는 뉴스 서비스"""
+    TICKER_MAPPING = {}
+
+    def search_news(self, query, display=15):
+        time.sleep(0.5)
+        return [{'title': query}]
+
+
+@pytest.fixture
+def unified_module(monkeypatch):
+    module = importlib.import_module('app.services.unified_data_service')
+    single_loads = []
+
+    def fake_single(ticker, start, end):
+        single_loads.append(ticker)
+        return _prices([1300.0, 1310.0, 1290.0])
+
+    monkeypatch.setattr(module.data_service, 'get_ticker_data_sync', fake_single)
+    # 이벤트 인덱스(DB) 대신 가격 데이터로 계산
+    monkeypatch.setattr(module.volatility_event_index, 'get_events', lambda *args, **kwargs: None)
+    module.single_loads = single_loads
+    return module
+
+
+@pytest.mark.asyncio
+async def test_price_sections_reuse_shared_frames(unified_module, monkeypatch):
+    """백테스트 단계에서 채운 프레임은 다시 조회하지 않고, 빠진 종목만 한 번에 로드해 맵에 채워야 한다"""
+    # Given: AAA는 이미 로드됨, BBB만 빠짐
+    batch_calls = []
+
+    def fake_many(symbols, start, end):
+        batch_calls.append(list(symbols))
+        return {symbol: _prices([10.0, 11.0, 10.0]) for symbol in symbols}
+
+    monkeypatch.setattr(unified_module.data_service, 'get_many_ticker_data_sync', fake_many)
+    frames = {'AAA': _prices([100.0, 110.0, 111.0])}
+
+    # When
+    result = await UnifiedDataService().collect_all_unified_data_async(
+        ['AAA', 'BBB'], '2024-01-01', '2024-01-03', include_news=False, frames=frames
+    )
+
+    # Then
+    assert batch_calls == [['BBB']]
+    assert set(frames) == {'AAA', 'BBB'}
+    assert [row['price'] for row in result['stock_data']['AAA']] == [100.0, 110.0, 111.0]
+    assert [event['event_type'] for event in result['volatility_events']['AAA']] == ['급등']
+    assert len(result['volatility_events']['BBB']) == 2
+    assert sorted(unified_module.single_loads) == sorted(['^GSPC', '^IXIC', unified_module.settings.exchange_rate_ticker])
+    assert result['exchange_stats']['high_point']['rate'] == 1310.0
+    assert len(result['sp500_benchmark']) == 3
+    assert result['latest_news'] == {}
+
+
+@pytest.mark.asyncio
+async def test_slow_news_section_times_out_without_blocking_prices(unified_module, monkeypatch):
+    """뉴스 섹션이 제한 시간을 넘기면 빈 뉴스로 대체하고 가격 섹션은 정상 반환해야 한다"""
+    # Given
+    monkeypatch.setattr(
+        unified_module.data_service, 'get_many_ticker_data_sync',
+        lambda symbols, start, end: {symbol: _prices([10.0, 10.1, 10.2]) for symbol in symbols}
+    )
+    monkeypatch.setattr(unified_module.settings, 'unified_news_timeout_seconds', 0.1)
+    service = UnifiedDataService(news_service=_SlowNewsService())
+
+    # When
+    started = time.perf_counter()
+    result = await service.collect_all_unified_data_async(['AAA'], '2024-01-01', '2024-01-03')
+    elapsed = time.perf_counter() - started
+
+    # Then
+    assert elapsed < 0.4
+    assert result['latest_news'] == {'AAA': []}
+    assert len(result['stock_data']['AAA']) == 3
+    assert result['volatility_events']['AAA'] == []
+
+
+@pytest.mark.asyncio
+async def test_timed_out_price_section_does_not_hold_io_pool(unified_module, monkeypatch):
+    """가격 섹션이 제한 시간을 넘겨도 계속 실행 중인 조회가 요청 경로의 I/O 풀 슬롯을 점유하지 않아야 한다"""
+    # Given: I/O 풀 1개 스레드, 가격 일괄 조회는 해제될 때까지 블로킹
+    manager = ExecutorManager(io_workers=1, unified_io_workers=2, use_processes=False)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_many(symbols, start, end):
+        started.set()
+        release.wait(5)
+        return {}
+
+    monkeypatch.setattr(unified_module, 'executor_manager', manager)
+    monkeypatch.setattr(unified_module.data_service, 'get_many_ticker_data_sync', blocking_many)
+    monkeypatch.setattr(unified_module.settings, 'unified_data_section_timeout_seconds', 0.1)
+
+    try:
+        # When
+        result = await UnifiedDataService().collect_all_unified_data_async(
+            ['AAA'], '2024-01-01', '2024-01-03', include_news=False
+        )
+
+        # Then: 가격 섹션은 빈 값, 느린 조회는 아직 실행 중이지만 I/O 풀은 바로 다른 작업을 실행
+        assert result['stock_data'] == {'AAA': []}
+        assert started.is_set() and not release.is_set()
+        assert await manager.run_io(lambda: 'free', timeout=0.5) == 'free'
+    finally:
+        release.set()
+        manager.shutdown()
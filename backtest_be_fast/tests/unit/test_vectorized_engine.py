@@ -0,0 +1,247 @@
+"""
+벡터화 백테스트 엔진 패리티 테스트
+
+backtesting.py Backtest.run() 결과와 벡터화 엔진 결과가 동일한지 검증합니다.
+"""
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting import Backtest, Strategy
+
+from app.core.executors import executor_manager
+from app.services.backtest_engine import BacktestEngine
+from app.services.vectorized_engine import VectorizedBacktestEngine
+
+
+COMPARED_STATS = [
+    'Equity Final [$]',
+    'Return [%]',
+    'Return (Ann.) [%]',
+    'Buy & Hold Return [%]',
+    'Volatility (Ann.) [%]',
+    'Sharpe Ratio',
+    'Sortino Ratio',
+    'Calmar Ratio',
+    'Max. Drawdown [%]',
+    'Avg. Drawdown [%]',
+    '# Trades',
+    'Win Rate [%]',
+    'Best Trade [%]',
+    'Worst Trade [%]',
+    'Avg. Trade [%]',
+    'Profit Factor',
+    'SQN',
+]
+
+STRATEGY_CASES = [
+    ('sma_strategy', None),
+    ('sma_strategy', {'short_window': 5, 'long_window': 30}),
+    ('ema_strategy', None),
+    ('ema_strategy', {'fast_window': 5, 'slow_window': 15}),
+    ('rsi_strategy', None),
+    ('rsi_strategy', {'rsi_period': 7, 'rsi_oversold': 35, 'rsi_overbought': 65}),
+    ('macd_strategy', None),
+    ('bollinger_strategy', None),
+    ('bollinger_strategy', {'period': 10, 'std_dev': 1.5}),
+    ('buy_hold_strategy', None),
+]
+
+
+def _random_walk_frame(seed: int, periods: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2020-01-01', periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+    open_ = close * (1 + rng.normal(0, 0.005, periods))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, periods)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, periods)))
+    volume = rng.integers(1_000, 10_000, periods)
+    return pd.DataFrame(
+        {'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume},
+        index=index,
+    )
+
+
+def _assert_stat_equal(name, expected, actual):
+    if pd.isna(expected):
+        assert pd.isna(actual), f"{name}: expected NaN, got {actual}"
+    else:
+        assert actual == pytest.approx(expected, rel=1e-7, abs=1e-9), name
+
+
+@pytest.mark.parametrize('seed', [1, 7, 42])
+@pytest.mark.parametrize('commission,spread', [(0.0, 0.0), (0.002, 0.0), (0.001, 0.0005)])
+@pytest.mark.parametrize('strategy_name,params', STRATEGY_CASES)
+def test_vectorized_engine_matches_backtesting(strategy_name, params, commission, spread, seed):
+    """벡터화 엔진 결과가 backtesting.py 결과와 일치해야 한다"""
+    # Given
+    data = _random_walk_frame(seed)
+    strategy_class = BacktestEngine()._build_strategy(strategy_name, params)
+
+    # When
+    expected = Backtest(
+        data, strategy_class, cash=10000, commission=commission, spread=spread
+    ).run()
+    actual = VectorizedBacktestEngine().run(
+        data, strategy_class, cash=10000, commission=commission, spread=spread
+    )
+
+    # Then: 통계 지표
+    for name in COMPARED_STATS:
+        _assert_stat_equal(name, expected[name], actual[name])
+
+    # Then: 자산 곡선
+    np.testing.assert_allclose(
+        actual['_equity_curve']['Equity'].to_numpy(),
+        expected['_equity_curve']['Equity'].to_numpy(),
+        rtol=1e-9,
+    )
+
+    # Then: 거래 내역
+    expected_trades = expected['_trades']
+    actual_trades = actual['_trades']
+    assert len(actual_trades) == len(expected_trades)
+    for column in ['Size', 'EntryBar', 'ExitBar']:
+        assert actual_trades[column].tolist() == expected_trades[column].tolist()
+    for column in ['EntryPrice', 'ExitPrice', 'PnL', 'ReturnPct']:
+        np.testing.assert_allclose(
+            actual_trades[column].to_numpy(dtype=float),
+            expected_trades[column].to_numpy(dtype=float),
+            rtol=1e-9,
+        )
+    assert actual_trades['EntryTime'].tolist() == expected_trades['EntryTime'].tolist()
+
+
+def test_vectorized_engine_handles_short_data_without_trades():
+    """지표 기간보다 짧은 데이터에서도 거래 없이 결과를 반환해야 한다"""
+    # Given
+    data = _random_walk_frame(3, periods=15)
+    strategy_class = BacktestEngine()._build_strategy('sma_strategy', None)
+
+    # When
+    stats = VectorizedBacktestEngine().run(data, strategy_class, cash=10000)
+
+    # Then
+    assert stats['# Trades'] == 0
+    assert stats['Equity Final [$]'] == pytest.approx(10000)
+
+
+def test_vectorized_engine_rejects_unknown_strategy():
+    """지원하지 않는 전략 클래스는 ValueError를 발생시켜야 한다"""
+    from backtesting import Strategy
+
+    class CustomStrategy(Strategy):
+        def init(self):
+            pass
+
+        def next(self):
+            pass
+
+    engine = VectorizedBacktestEngine()
+    assert engine.supports(CustomStrategy) is False
+    with pytest.raises(ValueError):
+        engine.run(_random_walk_frame(1), CustomStrategy, cash=10000)
+
+
+@pytest.mark.asyncio
+async def test_backtest_engine_uses_vectorized_engine_when_requested(monkeypatch):
+    """engine_mode=vectorized 요청 시 벡터화 엔진 결과로 응답을 생성해야 한다"""
+    from app.schemas.requests import BacktestRequest, EngineMode, StrategyType
+
+    # Given
+    data = _random_walk_frame(11)
+    engine = BacktestEngine(
+        validation_service_instance=SimpleNamespace(validate_backtest_request=lambda request: None),
+    )
+
+    async def fake_price_data(ticker, start_date, end_date):
+        return data
+
+    monkeypatch.setattr(engine, '_get_price_data', fake_price_data)
+    request = BacktestRequest(
+        ticker='AAPL',
+        start_date='2020-01-01',
+        end_date='2021-07-01',
+        strategy=StrategyType.SMA_STRATEGY,
+        commission=0.002,
+        engine_mode=EngineMode.VECTORIZED,
+    )
+
+    # When
+    result = await engine.run_backtest(request)
+
+    # Then
+    expected = Backtest(
+        data, engine._build_strategy('sma_strategy', None), cash=10000, commission=0.002
+    ).run()
+    assert result.total_trades == expected['# Trades']
+    assert result.final_equity == pytest.approx(expected['Equity Final [$]'])
+    assert len(result.equity_curve) == len(data)
+    assert result.equity_curve.iloc[-1] == pytest.approx(expected['Equity Final [$]'])
+    assert 'equity_curve' not in result.model_dump()
+
+
+class _InjectedStrategy(Strategy):
+    """주입된 전략 서비스가 반환하는 전략 (프로세스 간 전달을 위해 모듈 수준 정의)"""
+    threshold = 1
+
+    def init(self):
+        pass
+
+    def next(self):
+        pass
+
+
+class _InjectedVectorizedEngine:
+    """주입된 벡터화 엔진 - 받은 전략 클래스의 threshold를 거래 수로 돌려준다"""
+
+    def supports(self, strategy_class):
+        return True
+
+    def run(self, data, strategy_class, cash, commission=0.0, spread=0.0):
+        assert issubclass(strategy_class, _InjectedStrategy)
+        return pd.Series({'# Trades': strategy_class.threshold, 'Equity Final [$]': cash})
+
+
+@pytest.mark.asyncio
+async def test_process_pool_job_uses_injected_strategy_service_and_engine(monkeypatch):
+    """프로세스 풀 작업은 전역 인스턴스가 아니라 엔진에 주입된 전략 서비스/벡터화 엔진으로 실행되어야 한다"""
+    from app.schemas.requests import BacktestRequest, EngineMode, StrategyType
+
+    # Given: 작업 인자를 pickle 왕복시켜 프로세스 풀 전달과 같게 실행
+    strategy_service = SimpleNamespace(
+        get_strategy_class=lambda name: _InjectedStrategy,
+        validate_strategy_params=lambda name, params: params,
+        get_attribute_map=lambda name: {},
+    )
+    engine = BacktestEngine(
+        strategy_service_instance=strategy_service,
+        validation_service_instance=SimpleNamespace(validate_backtest_request=lambda request: None),
+        vectorized_engine_instance=_InjectedVectorizedEngine(),
+    )
+
+    async def fake_price_data(ticker, start_date, end_date):
+        return _random_walk_frame(5)
+
+    async def pickled_run_cpu(func, *args, **kwargs):
+        func, args = pickle.loads(pickle.dumps((func, args)))
+        return func(*args)
+
+    monkeypatch.setattr(engine, '_get_price_data', fake_price_data)
+    monkeypatch.setattr(executor_manager, 'run_cpu', pickled_run_cpu)
+    request = BacktestRequest(
+        ticker='AAPL',
+        start_date='2020-01-01',
+        end_date='2021-07-01',
+        strategy=StrategyType.SMA_STRATEGY,
+        strategy_params={'threshold': 5},
+        engine_mode=EngineMode.VECTORIZED,
+    )
+
+    # When
+    result = await engine.run_backtest(request)
+
+    # Then: 주입된 전략 클래스에 요청 파라미터가 적용되어 주입된 엔진으로 실행
+    assert result.total_trades == 5
@@ -0,0 +1,193 @@
+"""
+급등/급락 이벤트 인덱스(VolatilityEventIndex) 테스트
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.services.volatility_index import VolatilityEventIndex, _TickerEvents
+
+
+def _prices(closes, start='2024-01-01') -> pd.DataFrame:
+    index = pd.bdate_range(start, periods=len(closes))
+    return pd.DataFrame({'Close': closes, 'Volume': np.arange(len(closes)) * 10}, index=index)
+
+
+def _reference_events(df: pd.DataFrame, threshold: float, max_events: int) -> list:
+    """요청마다 iterrows로 계산하던 기존 방식"""
+    df = df.copy()
+    df['daily_return'] = df['Close'].pct_change() * 100
+    events = [
+        {
+            'date': d.strftime('%Y-%m-%d'),
+            'daily_return': float(row['daily_return']),
+            'close_price': float(row['Close']),
+            'volume': int(row['Volume']),
+            'event_type': '급등' if row['daily_return'] > 0 else '급락',
+        }
+        for d, row in df[abs(df['daily_return']) >= threshold].iterrows()
+    ]
+    events.sort(key=lambda x: x['date'], reverse=True)
+    return events[:max_events]
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    return _prices(100 * np.exp(np.cumsum(rng.normal(0, 0.04, 500))))
+
+
+def _indexed(prices: pd.DataFrame, min_pct: float = 2.0) -> VolatilityEventIndex:
+    index = VolatilityEventIndex(min_return_pct=min_pct)
+    index._entries['AAA'] = _TickerEvents(VolatilityEventIndex.events_from_frame(prices, min_pct))
+    return index
+
+
+class TestEventLookup:
+    """메모리 인덱스 조회 테스트"""
+
+    def test_format_events_matches_iterrows_reference(self, prices):
+        """벡터화 계산은 기존 iterrows 계산과 같은 이벤트를 반환해야 한다"""
+        assert VolatilityEventIndex.format_events(prices, 5.0, 10) == _reference_events(prices, 5.0, 10)
+
+    @pytest.mark.parametrize('threshold', [2.0, 5.0, 8.5])
+    def test_recent_events_in_range_match_reference(self, prices, threshold):
+        """임의 임계값/기간 조회는 (직전 거래일 기준 변동률로) 기준 계산과 같아야 한다"""
+        index = _indexed(prices)
+        start, end = prices.index[100], prices.index[300]
+
+        result = index.get_events('AAA', start, end, threshold, 7)
+
+        expected = [e for e in _reference_events(prices, threshold, len(prices)) if start <= pd.Timestamp(e['date']) <= end]
+        assert result == expected[:7]
+
+    def test_magnitude_order_returns_largest_moves(self, prices):
+        """변동 폭순 조회는 기간 내 절대 변동률 상위 N개를 반환해야 한다"""
+        index = _indexed(prices)
+
+        result = index.get_events('AAA', prices.index[0], prices.index[-1], 2.0, 5, order='magnitude')
+
+        all_events = _reference_events(prices, 2.0, len(prices))
+        expected = sorted(all_events, key=lambda e: abs(e['daily_return']), reverse=True)[:5]
+        assert [e['date'] for e in result] == [e['date'] for e in expected]
+
+    def test_threshold_below_stored_minimum_returns_none(self, prices):
+        """저장 기준보다 낮은 임계값은 None을 반환해 호출자가 직접 계산해야 한다"""
+        assert _indexed(prices).get_events('AAA', prices.index[0], prices.index[-1], 1.0, 5) is None
+
+    def test_apply_window_replaces_only_that_range(self):
+        """커밋된 구간 이벤트는 해당 구간만 교체해야 한다"""
+        index = _indexed(_prices([100.0, 110.0, 99.0, 100.0, 120.0]))
+        new_events = pd.DataFrame(
+            {'daily_return': [-30.0], 'close': [77.0], 'volume': [5]}, index=pd.to_datetime(['2024-01-03'])
+        )
+
+        index.apply_window('AAA', '2024-01-03', '2024-01-04', new_events)
+
+        result = index.get_events('AAA', '2024-01-01', '2024-01-31', 5.0, 10)
+        assert [(e['date'], e['daily_return']) for e in result] == [
+            ('2024-01-05', pytest.approx(20.0)), ('2024-01-03', -30.0), ('2024-01-02', pytest.approx(10.0))
+        ]
+
+
+class TestRecordWindow:
+    """적재 구간 증분 갱신 테스트 (SQLite)"""
+
+    def test_window_and_next_trading_day_are_recomputed(self):
+        """새 봉 구간과 그 다음 거래일의 이벤트만 직전 거래일 종가 기준으로 다시 계산되어야 한다"""
+        # Given: 1/2~1/5 가격, 1/4 종가만 새로 적재(100 → 120)
+        engine = create_engine('sqlite://')
+        with engine.connect() as conn:
+            conn.execute(text('CREATE TABLE daily_prices (stock_id INT, date TEXT, close REAL, volume INT)'))
+            conn.execute(text(
+                'CREATE TABLE volatility_events (stock_id INT, date TEXT, daily_return REAL, '
+                'abs_return REAL, close REAL, volume INT)'
+            ))
+            conn.execute(
+                text('INSERT INTO daily_prices VALUES (1, :date, :close, 0)'),
+                [{'date': d, 'close': c} for d, c in
+                 [('2024-01-02', 100.0), ('2024-01-03', 100.0), ('2024-01-04', 120.0), ('2024-01-05', 120.0)]],
+            )
+            conn.execute(text(
+                "INSERT INTO volatility_events VALUES (1, '2024-01-02', 9.0, 9.0, 100.0, 0), "
+                "(1, '2024-01-05', 7.0, 7.0, 120.0, 0)"
+            ))
+
+            # When
+            start, end, events = VolatilityEventIndex(min_return_pct=2.0).record_window(conn, 1, '2024-01-04', '2024-01-04')
+            stored = conn.execute(text('SELECT date, daily_return FROM volatility_events ORDER BY date')).fetchall()
+
+        # Then: 1/4는 +20% 이벤트, 1/5는 변동 없음으로 제거, 구간 밖 1/2는 유지
+        assert (str(start), str(end)) == ('2024-01-04', '2024-01-05')
+        assert list(events.index.strftime('%Y-%m-%d')) == ['2024-01-04']
+        assert [(d, pytest.approx(r)) for d, r in stored] == [('2024-01-02', 9.0), ('2024-01-04', 20.0)]
+
+
+class TestLegacyTickerRebuild:
+    """인덱스 도입 전 적재된 티커의 전체 재구성 테스트 (SQLite)"""
+
+    @staticmethod
+    def _engine():
+        engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+        with engine.begin() as conn:
+            conn.execute(text('CREATE TABLE stocks (id INT, ticker TEXT)'))
+            conn.execute(text('CREATE TABLE daily_prices (stock_id INT, date TEXT, close REAL, volume INT)'))
+            conn.execute(text(
+                'CREATE TABLE volatility_events (stock_id INT, date TEXT, daily_return REAL, '
+                'abs_return REAL, close REAL, volume INT)'
+            ))
+            conn.execute(text('CREATE TABLE volatility_index_state (stock_id INT PRIMARY KEY, indexed_at TEXT)'))
+        return engine
+
+    def test_incremental_save_does_not_hide_older_history(self, monkeypatch):
+        """기존 티커에 증분 적재만 기록된 상태에서도 과거 구간 이벤트가 daily_prices 전체로 재구성되어야 한다"""
+        # Given: 인덱스 도입 전부터 있던 가격(1/3 +10% 급등), 이후 1/8 봉만 증분 적재
+        engine = self._engine()
+        monkeypatch.setattr('app.services.volatility_index._get_engine', lambda: engine)
+        closes = [('2024-01-02', 100.0), ('2024-01-03', 110.0), ('2024-01-04', 110.0),
+                  ('2024-01-05', 110.0), ('2024-01-08', 99.0)]
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO stocks VALUES (1, 'AAA')"))
+            conn.execute(
+                text('INSERT INTO daily_prices VALUES (1, :date, :close, 0)'),
+                [{'date': d, 'close': c} for d, c in closes],
+            )
+        index = VolatilityEventIndex(min_return_pct=2.0)
+        index._table_ready = True
+        with engine.begin() as conn:
+            index.record_window(conn, 1, '2024-01-08', '2024-01-08')
+
+        # When
+        events = index.get_events('AAA', '2024-01-01', '2024-01-31', threshold=5.0)
+        with engine.connect() as conn:
+            marked = conn.execute(text('SELECT stock_id FROM volatility_index_state')).fetchall()
+
+        # Then: 증분 구간(1/8)뿐 아니라 과거 급등(1/3)도 조회되고, 완료 기록 후 새 인스턴스는 저장된 이벤트를 사용
+        assert [e['date'] for e in events] == ['2024-01-08', '2024-01-03']
+        assert marked == [(1,)]
+        reloaded = VolatilityEventIndex(min_return_pct=2.0)
+        reloaded._table_ready = True
+        with engine.begin() as conn:
+            conn.execute(text('DELETE FROM daily_prices'))
+        assert [e['date'] for e in reloaded.get_events('AAA', '2024-01-01', '2024-01-31', threshold=5.0)] == [
+            '2024-01-08', '2024-01-03'
+        ]
+
+    def test_full_history_window_marks_ticker_indexed(self, monkeypatch):
+        """최초 적재처럼 증분 구간이 전체 가격 범위를 덮으면 바로 완료로 기록되어야 한다"""
+        # Given
+        engine = self._engine()
+        with engine.begin() as conn:
+            conn.execute(
+                text('INSERT INTO daily_prices VALUES (1, :date, :close, 0)'),
+                [{'date': d, 'close': c} for d, c in [('2024-01-02', 100.0), ('2024-01-03', 110.0)]],
+            )
+
+            # When
+            VolatilityEventIndex(min_return_pct=2.0).record_window(conn, 1, '2024-01-02', '2024-01-03')
+            marked = conn.execute(text('SELECT stock_id FROM volatility_index_state')).fetchall()
+
+        # Then
+        assert marked == [(1,)]
@@ -0,0 +1,322 @@
+"""
+yfinance_db 적재 헬퍼 테스트 (DB 연결 없이 행 변환/갱신 판단/적재 구간 계산만 검증)
+"""
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.services import yfinance_db
+from app.services.yfinance_db import (
+    _info_is_stale,
+    _merge_intervals,
+    _missing_intervals,
+    _prepare_price_rows,
+)
+from app.utils import data_fetcher as data_fetcher_module
+from app.utils.data_fetcher import DataFetchError, DataNotFoundError, data_fetcher
+
+
+class TestPreparePriceRows:
+    """daily_prices upsert 행 변환 테스트"""
+
+    def test_columns_are_converted_with_nulls(self):
+        """NaN은 None, 누락 거래량은 0, 날짜는 YYYY-MM-DD 문자열로 변환되어야 한다"""
+        # Given
+        index = pd.date_range('2024-01-01', periods=3, tz='America/New_York')
+        df = pd.DataFrame(
+            {
+                'Open': [1.0, np.nan, 3.0],
+                'High': [1.5, 2.5, 3.5],
+                'Low': [0.5, 1.5, 2.5],
+                'Close': [1.2, 2.2, 3.2],
+                'Adj Close': [1.1, 2.1, np.nan],
+                'Volume': [100, np.nan, 300],
+            },
+            index=index,
+        )
+
+        # When
+        rows = _prepare_price_rows(df, stock_id=7)
+
+        # Then
+        assert [r['date'] for r in rows] == ['2024-01-01', '2024-01-02', '2024-01-03']
+        assert rows[1]['open'] is None
+        assert rows[2]['adj_close'] is None
+        assert [r['volume'] for r in rows] == [100, 0, 300]
+        assert all(r['stock_id'] == 7 for r in rows)
+        assert isinstance(rows[0]['close'], float)
+
+    def test_date_column_and_missing_optional_columns(self):
+        """Date 컬럼이 있으면 사용하고, 없는 Adj Close/Volume은 None/0으로 채워야 한다"""
+        df = pd.DataFrame(
+            {
+                'Date': ['2024-02-01', '2024-02-02'],
+                'Open': [1.0, 2.0],
+                'High': [1.0, 2.0],
+                'Low': [1.0, 2.0],
+                'Close': [1.0, 2.0],
+            }
+        )
+
+        rows = _prepare_price_rows(df, stock_id=1)
+
+        assert [r['date'] for r in rows] == ['2024-02-01', '2024-02-02']
+        assert all(r['adj_close'] is None and r['volume'] == 0 for r in rows)
+
+    def test_empty_frame_returns_no_rows(self):
+        """빈 DataFrame은 빈 목록을 반환해야 한다"""
+        assert _prepare_price_rows(pd.DataFrame(), stock_id=1) == []
+
+
+class TestChangedPriceRows:
+    """값이 바뀐 가격 행만 upsert 대상으로 고르는지 테스트"""
+
+    def test_only_new_or_changed_rows_are_returned(self):
+        """저장된 값(DECIMAL(19,4) 기준)과 같은 행은 제외하고 새 날짜/바뀐 값만 반환해야 한다"""
+        # Given: 1/2, 1/3이 저장된 DB
+        engine = create_engine('sqlite://')
+        with engine.connect() as conn:
+            conn.execute(text(
+                'CREATE TABLE daily_prices (stock_id INTEGER, date DATE, open REAL, high REAL, low REAL, '
+                'close REAL, adj_close REAL, volume INTEGER)'
+            ))
+            conn.execute(text(
+                "INSERT INTO daily_prices VALUES (1, '2024-01-02', 10, 11, 9, 10.5, 10.5, 100), "
+                "(1, '2024-01-03', 10, 11, 9, 10.5, NULL, 100)"
+            ))
+            frame = pd.DataFrame(
+                {
+                    'Open': [10.00001, 10.0, 10.0],
+                    'High': [11.0, 11.0, 11.0],
+                    'Low': [9.0, 9.0, 9.0],
+                    'Close': [10.5, 10.75, 10.0],
+                    'Volume': [100, 100, 100],
+                },
+                index=pd.to_datetime(['2024-01-02', '2024-01-03', '2024-01-04']),
+            )
+            frame['Adj Close'] = [10.5, np.nan, 10.0]
+            rows = _prepare_price_rows(frame, stock_id=1)
+
+            # When
+            changed = yfinance_db._changed_price_rows(conn, 1, rows)
+
+        # Then: 1/2는 소수 4자리까지 같음, 1/3은 종가 변경, 1/4는 새 행
+        assert [r['date'] for r in changed] == ['2024-01-03', '2024-01-04']
+
+
+class TestInfoRefresh:
+    """stocks.info_json 갱신 판단 테스트"""
+
+    def test_missing_or_old_info_is_stale(self):
+        """기록이 없거나 갱신 주기를 넘긴 경우 갱신 대상이어야 한다"""
+        now = datetime(2024, 6, 1, 12, 0)
+
+        assert _info_is_stale(None, now, max_age_hours=24)
+        assert _info_is_stale(now - timedelta(hours=25), now, max_age_hours=24)
+        assert not _info_is_stale(now - timedelta(hours=1), now, max_age_hours=24)
+
+
+class TestCoverageIntervals:
+    """적재 구간(price_coverage) 계산 테스트"""
+
+    def test_overlapping_and_adjacent_intervals_are_merged(self):
+        """겹치거나 하루 차이로 인접한 구간은 병합되어야 한다"""
+        merged = _merge_intervals(
+            [(date(2020, 1, 1), date(2020, 3, 31)), (date(2020, 6, 1), date(2020, 6, 30))],
+            (date(2020, 4, 1), date(2020, 4, 30)),
+        )
+
+        assert merged == [
+            (date(2020, 1, 1), date(2020, 4, 30)),
+            (date(2020, 6, 1), date(2020, 6, 30)),
+        ]
+
+    def test_interior_hole_is_detected(self):
+        """양 끝뿐 아니라 중간의 구멍도 누락 구간으로 반환해야 한다"""
+        covered = [
+            (date(2020, 1, 1), date(2020, 3, 31)),
+            (date(2020, 6, 1), date(2020, 12, 31)),
+        ]
+
+        missing = _missing_intervals(covered, date(2019, 12, 1), date(2021, 1, 31))
+
+        assert missing == [
+            (date(2019, 12, 1), date(2019, 12, 31)),
+            (date(2020, 4, 1), date(2020, 5, 31)),
+            (date(2021, 1, 1), date(2021, 1, 31)),
+        ]
+
+    def test_fully_covered_and_weekend_only_gaps_are_not_missing(self):
+        """커버된 구간 내부 요청이나 주말만 빠진 구간은 누락이 아니어야 한다"""
+        # 2024-01-05(금) 까지, 2024-01-08(월) 부터 커버
+        covered = [
+            (date(2024, 1, 1), date(2024, 1, 5)),
+            (date(2024, 1, 8), date(2024, 1, 31)),
+        ]
+
+        assert _missing_intervals(covered, date(2024, 1, 2), date(2024, 1, 30)) == []
+
+    def test_open_day_counts_as_covered_only_within_ttl(self, monkeypatch):
+        """당일까지 수집한 티커는 TTL 동안만 당일을 적재된 것으로 보아야 한다"""
+        # Given: 어제까지 적재, 당일 수집 기록
+        today = date.today()
+        covered = [(today - timedelta(days=30), today - timedelta(days=1))]
+        monkeypatch.setattr(yfinance_db, '_OPEN_DAY_FETCHES', {})
+        yfinance_db._mark_open_day_fetched('AAPL')
+
+        # When / Then: TTL 안에서는 당일까지 커버, 수집 기록이 없는 티커는 그대로
+        assert yfinance_db._with_recent_fetches('AAPL', covered) == [(today - timedelta(days=30), today)]
+        assert yfinance_db._with_recent_fetches('MSFT', covered) == covered
+
+        # When / Then: TTL이 지나면 당일은 다시 누락 구간
+        monkeypatch.setattr(settings, 'price_open_day_ttl_seconds', 0)
+        assert yfinance_db._with_recent_fetches('AAPL', covered) == covered
+
+    def test_empty_answer_is_not_persisted_and_expires(self, monkeypatch):
+        """행 없이 응답한 구간은 DB 적재 구간에 기록하지 않고 TTL 동안만 프로세스 내에서 적재된 것으로 보아야 한다"""
+        # Given
+        today = date.today()
+        saved = []
+
+        def not_found(ticker, start, end, use_cache=True, min_rows=2):
+            raise DataNotFoundError('데이터 없음')
+
+        monkeypatch.setattr(data_fetcher, 'get_stock_data', not_found)
+        monkeypatch.setattr(yfinance_db, 'save_ticker_data', lambda *args, **kwargs: saved.append(args))
+        monkeypatch.setattr(yfinance_db, '_OPEN_DAY_FETCHES', {})
+        monkeypatch.setattr(yfinance_db, '_EMPTY_FETCHES', {})
+
+        # When
+        yfinance_db._fill_missing_ranges('NEWCO', [(date(2020, 1, 6), date(2020, 1, 10)), (today, today)])
+        covered = yfinance_db._with_recent_fetches('NEWCO', [])
+
+        # Then: 구간 양쪽 여유(3일) 포함 TTL 기록만 남고 저장은 없음, 당일까지 수집했으므로 당일 수집 기록
+        assert saved == []
+        assert covered == [(date(2020, 1, 3), date(2020, 1, 13)), (today - timedelta(days=3), today)]
+        assert 'NEWCO' in yfinance_db._OPEN_DAY_FETCHES
+
+        # When / Then: TTL이 지나면 다시 누락 구간
+        monkeypatch.setattr(settings, 'price_empty_range_ttl_seconds', 0)
+        monkeypatch.setattr(settings, 'price_open_day_ttl_seconds', 0)
+        assert _missing_intervals(
+            yfinance_db._with_recent_fetches('NEWCO', []), date(2020, 1, 6), date(2020, 1, 10)
+        ) == [(date(2020, 1, 6), date(2020, 1, 10))]
+        assert 'NEWCO' not in yfinance_db._EMPTY_FETCHES
+
+    def test_download_error_leaves_range_missing(self, monkeypatch):
+        """다운로드 예외는 빈 응답으로 처리하지 않고 아무것도 기록하지 않은 채 호출자에게 전달해야 한다"""
+        # Given: history/download 모두 연결 오류
+        class FailingTicker:
+            def __init__(self, ticker):
+                pass
+
+            def history(self, **kwargs):
+                raise OSError('Read timed out')
+
+        def failing_download(*args, **kwargs):
+            raise OSError('Read timed out')
+
+        saved = []
+        monkeypatch.setattr(data_fetcher_module.yf, 'Ticker', FailingTicker)
+        monkeypatch.setattr(data_fetcher_module.yf, 'download', failing_download)
+        monkeypatch.setattr(yfinance_db, 'save_ticker_data', lambda *args, **kwargs: saved.append(args))
+        monkeypatch.setattr(yfinance_db, '_OPEN_DAY_FETCHES', {})
+        monkeypatch.setattr(yfinance_db, '_EMPTY_FETCHES', {})
+        gap = (date(2020, 1, 6), date(2020, 1, 10))
+
+        # When
+        with pytest.raises(DataFetchError):
+            yfinance_db._fill_missing_ranges('AAPL', [gap])
+
+        # Then
+        assert saved == []
+        assert _missing_intervals(yfinance_db._with_recent_fetches('AAPL', []), *gap) == [gap]
+
+    def test_single_row_answer_is_saved_with_returned_span(self, monkeypatch):
+        """행이 1개뿐인 응답도 저장하고, 적재 구간은 수집 구간이 아니라 반환된 행의 날짜로 기록해야 한다"""
+        # Given: 2020-01-08 한 행만 반환
+        bar = pd.DataFrame(
+            {'Open': [1.0], 'High': [1.0], 'Low': [1.0], 'Close': [1.0], 'Volume': [10]},
+            index=pd.DatetimeIndex([pd.Timestamp('2020-01-08', tz='America/New_York')]),
+        )
+
+        class OneRowTicker:
+            def __init__(self, ticker):
+                pass
+
+            def history(self, **kwargs):
+                return bar.copy()
+
+        saved = []
+        monkeypatch.setattr(data_fetcher_module.yf, 'Ticker', OneRowTicker)
+        monkeypatch.setattr(
+            yfinance_db, 'save_ticker_data',
+            lambda ticker, df, coverage_start=None, coverage_end=None: saved.append(
+                (ticker, len(df), coverage_start, coverage_end)
+            ),
+        )
+        monkeypatch.setattr(yfinance_db, '_EMPTY_FETCHES', {})
+
+        # When
+        yfinance_db._fill_missing_ranges('AAPL', [(date(2020, 1, 8), date(2020, 1, 8))])
+
+        # Then: 행이 없던 앞뒤 여유 구간은 TTL 기록만
+        assert saved == [('AAPL', 1, date(2020, 1, 8), date(2020, 1, 8))]
+        assert yfinance_db._with_recent_fetches('AAPL', []) == [
+            (date(2020, 1, 5), date(2020, 1, 7)), (date(2020, 1, 9), date(2020, 1, 11))
+        ]
+
+
+class TestLoadManyTickers:
+    """여러 티커 일괄 보완/가격 행렬 테스트"""
+
+    def test_missing_ranges_are_filled_by_one_batch_download(self, monkeypatch):
+        """여러 티커의 누락 구간은 일괄 다운로드 한 번으로 보완하고, 빠진 티커만 개별 수집해야 한다"""
+        # Given
+        index = pd.bdate_range('2024-01-01', '2024-03-29', tz='America/New_York')
+        frame = pd.DataFrame({'Close': np.arange(len(index), dtype=float)}, index=index)
+        batch_calls, saved, single = [], [], []
+
+        def fake_many(tickers, start, end):
+            batch_calls.append(tickers)
+            return {'AAPL': frame, 'MSFT': frame}
+
+        monkeypatch.setattr(data_fetcher, 'get_many_stock_data', fake_many)
+        monkeypatch.setattr(yfinance_db, '_EMPTY_FETCHES', {})
+        monkeypatch.setattr(
+            yfinance_db, 'save_ticker_data',
+            lambda ticker, df, coverage_start=None, coverage_end=None: saved.append(
+                (ticker, df.index.min().date(), df.index.max().date(), coverage_start, coverage_end)
+            ),
+        )
+        monkeypatch.setattr(yfinance_db, '_fill_missing_ranges', lambda ticker, gaps: single.append(ticker))
+
+        # When
+        yfinance_db._fill_many_missing_ranges({
+            'AAPL': [(date(2024, 2, 1), date(2024, 2, 29))],
+            'MSFT': [(date(2024, 1, 8), date(2024, 1, 12)), (date(2024, 3, 4), date(2024, 3, 8))],
+            'GOOG': [(date(2024, 1, 1), date(2024, 3, 29))],
+        })
+
+        # Then
+        assert batch_calls == [['AAPL', 'MSFT', 'GOOG']]
+        assert single == ['GOOG']
+        assert [s[0] for s in saved] == ['AAPL', 'MSFT', 'MSFT']
+        aapl = saved[0]
+        assert (aapl[3], aapl[4]) == (aapl[1], aapl[2]) == (date(2024, 1, 29), date(2024, 3, 1))
+
+    def test_build_price_matrix_aligns_on_date_union(self):
+        """가격 행렬은 거래일 합집합으로 정렬되고 없는 날은 NaN이어야 한다"""
+        a = pd.DataFrame({'Close': [1.0, 2.0]}, index=pd.to_datetime(['2024-01-02', '2024-01-03']))
+        b = pd.DataFrame({'Close': [10.0]}, index=pd.to_datetime(['2024-01-03']))
+
+        matrix = yfinance_db.build_price_matrix({'A': a, 'B': b})
+
+        assert list(matrix.columns) == ['A', 'B']
+        assert list(matrix.index) == list(pd.to_datetime(['2024-01-02', '2024-01-03']))
+        assert np.isnan(matrix.loc['2024-01-02', 'B'])
+        assert yfinance_db.build_price_matrix({}).empty
@@ -27,6 +27,7 @@ interface Indicator {
   name: string;
   color: string;
   data?: Array<{ date: string; value: number }>;
+  value?: number | null;
 }
 
 interface Trade {
@@ -60,6 +61,11 @@ const OHLCChart: React.FC<OHLCChartProps> = memo(({ data, indicators, trades })
       };
 
       safeIndicators.forEach(indicator => {
+        // 상수 기준선(RSI 과매수/과매도 등)은 날짜별 포인트 없이 value 하나로 전달됨
+        if (indicator.value != null) {
+          point[indicator.name] = Number(indicator.value);
+          return;
+        }
         const indicatorPoint = indicator.data?.find(d => d.date === ohlc.date);
         if (indicatorPoint) {
           point[indicator.name] = Number(indicatorPoint.value) || 0;
@@ -136,6 +136,7 @@ export interface IndicatorData {
     date: string;
     value: number;
   }>;
+  value?: number | null; // 상수 기준선 값 (이 경우 data는 비어 있음)
   [key: string]: unknown;
 }
 
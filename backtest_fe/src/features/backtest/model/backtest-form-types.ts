@@ -69,7 +69,7 @@ export const initialBacktestFormState: BacktestFormState = {
     strategyParams: {}
   },
   settings: {
-    rebalanceFrequency: 'monthly',
+    rebalanceFrequency: 'never',
     commission: 0.2
   },
   ui: {
@@ -205,7 +205,7 @@ export function backtestFormReducer(state: BacktestFormState, action: BacktestFo
           strategyParams: {}
         },
         settings: {
-          rebalanceFrequency: 'monthly',
+          rebalanceFrequency: 'never',
           commission: 0.2
         },
         ui: {
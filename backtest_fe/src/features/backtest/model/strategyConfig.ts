@@ -194,6 +194,6 @@ export const DEFAULT_VALUES = {
   INITIAL_AMOUNT: 10000,
   COMMISSION: 0.2, // 퍼센트
   DCA_PERIODS: 12,
-  REBALANCE_FREQUENCY: 'monthly',
+  REBALANCE_FREQUENCY: 'never',
   STRATEGY: 'buy_hold_strategy'
 };
@@ -16,6 +16,10 @@ USE stock_data_cache;
 -- 실행 시 오류를 방지하기 위해 기존 테이블이 있다면 삭제 후 재생성합니다.
 
 DROP TABLE IF EXISTS stock_news;
+DROP TABLE IF EXISTS backtest_results;
+DROP TABLE IF EXISTS volatility_index_state;
+DROP TABLE IF EXISTS volatility_events;
+DROP TABLE IF EXISTS price_coverage;
 DROP TABLE IF EXISTS daily_prices;
 DROP TABLE IF EXISTS stocks;
 
@@ -32,7 +36,7 @@ CREATE TABLE stocks (
     summary TEXT,                                 -- 회사 요약
     info_json JSON,                               -- yfinance의 'info' 전체를 저장할 JSON 필드
     last_info_update TIMESTAMP NULL,              -- 정보 마지막 업데이트 시각
-    data_last_update TIMESTAMP NULL,              -- 데이터 마지막 업데이트 시각
+    data_last_update TIMESTAMP NULL,              -- 데이터 마지막 업데이트 시각 (티커 데이터 버전, 가격 적재마다 단조 증가)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_ticker (ticker),
@@ -62,6 +66,59 @@ CREATE TABLE daily_prices (
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '일별 주가 정보 (OHLCV)';
 
 
+-- === `price_coverage` 테이블: 가격 데이터 적재 구간 ===
+-- 티커별로 daily_prices에 적재가 끝난 날짜 구간 목록입니다. (겹치거나 인접한 구간은 병합)
+-- load_ticker_data는 이 목록으로 양 끝과 중간의 누락 구간을 판단해 해당 구간만 보완합니다.
+CREATE TABLE price_coverage (
+    stock_id INT NOT NULL,                        -- stocks 테이블의 ID (Foreign Key)
+    start_date DATE NOT NULL,                     -- 구간 시작일 (포함)
+    end_date DATE NOT NULL,                       -- 구간 종료일 (포함)
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (stock_id, start_date),
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '종목별 가격 데이터 적재 구간';
+
+
+-- === `volatility_events` 테이블: 급등/급락 이벤트 ===
+-- 전 거래일 대비 종가 변동률이 VOLATILITY_EVENT_MIN_PCT(기본 2%) 이상인 날짜를 미리 계산해 저장합니다.
+-- save_ticker_data가 새 봉을 적재할 때 해당 구간만 증분 갱신하고, 임의 임계값 조회는 abs_return 인덱스를 사용합니다.
+CREATE TABLE volatility_events (
+    stock_id INT NOT NULL,                        -- stocks 테이블의 ID (Foreign Key)
+    date DATE NOT NULL,                           -- 이벤트 날짜
+    daily_return DECIMAL(10, 4) NOT NULL,         -- 전 거래일 대비 변동률 (%)
+    abs_return DECIMAL(10, 4) NOT NULL,           -- 변동률 절댓값 (%)
+    close DECIMAL(19, 4) NOT NULL,                -- 종가
+    volume BIGINT UNSIGNED DEFAULT 0,             -- 거래량
+    PRIMARY KEY (stock_id, date),
+    INDEX idx_stock_abs_return (stock_id, abs_return),
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '종목별 급등/급락 이벤트';
+
+
+-- === `volatility_index_state` 테이블: 급등/급락 이벤트 전체 인덱싱 완료 티커 ===
+-- 행이 없는 티커는 volatility_events에 증분 갱신 행이 일부 있더라도 첫 조회 시 daily_prices 전체로 재구성합니다.
+CREATE TABLE volatility_index_state (
+    stock_id INT NOT NULL PRIMARY KEY,            -- stocks 테이블의 ID (Foreign Key)
+    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, -- 전체 인덱싱 완료 시각
+    FOREIGN KEY (stock_id) REFERENCES stocks(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '급등/급락 이벤트 전체 인덱싱 완료 티커';
+
+
+-- === `backtest_results` 테이블: 백테스트 결과 캐시 ===
+-- 요청 지문(종목, 기간, 전략, 파라미터, 자본, 수수료, 스프레드, 벤치마크, 엔진)과 데이터 버전으로 만든 키별 결과입니다.
+-- save_ticker_data가 새 가격 행을 저장하면 해당 티커를 대상 또는 벤치마크로 쓴 행을 같은 트랜잭션에서 삭제합니다.
+CREATE TABLE backtest_results (
+    cache_key CHAR(64) NOT NULL,                  -- SHA-256 캐시 키
+    ticker VARCHAR(20) NOT NULL,                  -- 백테스트 대상 티커
+    benchmark_ticker VARCHAR(20) NULL,            -- 비교 벤치마크 티커
+    payload MEDIUMTEXT NOT NULL,                  -- BacktestResult JSON + 일별 자산 곡선
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (cache_key),
+    INDEX idx_ticker (ticker),
+    INDEX idx_benchmark_ticker (benchmark_ticker)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '요청 지문 기반 백테스트 결과 캐시';
+
+
 -- === `stock_news` 테이블: 종목별 뉴스 정보 ===
 -- 네이버 뉴스 API 등에서 가져온 종목 관련 뉴스를 캐싱합니다.
 CREATE TABLE stock_news (
@@ -72,12 +129,14 @@ CREATE TABLE stock_news (
     link VARCHAR(1000),                           -- 뉴스 링크
     description TEXT,                             -- 뉴스 요약
     source VARCHAR(100),                          -- 뉴스 출처 (예: 네이버)
+    kind VARCHAR(10) NOT NULL DEFAULT 'event',    -- 뉴스 종류 (event: 날짜별 이벤트 뉴스, latest: 최신 뉴스 캐시)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '저장일',
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
     INDEX idx_ticker (ticker),
     INDEX idx_news_date (news_date),
     INDEX idx_ticker_date (ticker, news_date),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_ticker_kind_created (ticker, kind, created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT '종목별 뉴스 캐시';
 
 
@@ -94,5 +153,5 @@ SELECT
     COLUMN_NAME
 FROM information_schema.STATISTICS
 WHERE TABLE_SCHEMA = 'stock_data_cache'
-    AND TABLE_NAME IN ('stocks', 'daily_prices', 'stock_news')
+    AND TABLE_NAME IN ('stocks', 'daily_prices', 'price_coverage', 'volatility_events', 'stock_news')
 ORDER BY TABLE_NAME, INDEX_NAME;